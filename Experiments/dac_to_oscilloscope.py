@@ -0,0 +1,192 @@
+"""READ ME: Closed loop check of QubiC pulses on the oscilloscope. Every circuit (e.g. the
+8 qubit 150 MHz cos_edge_square pulses of Reference/DAC_to_Oscilloscope.ipynb) is
+compiled, the oscilloscope is armed for a single capture, the circuit batch is run
+and the captured pulse is compared with the expected envelope by cross-correlation.
+The next circuit is compiled while the current one is measured. The runner is
+pluggable: QubiC's CircuitRunnerClient on hardware, LocalRunner without it."""
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from Experiments import pulse_reference
+
+# Result of comparing one captured source with the expected pulse. lag is the start of
+# the pulse in the capture (s), correlation the normalized envelope correlation (1 is a
+# perfect match), gain the captured/expected amplitude and residual_rms the RMS
+# difference of the envelopes after scaling.
+PulseComparison = namedtuple('PulseComparison', ['source', 'lag', 'correlation', 'gain', 'residual_rms'])
+
+
+#Instruments
+class QubicCompiler():
+    """Compiles and assembles circuits with the QubiC toolchain, like the notebook."""
+
+    def __init__(self, channel_configs='channel_config.json', fpga_config=None, compiler_flags=None):
+        # QubiC is only needed when running on the QubiC hardware.
+        import qubic.toolchain as tc
+        from distproc.hwconfig import FPGAConfig, load_channel_configs
+        self._toolchain = tc
+        self.fpga_config = FPGAConfig() if fpga_config is None else fpga_config
+        if isinstance(channel_configs, str):
+            channel_configs = load_channel_configs(channel_configs)
+        self.channel_configs = channel_configs
+        self.compiler_flags = {'resolve_gates': False} if compiler_flags is None else compiler_flags
+
+    def __call__(self, circuit):
+        compiled = self._toolchain.run_compile_stage(circuit, fpga_config=self.fpga_config, qchip=None,
+                                                     compiler_flags=self.compiler_flags)
+        return self._toolchain.run_assemble_stage(compiled, self.channel_configs)
+
+
+def qubic_runner(ip='127.0.0.1', port=9095):
+    """The QubiC RPC client used in the notebook."""
+    import qubic.rpc_client as rc
+    return rc.CircuitRunnerClient(ip=ip, port=port)
+
+
+class LocalRunner():
+    """
+    Stand-in for CircuitRunnerClient when no QubiC board is available. It records every
+    batch and calls on_batch(programs, n_total_shots), e.g. to drive a function generator.
+    """
+
+    def __init__(self, on_batch=None):
+        self.on_batch = on_batch
+        self.batches = []
+
+    def run_circuit_batch(self, raw_asm_list, n_total_shots, **kwargs):
+        self.batches.append((raw_asm_list, n_total_shots))
+        if self.on_batch is not None:
+            return self.on_batch(raw_asm_list, n_total_shots)
+        return {}
+
+
+#Analysis
+def analytic_envelope(signals):
+    """Envelope (magnitude of the analytic signal) along the last axis, for a batch of signals."""
+    signals = np.asarray(signals, dtype=np.float64)
+    n = signals.shape[-1]
+    spectrum = np.fft.fft(signals, axis=-1)
+    weights = np.zeros(n)
+    weights[0] = 1
+    weights[1:(n + 1) // 2] = 2
+    if n % 2 == 0:
+        weights[n // 2] = 1
+    return np.abs(np.fft.ifft(spectrum * weights, axis=-1))
+
+
+def compare_pulses(captures, reference_envelope, sample_interval, sources=None):
+    """
+    Find and compare the expected pulse envelope in every captured waveform.
+
+    The envelopes of all captures are cross-correlated with the reference in one FFT
+    over the batch, normalized by the energy of each capture window.
+
+    Parameters:
+    captures (array-like): Captured waveforms (n_sources, n_points) in V.
+    reference_envelope (array-like): Expected envelope in V, at the same sample interval.
+    sample_interval (float): Time between samples in seconds.
+    sources (list, optional): Names for the results, defaults to 0, 1, ...
+
+    Returns:
+    list: A PulseComparison per capture.
+    """
+    captures = np.atleast_2d(captures)
+    reference = np.asarray(reference_envelope, dtype=np.float64)
+    n, m = captures.shape[-1], len(reference)
+    if m == 0 or n < m:
+        raise ValueError(f"The capture ({n} points) must be at least as long as the pulse ({m} points).")
+    envelopes = analytic_envelope(captures)
+    size = 1 << int(np.ceil(np.log2(n + m - 1)))
+    correlation = np.fft.irfft(np.fft.rfft(envelopes, size, axis=-1) *
+                               np.conj(np.fft.rfft(reference, size)), size, axis=-1)[:, :n - m + 1]
+    # Energy of every window of m points, from a running sum.
+    cumulative = np.concatenate((np.zeros((len(envelopes), 1)), np.cumsum(envelopes ** 2, axis=-1)), axis=-1)
+    window_energy = cumulative[:, m:] - cumulative[:, :n - m + 1]
+    reference_energy = np.dot(reference, reference)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        normalized = correlation / np.sqrt(window_energy * reference_energy)
+    normalized = np.nan_to_num(normalized)
+    starts = np.argmax(normalized, axis=-1)
+
+    if sources is None:
+        sources = range(len(captures))
+    results = []
+    for row, (source, start) in enumerate(zip(sources, starts)):
+        gain = correlation[row, start] / reference_energy
+        residual = envelopes[row, start:start + m] - gain * reference
+        results.append(PulseComparison(source, start * sample_interval, float(normalized[row, start]),
+                                       float(gain), float(np.sqrt(np.mean(residual ** 2)))))
+    return results
+
+
+#Experiment
+class DacToOscilloscope():
+    """
+    Run circuits and compare what the oscilloscope captures with the expected pulse.
+    """
+
+    def __init__(self, scope, runner, compiler, sources=(1,), n_total_shots=1000, trigger_timeout=10.0,
+                 references=None):
+        """
+        Parameters:
+        scope (Oscilloscope): The oscilloscope, triggered by the DAC output or a marker.
+        runner: Object with run_circuit_batch(programs, n_total_shots), e.g. qubic_runner() or LocalRunner().
+        compiler (callable): Turns a circuit into a program for the runner, e.g. QubicCompiler().
+        sources (list): Oscilloscope sources to capture.
+        n_total_shots (int): Shots per batch.
+        trigger_timeout (float): Seconds to wait for the oscilloscope to trigger.
+        references (pulse_reference.ReferenceWaveformCache, optional): Cache of the expected
+                   waveforms, share one between experiments to reuse it.
+        """
+        self.scope = scope
+        self.runner = runner
+        self.compiler = compiler
+        self.sources = list(sources)
+        self.n_total_shots = n_total_shots
+        self.trigger_timeout = trigger_timeout
+        self.references = pulse_reference.ReferenceWaveformCache() if references is None else references
+
+    def measure(self, program, pulse):
+        """Run one compiled program and compare the capture with pulse (a QubiC pulse dictionary)."""
+        self.scope.single()
+        self.runner.run_circuit_batch([program], n_total_shots=self.n_total_shots)
+        self.scope.wait_for_acquisition(self.trigger_timeout)
+        volts, time = self.scope.acquire_channels(self.sources, stop=False)
+        sample_interval = time[1] - time[0]
+        _, envelope = self.references.get(pulse, sample_interval)
+        return compare_pulses(volts, envelope, sample_interval, self.sources)
+
+    def run(self, circuits, pulses=None):
+        """
+        Measure every circuit. Circuit N+1 is compiled on a worker thread while circuit N runs.
+
+        Parameters:
+        circuits (list): QubiC circuits (lists of instruction dictionaries).
+        pulses (list, optional): The expected pulse of each circuit. Defaults to the first
+                                 pulse instruction of the circuit.
+
+        Returns:
+        list: For every circuit, the list of PulseComparison of the captured sources.
+        """
+        if pulses is None:
+            pulses = [next(i for i in circuit if i.get('name') == 'pulse') for circuit in circuits]
+        results = []
+        if not circuits:
+            return results
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            compiling = pool.submit(self.compiler, circuits[0])
+            for i, pulse in enumerate(pulses):
+                program = compiling.result()
+                if i + 1 < len(circuits):
+                    compiling = pool.submit(self.compiler, circuits[i + 1])
+                results.append(self.measure(program, pulse))
+        return results
+
+
+def notebook_circuit(n_qubits=8, freq=150e6, amp=1, twidth=0.5e-6, ramp_fraction=0.5):
+    """The circuit of Reference/DAC_to_Oscilloscope.ipynb: one drive pulse per qubit."""
+    return [{'name': 'pulse', 'phase': 0, 'freq': freq, 'amp': amp, 'twidth': twidth,
+             'env': {'env_func': 'cos_edge_square', 'paradict': {'ramp_fraction': ramp_fraction}},
+             'dest': f'Q{q}.qdrv'} for q in range(n_qubits)]
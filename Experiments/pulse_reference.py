@@ -0,0 +1,151 @@
+"""READ ME: Synthesizes the waveform a QubiC pulse should produce at the DAC output, so
+oscilloscope captures can be compared against it. A pulse is described like in the
+QubiC circuits of Reference/DAC_to_Oscilloscope.ipynb (freq, amp, phase, twidth and
+an env with env_func and paradict), the reference is sampled at the scope's sample
+interval. ReferenceWaveformCache keeps recently used references, so a calibration loop
+comparing many captures of the same pulses synthesizes each of them only once."""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+def cos_edge_square(sample_interval, twidth, ramp_fraction=0.25):
+    """
+    Flat top envelope with raised cosine edges.
+
+    Parameters:
+    sample_interval (float): Time between samples in seconds.
+    twidth (float): Total pulse length in seconds.
+    ramp_fraction (float): Fraction of twidth used by the two edges together (0 to 1).
+
+    Returns:
+    numpy.ndarray: The envelope, 0 to 1.
+    """
+    if not 0 <= ramp_fraction <= 1:
+        raise ValueError(f"Invalid ramp fraction ({ramp_fraction}). Must be between 0 and 1.")
+    t = np.arange(int(round(twidth / sample_interval))) * sample_interval
+    envelope = np.ones(t.shape)
+    tedge = ramp_fraction * twidth / 2
+    if tedge > 0:
+        rise = t < tedge
+        envelope[rise] = 0.5 * (1 - np.cos(np.pi * t[rise] / tedge))
+        fall = t > twidth - tedge
+        envelope[fall] = 0.5 * (1 - np.cos(np.pi * (twidth - t[fall]) / tedge))
+    return envelope
+
+
+def square(sample_interval, twidth):
+    """Rectangular envelope."""
+    return np.ones(int(round(twidth / sample_interval)))
+
+
+ENVELOPES = {'cos_edge_square': cos_edge_square, 'square': square}
+
+
+def pulse_envelope(pulse, sample_interval):
+    """The envelope (0 to 1) of a QubiC pulse dictionary."""
+    env = pulse.get('env', {'env_func': 'square', 'paradict': {}})
+    try:
+        function = ENVELOPES[env['env_func']]
+    except KeyError:
+        raise ValueError(f"Unsupported envelope ({env['env_func']}). Choose from {list(ENVELOPES)}.")
+    return function(sample_interval, pulse['twidth'], **env.get('paradict', {}))
+
+
+def pulse_waveform(pulse, sample_interval):
+    """
+    The expected DAC output of a QubiC pulse dictionary: amp * envelope * cos(2 pi freq t + phase).
+
+    Returns:
+    tuple: (waveform, envelope) sampled every sample_interval seconds.
+    """
+    envelope = pulse['amp'] * pulse_envelope(pulse, sample_interval)
+    t = np.arange(len(envelope)) * sample_interval
+    return envelope * np.cos(2 * np.pi * pulse['freq'] * t + pulse.get('phase', 0)), envelope
+
+
+def pulse_key(pulse, sample_interval):
+    """
+    Hashable key of everything that determines the reference waveform of a pulse. The
+    sample interval is rounded, as intervals taken from time axes differ in the last digits.
+    """
+    env = pulse.get('env', {'env_func': 'square', 'paradict': {}})
+    paradict = tuple(sorted(env.get('paradict', {}).items()))
+    return (float(pulse['freq']), float(pulse['amp']), float(pulse.get('phase', 0)), float(pulse['twidth']),
+            env['env_func'], paradict, float(f"{sample_interval:.12g}"))
+
+
+class ReferenceWaveformCache():
+    """
+    Least recently used cache of pulse_waveform results, optionally persisted to disk.
+
+    The cached arrays are read-only, copy them before modifying them.
+    Use cache.get(pulse, 1 / scope.get_sample_rate()) or the sample interval of a capture.
+    """
+
+    def __init__(self, maxsize=64, directory=None):
+        """
+        Parameters:
+        maxsize (int): Number of references kept in memory.
+        directory (str, optional): Folder where references are saved as .npz files and
+                                   loaded from in later runs.
+        """
+        self.maxsize = maxsize
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._references = OrderedDict()
+        self._lock = threading.Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        name = hashlib.sha1(repr(key).encode()).hexdigest()
+        return os.path.join(self.directory, name + ".npz")
+
+    def _load(self, key):
+        if self.directory is None or not os.path.exists(self._path(key)):
+            return None
+        with np.load(self._path(key)) as data:
+            return data['waveform'], data['envelope']
+
+    def _save(self, key, waveform, envelope):
+        if self.directory is not None:
+            np.savez(self._path(key), waveform=waveform, envelope=envelope)
+
+    def get(self, pulse, sample_interval):
+        """
+        The reference of a QubiC pulse dictionary, see pulse_waveform.
+
+        Returns:
+        tuple: (waveform, envelope) sampled every sample_interval seconds.
+        """
+        key = pulse_key(pulse, sample_interval)
+        with self._lock:
+            if key in self._references:
+                self._references.move_to_end(key)
+                self.hits += 1
+                return self._references[key]
+            self.misses += 1
+        reference = self._load(key)
+        if reference is None:
+            reference = pulse_waveform(pulse, sample_interval)
+            self._save(key, *reference)
+        for array in reference:
+            array.flags.writeable = False
+        with self._lock:
+            self._references[key] = reference
+            while len(self._references) > self.maxsize:
+                self._references.popitem(last=False)
+        return reference
+
+    def clear(self):
+        """Forget the references in memory, the files on disk are kept."""
+        with self._lock:
+            self._references.clear()
+
+    def __len__(self):
+        return len(self._references)
@@ -0,0 +1,455 @@
+"""READ ME: Runs queued experiments against the shared bench instruments. Every job names the
+instruments it needs, exclusively (it changes their settings) or shared (it only reads them,
+e.g. a monitor), and starts as soon as its instruments are free: jobs on different
+instruments run side by side. A blocked job reserves the instruments it is waiting for, so
+later jobs cannot overtake it there, while its free instruments stay available to other
+jobs; after max_wait seconds it reserves all of them. The queue is a JSON file saved after
+every change, so after a crash the interrupted jobs run again and the batch continues where
+it stopped.
+
+    python -m Experiments.scheduler overnight.json add Experiments.my_experiment:run Oscilloscope --kwargs '{"n": 100}'
+    python -m Experiments.scheduler overnight.json add Experiments.monitor:run Oscilloscope:shared Spike
+    python -m Experiments.scheduler overnight.json run --workers 4
+
+A job is a function called as function(instruments, **kwargs), with instruments a dict of
+the drivers by name. The scheduler opens every instrument once and shares the driver
+between the jobs; each driver method call holds the instrument's lock for its whole
+duration, so the commands of a read are never interleaved with those of a shared job. Hold
+driver.lock for several calls that belong together.
+Add jobs with `add` while the scheduler is not running, or with Scheduler.submit."""
+import argparse
+import functools
+import importlib
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+EXCLUSIVE = "exclusive"
+SHARED = "shared"
+LEASE_MODES = (EXCLUSIVE, SHARED)
+QUEUED, RUNNING, DONE, FAILED, CANCELLED = "queued", "running", "done", "failed", "cancelled"
+PORTS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "instrumentPorts.json")
+
+
+def resolve(target):
+    """The function of a 'module:function' target."""
+    module, _, name = target.partition(":")
+    if not module or not name:
+        raise ValueError(f"Invalid target ({target}). Use 'module:function'.")
+    return getattr(importlib.import_module(module), name)
+
+
+def _jsonable(value):
+    try:
+        json.dumps(value)
+        return value
+    except (TypeError, ValueError):
+        return repr(value)
+
+
+class JobQueue():
+    """The jobs (dictionaries) in submission order, saved to a JSON file after every change."""
+
+    def __init__(self, path):
+        """
+        Load the queue from path if it exists. Jobs that were running when the previous
+        scheduler stopped were interrupted and are queued again.
+        """
+        self.path = path
+        self.jobs = []
+        self._lock = threading.RLock()
+        if os.path.exists(path):
+            with open(path) as f:
+                self.jobs = json.load(f)["jobs"]
+            interrupted = [job for job in self.jobs if job["state"] == RUNNING]
+            for job in interrupted:
+                job["state"] = QUEUED
+                # An interruption is not a failed attempt.
+                job["attempts"] -= 1
+                job["interruptions"] += 1
+            if interrupted:
+                self.save()
+
+    def submit(self, target, instruments, kwargs=None, name=None, priority=0, max_attempts=1):
+        """
+        Add a job.
+
+        Parameters:
+        target (str): The experiment function as 'module:function'.
+        instruments (dict or list): Lease mode (EXCLUSIVE or SHARED) by instrument name. A list
+                                    of names leases them exclusively.
+        kwargs (dict, optional): Keyword arguments of the function, must be JSON serializable.
+        name (str, optional): Name shown in the listing, defaults to target.
+        priority (int): Higher priority jobs start first.
+        max_attempts (int): Attempts before the job fails.
+
+        Returns:
+        int: The job id.
+        """
+        resolve(target)
+        if not isinstance(instruments, dict):
+            instruments = {name: EXCLUSIVE for name in instruments}
+        for instrument, mode in instruments.items():
+            if mode not in LEASE_MODES:
+                raise ValueError(f"Invalid lease mode ({mode}) for {instrument}. Choose from {LEASE_MODES}.")
+        kwargs = {} if kwargs is None else kwargs
+        try:
+            json.dumps(kwargs)
+        except (TypeError, ValueError):
+            raise ValueError("The job arguments must be JSON serializable to survive a restart.")
+        if max_attempts < 1:
+            raise ValueError(f"Invalid number of attempts ({max_attempts}). Must be at least 1.")
+        with self._lock:
+            job = {"id": max((j["id"] for j in self.jobs), default=0) + 1, "name": name or target,
+                   "target": target, "instruments": dict(instruments), "kwargs": kwargs, "priority": priority,
+                   "max_attempts": max_attempts, "attempts": 0, "interruptions": 0, "state": QUEUED,
+                   "submitted": time.time(), "started": None, "finished": None, "error": None, "result": None}
+            self.jobs.append(job)
+            self.save()
+        return job["id"]
+
+    def get(self, job_id):
+        for job in self.jobs:
+            if job["id"] == job_id:
+                return job
+        raise KeyError(f"No job {job_id}.")
+
+    def queued(self):
+        """The queued jobs, highest priority first, then in submission order."""
+        with self._lock:
+            return sorted((job for job in self.jobs if job["state"] == QUEUED),
+                          key=lambda job: (-job["priority"], job["id"]))
+
+    def cancel(self, job_id):
+        with self._lock:
+            job = self.get(job_id)
+            if job["state"] != QUEUED:
+                raise ValueError(f"Job {job_id} is {job['state']}, only queued jobs can be cancelled.")
+            job["state"] = CANCELLED
+            self.save()
+
+    def save(self):
+        """Write the queue, replacing the file at once so a crash never leaves half a file."""
+        with self._lock:
+            temporary = self.path + ".tmp"
+            with open(temporary, "w") as f:
+                json.dump({"jobs": self.jobs}, f, indent=1)
+            os.replace(temporary, self.path)
+
+    def format(self):
+        """Table of the jobs."""
+        lines = [f"{'id':>4}  {'state':<10}{'priority':>8}  {'attempts':<9}{'instruments':<32}name"]
+        for job in self.jobs:
+            instruments = ", ".join(name + (":shared" if mode == SHARED else "")
+                                    for name, mode in job["instruments"].items())
+            lines.append(f"{job['id']:>4}  {job['state']:<10}{job['priority']:>8}  "
+                         f"{job['attempts']}/{job['max_attempts']:<7}{instruments:<32}{job['name']}"
+                         + (f"  ({job['error']})" if job["error"] and job["state"] != DONE else ""))
+        return "\n".join(lines)
+
+
+class Leases():
+    """Exclusive and shared leases of the instruments, and the time each instrument was leased."""
+
+    def __init__(self):
+        self.exclusive = {}
+        self.shared = defaultdict(set)
+        self.busy = defaultdict(float)
+        self._since = {}
+
+    def contended(self, instruments):
+        """The names of the instruments ({name: mode}) that cannot be leased now."""
+        return {name for name, mode in instruments.items()
+                if name in self.exclusive or (mode == EXCLUSIVE and self.shared[name])}
+
+    def available(self, instruments):
+        """True if all instruments ({name: mode}) can be leased now."""
+        return not self.contended(instruments)
+
+    def acquire(self, job_id, instruments):
+        now = time.monotonic()
+        for name, mode in instruments.items():
+            self._since.setdefault(name, now)
+            if mode == EXCLUSIVE:
+                self.exclusive[name] = job_id
+            else:
+                self.shared[name].add(job_id)
+
+    def release(self, job_id, instruments):
+        now = time.monotonic()
+        for name in instruments:
+            if self.exclusive.get(name) == job_id:
+                del self.exclusive[name]
+            self.shared[name].discard(job_id)
+            if name not in self.exclusive and not self.shared[name]:
+                self.busy[name] += now - self._since.pop(name)
+
+
+class LockedResource():
+    """
+    Resource whose calls hold lock, so jobs sharing an instrument never interleave within
+    a call. Hold lock for several calls that belong together (e.g. write and read_raw).
+    Other attributes are passed to the resource.
+    """
+
+    def __init__(self, resource, lock=None):
+        object.__setattr__(self, 'resource', resource)
+        object.__setattr__(self, 'lock', threading.RLock() if lock is None else lock)
+
+    def write(self, message):
+        with self.lock:
+            return self.resource.write(message)
+
+    def query(self, message):
+        with self.lock:
+            return self.resource.query(message)
+
+    def read(self):
+        with self.lock:
+            return self.resource.read()
+
+    def read_raw(self, *args):
+        with self.lock:
+            return self.resource.read_raw(*args)
+
+    def __getattr__(self, name):
+        return getattr(self.resource, name)
+
+    def __setattr__(self, name, value):
+        setattr(self.resource, name, value)
+
+
+class LockedDriver():
+    """
+    Driver whose method calls hold lock until they return. Driver methods send several
+    commands (e.g. select a source, then read it), so a job sharing the instrument must not
+    get in between. The lock is held by the calling thread: a method must not wait for
+    another thread using the same driver (e.g. a capture callback). Other attributes are
+    passed to the driver.
+    """
+
+    def __init__(self, driver, lock):
+        object.__setattr__(self, 'driver', driver)
+        object.__setattr__(self, 'lock', lock)
+
+    def __getattr__(self, name):
+        attribute = getattr(self.driver, name)
+        if not callable(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        def locked(*args, **kwargs):
+            with self.lock:
+                return attribute(*args, **kwargs)
+        return locked
+
+    def __setattr__(self, name, value):
+        setattr(self.driver, name, value)
+
+
+def default_instruments(path=PORTS_FILE):
+    """Driver factories of the instruments in instrumentPorts.json (Oscilloscope) and of Spike."""
+    from Instruments import acquisition_service
+    with open(path) as f:
+        ports = json.load(f)
+    instruments = {"Spike": acquisition_service.open_spectrum_analyzer}
+    if "Oscilloscope" in ports:
+        instruments["Oscilloscope"] = functools.partial(acquisition_service.open_oscilloscope, ports["Oscilloscope"])
+    return instruments
+
+
+class Scheduler():
+
+    def __init__(self, queue, instruments, workers=4, poll_interval=1.0, max_wait=600.0):
+        """
+        Parameters:
+        queue (JobQueue or str): The queue or its file.
+        instruments (dict): Factory returning the driver, by instrument name (see default_instruments).
+        workers (int): Maximum number of jobs running at once.
+        poll_interval (float): Seconds between checks of the queue while waiting.
+        max_wait (float): Seconds a blocked job waits for some of its instruments before it
+                          reserves all of them, so jobs on its free instruments cannot keep
+                          it waiting forever.
+        """
+        self.queue = JobQueue(queue) if isinstance(queue, str) else queue
+        self.factories = instruments
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.max_wait = max_wait
+        self.leases = Leases()
+        self.drivers = {}
+        self._open_lock = threading.Lock()
+        self._condition = threading.Condition()
+        self._running = set()
+        # Time each queued job was first blocked, by job id.
+        self._blocked_since = {}
+        self._stopping = False
+
+    def submit(self, target, instruments, kwargs=None, name=None, priority=0, max_attempts=1):
+        """Add a job (see JobQueue.submit), also while run is running."""
+        for instrument in (instruments if isinstance(instruments, dict) else dict.fromkeys(instruments)):
+            if instrument not in self.factories:
+                raise ValueError(f"Unknown instrument ({instrument}). Choose from {sorted(self.factories)}.")
+        with self._condition:
+            job_id = self.queue.submit(target, instruments, kwargs, name, priority, max_attempts)
+            self._condition.notify_all()
+        return job_id
+
+    def _driver(self, name):
+        with self._open_lock:
+            if name not in self.drivers:
+                driver = self.factories[name]()
+                lock = threading.RLock()
+                instrument = getattr(driver, "instrument", None)
+                if instrument is not None:
+                    driver.instrument = LockedResource(instrument, lock)
+                self.drivers[name] = LockedDriver(driver, lock)
+            return self.drivers[name]
+
+    def _startable(self):
+        """
+        Queued jobs that can start now. A blocked job reserves the instruments it waits for
+        against later jobs, and all its instruments once it has waited max_wait seconds.
+        """
+        reserved = set()
+        startable = []
+        free = self.workers - len(self._running)
+        now = time.monotonic()
+        for job in self.queue.queued():
+            if len(startable) == free:
+                break
+            instruments = job["instruments"]
+            if missing := set(instruments) - set(self.factories):
+                job["state"], job["error"] = FAILED, f"Unknown instruments {sorted(missing)}."
+                self.queue.save()
+                continue
+            blocked = (reserved & set(instruments)) | self.leases.contended(instruments)
+            if not blocked:
+                self._blocked_since.pop(job["id"], None)
+                self.leases.acquire(job["id"], instruments)
+                startable.append(job)
+            elif now - self._blocked_since.setdefault(job["id"], now) >= self.max_wait:
+                reserved.update(instruments)
+            else:
+                reserved.update(blocked)
+        return startable
+
+    def _execute(self, job):
+        error = result = None
+        try:
+            drivers = {name: self._driver(name) for name in job["instruments"]}
+            result = resolve(job["target"])(drivers, **job["kwargs"])
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        with self._condition:
+            self.leases.release(job["id"], job["instruments"])
+            self._running.discard(job["id"])
+            job["finished"] = time.time()
+            job["error"] = error
+            if error is None:
+                job["state"], job["result"] = DONE, _jsonable(result)
+            else:
+                job["state"] = QUEUED if job["attempts"] < job["max_attempts"] else FAILED
+            self.queue.save()
+            self._condition.notify_all()
+
+    def run(self, until_empty=True):
+        """
+        Run the queued jobs.
+
+        Parameters:
+        until_empty (bool): Return once no job is queued or running. False keeps waiting for
+                            submitted jobs until stop is called.
+
+        Returns:
+        dict: Fraction of the run time each instrument was leased.
+        """
+        start = time.monotonic()
+        self._stopping = False
+        with ThreadPoolExecutor(self.workers, thread_name_prefix="experiment") as executor:
+            with self._condition:
+                while not self._stopping:
+                    for job in self._startable():
+                        job["state"], job["started"] = RUNNING, time.time()
+                        job["attempts"] += 1
+                        self._running.add(job["id"])
+                        self.queue.save()
+                        executor.submit(self._execute, job)
+                    if until_empty and not self._running and not self.queue.queued():
+                        break
+                    self._condition.wait(self.poll_interval)
+                while self._running:
+                    self._condition.wait()
+        elapsed = max(time.monotonic() - start, 1e-9)
+        return {name: self.leases.busy[name] / elapsed for name in self.factories}
+
+    def stop(self):
+        """Let the running jobs finish and return from run, the queued jobs stay queued."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+
+    def close(self):
+        """Close the instruments that were opened."""
+        for driver in self.drivers.values():
+            instrument = getattr(driver, "instrument", None)
+            if instrument is not None:
+                instrument.close()
+        self.drivers.clear()
+
+
+def _instrument_argument(text):
+    name, _, mode = text.partition(":")
+    mode = mode or EXCLUSIVE
+    if mode not in LEASE_MODES:
+        raise argparse.ArgumentTypeError(f"Invalid lease mode ({mode}). Choose from {LEASE_MODES}.")
+    return name, mode
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Queue experiments and run them on the shared instruments.")
+    parser.add_argument("queue", help="The queue file (JSON), created if it does not exist.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    add = commands.add_parser("add", help="Queue a job.")
+    add.add_argument("target", help="The experiment function, e.g. Experiments.my_experiment:run.")
+    add.add_argument("instruments", nargs="+", type=_instrument_argument,
+                     help="Instruments to lease, e.g. Oscilloscope or Oscilloscope:shared.")
+    add.add_argument("--kwargs", type=json.loads, default={}, help="Arguments of the function as JSON.")
+    add.add_argument("--name")
+    add.add_argument("--priority", type=int, default=0)
+    add.add_argument("--attempts", type=int, default=1)
+    commands.add_parser("list", help="Show the jobs.")
+    cancel = commands.add_parser("cancel", help="Cancel a queued job.")
+    cancel.add_argument("id", type=int)
+    run = commands.add_parser("run", help="Run the queued jobs.")
+    run.add_argument("--workers", type=int, default=4)
+    run.add_argument("--setup", help="'module:function' returning the driver factories by instrument name, "
+                                     "defaults to the instruments of instrumentPorts.json.")
+    args = parser.parse_args(argv)
+
+    queue = JobQueue(args.queue)
+    if args.command == "add":
+        job_id = queue.submit(args.target, dict(args.instruments), args.kwargs, args.name, args.priority,
+                              args.attempts)
+        print(f"Queued job {job_id}.")
+    elif args.command == "list":
+        print(queue.format())
+    elif args.command == "cancel":
+        queue.cancel(args.id)
+    else:
+        instruments = resolve(args.setup)() if args.setup else default_instruments()
+        scheduler = Scheduler(queue, instruments, args.workers)
+        try:
+            utilization = scheduler.run()
+        finally:
+            scheduler.close()
+        print(queue.format())
+        for name, fraction in utilization.items():
+            print(f"{name}: leased {fraction:.0%} of the run")
+
+
+if __name__ == "__main__":
+    main()
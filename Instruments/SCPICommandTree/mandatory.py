@@ -1,3 +1,6 @@
+from Instruments import error_checking
+
+
 class Mandatory():
     def __init__(self, instrument):
         self.instrument = instrument
@@ -142,6 +145,13 @@ class Mandatory():
         """
         response = self.instrument.query(":SYST:ERR:NEXT?").strip()
         return response
+
+    def get_system_errors(self, depth=8) -> list:
+        """
+        Reads the whole error queue, up to depth entries per query.
+        Returns a list of (code, message) tuples, empty if there were no errors.
+        """
+        return error_checking.drain_errors(self.instrument, depth)
     
     def get_system_version(self) -> str:
         """
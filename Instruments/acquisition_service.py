@@ -0,0 +1,441 @@
+"""
+Acquisition in a separate process, with the captures handed over in shared memory.
+
+Instrument I/O and NumPy/Python analysis in one process compete for the GIL, so
+the acquisition stalls while the analysis runs. An AcquisitionService runs the
+driver (Oscilloscope, SpectrumAnalyzer, ...) in its own process and stores every
+capture in a slot of a SharedRing, a multiprocessing.shared_memory block cut
+into fixed size slots. Only small Capture descriptors go through the queues: the
+analysis reads the capture in place and frees the slot when it is done. An
+AnalysisPool runs the analysis in several processes, so I/O and compute scale
+independently:
+
+    factory = functools.partial(acquisition_service.open_oscilloscope, address)
+    acquire = functools.partial(acquisition_service.capture_channels, sources=(1, 2))
+    with acquisition_service.AcquisitionService(factory, acquire, slots=16) as service:
+        service.call("set_channel_scale", 1, 0.5)
+        pool = service.analyze(analysis_function, workers=4)
+        service.start(n=1000)
+        results = pool.results(1000)
+
+factory, acquire and the analysis function are sent to other processes, so they
+must be picklable (module level functions or functools.partial of them). When all
+slots are in use the acquisition waits for the analysis to free one, nothing is dropped.
+"""
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+from collections import namedtuple
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# A capture in slot of the ring. slot is -1 for an acquisition error (the text is metadata['error']).
+Capture = namedtuple('Capture', ['slot', 'sequence', 'shape', 'dtype', 'time', 'metadata'])
+
+# Slots start at multiples of this many bytes.
+SLOT_ALIGNMENT = 64
+
+
+def _attach(name):
+    """Open an existing shared memory block, its creator unlinks it."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # Child processes share the resource tracker of the creator, registering the name again is harmless.
+    return shared_memory.SharedMemory(name=name)
+
+
+class SharedRing():
+    """
+    Fixed size slots in shared memory with queues of the free slots and of the published captures.
+    Passing a SharedRing to a new process attaches it there to the same memory.
+    """
+
+    def __init__(self, slots=8, slot_bytes=1 << 24, context=None):
+        """
+        Parameters:
+        slots (int): Number of captures that can be in flight at once.
+        slot_bytes (int): Size of a slot, the largest capture in bytes.
+        context (str, optional): multiprocessing start method, e.g. "spawn". Defaults to the platform default.
+        """
+        if slots < 1:
+            raise ValueError(f"Invalid number of slots ({slots}). Must be at least 1.")
+        ctx = multiprocessing.get_context(context)
+        self.slots = slots
+        self.slot_bytes = -(-slot_bytes // SLOT_ALIGNMENT) * SLOT_ALIGNMENT
+        self.memory = shared_memory.SharedMemory(create=True, size=self.slots * self.slot_bytes)
+        # Forked processes share this object, only the creating process unlinks the memory.
+        self._owner = os.getpid()
+        self.free = ctx.Queue()
+        self.filled = ctx.Queue()
+        for slot in range(slots):
+            self.free.put(slot)
+
+    def __getstate__(self):
+        return {'name': self.memory.name, 'slots': self.slots, 'slot_bytes': self.slot_bytes,
+                'free': self.free, 'filled': self.filled}
+
+    def __setstate__(self, state):
+        self.slots = state['slots']
+        self.slot_bytes = state['slot_bytes']
+        self.free = state['free']
+        self.filled = state['filled']
+        self.memory = _attach(state['name'])
+        self._owner = None
+
+    def array(self, slot, shape, dtype):
+        """Writable array of shape and dtype at the start of slot."""
+        dtype = np.dtype(dtype)
+        nbytes = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+        if nbytes > self.slot_bytes:
+            raise ValueError(f"A capture of {nbytes} bytes does not fit in a slot of {self.slot_bytes} bytes.")
+        return np.ndarray(shape, dtype=dtype, buffer=self.memory.buf, offset=slot * self.slot_bytes)
+
+    def view(self, capture):
+        """Read-only array of a capture, valid until the capture is released."""
+        array = self.array(capture.slot, capture.shape, capture.dtype)
+        array.flags.writeable = False
+        return array
+
+    def acquire(self, timeout=None):
+        """A free slot, None if there was none within timeout s."""
+        try:
+            return self.free.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def publish(self, capture):
+        self.filled.put(capture)
+
+    def next(self, timeout=None):
+        """
+        The next published Capture, None at the end of the stream.
+
+        Raises:
+        TimeoutError: Nothing was published within timeout s.
+        """
+        try:
+            return self.filled.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No capture within {timeout} s.")
+
+    def release(self, capture):
+        """Return the slot of a capture for the next acquisition."""
+        if capture.slot >= 0:
+            self.free.put(capture.slot)
+
+    def finish(self):
+        """Mark the end of the stream. Every consumer puts the mark back for the others."""
+        self.filled.put(None)
+
+    def close(self):
+        try:
+            self.memory.close()
+        except BufferError:
+            # Arrays of the slots are still referenced, the memory is freed with the process.
+            pass
+        if self._owner == os.getpid():
+            self.memory.unlink()
+            self._owner = None
+
+
+def open_oscilloscope(address):
+    """Factory of an Oscilloscope, use functools.partial(open_oscilloscope, address)."""
+    from Instruments import transport
+    from Instruments.oscilloscope_rigol import Oscilloscope
+    return Oscilloscope(transport.open_resource(address))
+
+
+def open_spectrum_analyzer(address=None):
+    """Factory of a SpectrumAnalyzer on Spike (transport.SPIKE_ADDRESS by default)."""
+    from Instruments import transport
+    from Instruments.spectrum_analyzer_signal_hound import SpectrumAnalyzer
+    return SpectrumAnalyzer(transport.open_resource(address or transport.SPIKE_ADDRESS))
+
+
+def capture_channels(scope, allocate, sources=(1,), mode="RAW", trigger_timeout=None):
+    """
+    Acquisition of an AcquisitionService: one single acquisition of sources (see
+    Oscilloscope.acquire_channels), decoded straight into the slot as an
+    (n_sources, n_points) float32 array.
+
+    Returns:
+    dict: x0 and dx of the time axis in s.
+    """
+    scope.single()
+    scope.wait_for_acquisition(trigger_timeout)
+    _, axis = scope.acquire_channels(sources, mode, stop=False, allocate=allocate)
+    return {'x0': float(axis[0]), 'dx': float(axis[1] - axis[0]) if len(axis) > 1 else 0.0}
+
+
+def capture_trace(analyzer, allocate):
+    """
+    Acquisition of an AcquisitionService: one sweep of the spectrum analyzer (continuous
+    measurement should be off). The trace is parsed into its own array and copied into
+    the slot, a sweep is small next to the time it takes.
+    """
+    trace = next(analyzer.stream_traces(1))
+    allocate(trace.shape, trace.dtype)[...] = trace
+    return {}
+
+
+def _close_driver(driver):
+    instrument = getattr(driver, "instrument", None)
+    if instrument is not None and hasattr(instrument, "close"):
+        instrument.close()
+
+
+def _serve(factory, acquire, ring, control):
+    """Main loop of the service process: answer control commands and acquire while started."""
+    try:
+        driver = factory()
+    except Exception as e:
+        control.send(("error", f"Could not open the instrument: {type(e).__name__}: {e}"))
+        ring.close()
+        return
+    control.send(("ok", None))
+    sequence = 0
+    remaining = 0
+    acquiring = False
+    # Seconds spent acquiring and waiting for a free slot.
+    busy = waiting = 0.0
+    try:
+        while True:
+            if control.poll(0 if acquiring else None):
+                command, arguments = control.recv()
+                if command == "stop":
+                    break
+                try:
+                    if command == "start":
+                        acquiring, remaining = True, arguments[0]
+                        result = None
+                    elif command == "pause":
+                        acquiring, result = False, None
+                    elif command == "status":
+                        result = {'acquiring': acquiring, 'sequence': sequence, 'remaining': remaining,
+                                  'busy': busy, 'waiting': waiting}
+                    elif command == "call":
+                        method, args, kwargs = arguments
+                        result = getattr(driver, method)(*args, **kwargs)
+                    else:
+                        raise ValueError(f"Unknown command ({command}).")
+                    control.send(("ok", result))
+                except Exception as e:
+                    control.send(("error", f"{type(e).__name__}: {e}"))
+                continue
+            if not acquiring:
+                continue
+            start = time.perf_counter()
+            slot = ring.acquire(timeout=0.05)
+            waiting += time.perf_counter() - start
+            if slot is None:
+                continue
+            start = time.perf_counter()
+            stored = {}
+
+            def allocate(shape, dtype):
+                stored['shape'], stored['dtype'] = tuple(shape), np.dtype(dtype).str
+                return ring.array(slot, shape, dtype)
+
+            try:
+                metadata = acquire(driver, allocate)
+            except Exception as e:
+                ring.release(Capture(slot, sequence, None, None, None, None))
+                ring.publish(Capture(-1, sequence, None, None, time.time(), {'error': f"{type(e).__name__}: {e}"}))
+                acquiring = False
+                continue
+            busy += time.perf_counter() - start
+            ring.publish(Capture(slot, sequence, stored['shape'], stored['dtype'], time.time(), metadata or {}))
+            sequence += 1
+            if remaining is not None:
+                remaining -= 1
+                acquiring = remaining > 0
+    finally:
+        ring.finish()
+        _close_driver(driver)
+        control.send(("ok", None))
+        ring.close()
+
+
+def _analyze(ring, function, results):
+    """Main loop of an analysis process."""
+    while True:
+        capture = ring.next()
+        if capture is None:
+            ring.finish()
+            break
+        if capture.slot < 0:
+            results.put((capture.sequence, RuntimeError(capture.metadata['error'])))
+            continue
+        try:
+            result = function(ring.view(capture), capture)
+        except Exception as e:
+            result = e
+        finally:
+            ring.release(capture)
+        results.put((capture.sequence, result))
+    ring.close()
+
+
+class AnalysisPool():
+    """Processes applying function(array, capture) to the captures of a ring."""
+
+    def __init__(self, ring, function, workers=None, context=None):
+        """
+        Parameters:
+        ring (SharedRing): The ring the captures are published to.
+        function (callable): Called as function(array, capture) with the read-only array of the
+                             capture, which is only valid during the call. Must be picklable.
+        workers (int, optional): Number of processes, defaults to the number of CPUs.
+        context (str, optional): multiprocessing start method.
+        """
+        ctx = multiprocessing.get_context(context)
+        self._results = ctx.Queue()
+        self.processes = [ctx.Process(target=_analyze, args=(ring, function, self._results),
+                                      name=f"analysis-{i}", daemon=True)
+                          for i in range(workers or multiprocessing.cpu_count())]
+        for process in self.processes:
+            process.start()
+
+    def results(self, n, timeout=None):
+        """
+        The next n results as a list of (sequence, result), in the order they finished.
+        A capture whose analysis raised has the exception as its result.
+        """
+        try:
+            return [self._results.get(timeout=timeout) for _ in range(n)]
+        except queue.Empty:
+            raise TimeoutError(f"No analysis result within {timeout} s.")
+
+    def join(self, timeout=None):
+        """Wait for the processes, they end with the stream (AcquisitionService.close)."""
+        for process in self.processes:
+            process.join(timeout)
+
+
+class AcquisitionService():
+    """A process owning an instrument driver and publishing its captures to a SharedRing."""
+
+    def __init__(self, factory, acquire, slots=8, slot_bytes=1 << 24, context=None):
+        """
+        Parameters:
+        factory (callable): Opens the driver in the service process, e.g.
+                            functools.partial(open_oscilloscope, address).
+        acquire (callable): Takes one capture, called as acquire(driver, allocate) where
+                            allocate(shape, dtype) returns the array of the slot to write the
+                            capture into. Returns a dict of metadata (or None).
+        slots (int): Number of slots of the ring.
+        slot_bytes (int): Size of a slot in bytes.
+        context (str, optional): multiprocessing start method.
+
+        Raises:
+        RuntimeError: The driver could not be opened.
+        """
+        self.context = context
+        ctx = multiprocessing.get_context(context)
+        self.ring = SharedRing(slots, slot_bytes, context)
+        self._control, child = ctx.Pipe()
+        self._lock = threading.Lock()
+        self.process = ctx.Process(target=_serve, args=(factory, acquire, self.ring, child),
+                                   name="acquisition-service", daemon=True)
+        try:
+            self.process.start()
+        except Exception:
+            self.ring.close()
+            raise
+        finally:
+            # Only the service keeps its end, so recv sees EOF when the service dies.
+            child.close()
+        self._pools = []
+        try:
+            self._reply()
+        except RuntimeError:
+            self.process.join()
+            self.ring.close()
+            raise
+
+    def _reply(self):
+        try:
+            status, result = self._control.recv()
+        except EOFError:
+            raise RuntimeError("The acquisition service died.")
+        if status == "error":
+            raise RuntimeError(result)
+        return result
+
+    def _request(self, command, *arguments):
+        with self._lock:
+            if not self.process.is_alive():
+                raise RuntimeError("The acquisition service is not running.")
+            try:
+                self._control.send((command, arguments))
+            except (BrokenPipeError, EOFError):
+                raise RuntimeError("The acquisition service died.")
+            return self._reply()
+
+    def call(self, method, *args, **kwargs):
+        """Call a driver method in the service process and return its (picklable) result."""
+        return self._request("call", method, args, kwargs)
+
+    def start(self, n=None):
+        """Start acquiring n captures, None acquires until pause or close."""
+        self._request("start", n)
+
+    def pause(self):
+        self._request("pause")
+
+    def status(self):
+        """dict with acquiring, sequence (captures taken), remaining, busy and waiting (s waiting for free slots)."""
+        return self._request("status")
+
+    def analyze(self, function, workers=None):
+        """Start an AnalysisPool on the captures of the service."""
+        pool = AnalysisPool(self.ring, function, workers, self.context)
+        self._pools.append(pool)
+        return pool
+
+    def captures(self, n=None, timeout=None):
+        """
+        Consume captures in this process. Yields (array, capture), the read-only array is
+        only valid until the next capture is requested.
+        """
+        taken = 0
+        while n is None or taken < n:
+            capture = self.ring.next(timeout)
+            if capture is None:
+                self.ring.finish()
+                return
+            if capture.slot < 0:
+                raise RuntimeError(f"Acquisition {capture.sequence} failed: {capture.metadata['error']}")
+            try:
+                yield self.ring.view(capture), capture
+            finally:
+                self.ring.release(capture)
+            taken += 1
+
+    def close(self, timeout=10):
+        """Stop the service and the analysis pools and free the shared memory."""
+        with self._lock:
+            if self.process.is_alive():
+                try:
+                    self._control.send(("stop", None))
+                    if self._control.poll(timeout):
+                        self._control.recv()
+                except (BrokenPipeError, EOFError):
+                    # The service died, the join below reaps it.
+                    pass
+            self.process.join(timeout)
+            if self.process.is_alive():
+                self.process.terminate()
+        for pool in self._pools:
+            pool.join(timeout)
+        self.ring.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
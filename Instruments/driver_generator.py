@@ -0,0 +1,640 @@
+"""
+Generate a driver and a simulator from a SCPI programming manual.
+
+The manual text is parsed into a command schema (saved as JSON, see
+save_schema): every command header with its set and query forms, the type,
+choices and range of its parameter and its description. From the schema
+generate_driver writes a driver class in the style of template_instrument.py
+and generate_simulator a simulator.SimulatedInstrument to run it without
+hardware. Commands the SCPICommandTree modules already implement are not
+generated again: the driver delegates to the existing module, and the
+Mandatory commands (*IDN?, *RST, ...) are inherited.
+
+    python -m Instruments.driver_generator "Spike SCPI Programming Manual.pdf" SpikeAnalyzer \\
+        --name Spike --output Instruments/spectrum_analyzer_spike.py --schema spike_commands.json
+
+The parser reads the command tables of manuals like the Spike manual: a
+"Command" line followed by the other forms of the command, one per line, and a
+"Description" with "KEYWORD, text" entries. Review the generated driver
+against the manual before using it.
+"""
+import argparse
+import ast
+import builtins
+import functools
+import json
+import os
+import pprint
+import re
+import textwrap
+from collections import namedtuple
+
+from Instruments import simulator
+from Instruments import validation
+
+# SCPICommandTree module of each generic root header.
+GENERIC_HEADERS = {"CALC": "calculate.py", "CAL": "calibration.py", "CONT": "control.py", "DISP": "display.py",
+                   "FORM": "format.py", "HCOP": "hcopy.py", "INP": "input.py", "MEM": "memory.py",
+                   "MMEM": "mmemory.py", "OUTP": "output.py", "PROG": "program.py", "ROUT": "route.py",
+                   "SENS": "sense.py", "SOUR": "source.py", "STAT": "status.py", "SYST": "system.py",
+                   "TRAC": "trace.py", "TRIG": "trigger.py", "UNIT": "unit.py", "VXI": "vxi.py"}
+TREE_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "SCPICommandTree")
+# Modules whose commands a generated driver inherits instead of delegating to them.
+INHERITED_MODULES = ("mandatory",)
+
+BOOLEAN_WORDS = {"ON", "OFF", "0", "1"}
+INTEGER_PLACEHOLDERS = {"int", "integer"}
+STRING_PLACEHOLDERS = {"string", "filename", "name"}
+# Form lines of a command start with ':' or '*', or '[' for an optional root.
+FORM_START = (":", "*", "[")
+# Sections after the description of a command.
+SECTION_ENDS = ("Examples", "Software", "Couplings", "Preset", "Notes")
+DESCRIPTION_ENTRY = re.compile(r'^(?P<key>\*?[A-Za-z][\w:\[\]|]*\??),\s*(?P<text>.*)$')
+RANGES = [re.compile(r'\[\s*(-?\d+(?:\.\d+)?)\s*[-,]\s*(-?\d+(?:\.\d+)?)\s*\]'),
+          re.compile(r'between (-?\d+(?:\.\d+)?) and (-?\d+(?:\.\d+)?)\b(?!\s*[A-Za-z%])')]
+
+# A write or query of an existing SCPICommandTree method.
+ExistingCommand = namedtuple('ExistingCommand', ['module', 'class_name', 'method', 'header', 'query', 'arguments'])
+
+
+def read_manual(path):
+    """Text of a manual, a .pdf (needs pypdf) or a text file."""
+    if not path.lower().endswith(".pdf"):
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    try:
+        import pypdf
+    except ImportError:
+        raise ImportError("Reading PDF manuals needs pypdf (pip install pypdf), "
+                          "or pass the manual as a text file.")
+    reader = pypdf.PdfReader(path)
+    return "\n".join(page.extract_text() or "" for page in reader.pages)
+
+
+def parse_parameter(text):
+    """
+    Parameter of a command form as written in a manual, e.g. 'ON|OFF|0|1', '<int>' or '<freq>|UP|DOWN'.
+
+    Returns:
+    dict: type ('bool', 'choice', 'int', 'float', 'string' or 'raw'), values (choices or
+          keywords of a number), low/high (range) and optional. None without a parameter.
+    """
+    text = text.strip()
+    if not text:
+        return None
+    optional = text.startswith("[") and text.endswith("]")
+    if optional:
+        text = text[1:-1].strip()
+    parameter = {"type": "raw", "text": text}
+    tokens = [t.strip() for t in text.split("|") if t.strip()]
+    placeholders = [t[1:-1].lower() for t in tokens if t.startswith("<") and t.endswith(">")]
+    words = [t for t in tokens if not t.startswith("<")]
+    if "," in text or "…" in text or "..." in text or len(placeholders) > 1 or \
+            not all(re.fullmatch(r'[A-Za-z0-9.+-]+', w) for w in words):
+        pass
+    elif placeholders == ["bool"] or (tokens and {t.upper() for t in tokens} <= BOOLEAN_WORDS and len(tokens) > 1):
+        parameter = {"type": "bool"}
+    elif placeholders:
+        kind = placeholders[0]
+        if kind in INTEGER_PLACEHOLDERS:
+            parameter = {"type": "int", "values": words}
+        elif kind in STRING_PLACEHOLDERS:
+            parameter = {"type": "string"}
+        else:
+            parameter = {"type": "float", "values": words}
+    elif all(w.isdigit() for w in words):
+        parameter = {"type": "int", "values": [], "low": min(map(int, words)), "high": max(map(int, words))}
+    else:
+        parameter = {"type": "choice", "values": words}
+    if optional:
+        parameter["optional"] = True
+    return parameter
+
+
+def _node_forms(keyword):
+    return {keyword.upper(), validation.short_form(keyword).upper()}
+
+
+def _key_score(header, key):
+    """Number of keywords of a description key matching the end of header, 0 if it does not match."""
+    key_nodes = [k.upper() for k, _, _ in simulator.parse_header(key)]
+    nodes = simulator.parse_header(header)
+    for candidate in ([k for k, _, _ in nodes], [k for k, optional, _ in nodes if not optional]):
+        tail = candidate[-len(key_nodes):]
+        if key_nodes and len(tail) == len(key_nodes) and all(k in _node_forms(n) for k, n in zip(key_nodes, tail)):
+            return len(key_nodes)
+    return 0
+
+
+def _parameter_range(parameter, description):
+    if not parameter or parameter["type"] not in ("int", "float") or "low" in parameter:
+        return
+    for pattern in RANGES:
+        match = pattern.search(description or "")
+        if match:
+            convert = int if parameter["type"] == "int" else float
+            parameter["low"], parameter["high"] = convert(float(match.group(1))), convert(float(match.group(2)))
+            return
+
+
+def _finish_block(commands, forms, entries):
+    """Attach the description entries to the command forms of a block."""
+    for header, query in forms:
+        command = commands[header.rstrip("?")]
+        best = (0, 0, None)
+        for key, text in entries:
+            if key is None:
+                score = 1
+            else:
+                score = _key_score(header, key.rstrip("?"))
+            # An entry of the other form (with or without '?') only describes a command without this one.
+            same_form = (key or "").endswith("?") == query
+            if score and (same_form or key is None or not command["query" if not query else "set"]):
+                best = max(best, (score, int(same_form), text), key=lambda b: b[:2])
+        if best[2]:
+            field = "query_description" if query else "description"
+            if not command.get(field):
+                command[field] = best[2]
+    for header, query in forms:
+        command = commands[header.rstrip("?")]
+        _parameter_range(command.get("parameter"), command.get("description"))
+        _parameter_range(command.get("query_parameter"), command.get("query_description"))
+
+
+def parse_manual(text):
+    """
+    Extract the commands from the text of a programming manual.
+
+    Returns:
+    list: Command dictionaries: header (as in the manual, without '?'), set, query (which forms
+          exist), parameter, query_parameter (see parse_parameter), description, query_description.
+    """
+    commands = {}
+    forms = []
+    entries = []
+    state = None
+    for raw in text.splitlines():
+        line = raw.strip()
+        if line.startswith("Command "):
+            _close_block(commands, state, forms, entries)
+            state, forms, entries = "command", [], []
+            line = line[len("Command "):].strip()
+        if state == "command":
+            if line.startswith("Description"):
+                state = "description"
+                line = line[len("Description"):].strip()
+            elif line.startswith(FORM_START):
+                header, _, parameter = line.partition(" ")
+                forms.append([header, parameter.strip()])
+                continue
+            elif forms and "|" in line and (not forms[-1][1] or forms[-1][1].endswith("|")):
+                # Choices continued on the next line.
+                forms[-1][1] = (forms[-1][1] + line).strip()
+                continue
+            else:
+                continue
+        if state == "description":
+            if line.startswith(SECTION_ENDS):
+                _close_block(commands, state, forms, entries)
+                state = None
+                continue
+            match = DESCRIPTION_ENTRY.match(line)
+            if match and any(_key_score(h, match.group("key").rstrip("?")) for h, _ in forms):
+                entries.append([match.group("key"), match.group("text").strip()])
+            elif line and not line.isdigit():
+                if entries:
+                    entries[-1][1] = f"{entries[-1][1]} {line}"
+                else:
+                    entries.append([None, line])
+    _close_block(commands, state, forms, entries)
+    for command in commands.values():
+        if command["set"] and command["query"] and command["parameter"] is None and \
+                command["query_parameter"] is None and "description" in command and \
+                re.match(r'(Specify|Set|Enable|Select|Determine|Configure|Change)', command["description"]):
+            # The manual lists the set form without its parameter.
+            command["parameter"] = {"type": "raw", "text": ""}
+    return list(commands.values())
+
+
+def _close_block(commands, state, forms, entries):
+    if state == "command":
+        _add_forms(commands, forms)
+    elif state == "description":
+        _finish_block(commands, _add_forms(commands, forms), entries)
+
+
+def _add_forms(commands, forms):
+    """Merge the forms of a block into commands. Returns (header, query) of every form."""
+    added = []
+    for header, parameter in forms:
+        query = header.endswith("?")
+        key = header.rstrip("?")
+        command = commands.setdefault(key, {"header": key, "set": False, "query": False, "parameter": None,
+                                            "query_parameter": None})
+        if query:
+            command["query"] = True
+            if parameter:
+                command["query_parameter"] = parse_parameter(parameter)
+        else:
+            command["set"] = True
+            if parameter:
+                command["parameter"] = parse_parameter(parameter)
+        added.append((header, query))
+    # Forms are added once, the description part of the block only attaches descriptions.
+    forms.clear()
+    return added
+
+
+def save_schema(commands, path, source=None):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"source": source, "commands": commands}, f, indent=1)
+
+
+def load_schema(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["commands"]
+
+
+def _command_string(node, assignments):
+    """The command string of a write/query argument, with '1' for the formatted values."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.JoinedStr):
+        return "".join(v.value if isinstance(v, ast.Constant) else "1" for v in node.values)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        left, right = _command_string(node.left, assignments), _command_string(node.right, assignments)
+        return None if left is None else left + (right if right is not None else "1")
+    if isinstance(node, ast.Name) and node.id in assignments:
+        return _command_string(assignments[node.id], assignments)
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def existing_commands(directory=TREE_DIRECTORY):
+    """Every write and query of the SCPICommandTree methods, as a tuple of ExistingCommands."""
+    found = []
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith(".py"):
+            continue
+        with open(os.path.join(directory, filename), encoding="utf-8") as f:
+            tree = ast.parse(f.read())
+        for cls in (n for n in tree.body if isinstance(n, ast.ClassDef)):
+            for method in (n for n in cls.body if isinstance(n, ast.FunctionDef)):
+                if method.name.startswith("_"):
+                    continue
+                assignments = {t.id: n.value for n in ast.walk(method) if isinstance(n, ast.Assign)
+                               for t in n.targets if isinstance(t, ast.Name)}
+                arguments = method.args.args[1:]
+                defaults = [None] * (len(arguments) - len(method.args.defaults)) + method.args.defaults
+                signature = [(a.arg, None if d is None else ast.unparse(d)) for a, d in zip(arguments, defaults)]
+                for call in ast.walk(method):
+                    if not (isinstance(call, ast.Call) and isinstance(call.func, ast.Attribute)
+                            and call.func.attr in ("write", "query") and call.args):
+                        continue
+                    command = _command_string(call.args[0], assignments)
+                    if not command or not command.strip():
+                        continue
+                    header = command.strip().split(None, 1)[0]
+                    found.append(ExistingCommand(filename[:-3], cls.name, method.name, header.rstrip("?"),
+                                                 header.endswith("?"), signature))
+    return tuple(found)
+
+
+def _root_module(header):
+    required = [k for k, optional, _ in simulator.parse_header(header) if not optional]
+    return GENERIC_HEADERS.get(validation.short_form(required[0]).upper(), "")[:-3] if required else ""
+
+
+def find_existing(command, query, existing):
+    """The ExistingCommand implementing the set (query=False) or query form of command, None if there is none."""
+    pattern = simulator.header_pattern(command["header"])
+    header_of = lambda e: e.header if e.header.startswith((":", "*")) else ":" + e.header
+    matches = [e for e in existing if e.query == query and pattern.match(header_of(e)) and e.module != "common"]
+    if not matches:
+        return None
+    # Inherited commands first, then the module of the root header.
+    root = _root_module(command["header"])
+    matches.sort(key=lambda e: (e.module not in INHERITED_MODULES, e.module != root))
+    return matches[0]
+
+
+def _words(header, include_optional=False):
+    return [k.lstrip("*").lower() for k, optional, _ in simulator.parse_header(header)
+            if include_optional or not optional]
+
+
+def method_names(command, used=None):
+    """
+    Names of the set and query methods of a command (None for a missing form): enable_.../is_..._enabled
+    for ON|OFF parameters, set_.../get_... otherwise, and the header itself for commands without parameter.
+    """
+    used = set() if used is None else used
+    names = {}
+    for include_optional in (False, True):
+        words = _words(command["header"], include_optional)
+        boolean = (command.get("parameter") or {}).get("type") == "bool"
+        if boolean and len(words) > 1 and words[-1] == "state":
+            words = words[:-1]
+        base = "_".join(words)
+        if boolean:
+            names = {"set": f"enable_{base}", "query": f"is_{base}_enabled"}
+        elif command["set"] and not command.get("parameter"):
+            names = {"set": base, "query": f"get_{base}"}
+        else:
+            names = {"set": f"set_{base}", "query": f"get_{base}"}
+        if not any(names[form] in used for form in names if command[form]):
+            break
+    for form in names:
+        if command[form]:
+            name, n = names[form], 2
+            while name in used:
+                name, n = f"{names[form]}_{n}", n + 1
+            names[form] = name
+            used.add(name)
+        else:
+            names[form] = None
+    return names
+
+
+def _short_header(header):
+    """Short form command of a manual header with {name} fields for the suffixes, e.g. ':CALC:LLIN{lline}:STAT'."""
+    parts = []
+    for keyword, optional, suffixes in simulator.parse_header(header):
+        if optional:
+            continue
+        node = validation.short_form(keyword).upper()
+        if suffixes is not None:
+            node += "{" + keyword.lstrip("*").lower() + "}"
+        parts.append(node if keyword.startswith("*") else ":" + node)
+    return "".join(parts)
+
+
+def _suffix_arguments(header):
+    arguments = []
+    for keyword, optional, suffixes in simulator.parse_header(header):
+        if suffixes is None or optional:
+            continue
+        name = keyword.lstrip("*").lower()
+        check = f"validation.Choice({', '.join(map(str, suffixes))}, name=\"{name}\")" if suffixes else \
+            f"validation.Range(1, None, int, name=\"{name}\")"
+        arguments.append((name, check))
+    return arguments
+
+
+def _validator(parameter, name):
+    kind = parameter["type"]
+    keywords = ", ".join(f'"{v}"' for v in parameter.get("values", []))
+    if kind == "bool":
+        return f'validation.Boolean(name="{name}")'
+    if kind == "choice":
+        return f'validation.Choice({keywords}, name="{name}")'
+    if kind in ("int", "float"):
+        arguments = [repr(parameter.get("low")), repr(parameter.get("high")), kind]
+        if keywords:
+            arguments.append(f"keywords=({keywords},)")
+        return f'validation.Range({", ".join(arguments)}, name="{name}")'
+    return None
+
+
+def _describe(parameter):
+    kind = parameter["type"]
+    if kind == "bool":
+        return "bool", "ON|OFF, True/False or 1/0"
+    if kind == "choice":
+        return "str", "|".join(parameter["values"])
+    if kind in ("int", "float"):
+        limits = ""
+        if parameter.get("low") is not None or parameter.get("high") is not None:
+            limits = f" between {parameter.get('low')} and {parameter.get('high')}"
+        keywords = f" or {'|'.join(parameter['values'])}" if parameter.get("values") else ""
+        return kind, f"{'Integer' if kind == 'int' else 'Number'}{limits}{keywords}"
+    if kind == "string":
+        return "str", "Text, sent in quotes"
+    return "str or list", f"{parameter.get('text') or 'Value'} (lists are sent comma separated)"
+
+
+def _f_string(command):
+    quote = "'" if '"' in command else '"'
+    return ("f" if "{" in command else "") + quote + command + quote
+
+
+def _docstring(text, parameters, returns=None):
+    lines = textwrap.wrap(text or "See the programming manual.", 100)
+    if parameters:
+        lines += ["", "Parameters:"] + [f"{name} ({kind}): {info}" for name, kind, info in parameters]
+    if returns:
+        lines += ["", "Returns:", returns]
+    if len(lines) == 1:
+        return [f'        """{lines[0]}"""']
+    return ['        """'] + [f"        {line}" if line else "" for line in lines] + ['        """']
+
+
+def _decorator(arguments):
+    checks = [f"{n}={c}" for n, c in arguments if c]
+    if not checks:
+        return []
+    line = f"    @validation.validate({', '.join(checks)})"
+    if len(line) <= 120:
+        return [line]
+    # One argument per line.
+    indent = " " * len("    @validation.validate(")
+    lines = [f"{indent}{check}," for check in checks]
+    lines[0] = "    @validation.validate(" + lines[0].lstrip()
+    lines[-1] = lines[-1][:-1] + ")"
+    return lines
+
+
+def _set_method(command, name):
+    parameter = command.get("parameter")
+    arguments = _suffix_arguments(command["header"])
+    header = _short_header(command["header"])
+    docs = [(n, "int", "Numeric suffix of the header") for n, _ in arguments]
+    body = []
+    if parameter:
+        value = "state" if parameter["type"] == "bool" else "value"
+        check = _validator(parameter, value)
+        arguments.append((value, check))
+        docs.append((value,) + _describe(parameter))
+        if parameter["type"] == "string":
+            header += ' "{' + value + '}"'
+        else:
+            header += " {" + value + "}"
+        if parameter["type"] == "raw":
+            body.append(f"        if not isinstance({value}, str):")
+            body.append(f'            {value} = ",".join(str(v) for v in {value})')
+    lines = _decorator(arguments)
+    lines.append(f"    def {name}(self{''.join(', ' + n for n, _ in arguments)}):")
+    lines += _docstring(command.get("description"), docs)
+    lines += body
+    lines.append(f"        self.instrument.write({_f_string(header)})")
+    return lines
+
+
+def _query_method(command, name, setter=None):
+    parameter = command.get("parameter")
+    query_parameter = command.get("query_parameter")
+    arguments = _suffix_arguments(command["header"])
+    docs = [(n, "int", "Numeric suffix of the header") for n, _ in arguments]
+    header = _short_header(command["header"]) + "?"
+    signature = "".join(", " + n for n, _ in arguments)
+    query = _f_string(header)
+    if query_parameter:
+        check = _validator(query_parameter, "value")
+        arguments.append(("value", check))
+        docs.append(("value",) + _describe(query_parameter))
+        if query_parameter.get("optional"):
+            signature += ", value=None"
+            query = f"{_f_string(header + ' {value}')} if value is not None else {query}"
+        else:
+            signature += ", value"
+            query = _f_string(header + " {value}")
+    kind = parameter["type"] if parameter else None
+    response = f"self.instrument.query({query})"
+    if kind == "bool":
+        result, returns = f'{response}.strip().upper() in ("1", "ON", "TRUE")', "bool: True if enabled."
+    elif kind == "int":
+        result, returns = f"int(float({response}))", "int"
+    elif kind == "float":
+        result, returns = f"float({response})", "float"
+    else:
+        result, returns = f"{response}.strip()", "str"
+    lines = _decorator(arguments)
+    lines.append(f"    def {name}(self{signature}):")
+    description = command.get("query_description")
+    if not description:
+        description = f"Returns the setting of {setter}." if setter else command.get("description")
+    lines += _docstring(description, docs, returns)
+    lines.append(f"        return {result}")
+    return lines
+
+
+def _delegate_method(existing, name):
+    signature = "".join(f", {n}" if d is None else f", {n}={d}" for n, d in existing.arguments)
+    call = ", ".join(n for n, _ in existing.arguments)
+    return [f"    def {name}(self{signature}):",
+            f'        """See {existing.class_name}.{existing.method}."""',
+            f"        return self.{existing.module}.{existing.method}({call})"]
+
+
+def plan(commands, existing=None):
+    """
+    What the driver does for every command form.
+
+    Returns:
+    list: (command, form, method name, ExistingCommand or None, inherited) with form 'set' or 'query'.
+    """
+    existing = existing_commands() if existing is None else existing
+    used = set()
+    entries = []
+    for command in commands:
+        names = method_names(command, used)
+        for form in ("set", "query"):
+            if not command[form]:
+                continue
+            match = find_existing(command, form == "query", existing)
+            inherited = match is not None and match.module in INHERITED_MODULES
+            entries.append((command, form, names[form], match, inherited))
+    return entries
+
+
+def _module_alias(module):
+    return f"{module}_commands" if hasattr(builtins, module) else module
+
+
+def generate_driver(commands, class_name, name=None, source=None, existing=None):
+    """
+    Source of a driver module for the commands of a schema.
+
+    Parameters:
+    commands (list): The command schema, see parse_manual.
+    class_name (str): Name of the driver class.
+    name (str, optional): Value of self.name, defaults to class_name.
+    source (str, optional): The manual, mentioned in the module docstring.
+    existing (list, optional): ExistingCommands to reuse, defaults to existing_commands().
+    """
+    entries = plan(commands, existing)
+    modules = sorted({match.module for _, _, _, match, inherited in entries if match and not inherited})
+    lines = ['"""',
+             f"Driver for {name or class_name}, generated by driver_generator.py"
+             + (f" from {os.path.basename(source)}." if source else "."),
+             "Check the parameter types and ranges against the manual before use.",
+             '"""',
+             "from Instruments.SCPICommandTree import mandatory"]
+    for module in modules:
+        alias = _module_alias(module)
+        lines.append(f"from Instruments.SCPICommandTree import {module}" + (f" as {alias}" if alias != module else ""))
+    lines += ["from Instruments import validation", "", "",
+              f"class {class_name}(mandatory.Mandatory):", "",
+              "    def __init__(self, instrument):", "",
+              f'        self.name = "{name or class_name}"',
+              "        self.instrument = instrument"]
+    classes = {match.module: match.class_name for _, _, _, match, inherited in entries if match and not inherited}
+    for module in modules:
+        lines.append(f"        self.{module} = {_module_alias(module)}.{classes[module]}(self.instrument)")
+    setters = {command["header"]: method for command, form, method, _, _ in entries if form == "set"}
+    for command, form, method, match, inherited in entries:
+        if inherited:
+            continue
+        lines.append("")
+        if match is not None:
+            lines += _delegate_method(match, method)
+        elif form == "set":
+            lines += _set_method(command, method)
+        else:
+            lines += _query_method(command, method, setters.get(command["header"]))
+    return "\n".join(lines) + "\n"
+
+
+def generate_simulator(commands, class_name, source=None):
+    """Source of a module with a simulator.SimulatedInstrument for the commands of a schema."""
+    schema = [{key: command.get(key) for key in ("header", "set", "query", "parameter")} for command in commands]
+    return "\n".join([
+        '"""',
+        f"Simulator of {class_name}, generated by driver_generator.py"
+        + (f" from {os.path.basename(source)}." if source else "."),
+        '"""',
+        "from Instruments import simulator",
+        "",
+        "COMMANDS = " + pprint.pformat(schema, width=110, sort_dicts=False),
+        "",
+        "",
+        f"class {class_name}Simulator(simulator.SimulatedInstrument):",
+        "",
+        "    def __init__(self, responses=None):",
+        "        super().__init__(COMMANDS, responses)",
+        ""])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a driver and a simulator from a SCPI programming manual.")
+    parser.add_argument("manual", help="The manual, a .pdf or a text file, or a schema .json from --schema.")
+    parser.add_argument("class_name", help="Name of the driver class, e.g. SpikeAnalyzer.")
+    parser.add_argument("--name", help="Instrument name (self.name) as in instrumentPorts.json.")
+    parser.add_argument("--output", help="Driver module to write, the simulator goes next to it (_simulator.py).")
+    parser.add_argument("--schema", help="Also save the extracted command schema to this .json file.")
+    args = parser.parse_args(argv)
+
+    if args.manual.lower().endswith(".json"):
+        commands = load_schema(args.manual)
+    else:
+        commands = parse_manual(read_manual(args.manual))
+    if args.schema:
+        save_schema(commands, args.schema, os.path.basename(args.manual))
+    entries = plan(commands)
+    reused = sum(1 for entry in entries if entry[3] is not None and not entry[4])
+    inherited = sum(1 for entry in entries if entry[4])
+    print(f"{len(commands)} commands, {len(entries)} methods: {len(entries) - reused - inherited} generated, "
+          f"{reused} reused from SCPICommandTree, {inherited} inherited from Mandatory.")
+    driver = generate_driver(commands, args.class_name, args.name, args.manual)
+    simulation = generate_simulator(commands, args.class_name, args.manual)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(driver)
+        with open(args.output[:-3] + "_simulator.py", "w", encoding="utf-8") as f:
+            f.write(simulation)
+    else:
+        print(driver)
+
+
+if __name__ == "__main__":
+    main()
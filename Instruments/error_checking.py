@@ -0,0 +1,204 @@
+"""
+Checking the instrument error queue after batches of commands.
+
+Reading the error queue one :SYST:ERR:NEXT? at a time costs a round trip per entry, so
+nobody does it and bad commands go unnoticed. drain_errors reads up to depth
+entries with one compound query. ErrorCheckingResource wraps a resource, logs the
+commands sent since the last check and drains the queue after every batch (or every
+interval commands), attributing each error to the command that caused it:
+
+    checked = ErrorCheckingResource(instrument, raise_errors=True)
+    scope = Oscilloscope(checked)
+    with checked.batch():
+        scope.set_channel_range(1, 8)
+        scope.set_channel_scale(1, 1)
+
+With interval=1 every command is checked on its own and the attribution is exact.
+In larger batches an error is attributed by the command header the instrument
+quotes in the message, otherwise all commands of the batch are its candidates.
+
+The commands since the last check are kept in a list of their own, not taken from
+the log of a RecordingResource (traffic_recorder.py). That log is a file, written
+through a buffer and only complete after a flush, and error checking has to work
+without recording. Both wrappers can be stacked when both are wanted.
+"""
+import re
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+
+from Instruments import validation
+
+ERROR_QUERY = ":SYST:ERR:NEXT?"
+# Entries are 'code,"message"', the message may itself contain ';'.
+ERROR_SEPARATOR = re.compile(r';(?=\s*[+-]?\d+\s*,)')
+
+# An error from the queue. command is the command that caused it if it is known,
+# candidates the commands sent since the previous check.
+ErrorRecord = namedtuple('ErrorRecord', ['code', 'message', 'command', 'candidates', 'time'])
+
+
+class SCPIError(Exception):
+    """The instrument reported errors, see errors for the ErrorRecords."""
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__("; ".join(f"{e.code},{e.message}" + (f" (after {e.command})" if e.command else "")
+                                   for e in errors))
+
+
+def parse_errors(response):
+    """
+    Split the response to one or more :SYST:ERR:NEXT? queries.
+
+    Returns:
+    list: (code, message) of every entry, including 0,"No error".
+    """
+    errors = []
+    for entry in ERROR_SEPARATOR.split(response.strip()):
+        code, _, message = entry.strip().partition(",")
+        try:
+            errors.append((int(code), message.strip().strip('"')))
+        except ValueError:
+            raise ValueError(f"Invalid error queue entry ({entry}).")
+    return errors
+
+
+def drain_errors(resource, depth=8, error_query=ERROR_QUERY, max_queries=16):
+    """
+    Read the whole error queue, up to depth entries per round trip.
+
+    Parameters:
+    resource: Object with query, e.g. a pyvisa resource.
+    depth (int): Number of error queries combined in one message.
+    error_query (str): The query for the next error.
+    max_queries (int): Stop after this many round trips, even if the queue is not empty yet.
+
+    Returns:
+    list: (code, message) of the errors, oldest first. Empty if there were none.
+    """
+    errors = []
+    for _ in range(max_queries):
+        entries = parse_errors(resource.query(";".join([error_query] * depth)))
+        found = [entry for entry in entries if entry[0] != 0]
+        errors.extend(found)
+        # A "No error" entry means the queue is empty.
+        if len(found) < len(entries):
+            break
+    return errors
+
+
+def attribute_error(message, commands):
+    """
+    The command an error message belongs to, None if it cannot be told.
+
+    Parameters:
+    message (str): Message of the error, some instruments append the offending
+                   command after a ';'.
+    commands (list): Commands sent since the queue was last empty, oldest first.
+    """
+    if len(commands) == 1:
+        return commands[0]
+    _, _, detail = message.partition(";")
+    if detail.strip():
+        # The instrument may quote the header in short or long form, the driver may send either.
+        quoted = validation.header_nodes(detail)
+        matching = [c for c in commands if validation.header_nodes(c)[:len(quoted)] == quoted]
+        if matching:
+            return matching[-1]
+    return None
+
+
+class ErrorCheckingResource():
+    """
+    Resource that drains the instrument error queue after batches of commands and
+    records, prints or raises the errors. Attributes not defined here are passed
+    to the wrapped resource.
+    """
+
+    def __init__(self, resource, interval=None, raise_errors=False, depth=8, error_query=ERROR_QUERY):
+        """
+        Parameters:
+        resource: The resource to check, e.g. a pyvisa resource.
+        interval (int, optional): Check after every interval commands. None only checks at
+                                  the end of a batch() or when check() is called.
+        raise_errors (bool): Raise SCPIError when errors are found, otherwise they are printed.
+        depth (int): Error queries per round trip, see drain_errors.
+        error_query (str): The query for the next error.
+        """
+        object.__setattr__(self, 'resource', resource)
+        object.__setattr__(self, 'interval', interval)
+        object.__setattr__(self, 'raise_errors', raise_errors)
+        object.__setattr__(self, 'depth', depth)
+        object.__setattr__(self, 'error_query', error_query)
+        # Commands since the last check and all errors found so far.
+        object.__setattr__(self, 'pending', [])
+        object.__setattr__(self, 'errors', [])
+        object.__setattr__(self, '_batches', 0)
+
+    def _sent(self, command):
+        self.pending.append(command)
+        if self.interval is not None and self._batches == 0 and len(self.pending) >= self.interval:
+            self.check()
+
+    def write(self, message):
+        result = self.resource.write(message)
+        self._sent(message)
+        return result
+
+    def query(self, message):
+        result = self.resource.query(message)
+        self._sent(message)
+        return result
+
+    def read(self):
+        return self.resource.read()
+
+    def read_raw(self, *args):
+        return self.resource.read_raw(*args)
+
+    def check(self):
+        """
+        Drain the error queue and attribute the errors to the commands sent since the last check.
+
+        Returns:
+        list: The new ErrorRecords.
+        """
+        commands = list(self.pending)
+        self.pending.clear()
+        if not commands:
+            return []
+        now = time.time()
+        records = [ErrorRecord(code, message, attribute_error(message, commands), commands, now)
+                   for code, message in drain_errors(self.resource, self.depth, self.error_query)]
+        self.errors.extend(records)
+        if records:
+            if self.raise_errors:
+                raise SCPIError(records)
+            for record in records:
+                print(f"Instrument error {record.code},{record.message} after "
+                      f"{record.command if record.command else commands}")
+        return records
+
+    @contextmanager
+    def batch(self):
+        """Send commands without checks in between and check once at the end."""
+        object.__setattr__(self, '_batches', self._batches + 1)
+        try:
+            yield self
+        finally:
+            object.__setattr__(self, '_batches', self._batches - 1)
+        if self._batches == 0:
+            self.check()
+
+    def close(self):
+        self.resource.close()
+
+    def __getattr__(self, name):
+        return getattr(self.resource, name)
+
+    def __setattr__(self, name, value):
+        if name in ('interval', 'raise_errors', 'depth', 'error_query'):
+            object.__setattr__(self, name, value)
+            return
+        setattr(self.resource, name, value)
@@ -0,0 +1,240 @@
+"""
+Opt-in timing of the driver methods.
+
+enable() replaces the methods of the driver classes (Oscilloscope, SpectrumAnalyzer
+and the SCPICommandTree classes by default) with wrappers that count the calls and
+split their time into I/O time (spent in write/query/read/read_raw of the
+instrument) and host time (everything else: validation, formatting, parsing).
+disable() puts the original methods back, so nothing is left to slow down the
+drivers when instrumentation is off.
+
+    instrumentation.enable()
+    ...run the experiment...
+    print(instrumentation.REGISTRY.format_report())
+    instrumentation.REGISTRY.write_prometheus("driver_metrics.prom")
+    instrumentation.disable()
+
+Time is inclusive: a method calling another method counts the time of both.
+"""
+import functools
+import importlib
+import inspect
+import os
+import pkgutil
+import threading
+import time
+import weakref
+from collections import namedtuple
+
+MethodMetrics = namedtuple('MethodMetrics', ['calls', 'errors', 'host_time', 'io_time', 'io_calls'])
+
+# I/O time of the instrumented calls running on this thread, innermost last.
+_state = threading.local()
+
+
+def _frames():
+    frames = getattr(_state, 'frames', None)
+    if frames is None:
+        frames = _state.frames = []
+    return frames
+
+
+class MetricsRegistry():
+    """Call counts and times per method, safe to update from several threads."""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def add(self, name, duration, io_time=0.0, io_calls=0, error=False):
+        with self._lock:
+            calls, errors, total, io, n_io = self._metrics.get(name, (0, 0, 0.0, 0.0, 0))
+            self._metrics[name] = (calls + 1, errors + error, total + duration, io + io_time, n_io + io_calls)
+
+    def snapshot(self):
+        """A MethodMetrics per method name ('Class.method')."""
+        with self._lock:
+            metrics = dict(self._metrics)
+        return {name: MethodMetrics(calls, errors, total - io, io, n_io)
+                for name, (calls, errors, total, io, n_io) in metrics.items()}
+
+    def reset(self):
+        with self._lock:
+            self._metrics.clear()
+
+    def format_report(self, top=None):
+        """Table of the methods, most total time first."""
+        metrics = sorted(self.snapshot().items(), key=lambda m: m[1].host_time + m[1].io_time, reverse=True)
+        lines = [f"{'method':<56}{'calls':>8}{'host ms':>12}{'io ms':>12}{'io calls':>10}"]
+        for name, m in metrics[:top]:
+            lines.append(f"{name:<56}{m.calls:>8}{m.host_time * 1e3:>12.3f}{m.io_time * 1e3:>12.3f}{m.io_calls:>10}")
+        return "\n".join(lines)
+
+    def to_prometheus(self, prefix="scpi_driver"):
+        """The metrics in the Prometheus text exposition format."""
+        metrics = sorted(self.snapshot().items())
+        families = [("calls_total", "Driver method calls.", "calls"),
+                    ("errors_total", "Driver method calls that raised.", "errors"),
+                    ("host_seconds_total", "Time spent in the driver outside instrument I/O.", "host_time"),
+                    ("io_seconds_total", "Time spent in instrument I/O.", "io_time"),
+                    ("io_calls_total", "Instrument I/O calls.", "io_calls")]
+        lines = []
+        for suffix, description, field in families:
+            lines.append(f"# HELP {prefix}_{suffix} {description}")
+            lines.append(f"# TYPE {prefix}_{suffix} counter")
+            for name, m in metrics:
+                lines.append(f'{prefix}_{suffix}{{method="{name}"}} {getattr(m, field)}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path, prefix="scpi_driver"):
+        """Write to_prometheus to path, replacing the file at once (for textfile collectors)."""
+        temporary = path + ".tmp"
+        with open(temporary, "w") as f:
+            f.write(self.to_prometheus(prefix))
+        os.replace(temporary, path)
+
+
+REGISTRY = MetricsRegistry()
+
+
+class TimedResource():
+    """
+    Resource that adds the time of write/query/read/read_raw to the instrumented
+    method calls running on the same thread. Other attributes are passed through.
+    """
+
+    def __init__(self, resource):
+        object.__setattr__(self, 'resource', resource)
+
+    def _timed(self, method, *args):
+        frames = _frames()
+        if not frames:
+            return getattr(self.resource, method)(*args)
+        start = time.perf_counter()
+        try:
+            return getattr(self.resource, method)(*args)
+        finally:
+            duration = time.perf_counter() - start
+            for frame in frames:
+                frame[0] += duration
+                frame[1] += 1
+
+    def write(self, message):
+        return self._timed('write', message)
+
+    def query(self, message):
+        return self._timed('query', message)
+
+    def read(self):
+        return self._timed('read')
+
+    def read_raw(self, *args):
+        return self._timed('read_raw', *args)
+
+    def __getattr__(self, name):
+        return getattr(self.resource, name)
+
+    def __setattr__(self, name, value):
+        setattr(self.resource, name, value)
+
+
+def driver_classes():
+    """Oscilloscope, SpectrumAnalyzer and every class of the SCPICommandTree package."""
+    from Instruments import SCPICommandTree
+    from Instruments.oscilloscope_rigol import Oscilloscope
+    from Instruments.spectrum_analyzer_signal_hound import SpectrumAnalyzer
+    classes = [Oscilloscope, SpectrumAnalyzer]
+    for module_info in pkgutil.iter_modules(SCPICommandTree.__path__):
+        module = importlib.import_module(f"Instruments.SCPICommandTree.{module_info.name}")
+        classes.extend(c for _, c in inspect.getmembers(module, inspect.isclass) if c.__module__ == module.__name__)
+    return classes
+
+
+# Patched methods as (class, name, original), and the drivers whose instrument was wrapped.
+_patched = []
+_timed_drivers = weakref.WeakSet()
+
+
+def _wrap(function, name, registry):
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        instrument = self.__dict__.get('instrument')
+        if instrument is not None and not isinstance(instrument, TimedResource):
+            self.instrument = TimedResource(instrument)
+            _timed_drivers.add(self)
+        frames = _frames()
+        frame = [0.0, 0]
+        frames.append(frame)
+        error = False
+        start = time.perf_counter()
+        try:
+            return function(self, *args, **kwargs)
+        except BaseException:
+            error = True
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            frames.pop()
+            registry.add(name, duration, frame[0], frame[1], error)
+    return wrapper
+
+
+def is_enabled():
+    return bool(_patched)
+
+
+def enable(classes=None, registry=REGISTRY, include_private=False):
+    """
+    Start timing the methods of classes.
+
+    Parameters:
+    classes (list, optional): Classes to instrument, defaults to driver_classes(). Methods
+                              are patched on the class defining them, so subclasses are covered.
+    registry (MetricsRegistry): Where the metrics go.
+    include_private (bool): Also time the methods starting with an underscore (not the dunder methods).
+
+    The instrument of a driver is wrapped in a TimedResource at its first instrumented call.
+    """
+    if is_enabled():
+        raise RuntimeError("Instrumentation is already enabled, call disable() first.")
+    if classes is None:
+        classes = driver_classes()
+    done = set()
+    for cls in classes:
+        for owner in cls.__mro__:
+            if owner is object or owner in done:
+                continue
+            done.add(owner)
+            for name, attribute in list(vars(owner).items()):
+                # Generator functions are skipped, only their creation would be timed.
+                if not inspect.isfunction(attribute) or inspect.isgeneratorfunction(attribute) or name.startswith('__'):
+                    continue
+                if name.startswith('_') and not include_private:
+                    continue
+                _patched.append((owner, name, attribute))
+                setattr(owner, name, _wrap(attribute, f"{owner.__name__}.{name}", registry))
+
+
+def disable():
+    """Restore the original methods and instruments."""
+    while _patched:
+        owner, name, original = _patched.pop()
+        setattr(owner, name, original)
+    for driver in list(_timed_drivers):
+        if isinstance(driver.__dict__.get('instrument'), TimedResource):
+            driver.instrument = driver.instrument.resource
+    _timed_drivers.clear()
+
+
+class instrumented():
+    """Context manager enabling instrumentation: with instrumentation.instrumented(): ..."""
+
+    def __init__(self, classes=None, registry=REGISTRY, include_private=False):
+        self.arguments = (classes, registry, include_private)
+
+    def __enter__(self):
+        enable(*self.arguments)
+        return self.arguments[1]
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        disable()
@@ -0,0 +1,679 @@
+"""Host-side helpers for the Rigol oscilloscope.
+
+The functions and classes in this file work on data that has already been
+downloaded from the oscilloscope, so they do not talk to the instrument
+themselves (except for the convenience constructors that read the current
+settings from an Oscilloscope instance).
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from Instruments import validation
+
+#Measurement Items
+# Same names that Oscilloscope.get_measure_item/set_measure_item accept.
+MEASURE_ITEMS = ("VMAX", "VMIN", "VPP", "VTOP", "VBASe", "VAMP", "VAVG", "VRMS",
+                 "OVERshoot", "PREShoot", "MARea", "MPARea", "PERiod", "FREQuency",
+                 "RTIMe", "FTIMe", "PWIDth", "NWIDth", "PDUTy", "NDUTy", "RDELay",
+                 "FDELay", "RPHase", "FPHase", "TVMAX", "TVMIN", "PSLEWrate",
+                 "NSLEWrate", "VUPper", "VMID", "VLOWer", "VARIance", "PVRMS",
+                 "PPULses", "NPULses", "PEDGes", "NEDGes")
+
+# Items that need a second source (source B).
+TWO_SOURCE_ITEMS = frozenset({"RDELay", "FDELay", "RPHase", "FPHase"})
+
+
+# Accepts the long and the short form in any case.
+_MEASURE_ITEM = validation.Choice(*MEASURE_ITEMS, name="measurement item")
+
+
+def canonical_measure_item(item):
+    """
+    Return the canonical measurement item name for item.
+
+    Accepts the long form, the short form or any capitalisation of either,
+    e.g. "FREQuency", "FREQ" and "frequency" all return "FREQuency".
+    Raises ValueError if item is not a valid measurement item.
+    """
+    return _MEASURE_ITEM(item)
+
+
+#Waveform Decoding
+def parse_tmc_block(data):
+    """
+    Strip the TMC block header (#N followed by N length digits) from a binary response.
+
+    Parameters:
+    data (bytes): The raw response, e.g. b'#9000001200' followed by the data.
+
+    Returns:
+    memoryview: The data of the block. No copy of the response is made.
+    """
+    view = memoryview(data)
+    start = bytes(view[:64]).find(b'#')
+    if start < 0 or len(view) < start + 2:
+        raise ValueError("Response does not contain a TMC block header.")
+    digits = view[start + 1:start + 2].tobytes()
+    if not digits.isdigit():
+        raise ValueError(f"Invalid TMC block header ({bytes(view[start:start + 2])}).")
+    n = int(digits)
+    if n == 0:
+        # Indefinite length block, terminated by the newline.
+        payload = view[start + 2:]
+        return payload[:-1] if bytes(payload[-1:]) == b'\n' else payload
+    header = view[start + 2:start + 2 + n].tobytes()
+    if len(header) != n or not header.isdigit():
+        raise ValueError(f"Invalid TMC block header ({bytes(view[start:start + 2 + n])}).")
+    begin = start + 2 + n
+    length = int(header)
+    if len(view) < begin + length:
+        raise ValueError(f"TMC block is truncated: expected {length} bytes, got {len(view) - begin}.")
+    return view[begin:begin + length]
+
+
+def decode_waveform(raw, preamble, out=None):
+    """
+    Convert raw BYTE/WORD waveform codes to voltages using the waveform preamble.
+
+    Parameters:
+    raw (array-like): The waveform codes read with :WAVeform:DATA? (TMC header removed).
+    preamble (dict): The dictionary returned by Oscilloscope.get_waveform_preamble().
+    out (np.ndarray, optional): Float array to write the result into.
+
+    Returns:
+    np.ndarray: Voltage = (code - yorigin - yreference) * yincrement.
+    """
+    codes = np.asarray(raw)
+    if codes.dtype == np.uint16:
+        # WORD format, only the lower 8 bits are valid.
+        codes = codes & 0xFF
+    if out is None:
+        out = np.empty(codes.shape, dtype=np.float32)
+    np.copyto(out, codes, casting='unsafe')
+    out -= preamble['yorigin'] + preamble['yreference']
+    out *= preamble['yincrement']
+    return out
+
+
+def waveform_time_axis(preamble, points=None):
+    """
+    Return the time of every point described by the waveform preamble.
+
+    Parameters:
+    preamble (dict): The dictionary returned by Oscilloscope.get_waveform_preamble().
+    points (int, optional): Number of points. Defaults to preamble['points'].
+
+    Returns:
+    np.ndarray: time = (i - xreference) * xincrement + xorigin.
+    """
+    if points is None:
+        points = preamble['points']
+    index = np.arange(points, dtype=np.float64)
+    return (index - preamble['xreference']) * preamble['xincrement'] + preamble['xorigin']
+
+
+#Measurement Engine
+_executors = {}
+
+
+def _get_executor(workers):
+    """Return a shared thread pool with the given number of workers."""
+    if workers not in _executors:
+        _executors[workers] = ThreadPoolExecutor(max_workers=workers)
+    return _executors[workers]
+
+
+def _crossing_positions(values, index, level):
+    """
+    Fractional sample position where the waveform crosses level between
+    sample index-1 and sample index.
+    """
+    before = values[index - 1].astype(np.float64)
+    after = values[index].astype(np.float64)
+    step = after - before
+    step[step == 0] = np.nan
+    return (index - 1) + (level - before) / step
+
+
+class WaveformMeasurement():
+    """
+    Compute the oscilloscope's :MEASure items on a downloaded waveform.
+
+    The scope only measures the data that is on screen. This class computes the
+    same parameters over the full memory depth of a capture. The waveform is
+    split into chunks that are reduced in parallel (NumPy releases the GIL), so
+    a 24 Mpts capture is analysed using every core.
+
+    Thresholds are percentages of the amplitude (VTOP - VBASe), with the same
+    ranges as set_measure_setup_max/mid/min_threshold. Time based items are
+    averaged over every complete edge/period in the capture. Items that cannot
+    be measured (e.g. the period of a DC signal) are returned as NaN.
+    """
+
+    def __init__(self, waveform, xincrement, xorigin=0.0, max_threshold=90,
+                 mid_threshold=50, min_threshold=10, workers=None, chunk_size=1 << 20):
+        """
+        Parameters:
+        waveform (array-like): The decoded waveform in volts (see decode_waveform).
+        xincrement (float): Time between two samples in seconds.
+        xorigin (float): Time of the first sample in seconds.
+        max_threshold (int): Upper threshold, 7 to 95 percent.
+        mid_threshold (int): Middle threshold, 6 to 94 percent.
+        min_threshold (int): Lower threshold, 5 to 93 percent.
+        workers (int, optional): Number of threads. Defaults to the number of cores.
+        chunk_size (int): Number of samples per chunk.
+        """
+        if not 7 <= max_threshold <= 95:
+            raise ValueError(f"Invalid max threshold ({max_threshold}). Must be between 7 and 95.")
+        if not 6 <= mid_threshold <= 94:
+            raise ValueError(f"Invalid mid threshold ({mid_threshold}). Must be between 6 and 94.")
+        if not 5 <= min_threshold <= 93:
+            raise ValueError(f"Invalid min threshold ({min_threshold}). Must be between 5 and 93.")
+        if not min_threshold < mid_threshold < max_threshold:
+            raise ValueError("Thresholds must satisfy min < mid < max.")
+
+        self.waveform = np.ascontiguousarray(waveform).ravel()
+        if self.waveform.size < 2:
+            raise ValueError("A waveform needs at least two points to be measured.")
+        self.xincrement = float(xincrement)
+        self.xorigin = float(xorigin)
+        self.thresholds = (max_threshold, mid_threshold, min_threshold)
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = int(chunk_size)
+
+        self._stats = None
+        self._levels = None
+        self._edges = None
+        self._cache = {}
+
+    @classmethod
+    def from_oscilloscope(cls, scope, waveform, preamble, **kwargs):
+        """
+        Build a measurement using the threshold settings of the oscilloscope.
+
+        Parameters:
+        scope (Oscilloscope): Used to read the :MEASure:SETup thresholds.
+        waveform (array-like): The decoded waveform in volts.
+        preamble (dict): The dictionary returned by get_waveform_preamble().
+        """
+        return cls(waveform, preamble['xincrement'], preamble['xorigin'],
+                   max_threshold=scope.get_measure_setup_max_threshold(),
+                   mid_threshold=scope.get_measure_setup_mid_threshold(),
+                   min_threshold=scope.get_measure_setup_min_threshold(),
+                   **kwargs)
+
+    #Chunked Reductions
+    def _chunk_bounds(self):
+        n = self.waveform.size
+        return [(start, min(start + self.chunk_size, n)) for start in range(0, n, self.chunk_size)]
+
+    def _map_chunks(self, func):
+        bounds = self._chunk_bounds()
+        if len(bounds) == 1 or self.workers == 1:
+            return [func(start, stop) for start, stop in bounds]
+        return list(_get_executor(self.workers).map(lambda b: func(*b), bounds))
+
+    def _chunk_stats(self, start, stop):
+        chunk = self.waveform[start:stop]
+        as_double = chunk.astype(np.float64, copy=False)
+        imin = int(np.argmin(chunk))
+        imax = int(np.argmax(chunk))
+        return (chunk[imin], imin + start, chunk[imax], imax + start,
+                float(as_double.sum()), float(np.dot(as_double, as_double)))
+
+    def _get_stats(self):
+        if self._stats is None:
+            parts = self._map_chunks(self._chunk_stats)
+            vmin, imin = min(((p[0], p[1]) for p in parts), key=lambda p: p[0])
+            vmax, imax = max(((p[2], p[3]) for p in parts), key=lambda p: p[0])
+            n = self.waveform.size
+            total = sum(p[4] for p in parts)
+            total_sq = sum(p[5] for p in parts)
+            mean = total / n
+            self._stats = {
+                'min': float(vmin), 'argmin': imin,
+                'max': float(vmax), 'argmax': imax,
+                'sum': total, 'mean': mean,
+                'rms': float(np.sqrt(total_sq / n)),
+                'variance': max(total_sq / n - mean * mean, 0.0),
+            }
+        return self._stats
+
+    def _get_levels(self, bins=256):
+        """VTOP/VBASe from the histogram modes of the upper and lower half of the waveform."""
+        if self._levels is None:
+            stats = self._get_stats()
+            vmin, vmax = stats['min'], stats['max']
+            if vmax == vmin:
+                top, base = vmax, vmin
+            else:
+                scale = bins / (vmax - vmin)
+
+                def histogram(start, stop):
+                    index = ((self.waveform[start:stop] - vmin) * scale).astype(np.intp)
+                    np.clip(index, 0, bins - 1, out=index)
+                    return np.bincount(index, minlength=bins)
+
+                counts = sum(self._map_chunks(histogram))
+                centers = vmin + (np.arange(bins) + 0.5) / scale
+                half = bins // 2
+                upper, lower = counts[half:], counts[:half]
+                # A flat level needs a clear histogram peak, otherwise
+                # (sine, triangle) the extremes are used like the scope does.
+                minimum = 0.05 * self.waveform.size / half
+                top = centers[half + np.argmax(upper)] if upper.max() > minimum else vmax
+                base = centers[np.argmax(lower)] if lower.max() > minimum else vmin
+            amplitude = top - base
+            max_t, mid_t, min_t = self.thresholds
+            self._levels = {
+                'top': float(top), 'base': float(base), 'amplitude': float(amplitude),
+                'upper': float(base + amplitude * max_t / 100.0),
+                'mid': float(base + amplitude * mid_t / 100.0),
+                'lower': float(base + amplitude * min_t / 100.0),
+            }
+        return self._levels
+
+    def _chunk_edges(self, start, stop, lower, upper, mid):
+        chunk = self.waveform[start:stop]
+        state = np.zeros(chunk.size, dtype=np.int8)
+        state[chunk <= lower] = -1
+        state[chunk >= upper] = 1
+        defined = np.flatnonzero(state)
+
+        # Mid-level crossings, including the one between this chunk and the previous one.
+        first = max(start - 1, 0)
+        ext = self.waveform[first:stop]
+        above = ext >= mid
+        cross = np.flatnonzero(above[1:] != above[:-1]) + 1 + first
+        rising_mid = cross[self.waveform[cross] >= mid]
+        falling_mid = cross[self.waveform[cross] < mid]
+
+        if defined.size == 0:
+            return None, rising_mid, falling_mid
+        states = state[defined]
+        change = np.flatnonzero(states[1:] != states[:-1]) + 1
+        return ((defined[0] + start, states[0], defined[-1] + start, states[-1],
+                 defined[change - 1] + start, defined[change] + start, states[change]),
+                rising_mid, falling_mid)
+
+    def _get_edges(self):
+        """
+        Find every rising and falling edge with hysteresis between the lower
+        and upper thresholds, and interpolate the threshold crossing times.
+        """
+        if self._edges is None:
+            levels = self._get_levels()
+            lower, upper, mid = levels['lower'], levels['upper'], levels['mid']
+            parts = self._map_chunks(lambda a, b: self._chunk_edges(a, b, lower, upper, mid))
+
+            starts, ends, directions = [], [], []
+            last_index, last_state = None, 0
+            for chunk_edges, _, _ in parts:
+                if chunk_edges is None:
+                    continue
+                first_index, first_state, chunk_last_index, chunk_last_state, s, e, d = chunk_edges
+                if last_state and first_state != last_state:
+                    starts.append(np.array([last_index]))
+                    ends.append(np.array([first_index]))
+                    directions.append(np.array([first_state], dtype=np.int8))
+                starts.append(s)
+                ends.append(e)
+                directions.append(d)
+                last_index, last_state = chunk_last_index, chunk_last_state
+
+            start = np.concatenate(starts) if starts else np.empty(0, dtype=np.intp)
+            end = np.concatenate(ends) if ends else np.empty(0, dtype=np.intp)
+            direction = np.concatenate(directions) if directions else np.empty(0, dtype=np.int8)
+            rising_mid = np.concatenate([p[1] for p in parts])
+            falling_mid = np.concatenate([p[2] for p in parts])
+
+            v = self.waveform
+            rise = direction > 0
+            fall = ~rise
+            r_start, r_end = start[rise], end[rise]
+            f_start, f_end = start[fall], end[fall]
+
+            # Rising: leaves lower between start and start+1, reaches upper between end-1 and end.
+            r_lower = _crossing_positions(v, r_start + 1, lower)
+            r_upper = _crossing_positions(v, r_end, upper)
+            f_upper = _crossing_positions(v, f_start + 1, upper)
+            f_lower = _crossing_positions(v, f_end, lower)
+
+            # The first mid-level crossing after the edge started.
+            r_mid_index = rising_mid[np.searchsorted(rising_mid, r_start + 1)] if r_start.size else r_start
+            f_mid_index = falling_mid[np.searchsorted(falling_mid, f_start + 1)] if f_start.size else f_start
+
+            self._edges = {
+                'rise_time': (r_upper - r_lower) * self.xincrement,
+                'fall_time': (f_lower - f_upper) * self.xincrement,
+                'rising_mid': _crossing_positions(v, r_mid_index, mid),
+                'falling_mid': _crossing_positions(v, f_mid_index, mid),
+            }
+        return self._edges
+
+    #Derived Items
+    def _period_samples(self):
+        rising = self._get_edges()['rising_mid']
+        if rising.size >= 2:
+            return float(np.mean(np.diff(rising)))
+        falling = self._get_edges()['falling_mid']
+        if falling.size >= 2:
+            return float(np.mean(np.diff(falling)))
+        return np.nan
+
+    def _widths(self, first, second):
+        """Distance from every crossing in first to the next crossing in second."""
+        if first.size == 0 or second.size == 0:
+            return np.empty(0)
+        following = np.searchsorted(second, first, side='right')
+        valid = following < second.size
+        return second[following[valid]] - first[valid]
+
+    def _first_period(self):
+        """Sample range [start, stop) of the first complete period."""
+        rising = self._get_edges()['rising_mid']
+        if rising.size < 2:
+            return None
+        return int(np.ceil(rising[0])), int(np.ceil(rising[1]))
+
+    def _compute(self, item, other):
+        stats = self._get_stats()
+        dt = self.xincrement
+        if item in ("VMAX", "VMIN", "VPP", "VAVG", "VRMS", "VARIance", "TVMAX", "TVMIN", "MARea"):
+            return {
+                "VMAX": stats['max'],
+                "VMIN": stats['min'],
+                "VPP": stats['max'] - stats['min'],
+                "VAVG": stats['mean'],
+                "VRMS": stats['rms'],
+                "VARIance": stats['variance'],
+                "TVMAX": self.xorigin + stats['argmax'] * dt,
+                "TVMIN": self.xorigin + stats['argmin'] * dt,
+                "MARea": stats['sum'] * dt,
+            }[item]
+
+        levels = self._get_levels()
+        amplitude = levels['amplitude']
+        if item in ("VTOP", "VBASe", "VAMP", "VUPper", "VMID", "VLOWer"):
+            return {"VTOP": levels['top'], "VBASe": levels['base'], "VAMP": amplitude,
+                    "VUPper": levels['upper'], "VMID": levels['mid'], "VLOWer": levels['lower']}[item]
+        if item == "OVERshoot":
+            return (stats['max'] - levels['top']) / amplitude if amplitude else np.nan
+        if item == "PREShoot":
+            return (levels['base'] - stats['min']) / amplitude if amplitude else np.nan
+
+        edges = self._get_edges()
+        rising, falling = edges['rising_mid'], edges['falling_mid']
+        period = self._period_samples() * dt
+        if item == "PERiod":
+            return period
+        if item == "FREQuency":
+            return 1.0 / period if period else np.nan
+        if item == "RTIMe":
+            return float(np.mean(edges['rise_time'])) if edges['rise_time'].size else np.nan
+        if item == "FTIMe":
+            return float(np.mean(edges['fall_time'])) if edges['fall_time'].size else np.nan
+        if item in ("PWIDth", "PDUTy", "PPULses"):
+            widths = self._widths(rising, falling)
+            if item == "PPULses":
+                return widths.size
+            width = float(np.mean(widths)) * dt if widths.size else np.nan
+            return width if item == "PWIDth" else width / period
+        if item in ("NWIDth", "NDUTy", "NPULses"):
+            widths = self._widths(falling, rising)
+            if item == "NPULses":
+                return widths.size
+            width = float(np.mean(widths)) * dt if widths.size else np.nan
+            return width if item == "NWIDth" else width / period
+        if item == "PEDGes":
+            return rising.size
+        if item == "NEDGes":
+            return falling.size
+        if item == "PSLEWrate":
+            rise = self._compute("RTIMe", None)
+            return (levels['upper'] - levels['lower']) / rise if rise else np.nan
+        if item == "NSLEWrate":
+            fall = self._compute("FTIMe", None)
+            return (levels['lower'] - levels['upper']) / fall if fall else np.nan
+        if item in ("MPARea", "PVRMS"):
+            bounds = self._first_period()
+            if bounds is None:
+                return np.nan
+            segment = self.waveform[bounds[0]:bounds[1]].astype(np.float64)
+            if item == "MPARea":
+                return float(segment.sum()) * dt
+            return float(np.sqrt(np.mean(segment * segment)))
+
+        # Two source items: delay/phase from this waveform (A) to other (B).
+        if other is None:
+            raise ValueError(f"Measurement item {item} needs a second waveform.")
+        key = 'rising_mid' if item in ("RDELay", "RPHase") else 'falling_mid'
+        mine, theirs = edges[key], other._get_edges()[key]
+        if mine.size == 0 or theirs.size == 0:
+            return np.nan
+        delay = (other.xorigin + theirs[0] * other.xincrement) - (self.xorigin + mine[0] * dt)
+        if item in ("RDELay", "FDELay"):
+            return delay
+        return delay / period * 360.0 if period else np.nan
+
+    def get_measure_item(self, item, other=None):
+        """
+        Compute one measurement item.
+
+        Parameters:
+        item (str): The waveform parameter, same names as Oscilloscope.get_measure_item.
+        other (WaveformMeasurement, optional): Source B, required for RDELay, FDELay,
+                                               RPHase and FPHase.
+
+        Returns:
+        float: The measurement result (NaN if it cannot be measured).
+        """
+        item = canonical_measure_item(item)
+        if item in TWO_SOURCE_ITEMS:
+            return self._compute(item, other)
+        if item not in self._cache:
+            self._cache[item] = self._compute(item, None)
+        return self._cache[item]
+
+    def measure_all(self, items=None, other=None):
+        """
+        Compute several measurement items at once.
+
+        Parameters:
+        items (list, optional): The items to compute. Defaults to every single source item
+                                (and the two source items as well when other is given).
+        other (WaveformMeasurement, optional): Source B for the two source items.
+
+        Returns:
+        dict: {item: value}
+        """
+        if items is None:
+            items = [i for i in MEASURE_ITEMS if other is not None or i not in TWO_SOURCE_ITEMS]
+        return {item: self.get_measure_item(item, other) for item in items}
+
+
+#Event Table
+# Value of an empty cell in an integer column of the event table.
+MISSING_INTEGER = -1
+_TIME_UNITS = {"ps": 1e-12, "ns": 1e-9, "us": 1e-6, "ms": 1e-3, "s": 1.0}
+
+
+def _column_name(name, used):
+    """Lower case identifier for a column header, unique among used."""
+    name = "".join(c if c.isalnum() else "_" for c in name.strip().lower()).strip("_") or "column"
+    if name == "error":
+        name = "error_text"
+    base, i = name, 2
+    while name in used:
+        name, i = f"{base}_{i}", i + 1
+    used.add(name)
+    return name
+
+
+def _to_seconds(values):
+    """Convert time strings such as '-4.0e-04' or '12.5us' to seconds."""
+    try:
+        return values.astype(np.float64)
+    except ValueError:
+        pass
+    result = np.empty(values.shape, dtype=np.float64)
+    for i, value in enumerate(values):
+        value = value.strip()
+        number, scale = value, 1.0
+        for unit in ("ps", "ns", "us", "ms", "s"):
+            if value.lower().endswith(unit):
+                number, scale = value[:-len(unit)], _TIME_UNITS[unit]
+                break
+        try:
+            result[i] = float(number) * scale
+        except ValueError:
+            result[i] = np.nan
+    return result
+
+
+def _to_integers(values):
+    """
+    Convert a column of decimal or 0x hexadecimal strings to int64, or return None.
+    Empty cells become MISSING_INTEGER, so the column type does not depend on them.
+    """
+    empty = values == ""
+    filled = values[~empty]
+    try:
+        numbers = filled.astype(np.int64)
+    except ValueError:
+        if not np.all(np.char.startswith(np.char.upper(filled), "0X")):
+            return None
+        try:
+            numbers = np.fromiter((int(v, 16) for v in filled), dtype=np.int64, count=filled.size)
+        except ValueError:
+            return None
+    result = np.full(values.shape, MISSING_INTEGER, dtype=np.int64)
+    result[~empty] = numbers
+    return result
+
+
+def _split_rows(lines, n_columns):
+    """Split CSV lines into an (n_rows, n_columns) string array."""
+    if all(line.count(",") == n_columns - 1 for line in lines):
+        fields = ",".join(lines).split(",")
+    else:
+        # Rows with missing or extra fields, pad or cut them row by row.
+        fields = []
+        for line in lines:
+            row = line.split(",")[:n_columns]
+            fields.extend(row + [""] * (n_columns - len(row)))
+    return np.char.strip(np.array(fields, dtype=str).reshape(len(lines), n_columns))
+
+
+def _table_lines(data):
+    """Non-empty text lines of an event table block."""
+    text = bytes(data).decode("ascii", errors="replace").replace("\r", "")
+    return [line for line in text.split("\n") if line.strip()]
+
+
+def _find_header(lines):
+    """Index of the header line (the line with the Time column)."""
+    for i, line in enumerate(lines):
+        if any(field.strip().upper().startswith("TIME") for field in line.split(",")):
+            return i
+    raise ValueError("Event table has no header line with a Time column.")
+
+
+def parse_event_table(data, as_dict=False, header=None):
+    """
+    Parse the decoder event table (Oscilloscope.get_event_table_data) into columns.
+
+    The table is CSV text with a header line that contains the Time column, followed by
+    one line per decoded frame. Time is converted to seconds, data columns in DEC or HEX
+    format to integers (empty cells are MISSING_INTEGER, ASCII columns stay strings) and
+    an error flag is set for every row that contains an error.
+
+    Parameters:
+    data (bytes or memoryview): The event table without TMC header.
+    as_dict (bool): Return a dict of column arrays instead of a structured array.
+    header (str, optional): The header line, for data that only contains rows.
+
+    Returns:
+    numpy.ndarray or dict: Structured array with the fields 'time', one field per table
+                           column (lower case names) and 'error'.
+    """
+    lines = _table_lines(data)
+    if header is None:
+        i = _find_header(lines)
+        header, lines = lines[i], lines[i + 1:]
+    titles = header.split(",")
+    used = {"time"}
+    names = []
+    for title in titles:
+        if title.strip().upper().startswith("TIME") and "time" not in names:
+            names.append("time")
+        else:
+            names.append(_column_name(title, used))
+    table = _split_rows(lines, len(names)) if lines else np.empty((0, len(names)), dtype=str)
+
+    columns = {}
+    errors = np.zeros(len(lines), dtype=bool)
+    for i, name in enumerate(names):
+        values = table[:, i]
+        if name == "time":
+            columns[name] = _to_seconds(values)
+            continue
+        if "err" in titles[i].lower():
+            # Error text, empty when the frame is fine.
+            errors |= values != ""
+            columns[name] = values
+            continue
+        errors |= np.char.find(np.char.upper(values), "ERR") >= 0
+        integers = _to_integers(values)
+        columns[name] = integers if integers is not None else values
+    columns["error"] = errors
+    if as_dict:
+        return columns
+    result = np.empty(len(lines), dtype=[(name, values.dtype) for name, values in columns.items()])
+    for name, values in columns.items():
+        result[name] = values
+    return result
+
+
+class EventTableTracker():
+    """
+    Return only the rows that were added to the event table since the last update.
+
+    While the decoder runs, the event table grows at the end. When the new table starts
+    with the previously seen data only the added part is parsed. Otherwise (the table was
+    cleared or re-sorted) the whole table is returned and tracking starts over. A table
+    without header line yet gives no rows.
+    """
+
+    def __init__(self, as_dict=False):
+        self.as_dict = as_dict
+        self.header = None
+        self._seen = b""
+
+    def update(self, data):
+        """
+        Parameters:
+        data (bytes or memoryview): The complete current event table without TMC header.
+
+        Returns:
+        numpy.ndarray or dict: The new rows, see parse_event_table.
+        """
+        data = bytes(data)
+        # Only complete lines are parsed, a partial last line is kept for the next update.
+        end = data.rfind(b"\n") + 1 or len(data)
+        if self.header is not None and self._seen and data.startswith(self._seen):
+            rows = parse_event_table(data[len(self._seen):end], self.as_dict, self.header)
+        else:
+            lines = _table_lines(data[:end])
+            try:
+                self.header = lines[_find_header(lines)]
+            except ValueError:
+                # Empty or cleared table (e.g. the decoder was just enabled): wait for the header.
+                self.header = None
+                self._seen = b""
+                return parse_event_table(b"", self.as_dict, "Time")
+            rows = parse_event_table(data[:end], self.as_dict)
+        self._seen = data[:end]
+        return rows
@@ -1,14 +1,66 @@
 
 from time import sleep
 from time import sleep
+import queue
+import threading
+import time
 from Instruments.SCPICommandTree import mandatory
+from Instruments import oscilloscope_helper
+from Instruments import screenshot
+from Instruments import timeout_policy
+from Instruments import validation
+import numpy as np
 import pyvisa
+
+# Maximum number of points that can be read with one :WAVeform:DATA? in BYTE format.
+WAVEFORM_BYTE_CHUNK = 250000
+
+# Argument validators, see validation.validate.
+CHANNEL = validation.Choice(1, 2, name="channel")
+ACQUISITION_TYPE = validation.Choice("NORMal", "AVERages", "PEAK", "HRESolution", name="acquisition mode")
+# Single channel and dual channel memory depths.
+MEMORY_DEPTH = validation.Choice("AUTO", 6000, 12000, 60000, 120000, 600000, 1200000, 6000000, 12000000, 24000000,
+                                 name="memory depth")
+BANDWIDTH_LIMIT = validation.Choice("20M", "OFF", name="bandwidth limit")
+COUPLING = validation.Choice("AC", "DC", "GND", name="coupling mode")
+STATE = validation.Boolean()
+MEASURE_ITEM = validation.Choice(*oscilloscope_helper.MEASURE_ITEMS, name="measurement item")
+MEASURE_SOURCES = validation.ListOf(validation.Choice("CHANnel1", "CHANnel2", "MATH", name="measurement source"))
+STATISTIC_TYPE = validation.Choice("MAXimum", "MINimum", "CURRent", "AVERages", "DEViation", name="statistic type")
+MEASURE_SLOT = validation.Choice("ITEM1", "ITEM2", "ITEM3", "ITEM4", "ITEM5", "ALL", name="measurement slot")
+DECODER = validation.Choice(1, 2, name="decoder channel")
+REFERENCE = validation.Choice(*range(1, 11), name="reference channel number")
+SOURCE = validation.Choice("CHANnel1", "CHANnel2", name="source")
+SLOPE = validation.Choice("POSitive", "NEGative", name="slope type")
+# None leaves the pattern or type of channel 2 unchanged.
+PATTERN = validation.Choice("H", "L", "X", "R", "F", None, name="pattern")
+DURATION_TYPE = validation.Choice("H", "L", "X", None, name="duration type")
+LEVEL = validation.Range(name="trigger level")
+# Trigger widths and times in s. An upper limit is at least 16 ns, a lower limit at most 9.99 s.
+WIDTH = validation.Range(8e-9, 10.0, name="time")
+UPPER_WIDTH = validation.Range(16e-9, 10.0, name="time")
+LOWER_WIDTH = validation.Range(8e-9, 9.99, name="time")
+DATA_VALUE = validation.Range(0, None, int, name="data value")
+FRAME = validation.Range(1, None, int, name="frame")
+IMAGE_FORMAT = validation.Choice("BMP24", "BMP8", "PNG", "JPEG", "TIFF", None, name="image format")
+CURSOR = validation.Choice("A", "B", name="cursor")
+INTERVAL = validation.Range(1e-6, 1000, keywords=("MIN",), name="interval")
+
 class Oscilloscope(mandatory.Mandatory):
 
     def __init__(self, instru):
         
         self.name = "Oscilloscope"
         self.instrument = instru
+        # Preamble of each source from the last acquisition, for the waveform mode it was
+        # read in, and the reusable download buffer.
+        self._preamble_cache = {}
+        self._preamble_mode = None
+        self._waveform_buffer = np.empty(0, dtype=np.uint8)
+        # Requested screenshot format, None once the oscilloscope turned out not to support PNG.
+        self._screenshot_format = "PNG"
+        # Timeouts of the bulk transfers, from their expected size and the measured link speed.
+        self.timeout_policy = timeout_policy.TimeoutPolicy()
         
     #Mandatory Commands
     #TODO Add nonimplemented 
@@ -25,7 +77,24 @@ will still be displayed."""
         self.instrument.write(":CLE")
         #instrument.clear_display_window_graphics()
 
+    def run(self):
+        """Start the oscilloscope. Equivalent to pressing RUN/STOP when the oscilloscope is stopped."""
+        self.instrument.write(":RUN")
+
+    def stop(self):
+        """Stop the oscilloscope. The waveform in memory is frozen and can be read out."""
+        self.instrument.write(":STOP")
+
+    def single(self):
+        """Set the oscilloscope to the single trigger mode. It stops after the next trigger."""
+        self.instrument.write(":SINGle")
+
+    def force_trigger(self):
+        """Generate a trigger signal forcefully (only in the normal and single trigger modes)."""
+        self.instrument.write(":TFORce")
+
  #Acquisition Commands
+    @validation.validate(mode=ACQUISITION_TYPE)
     def set_acquistion_mode(self, mode):
         """Set acquisition mode. Normal:  Samples the signal at equal time interval to
 rebuild the waveform. Averages:  Averages the waveforms from multiple
@@ -33,7 +102,7 @@ samples to reduce the random noise of the input signal. Peak: Acquires the maxim
 minimum values of the signal within the sample interval to get the envelope of the
 signal. HRESolution:  ultra-sample technique to average the neighboring points of the sample waveform to reduce the random noise
 on the input signal and generate much smoother waveforms """
-        comm_mode = ":ACQuire:TYPE "+mode
+        comm_mode = ":ACQuire:TYPE "+str(mode)
         self.instrument.write(comm_mode)
 
     def get_acquistion_mode(self, mode):
@@ -46,15 +115,13 @@ on the input signal and generate much smoother waveforms """
         comm_mode = ":ACQuire:TYPE?"
         self.instrument.query(comm_mode)
 
+    @validation.validate(avg=validation.Range(2, 1024, int, name="number of averages"))
     def set_number_of_averages(self, avg):
         """In the average acquisition mode, greater number of averages can lower the noise
         and increase the vertical resolution, but will also slow the response of the displayed
         waveform to the waveform changes. Avg: 2 to 1024"""
-        if avg<2 or avg>1024:
-            print("Average is an invalid value. Please enter a number between 2 and 1024")
-        else:
-            comm_mode = ":ACQuire:AVERages "+avg
-            self.instrument.write(comm_mode)
+        comm_mode = ":ACQuire:AVERages "+str(avg)
+        self.instrument.write(comm_mode)
 
     def get_number_of_averages(self, avg):
         """In the average acquisition mode, greater number of averages can lower the noise
@@ -62,19 +129,15 @@ on the input signal and generate much smoother waveforms """
         comm_mode = ":ACQuire:AVERages?"
         self.instrument.query(comm_mode)
     
+    @validation.validate(mdpth=MEMORY_DEPTH)
     def set_memory_depth(self, mdpth):
         """ Set memory depth of the oscilloscope (namely the number of waveform
 points that can be stored in a single trigger sample). Single Channel: AUTO|12000|
 120000|1200000|12000000|24000000. Dual Channel:  {AUTO|6000|60000|
 600000|6000000|12000000}."""
 #TODO: Add in check of channel status
-        sc_allowed_values = ["AUTO",12000,120000,1200000,12000000,24000000]
-        dc_allowed_values = ["AUTO",6000,60000,600000,6000000,12000000]
-        if mdpth in sc_allowed_values or mdpth in dc_allowed_values:
-            comm_mode = ":ACQuire:MDEPth "+mdpth
-            self.instrument.write(comm_mode)
-        else:
-            print("Invalid memory depth.")
+        comm_mode = ":ACQuire:MDEPth "+str(mdpth)
+        self.instrument.write(comm_mode)
 
     def get_memory_depth(self):
         """ Get memory depth of the oscilloscope (namely the number of waveform
@@ -86,114 +149,91 @@ points that can be stored in a single trigger sample)."""
     def get_sample_rate(self):
         """ Query the current sample rate. The default unit is Sa/s."""
         comm_mode = ":ACQuire:SRATe?"
-        self.instrument.query(comm_mode)
+        response = self.instrument.query(comm_mode)
+        return float(response.strip())
 
 #Channel Commands
+    @validation.validate(channel=CHANNEL, bw=BANDWIDTH_LIMIT)
     def set_channel_bandwidth_limit(self, channel, bw):
         """ Set or query the bandwidth limit parameter of the specified channel. OFF: disable the bandwidth limit and the high frequency components of the signal
 under test can pass the channel.
 20M: enable the bandwidth limit and the high frequency components of the signal
 under test that exceed 20 MHz are attenuated. """
 #TODO: Add in check of channel status
-        allowed_chnl_values = [1, 2]
-        allowed_type_values = ["20M", "OFF"]
-        if channel in allowed_chnl_values or bw in allowed_type_values:
-            comm = ":CHANnel"+str(channel)+":BWLimit "+bw
-            self.instrument.write(comm)
-        else:
-            print("Invalid channel or bandwidth.")
+        comm = ":CHANnel"+str(channel)+":BWLimit "+str(bw)
+        self.instrument.write(comm)
 
     def get_channel_bandwidth_limit(self, channel):
         """ Query the bandwidth limit parameter of the specified channel."""
         comm_mode = ":CHANnel"+str(channel)+":BWLimit?"
         self.instrument.query(comm_mode)
 
+    @validation.validate(channel=CHANNEL, coupling_mode=COUPLING)
     def set_channel_coupling_mode(self, channel, coupling_mode):
         """ Set the coupling mode of the specified channel."""
 #TODO: Add in check of channel status
-        allowed_chnl_values = [1, 2]
-        allowed_type_values = ["AC","DC","GND"]
-        if channel in allowed_chnl_values or bw in allowed_type_values:
-            comm = ":CHANnel"+str(channel)+":COUPling "+coupling_mode
-            self.instrument.write(comm)
-        else:
-            print("Invalid channel or bandwidth.")
+        comm = ":CHANnel"+str(channel)+":COUPling "+str(coupling_mode)
+        self.instrument.write(comm)
 
     def get_channel_coupling_mode(self, channel):
         """ Query the coupling mode of the specified channel."""
         comm_mode = ":CHANnel"+str(channel)+":COUPling?"
         self.instrument.query(comm_mode)
     
+    @validation.validate(channel=CHANNEL, param1=STATE)
     def channel_invert_waveform(self, channel, param1):
-        """ Set the coupling mode of the specified channel."""
+        """ Turn the waveform invert of the specified channel on or off."""
         #TODO: Add in check of channel status
-        allowed_chnl_values = [1, 2]
-        allowed_type_values = ["ON","OFF",1, 2]
-        if channel in allowed_chnl_values or param1 in allowed_type_values:
-            comm = ":CHANnel"+str(channel)+":INVert "+param1
-            self.instrument.write(comm)
-        else:
-            print("Invalid channel or bandwidth.")
+        comm = ":CHANnel"+str(channel)+":INVert "+str(param1)
+        self.instrument.write(comm)
 
     def channel_is_inverted(self, channel):
         """ Query the coupling mode of the specified channel."""
         comm_mode = ":CHANnel"+str(channel)+":INVert?"
         self.instrument.query(comm_mode)
     
+    @validation.validate(channel=CHANNEL, param1=validation.Range(name="offset"))
     def set_channel_offset(self, channel, param1):
         """ Set the vertical offset of the specified channel. The default unit is V."""
     #TODO: Add in check of channel status
-        allowed_chnl_values = [1, 2]
-        #allowed_type_values = ["AC","DC","GND"]
-        if channel in allowed_chnl_values: #or param1 in allowed_type_values:
-            comm = ":CHANnel"+str(channel)+":OFFSet "+param1
-            self.instrument.write(comm)
-        else:
-            print("Invalid channel or bandwidth.")
+        comm = ":CHANnel"+str(channel)+":OFFSet "+str(param1)
+        self.instrument.write(comm)
 
     def get_channel_offset(self, channel):
         """ Query the vertical offset of the specified channel. The default unit is V."""
         comm_mode = ":CHANnel"+str(channel)+":OFFSet?"
         self.instrument.query(comm_mode)
     
+    @validation.validate(channel=CHANNEL, param1=validation.Range(0, name="range"))
     def set_channel_range(self, channel, param1):
-        """ Set the vertical offset of the specified channel. The default unit is V."""
+        """ Set the vertical range of the specified channel. The default unit is V."""
     #TODO: Add in check of channel status
-        allowed_chnl_values = [1, 2]
-        #allowed_type_values = ["AC","DC","GND"]
-        if channel in allowed_chnl_values: #or param1 in allowed_type_values:
-            comm = ":CHANnel"+str(channel)+":OFFSet "+param1
-            self.instrument.write(comm)
-        else:
-            print("Invalid channel or bandwidth.")
+        comm = ":CHANnel"+str(channel)+":RANGe "+str(param1)
+        self.instrument.write(comm)
 
     def get_channel_range(self, channel):
-        """ Query the vertical offset of the specified channel. The default unit is V."""
-        comm_mode = ":CHANnel"+str(channel)+":OFFSet?"
-        self.instrument.query(comm_mode)
+        """ Query the vertical range of the specified channel. The default unit is V."""
+        comm_mode = ":CHANnel"+str(channel)+":RANGe?"
+        response = self.instrument.query(comm_mode)
+        return float(response.strip())
     
+    @validation.validate(channel=CHANNEL, val=validation.Range(-100e-9, 100e-9, name="delay calibration time"))
     def set_channel_tcal(self, channel, val):
         """
         Set delay calibration time for the specified channel.
         val: delay time in seconds (e.g., 20e-9 for 20ns). Valid range: -100e-9 to 100e-9.
         NOTE: Must match timing step for current timebase scale; oscilloscope rounds if needed.
         """
-        if channel in [1, 2] and isinstance(val, (float, int)) and -100e-9 <= val <= 100e-9:
-            self.instrument.write(f":CHANnel{channel}:TCAL {val}")
-        else:
-            print("Invalid channel or value (must be float between -100e-9 and 100e-9)")
+        self.instrument.write(f":CHANnel{channel}:TCAL {val}")
 
+    @validation.validate(channel=CHANNEL)
     def get_channel_tcal(self, channel):
         """
         Query delay calibration time for the specified channel (in seconds).
         Returns value in scientific notation as float.
         """
-        if channel in [1, 2]:
-            response = self.instrument.query(f":CHANnel{channel}:TCAL?")
-            return float(response)
-        else:
-            print("Invalid channel number.")
-            return None
+        response = self.instrument.query(f":CHANnel{channel}:TCAL?")
+        return float(response)
     
     def set_channel_scale(self, channel, scale):
         """Set vertical scale of the channel (in V/div)."""
@@ -235,6 +275,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
     
 
 #Cursor Commands
+    @validation.validate(mode=validation.Choice("OFF", "MANual", "TRACk", "AUTO", "XY", name="cursor mode"))
     def set_cursor_mode(self, mode):
         """
         Set cursor measurement mode.
@@ -243,12 +284,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         mode (str): One of {"OFF", "MANual", "TRACk", "AUTO", "XY"}
         Note: XY mode only valid when timebase mode is also XY.
         """
-        valid_modes = {"OFF", "MANual", "TRACk", "AUTO", "XY"}
-        mode = mode.upper()
-        if mode in {m.upper() for m in valid_modes}:
-            self.instrument.write(f":CURSor:MODE {mode}")
-        else:
-            print(f"Invalid mode. Must be one of: {valid_modes}")
+        self.instrument.write(f":CURSor:MODE {mode}")
 
     def get_cursor_mode(self):
         """
@@ -259,6 +295,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         """
         return self.instrument.query(":CURSor:MODE?")
     
+    @validation.validate(cursor_type=validation.Choice("X", "Y", name="cursor type"))
     def set_cursor_manual_type(self, cursor_type):
         """
         Set the type of manual cursor.
@@ -266,11 +303,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         cursor_type (str): Either "X" for vertical cursors (time) or "Y" for horizontal cursors (voltage).
         """
-        cursor_type = cursor_type.upper()
-        if cursor_type in ["X", "Y"]:
-            self.instrument.write(f":CURSor:MANual:TYPE {cursor_type}")
-        else:
-            print("Invalid cursor type. Use 'X' or 'Y'.")
+        self.instrument.write(f":CURSor:MANual:TYPE {cursor_type}")
     
     def get_cursor_manual_type(self):
         """
@@ -290,6 +323,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         """
         return self.instrument.query(":CURSor:MANual:SOURce?")
     
+    @validation.validate(source=validation.Choice("CHAN1", "CHAN2", "MATH", name="channel or source name"))
     def set_cursor_manual_source(self, source):
         """
         Set the source for manual cursor measurement.
@@ -298,13 +332,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         source (str): Channel or source name. Valid options include:
                     "CHAN1", "CHAN2", "MATH", "REF1", "REF2", "REF3", "REF4"
         """
-        source = source.upper()
-        valid_sources = {"CHAN1", "CHAN2", "MATH"}
-
-        if source in valid_sources:
-            self.instrument.write(f":CURSor:MANual:SOURce {source}")
-        else:
-            print(f"Invalid source. Choose from: {valid_sources}")
+        self.instrument.write(f":CURSor:MANual:SOURce {source}")
 
     def get_cursor_manual_source(self):
         """
@@ -319,38 +347,25 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         """ Query the current horizontal unit in the manual cursor measurement mode. """
         return self.instrument.query(":CURSor:MANual:TUNit?")
 
+    @validation.validate(unit=validation.Choice("S", "HZ", "DEGRee", "PERCent", name="unit"))
     def set_cursor_manual_tunit(self, unit):
         """ Set the horizontal unit for manual cursor measurement. """
-        valid_units = ["S", "HZ", "DEGRee", "PERCent"]
-        unit = unit.upper()
-        if unit in valid_units:
-            self.instrument.write(f":CURSor:MANual:TUNit {unit}")
-        else:
-            print(f"Invalid unit. Valid options are: {valid_units}")
+        self.instrument.write(f":CURSor:MANual:TUNit {unit}")
     def get_cursor_manual_vunit(self):
         """ Query the current vertical unit in the manual cursor measurement mode. """
         return self.instrument.query(":CURSor:MANual:VUNit?")
 
+    @validation.validate(unit=validation.Choice("PERCent", "SOURce", name="unit"))
     def set_cursor_manual_vunit(self, unit):
         """ Set the vertical unit for manual cursor measurement. """
-        valid_units = ["PERCent", "SOURce"]
-        unit = unit.upper()
-        if unit in valid_units:
-            self.instrument.write(f":CURSor:MANual:VUNit {unit}")
-        else:
-            print(f"Invalid unit. Valid options are: {valid_units}")
+        self.instrument.write(f":CURSor:MANual:VUNit {unit}")
 
+    @validation.validate(cursor=CURSOR, x=validation.Range(5, 594, int, name="x position"),
+                         y=validation.Range(5, 394, int, name="y position"))
     def set_cursor_manual(self, cursor, x, y):
         """ Set the horizontal position of cursor A or B  in the manual cursor measurement mode. """
-        if 5 <= x <= 594:  # Ensure the position is within the valid range
-            self.instrument.write(f":CURSor:MANual:"+cursor+"X {x}")
-        else:
-            print("Invalid position. x must be between 5 and 594.")
-        
-        if 5 <= y <= 394:  # Ensure the position is within the valid range
-            self.instrument.write(f":CURSor:MANual:"+cursor+"Y {y}")
-        else:
-            print("Invalid position. y must be between 5 and 394.")
+        self.instrument.write(f":CURSor:MANual:{cursor}X {x}")
+        self.instrument.write(f":CURSor:MANual:{cursor}Y {y}")
 
     def get_cursor_manual(self,cursor):
         """ Query the horizontal position of cursor A or B in the manual cursor measurement mode. """
@@ -371,26 +386,20 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":CURSor:MANual:YDELta?")
         return float(response)  # Returns the difference in scientific notation
 
+    @validation.validate(source=validation.Choice("OFF", "CHANnel1", "CHANnel2", "MATH", name="source"))
     def set_cursor_track_source(self, source, n):
         """ Set the channel source of cursor A in the track cursor measurement mode. """
-        valid_sources = ["OFF", "CHANnel1", "CHANnel2", "MATH"]
-        source = source.upper()  # Ensure source is in uppercase
-
-        if source in valid_sources:
-            self.instrument.write(f":CURSor:TRACk:SOURce"+str(n)+ " {source}")
-        else:
-            print(f"Invalid source. Choose from: {valid_sources}")
+        self.instrument.write(f":CURSor:TRACk:SOURce{n} {source}")
 
     def get_cursor_track_source(self, n):
         """ Query the channel source of cursor A in the track cursor measurement mode. """
         return self.instrument.query(":CURSor:TRACk:SOURce"+str(n)+"?")
     
+    @validation.validate(cursor=CURSOR, x=validation.Range(5, 394, int, name="x position"),
+                         y=validation.Range(5, 394, int, name="y position"))
     def set_cursor_xy(self, cursor, x, y):
         """ Set the horizontal position of cursor A in the XY cursor measurement mode. """
-        if 5 <= x <= 394 and 5 <= y <= 394:
-            self.instrument.write(f":CURSor:XY:"+cursor+"X {x};"+cursor+"Y {y};")
-        else:
-            print("Invalid x or y position. Must be between 5 and 394.")
+        self.instrument.write(f":CURSor:XY:{cursor}X {x};{cursor}Y {y};")
 
     def get_cursor_xy(self, cursor):
         """ Query the horizontal position of cursor A in the XY cursor measurement mode. """
@@ -398,6 +407,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         return response # Returns an integer between 5 and 394
 
 #Decoding Commands
+    @validation.validate(n=DECODER, mode=validation.Choice("PARallel", "UART", "SPI", "IIC", name="decoder type"))
     def set_decoder_mode(self, n, mode):
         """
         Set the decoder type for the specified decoder channel.
@@ -406,14 +416,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         mode (str): The decoder type, one of {"PARallel", "UART", "SPI", "IIC"}.
         """
-        valid_decoders = [1, 2]
-        valid_modes = ["PARallel", "UART", "SPI", "IIC"]
-
-        if n in valid_decoders and mode.upper() in valid_modes:
-            self.instrument.write(f":DECoder{n}:MODE {mode.upper()}")
-        else:
-            print(f"Invalid decoder or mode. Decoder: {valid_decoders}, Mode: {valid_modes}")
+        self.instrument.write(f":DECoder{n}:MODE {mode}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_mode(self, n):
         """
         Query the decoder type for the specified decoder channel.
@@ -424,13 +429,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         str: The decoder type, one of {"PAR", "UART", "SPI", "IIC"}.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:MODE?")
-            return response.strip().upper()  # Returns the mode (e.g., PAR, UART, SPI, IIC)
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:MODE?")
+        return response.strip().upper()  # Returns the mode (e.g., PAR, UART, SPI, IIC)
 
+    @validation.validate(n=DECODER, display_status=STATE)
     def set_decoder_display(self, n, display_status):
         """
         Turn on or off the decoder or query the status of the decoder.
@@ -439,28 +441,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         display_status (bool or str): Whether to turn on (True/1/"ON") or off (False/0/"OFF") the decoder.
         """
-        valid_decoders = [1, 2]
-        
-        # Handle different input types
-        if isinstance(display_status, bool):
-            status = "ON" if display_status else "OFF"
-        elif isinstance(display_status, (int, str)):
-            if str(display_status).upper() in ["1", "ON"]:
-                status = "ON"
-            elif str(display_status).upper() in ["0", "OFF"]:
-                status = "OFF"
-            else:
-                print("Invalid display status. Use True/False, 1/0, or 'ON'/'OFF'.")
-                return
-        else:
-            print("Invalid display status. Use True/False, 1/0, or 'ON'/'OFF'.")
-            return
-        
-        if n in valid_decoders:
-            self.instrument.write(f":DECoder{n}:DISPlay {status}")
-        else:
-            print(f"Invalid decoder. Choose from {valid_decoders}.")
+        self.instrument.write(f":DECoder{n}:DISPlay {display_status}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_display(self, n):
         """
         Query the status of the decoder.
@@ -471,13 +454,11 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         int: The status of the decoder (1 for ON, 0 for OFF).
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:DISPlay?")
-            return int(response.strip())  # Returns 1 for ON, 0 for OFF
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:DISPlay?")
+        return int(response.strip())  # Returns 1 for ON, 0 for OFF
         
+    @validation.validate(n=DECODER,
+                         fmt=validation.Choice("HEX", "ASCii", "DEC", "BIN", "LINE", name="bus display format"))
     def set_decoder_format(self, n, fmt):
         """
         Set the bus display format for the specified decoder channel.
@@ -486,14 +467,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         fmt (str): The bus display format, one of {"HEX", "ASCii", "DEC", "BIN", "LINE"}.
         """
-        valid_decoders = [1, 2]
-        valid_formats = ["HEX", "ASCii", "DEC", "BIN", "LINE"]
-
-        if n in valid_decoders and fmt.upper() in valid_formats:
-            self.instrument.write(f":DECoder{n}:FORMat {fmt.upper()}")
-        else:
-            print(f"Invalid decoder or format. Decoder: {valid_decoders}, Format: {valid_formats}")
+        self.instrument.write(f":DECoder{n}:FORMat {fmt}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_format(self, n):
         """
         Query the bus display format for the specified decoder channel.
@@ -504,13 +480,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         str: The bus display format, one of {"HEX", "ASC", "DEC", "BIN", "LINE"}.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:FORMat?")
-            return response.strip().upper()  # Returns the format (e.g., HEX, ASC, DEC, BIN, LINE)
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:FORMat?")
+        return response.strip().upper()  # Returns the format (e.g., HEX, ASC, DEC, BIN, LINE)
     
+    @validation.validate(n=DECODER, pos=validation.Range(50, 350, name="position"))
     def set_decoder_position(self, n, pos):
         """
         Set the vertical position of the bus on the screen for the specified decoder.
@@ -519,12 +492,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         pos (int): The vertical position, range 50 to 350.
         """
-        valid_decoders = [1, 2]
-        if n in valid_decoders and 50 <= pos <= 350:
-            self.instrument.write(f":DECoder{n}:POSition {pos}")
-        else:
-            print(f"Invalid decoder or position. Decoder: {valid_decoders}, Position: 50-350")
+        self.instrument.write(f":DECoder{n}:POSition {pos}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_position(self, n):
         """
         Query the vertical position of the bus on the screen for the specified decoder.
@@ -535,13 +505,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         int: The vertical position (integer between 50 and 350).
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:POSition?")
-            return int(response.strip())  # Returns the position as an integer
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:POSition?")
+        return int(response.strip())  # Returns the position as an integer
         
+    @validation.validate(n=DECODER)
     def set_decoder_threshold_channel(self, channel, n, thre):
         """
         Set the threshold level for the specified decoder channel 1.
@@ -550,12 +517,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         thre (float): The threshold level, in volts. Should be within the range of the vertical scale and offset.
         """
-        valid_decoders = [1, 2]
-        if n in valid_decoders:
-            self.instrument.write(f":DECoder{n}:THREshold:CHANnel"+channel+" {thre}")
-        else:
-            print(f"Invalid decoder. Choose from {valid_decoders}.")
+        self.instrument.write(f":DECoder{n}:THREshold:CHANnel{channel} {thre}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_threshold_channel(self, channel, n):
         """
         Query the threshold level for the specified decoder channel 1 or 2.
@@ -566,12 +530,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         float: The threshold level in scientific notation (volts).
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:THREshold:CHANnel1?")
-            return float(response.strip())  # Returns the threshold level as a float
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:THREshold:CHANnel{channel}?")
+        return float(response.strip())  # Returns the threshold level as a float
+    @validation.validate(n=DECODER)
     def set_decoder_auto_threshold(self, n, auto):
         """
         Turn on or off the auto threshold function for the specified decoder channel.
@@ -580,12 +541,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         auto (bool): Whether to turn on (1) or off (0) the auto threshold function.
         """
-        valid_decoders = [1, 2]
-        if n in valid_decoders:
-            self.instrument.write(f":DECoder{n}:THREshold:AUTO {'ON' if auto else 'OFF'}")
-        else:
-            print(f"Invalid decoder. Choose from {valid_decoders}.")
+        self.instrument.write(f":DECoder{n}:THREshold:AUTO {'ON' if auto else 'OFF'}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_auto_threshold(self, n):
         """
         Query the status of the auto threshold function for the specified decoder channel.
@@ -596,12 +554,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         bool: The status of the auto threshold function (1 for ON, 0 for OFF).
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:THREshold:AUTO?")
-            return int(response.strip())  # Returns 1 for ON, 0 for OFF
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:THREshold:AUTO?")
+        return int(response.strip())  # Returns 1 for ON, 0 for OFF
+    @validation.validate(n=DECODER)
     def set_decoder_label_display(self, n, label_status):
         """
         Turn on or off the label display function for the specified decoder.
@@ -610,12 +565,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         label_status (bool): Whether to turn on (1) or off (0) the label display function.
         """
-        valid_decoders = [1, 2]
-        if n in valid_decoders:
-            self.instrument.write(f":DECoder{n}:CONFig:LABel {'ON' if label_status else 'OFF'}")
-        else:
-            print(f"Invalid decoder. Choose from {valid_decoders}.")
+        self.instrument.write(f":DECoder{n}:CONFig:LABel {'ON' if label_status else 'OFF'}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_label_display(self, n):
         """
         Query the status of the label display function for the specified decoder.
@@ -626,13 +578,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         bool: The status of the label display function (1 for ON, 0 for OFF).
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:CONFig:LABel?")
-            return int(response.strip())  # Returns 1 for ON, 0 for OFF
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:CONFig:LABel?")
+        return int(response.strip())  # Returns 1 for ON, 0 for OFF
 
+    @validation.validate(n=DECODER)
     def set_decoder_bus_display(self, n, line_status):
         """
         Turn on or off the bus display function for the specified decoder.
@@ -641,12 +590,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         line_status (bool): Whether to turn on (1) or off (0) the bus display function.
         """
-        valid_decoders = [1, 2]
-        if n in valid_decoders:
-            self.instrument.write(f":DECoder{n}:CONFig:LINE {'ON' if line_status else 'OFF'}")
-        else:
-            print(f"Invalid decoder. Choose from {valid_decoders}.")
+        self.instrument.write(f":DECoder{n}:CONFig:LINE {'ON' if line_status else 'OFF'}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_bus_display(self, n):
         """
         Query the status of the bus display function for the specified decoder.
@@ -657,13 +603,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         bool: The status of the bus display function (1 for ON, 0 for OFF).
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:CONFig:LINE?")
-            return int(response.strip())  # Returns 1 for ON, 0 for OFF
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:CONFig:LINE?")
+        return int(response.strip())  # Returns 1 for ON, 0 for OFF
 
+    @validation.validate(n=DECODER)
     def set_decoder_format_display(self, n, format_status):
         """
         Turn on or off the format display function for the specified decoder.
@@ -672,12 +615,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         format_status (bool): Whether to turn on (1) or off (0) the format display function.
         """
-        valid_decoders = [1, 2]
-        if n in valid_decoders:
-            self.instrument.write(f":DECoder{n}:CONFig:FORMat {'ON' if format_status else 'OFF'}")
-        else:
-            print(f"Invalid decoder. Choose from {valid_decoders}.")
+        self.instrument.write(f":DECoder{n}:CONFig:FORMat {'ON' if format_status else 'OFF'}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_format_display(self, n):
         """
         Query the status of the format display function for the specified decoder.
@@ -688,12 +628,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         bool: The status of the format display function (1 for ON, 0 for OFF).
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:CONFig:FORMat?")
-            return int(response.strip())  # Returns 1 for ON, 0 for OFF
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:CONFig:FORMat?")
+        return int(response.strip())  # Returns 1 for ON, 0 for OFF
+    @validation.validate(n=DECODER)
     def set_decoder_endian_display(self, n, endian_status):
         """
         Turn on or off the endian display function for the specified decoder.
@@ -702,12 +639,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         endian_status (bool): Whether to turn on (1) or off (0) the endian display function.
         """
-        valid_decoders = [1, 2]
-        if n in valid_decoders:
-            self.instrument.write(f":DECoder{n}:CONFig:ENDian {'ON' if endian_status else 'OFF'}")
-        else:
-            print(f"Invalid decoder. Choose from {valid_decoders}.")
+        self.instrument.write(f":DECoder{n}:CONFig:ENDian {'ON' if endian_status else 'OFF'}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_endian_display(self, n):
         """
         Query the status of the endian display function for the specified decoder.
@@ -718,12 +652,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         bool: The status of the endian display function (1 for ON, 0 for OFF).
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:CONFig:ENDian?")
-            return int(response.strip())  # Returns 1 for ON, 0 for OFF
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:CONFig:ENDian?")
+        return int(response.strip())  # Returns 1 for ON, 0 for OFF
+    @validation.validate(n=DECODER)
     def set_decoder_width_display(self, n, width_status):
         """
         Turn on or off the width display function for the specified decoder.
@@ -732,12 +663,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         width_status (bool): Whether to turn on (1) or off (0) the width display function.
         """
-        valid_decoders = [1, 2]
-        if n in valid_decoders:
-            self.instrument.write(f":DECoder{n}:CONFig:WIDth {'ON' if width_status else 'OFF'}")
-        else:
-            print(f"Invalid decoder. Choose from {valid_decoders}.")
+        self.instrument.write(f":DECoder{n}:CONFig:WIDth {'ON' if width_status else 'OFF'}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_width_display(self, n):
         """
         Query the status of the width display function for the specified decoder.
@@ -748,13 +676,11 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         bool: The status of the width display function (1 for ON, 0 for OFF).
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:CONFig:WIDth?")
-            return int(response.strip())  # Returns 1 for ON, 0 for OFF
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:CONFig:WIDth?")
+        return int(response.strip())  # Returns 1 for ON, 0 for OFF
     # UART Decoding Commands
+    @validation.validate(n=DECODER,
+                         tx_source=validation.Choice("CHANnel1", "CHANnel2", "OFF", name="TX channel source"))
     def set_decoder_uart_tx_source(self, n, tx_source):
         """
         Set the TX channel source of RS232 decoding for the specified decoder.
@@ -763,15 +689,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         tx_source (str): The TX channel source, one of {"CHANnel1", "CHANnel2", "OFF"}.
         """
-        valid_decoders = [1, 2]
-        valid_sources = {"CHANnel1", "CHANnel2", "OFF"}
-        tx_source = tx_source.upper()
-
-        if n in valid_decoders and tx_source in valid_sources:
-            self.instrument.write(f":DECoder{n}:UART:TX {tx_source}")
-        else:
-            print(f"Invalid decoder ({n}) or TX source ({tx_source}). Decoder: {valid_decoders}, Source: {valid_sources}")
+        self.instrument.write(f":DECoder{n}:UART:TX {tx_source}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_uart_tx_source(self, n):
         """
         Query the TX channel source of RS232 decoding for the specified decoder.
@@ -782,13 +702,11 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         str: The TX channel source, one of {"CHAN1", "CHAN2", "OFF"}.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:UART:TX?")
-            return response.strip().upper()
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:UART:TX?")
+        return response.strip().upper()
 
+    @validation.validate(n=DECODER,
+                         rx_source=validation.Choice("CHANnel1", "CHANnel2", "OFF", name="RX channel source"))
     def set_decoder_uart_rx_source(self, n, rx_source):
         """
         Set the RX channel source of RS232 decoding for the specified decoder.
@@ -797,15 +715,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         rx_source (str): The RX channel source, one of {"CHANnel1", "CHANnel2", "OFF"}.
         """
-        valid_decoders = [1, 2]
-        valid_sources = {"CHANnel1", "CHANnel2", "OFF"}
-        rx_source = rx_source.upper()
-
-        if n in valid_decoders and rx_source in valid_sources:
-            self.instrument.write(f":DECoder{n}:UART:RX {rx_source}")
-        else:
-            print(f"Invalid decoder ({n}) or RX source ({rx_source}). Decoder: {valid_decoders}, Source: {valid_sources}")
+        self.instrument.write(f":DECoder{n}:UART:RX {rx_source}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_uart_rx_source(self, n):
         """
         Query the RX channel source of RS232 decoding for the specified decoder.
@@ -816,13 +728,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         str: The RX channel source, one of {"CHAN1", "CHAN2", "OFF"}.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:UART:RX?")
-            return response.strip().upper()
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:UART:RX?")
+        return response.strip().upper()
 
+    @validation.validate(n=DECODER, polarity=validation.Choice("NEGative", "POSitive", name="polarity"))
     def set_decoder_uart_polarity(self, n, polarity):
         """
         Set the polarity of RS232 decoding for the specified decoder.
@@ -831,15 +740,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         polarity (str): The polarity, one of {"NEGative", "POSitive"}.
         """
-        valid_decoders = [1, 2]
-        valid_polarities = {"NEGative", "POSitive"}
-        polarity = polarity.upper()
-
-        if n in valid_decoders and polarity in valid_polarities:
-            self.instrument.write(f":DECoder{n}:UART:POLarity {polarity}")
-        else:
-            print(f"Invalid decoder ({n}) or polarity ({polarity}). Decoder: {valid_decoders}, Polarity: {valid_polarities}")
+        self.instrument.write(f":DECoder{n}:UART:POLarity {polarity}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_uart_polarity(self, n):
         """
         Query the polarity of RS232 decoding for the specified decoder.
@@ -850,13 +753,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         str: The polarity, one of {"NEG", "POS"}.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:UART:POLarity?")
-            return response.strip().upper()
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:UART:POLarity?")
+        return response.strip().upper()
 
+    @validation.validate(n=DECODER, endian=validation.Choice("LSB", "MSB", name="endian"))
     def set_decoder_uart_endian(self, n, endian):
         """
         Set the endian of RS232 decoding for the specified decoder.
@@ -865,15 +765,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         endian (str): The endian, one of {"LSB", "MSB"}.
         """
-        valid_decoders = [1, 2]
-        valid_endians = {"LSB", "MSB"}
-        endian = endian.upper()
-
-        if n in valid_decoders and endian in valid_endians:
-            self.instrument.write(f":DECoder{n}:UART:ENDian {endian}")
-        else:
-            print(f"Invalid decoder ({n}) or endian ({endian}). Decoder: {valid_decoders}, Endian: {valid_endians}")
+        self.instrument.write(f":DECoder{n}:UART:ENDian {endian}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_uart_endian(self, n):
         """
         Query the endian of RS232 decoding for the specified decoder.
@@ -884,13 +778,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         str: The endian, one of {"LSB", "MSB"}.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:UART:ENDian?")
-            return response.strip().upper()
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:UART:ENDian?")
+        return response.strip().upper()
 
+    @validation.validate(n=DECODER, baud=validation.Range(110, 20000000, int, name="baud rate"))
     def set_decoder_uart_baud_rate(self, n, baud):
         """
         Set the baud rate of RS232 decoding for the specified decoder.
@@ -899,12 +790,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         baud (int): The baud rate in bps, from 110 to 20,000,000.
         """
-        valid_decoders = [1, 2]
-        if n in valid_decoders and isinstance(baud, int) and 110 <= baud <= 20000000:
-            self.instrument.write(f":DECoder{n}:UART:BAUD {baud}")
-        else:
-            print(f"Invalid decoder ({n}) or baud rate ({baud}). Baud rate must be an integer between 110 and 20M.")
+        self.instrument.write(f":DECoder{n}:UART:BAUD {baud}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_uart_baud_rate(self, n):
         """
         Query the baud rate of RS232 decoding for the specified decoder.
@@ -915,13 +803,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         int: The current baud rate.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:UART:BAUD?")
-            return int(response.strip())
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:UART:BAUD?")
+        return int(response.strip())
 
+    @validation.validate(n=DECODER, width=validation.Range(5, 8, int, name="width"))
     def set_decoder_uart_data_width(self, n, width):
         """
         Set the width of each frame of data in RS232 decoding for the specified decoder.
@@ -930,12 +815,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         width (int): The data width, from 5 to 8 bits.
         """
-        valid_decoders = [1, 2]
-        if n in valid_decoders and isinstance(width, int) and 5 <= width <= 8:
-            self.instrument.write(f":DECoder{n}:UART:WIDTH {width}")
-        else:
-            print(f"Invalid decoder ({n}) or width ({width}). Width must be an integer between 5 and 8.")
+        self.instrument.write(f":DECoder{n}:UART:WIDTH {width}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_uart_data_width(self, n):
         """
         Query the width of each frame of data in RS232 decoding for the specified decoder.
@@ -946,13 +828,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         int: The data width.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:UART:WIDTH?")
-            return int(response.strip())
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:UART:WIDTH?")
+        return int(response.strip())
 
+    @validation.validate(n=DECODER, stop_bit=validation.Choice(1.0, 1.5, 2.0, name="stop bit value"))
     def set_decoder_uart_stop_bit(self, n, stop_bit):
         """
         Set the stop bit after each frame of data in RS232 decoding for the specified decoder.
@@ -961,13 +840,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         stop_bit (float): The stop bit value, one of {1, 1.5, 2}.
         """
-        valid_decoders = [1, 2]
-        valid_stop_bits = {1.0, 1.5, 2.0}
-        if n in valid_decoders and stop_bit in valid_stop_bits:
-            self.instrument.write(f":DECoder{n}:UART:STOP {stop_bit}")
-        else:
-            print(f"Invalid decoder ({n}) or stop bit ({stop_bit}). Stop bit must be 1, 1.5, or 2.")
+        self.instrument.write(f":DECoder{n}:UART:STOP {stop_bit}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_uart_stop_bit(self, n):
         """
         Query the stop bit after each frame of data in RS232 decoding for the specified decoder.
@@ -978,13 +853,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         float: The stop bit value.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:UART:STOP?")
-            return float(response.strip())
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:UART:STOP?")
+        return float(response.strip())
 
+    @validation.validate(n=DECODER, parity=validation.Choice("NONE", "EVEN", "ODD", name="parity mode"))
     def set_decoder_uart_parity(self, n, parity):
         """
         Set the even-odd check mode of the data transmission in RS232 decoding for the specified decoder.
@@ -993,15 +865,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         parity (str): The parity mode, one of {"NONE", "EVEN", "ODD"}.
         """
-        valid_decoders = [1, 2]
-        valid_parities = {"NONE", "EVEN", "ODD"}
-        parity = parity.upper()
-
-        if n in valid_decoders and parity in valid_parities:
-            self.instrument.write(f":DECoder{n}:UART:PARity {parity}")
-        else:
-            print(f"Invalid decoder ({n}) or parity ({parity}). Parity: {valid_parities}")
+        self.instrument.write(f":DECoder{n}:UART:PARity {parity}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_uart_parity(self, n):
         """
         Query the even-odd check mode of the data transmission in RS232 decoding for the specified decoder.
@@ -1012,14 +878,11 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         str: The parity mode, one of {"NONE", "EVEN", "ODD"}.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:UART:PARity?")
-            return response.strip().upper()
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:UART:PARity?")
+        return response.strip().upper()
 
     # I2C Decoding Commands
+    @validation.validate(n=DECODER, clk_source=validation.Choice("CHANnel1", "CHANnel2", name="clock channel source"))
     def set_decoder_iic_clk_source(self, n, clk_source):
         """
         Set the signal source of the clock channel in I2C decoding for the specified decoder.
@@ -1028,15 +891,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         clk_source (str): The clock channel source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_decoders = [1, 2]
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        clk_source = clk_source.upper()
-
-        if n in valid_decoders and clk_source in valid_sources:
-            self.instrument.write(f":DECoder{n}:IIC:CLK {clk_source}")
-        else:
-            print(f"Invalid decoder ({n}) or clock source ({clk_source}). Decoder: {valid_decoders}, Source: {valid_sources}")
+        self.instrument.write(f":DECoder{n}:IIC:CLK {clk_source}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_iic_clk_source(self, n):
         """
         Query the signal source of the clock channel in I2C decoding for the specified decoder.
@@ -1047,13 +904,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         str: The clock channel source, one of {"CHAN1", "CHAN2"}.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:IIC:CLK?")
-            return response.strip().upper()
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:IIC:CLK?")
+        return response.strip().upper()
 
+    @validation.validate(n=DECODER, data_source=validation.Choice("CHANnel1", "CHANnel2", name="data channel source"))
     def set_decoder_iic_data_source(self, n, data_source):
         """
         Set the signal source of the data channel in I2C decoding for the specified decoder.
@@ -1062,15 +916,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         data_source (str): The data channel source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_decoders = [1, 2]
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        data_source = data_source.upper()
-
-        if n in valid_decoders and data_source in valid_sources:
-            self.instrument.write(f":DECoder{n}:IIC:DATA {data_source}")
-        else:
-            print(f"Invalid decoder ({n}) or data source ({data_source}). Decoder: {valid_decoders}, Source: {valid_sources}")
+        self.instrument.write(f":DECoder{n}:IIC:DATA {data_source}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_iic_data_source(self, n):
         """
         Query the signal source of the data channel in I2C decoding for the specified decoder.
@@ -1081,13 +929,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         str: The data channel source, one of {"CHAN1", "CHAN2"}.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:IIC:DATA?")
-            return response.strip().upper()
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:IIC:DATA?")
+        return response.strip().upper()
 
+    @validation.validate(n=DECODER, addr_mode=validation.Choice("NORMal", "RW", name="address mode"))
     def set_decoder_iic_address_mode(self, n, addr_mode):
         """
         Set the address mode of I2C decoding for the specified decoder.
@@ -1096,15 +941,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         addr_mode (str): The address mode, one of {"NORMal", "RW"}.
         """
-        valid_decoders = [1, 2]
-        valid_modes = {"NORMal", "RW"}
-        addr_mode = addr_mode.upper()
-
-        if n in valid_decoders and addr_mode in valid_modes:
-            self.instrument.write(f":DECoder{n}:IIC:ADDRess {addr_mode}")
-        else:
-            print(f"Invalid decoder ({n}) or address mode ({addr_mode}). Decoder: {valid_decoders}, Mode: {valid_modes}")
+        self.instrument.write(f":DECoder{n}:IIC:ADDRess {addr_mode}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_iic_address_mode(self, n):
         """
         Query the address mode of I2C decoding for the specified decoder.
@@ -1115,14 +954,11 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         str: The address mode, one of {"NORM", "RW"}.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:IIC:ADDRess?")
-            return response.strip().upper()
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:IIC:ADDRess?")
+        return response.strip().upper()
 
     # SPI Decoding Commands
+    @validation.validate(n=DECODER, clk_source=validation.Choice("CHANnel1", "CHANnel2", name="clock channel source"))
     def set_decoder_spi_clk_source(self, n, clk_source):
         """
         Set the signal source of the clock channel in SPI decoding for the specified decoder.
@@ -1131,15 +967,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         clk_source (str): The clock channel source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_decoders = [1, 2]
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        clk_source = clk_source.upper()
-
-        if n in valid_decoders and clk_source in valid_sources:
-            self.instrument.write(f":DECoder{n}:SPI:CLK {clk_source}")
-        else:
-            print(f"Invalid decoder ({n}) or clock source ({clk_source}). Decoder: {valid_decoders}, Source: {valid_sources}")
+        self.instrument.write(f":DECoder{n}:SPI:CLK {clk_source}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_spi_clk_source(self, n):
         """
         Query the signal source of the clock channel in SPI decoding for the specified decoder.
@@ -1150,13 +980,11 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         str: The clock channel source, one of {"CHAN1", "CHAN2"}.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:SPI:CLK?")
-            return response.strip().upper()
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:SPI:CLK?")
+        return response.strip().upper()
 
+    @validation.validate(n=DECODER,
+                         miso_source=validation.Choice("CHANnel1", "CHANnel2", "OFF", name="MISO channel source"))
     def set_decoder_spi_miso_source(self, n, miso_source):
         """
         Set the MISO channel source in SPI decoding for the specified decoder.
@@ -1165,15 +993,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         miso_source (str): The MISO channel source, one of {"CHANnel1", "CHANnel2", "OFF"}.
         """
-        valid_decoders = [1, 2]
-        valid_sources = {"CHANnel1", "CHANnel2", "OFF"}
-        miso_source = miso_source.upper()
-
-        if n in valid_decoders and miso_source in valid_sources:
-            self.instrument.write(f":DECoder{n}:SPI:MISO {miso_source}")
-        else:
-            print(f"Invalid decoder ({n}) or MISO source ({miso_source}). Decoder: {valid_decoders}, Source: {valid_sources}")
+        self.instrument.write(f":DECoder{n}:SPI:MISO {miso_source}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_spi_miso_source(self, n):
         """
         Query the MISO channel source in SPI decoding for the specified decoder.
@@ -1184,13 +1006,11 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         str: The MISO channel source, one of {"CHAN1", "CHAN2", "OFF"}.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:SPI:MISO?")
-            return response.strip().upper()
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:SPI:MISO?")
+        return response.strip().upper()
 
+    @validation.validate(n=DECODER,
+                         mosi_source=validation.Choice("CHANnel1", "CHANnel2", "OFF", name="MOSI channel source"))
     def set_decoder_spi_mosi_source(self, n, mosi_source):
         """
         Set the MOSI channel source in SPI decoding for the specified decoder.
@@ -1199,15 +1019,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         mosi_source (str): The MOSI channel source, one of {"CHANnel1", "CHANnel2", "OFF"}.
         """
-        valid_decoders = [1, 2]
-        valid_sources = {"CHANnel1", "CHANnel2", "OFF"}
-        mosi_source = mosi_source.upper()
-
-        if n in valid_decoders and mosi_source in valid_sources:
-            self.instrument.write(f":DECoder{n}:SPI:MOSI {mosi_source}")
-        else:
-            print(f"Invalid decoder ({n}) or MOSI source ({mosi_source}). Decoder: {valid_decoders}, Source: {valid_sources}")
+        self.instrument.write(f":DECoder{n}:SPI:MOSI {mosi_source}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_spi_mosi_source(self, n):
         """
         Query the MOSI channel source in SPI decoding for the specified decoder.
@@ -1218,13 +1032,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         str: The MOSI channel source, one of {"CHAN1", "CHAN2", "OFF"}.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:SPI:MOSI?")
-            return response.strip().upper()
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:SPI:MOSI?")
+        return response.strip().upper()
 
+    @validation.validate(n=DECODER, cs_source=validation.Choice("CHANnel1", "CHANnel2", name="CS channel source"))
     def set_decoder_spi_cs_source(self, n, cs_source):
         """
         Set the CS channel source in SPI decoding for the specified decoder. This command is only valid in CS mode.
@@ -1233,15 +1044,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         cs_source (str): The CS channel source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_decoders = [1, 2]
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        cs_source = cs_source.upper()
-
-        if n in valid_decoders and cs_source in valid_sources:
-            self.instrument.write(f":DECoder{n}:SPI:CS {cs_source}")
-        else:
-            print(f"Invalid decoder ({n}) or CS source ({cs_source}). Decoder: {valid_decoders}, Source: {valid_sources}")
+        self.instrument.write(f":DECoder{n}:SPI:CS {cs_source}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_spi_cs_source(self, n):
         """
         Query the CS channel source in SPI decoding for the specified decoder.
@@ -1252,13 +1057,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         str: The CS channel source, one of {"CHAN1", "CHAN2"}.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:SPI:CS?")
-            return response.strip().upper()
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:SPI:CS?")
+        return response.strip().upper()
 
+    @validation.validate(n=DECODER, polarity=validation.Choice("NCS", "CS", name="CS polarity"))
     def set_decoder_spi_cs_polarity(self, n, polarity):
         """
         Set the CS polarity in SPI decoding for the specified decoder. This command is only valid in CS mode.
@@ -1268,15 +1070,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         polarity (str): The CS polarity, one of {"NCS", "CS"}.
                         NCS: low level is valid. CS: high level is valid.
         """
-        valid_decoders = [1, 2]
-        valid_polarities = {"NCS", "CS"}
-        polarity = polarity.upper()
-
-        if n in valid_decoders and polarity in valid_polarities:
-            self.instrument.write(f":DECoder{n}:SPI:SELect {polarity}")
-        else:
-            print(f"Invalid decoder ({n}) or CS polarity ({polarity}). Decoder: {valid_decoders}, Polarity: {valid_polarities}")
+        self.instrument.write(f":DECoder{n}:SPI:SELect {polarity}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_spi_cs_polarity(self, n):
         """
         Query the CS polarity in SPI decoding for the specified decoder.
@@ -1287,13 +1083,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         str: The CS polarity, one of {"NCS", "CS"}.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:SPI:SELect?")
-            return response.strip().upper()
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:SPI:SELect?")
+        return response.strip().upper()
 
+    @validation.validate(n=DECODER, mode=validation.Choice("CS", "TIMeout", name="frame synchronization mode"))
     def set_decoder_spi_frame_sync_mode(self, n, mode):
         """
         Set the frame synchronization mode of SPI decoding for the specified decoder.
@@ -1302,15 +1095,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         mode (str): The frame synchronization mode, one of {"CS", "TIMeout"}.
         """
-        valid_decoders = [1, 2]
-        valid_modes = {"CS", "TIMeout"}
-        mode = mode.upper()
-
-        if n in valid_decoders and mode in valid_modes:
-            self.instrument.write(f":DECoder{n}:SPI:MODE {mode}")
-        else:
-            print(f"Invalid decoder ({n}) or mode ({mode}). Decoder: {valid_decoders}, Mode: {valid_modes}")
+        self.instrument.write(f":DECoder{n}:SPI:MODE {mode}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_spi_frame_sync_mode(self, n):
         """
         Query the frame synchronization mode of SPI decoding for the specified decoder.
@@ -1321,13 +1108,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         str: The frame synchronization mode, one of {"CS", "TIM"}.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:SPI:MODE?")
-            return response.strip().upper()
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:SPI:MODE?")
+        return response.strip().upper()
 
+    @validation.validate(n=DECODER, timeout_time=validation.Range(0, name="timeout time"))
     def set_decoder_spi_timeout_time(self, n, timeout_time):
         """
         Set the timeout time in the timeout mode of SPI decoding for the specified decoder.
@@ -1337,12 +1121,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         timeout_time (float): The timeout time in seconds.
         """
-        valid_decoders = [1, 2]
-        if n in valid_decoders and isinstance(timeout_time, (float, int)) and timeout_time >= 0: # Range is "Refer to Explanation", so assuming non-negative.
-            self.instrument.write(f":DECoder{n}:SPI:TIMeout {timeout_time}")
-        else:
-            print(f"Invalid decoder ({n}) or timeout time ({timeout_time}). Timeout time must be a non-negative float.")
+        self.instrument.write(f":DECoder{n}:SPI:TIMeout {timeout_time}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_spi_timeout_time(self, n):
         """
         Query the timeout time in the timeout mode of SPI decoding for the specified decoder.
@@ -1353,13 +1134,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         float: The timeout time in scientific notation (seconds).
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:SPI:TIMeout?")
-            return float(response.strip())
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:SPI:TIMeout?")
+        return float(response.strip())
 
+    @validation.validate(n=DECODER, polarity=validation.Choice("NEGative", "POSitive", name="polarity"))
     def set_decoder_spi_polarity(self, n, polarity):
         """
         Set the polarity of the SDA data line in SPI decoding for the specified decoder.
@@ -1368,15 +1146,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         polarity (str): The polarity, one of {"NEGative", "POSitive"}.
         """
-        valid_decoders = [1, 2]
-        valid_polarities = {"NEGative", "POSitive"}
-        polarity = polarity.upper()
-
-        if n in valid_decoders and polarity in valid_polarities:
-            self.instrument.write(f":DECoder{n}:SPI:POLarity {polarity}")
-        else:
-            print(f"Invalid decoder ({n}) or polarity ({polarity}). Decoder: {valid_decoders}, Polarity: {valid_polarities}")
+        self.instrument.write(f":DECoder{n}:SPI:POLarity {polarity}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_spi_polarity(self, n):
         """
         Query the polarity of the SDA data line in SPI decoding for the specified decoder.
@@ -1387,13 +1159,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         str: The polarity, one of {"NEG", "POS"}.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:SPI:POLarity?")
-            return response.strip().upper()
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:SPI:POLarity?")
+        return response.strip().upper()
 
+    @validation.validate(n=DECODER, edge=validation.Choice("RISE", "FALL", name="clock edge"))
     def set_decoder_spi_clock_edge(self, n, edge):
         """
         Set the clock type when the instrument samples the data line in SPI decoding for the specified decoder.
@@ -1402,15 +1171,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         edge (str): The clock edge, one of {"RISE", "FALL"}.
         """
-        valid_decoders = [1, 2]
-        valid_edges = {"RISE", "FALL"}
-        edge = edge.upper()
-
-        if n in valid_decoders and edge in valid_edges:
-            self.instrument.write(f":DECoder{n}:SPI:EDGE {edge}")
-        else:
-            print(f"Invalid decoder ({n}) or edge ({edge}). Decoder: {valid_decoders}, Edge: {valid_edges}")
+        self.instrument.write(f":DECoder{n}:SPI:EDGE {edge}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_spi_clock_edge(self, n):
         """
         Query the clock type when the instrument samples the data line in SPI decoding for the specified decoder.
@@ -1421,13 +1184,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         str: The clock edge, one of {"RISE", "FALL"}.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:SPI:EDGE?")
-            return response.strip().upper()
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:SPI:EDGE?")
+        return response.strip().upper()
 
+    @validation.validate(n=DECODER, endian=validation.Choice("LSB", "MSB", name="endian"))
     def set_decoder_spi_endian(self, n, endian):
         """
         Set the endian of the SPI decoding data for the specified decoder.
@@ -1436,15 +1196,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         endian (str): The endian, one of {"LSB", "MSB"}.
         """
-        valid_decoders = [1, 2]
-        valid_endians = {"LSB", "MSB"}
-        endian = endian.upper()
-
-        if n in valid_decoders and endian in valid_endians:
-            self.instrument.write(f":DECoder{n}:SPI:ENDian {endian}")
-        else:
-            print(f"Invalid decoder ({n}) or endian ({endian}). Decoder: {valid_decoders}, Endian: {valid_endians}")
+        self.instrument.write(f":DECoder{n}:SPI:ENDian {endian}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_spi_endian(self, n):
         """
         Query the endian of the SPI decoding data for the specified decoder.
@@ -1455,13 +1209,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         str: The endian, one of {"LSB", "MSB"}.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:SPI:ENDian?")
-            return response.strip().upper()
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:SPI:ENDian?")
+        return response.strip().upper()
 
+    @validation.validate(n=DECODER, width=validation.Range(4, 32, int, name="width"))
     def set_decoder_spi_data_width(self, n, width):
         """
         Set the number of bits of each frame of data in SPI decoding for the specified decoder.
@@ -1470,12 +1221,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         width (int): The data width, from 4 to 32 bits.
         """
-        valid_decoders = [1, 2]
-        if n in valid_decoders and isinstance(width, int) and 4 <= width <= 32:
-            self.instrument.write(f":DECoder{n}:SPI:WIDTh {width}")
-        else:
-            print(f"Invalid decoder ({n}) or width ({width}). Width must be an integer between 4 and 32.")
+        self.instrument.write(f":DECoder{n}:SPI:WIDTh {width}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_spi_data_width(self, n):
         """
         Query the number of bits of each frame of data in SPI decoding for the specified decoder.
@@ -1486,14 +1234,12 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         int: The data width.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:SPI:WIDTh?")
-            return int(response.strip())
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:SPI:WIDTh?")
+        return int(response.strip())
 
     # Parallel Decoding Commands
+    @validation.validate(n=DECODER,
+                         clk_source=validation.Choice("CHANnel1", "CHANnel2", "OFF", name="clock channel source"))
     def set_decoder_parallel_clk_source(self, n, clk_source):
         """
         Set the CLK channel source of parallel decoding for the specified decoder.
@@ -1502,15 +1248,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         clk_source (str): The clock channel source, one of {"CHANnel1", "CHANnel2", "OFF"}.
         """
-        valid_decoders = [1, 2]
-        valid_sources = {"CHANnel1", "CHANnel2", "OFF"}
-        clk_source = clk_source.upper()
-
-        if n in valid_decoders and clk_source in valid_sources:
-            self.instrument.write(f":DECoder{n}:PARallel:CLK {clk_source}")
-        else:
-            print(f"Invalid decoder ({n}) or clock source ({clk_source}). Decoder: {valid_decoders}, Source: {valid_sources}")
+        self.instrument.write(f":DECoder{n}:PARallel:CLK {clk_source}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_parallel_clk_source(self, n):
         """
         Query the CLK channel source of parallel decoding for the specified decoder.
@@ -1521,13 +1261,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         str: The clock channel source, one of {"CHAN1", "CHAN2", "OFF"}.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:PARallel:CLK?")
-            return response.strip().upper()
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:PARallel:CLK?")
+        return response.strip().upper()
 
+    @validation.validate(n=DECODER, edge=validation.Choice("RISE", "FALL", "BOTH", name="clock edge type"))
     def set_decoder_parallel_clock_edge(self, n, edge):
         """
         Set the edge type of the clock channel when the instrument samples the data channel in parallel decoding.
@@ -1536,15 +1273,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         edge (str): The clock edge type, one of {"RISE", "FALL", "BOTH"}.
         """
-        valid_decoders = [1, 2]
-        valid_edges = {"RISE", "FALL", "BOTH"}
-        edge = edge.upper()
-
-        if n in valid_decoders and edge in valid_edges:
-            self.instrument.write(f":DECoder{n}:PARallel:EDGE {edge}")
-        else:
-            print(f"Invalid decoder ({n}) or edge ({edge}). Decoder: {valid_decoders}, Edge: {valid_edges}")
+        self.instrument.write(f":DECoder{n}:PARallel:EDGE {edge}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_parallel_clock_edge(self, n):
         """
         Query the edge type of the clock channel when the instrument samples the data channel in parallel decoding.
@@ -1555,13 +1286,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         str: The clock edge type, one of {"RISE", "FALL", "BOTH"}.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:PARallel:EDGE?")
-            return response.strip().upper()
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:PARallel:EDGE?")
+        return response.strip().upper()
 
+    @validation.validate(n=DECODER, width=validation.Range(1, 2, int, name="width"))
     def set_decoder_parallel_data_width(self, n, width):
         """
         Set the data width (number of bits of each frame of data) of the parallel bus.
@@ -1570,12 +1298,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         width (int): The data width, from 1 to 2.
         """
-        valid_decoders = [1, 2]
-        if n in valid_decoders and isinstance(width, int) and 1 <= width <= 2:
-            self.instrument.write(f":DECoder{n}:PARallel:WIDTh {width}")
-        else:
-            print(f"Invalid decoder ({n}) or width ({width}). Width must be an integer between 1 and 2.")
+        self.instrument.write(f":DECoder{n}:PARallel:WIDTh {width}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_parallel_data_width(self, n):
         """
         Query the data width of the parallel bus.
@@ -1586,13 +1311,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         int: The data width.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:PARallel:WIDTh?")
-            return int(response.strip())
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:PARallel:WIDTh?")
+        return int(response.strip())
 
+    @validation.validate(n=DECODER, bit=validation.Range(0, type=int, name="bit"))
     def set_decoder_parallel_bit_selection(self, n, bit):
         """
         Set the data bit that requires a channel source on the parallel bus.
@@ -1602,14 +1324,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         bit (int): The data bit to select.
         """
-        valid_decoders = [1, 2]
-        # Note: Actual max bit depends on current data width, which needs to be queried or known.
-        # For now, we'll assume the user provides a valid bit within the *current* width.
-        if n in valid_decoders and isinstance(bit, int) and bit >= 0:
-            self.instrument.write(f":DECoder{n}:PARallel:BITX {bit}")
-        else:
-            print(f"Invalid decoder ({n}) or bit ({bit}). Bit must be a non-negative integer.")
+        # The highest bit depends on the current data width, which is not queried here.
+        self.instrument.write(f":DECoder{n}:PARallel:BITX {bit}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_parallel_bit_selection(self, n):
         """
         Query the data bit that requires a channel source on the parallel bus.
@@ -1620,13 +1338,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         int: The current data bit.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:PARallel:BITX?")
-            return int(response.strip())
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:PARallel:BITX?")
+        return int(response.strip())
 
+    @validation.validate(n=DECODER, source=validation.Choice("CHANnel1", "CHANnel2", name="channel source"))
     def set_decoder_parallel_bit_source(self, n, source):
         """
         Set the channel source of the data bit currently selected on the parallel bus.
@@ -1636,15 +1351,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         source (str): The channel source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_decoders = [1, 2]
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        source = source.upper()
-
-        if n in valid_decoders and source in valid_sources:
-            self.instrument.write(f":DECoder{n}:PARallel:SOURce {source}")
-        else:
-            print(f"Invalid decoder ({n}) or source ({source}). Decoder: {valid_decoders}, Source: {valid_sources}")
+        self.instrument.write(f":DECoder{n}:PARallel:SOURce {source}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_parallel_bit_source(self, n):
         """
         Query the channel source of the data bit currently selected on the parallel bus.
@@ -1655,13 +1364,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         str: The channel source, one of {"CHAN1", "CHAN2"}.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:PARallel:SOURce?")
-            return response.strip().upper()
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:PARallel:SOURce?")
+        return response.strip().upper()
 
+    @validation.validate(n=DECODER, polarity=validation.Choice("NEGative", "POSitive", name="polarity"))
     def set_decoder_parallel_polarity(self, n, polarity):
         """
         Set the data polarity of parallel decoding for the specified decoder.
@@ -1671,15 +1377,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         polarity (str): The polarity, one of {"NEGative", "POSitive"}.
                         NEGative: low level is 1. POSitive: high level is 1.
         """
-        valid_decoders = [1, 2]
-        valid_polarities = {"NEGative", "POSitive"}
-        polarity = polarity.upper()
-
-        if n in valid_decoders and polarity in valid_polarities:
-            self.instrument.write(f":DECoder{n}:PARallel:POLarity {polarity}")
-        else:
-            print(f"Invalid decoder ({n}) or polarity ({polarity}). Decoder: {valid_decoders}, Polarity: {valid_polarities}")
+        self.instrument.write(f":DECoder{n}:PARallel:POLarity {polarity}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_parallel_polarity(self, n):
         """
         Query the data polarity of parallel decoding for the specified decoder.
@@ -1690,13 +1390,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         str: The polarity, one of {"NEG", "POS"}.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:PARallel:POLarity?")
-            return response.strip().upper()
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:PARallel:POLarity?")
+        return response.strip().upper()
 
+    @validation.validate(n=DECODER)
     def set_decoder_parallel_noise_reject(self, n, state):
         """
         Turn on or off the noise rejection function of parallel decoding.
@@ -1705,12 +1402,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         state (bool): Whether to turn on (True) or off (False) the noise rejection function.
         """
-        valid_decoders = [1, 2]
-        if n in valid_decoders:
-            self.instrument.write(f":DECoder{n}:PARallel:NREJect {'ON' if state else 'OFF'}")
-        else:
-            print(f"Invalid decoder. Choose from {valid_decoders}.")
+        self.instrument.write(f":DECoder{n}:PARallel:NREJect {'ON' if state else 'OFF'}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_parallel_noise_reject(self, n):
         """
         Query the status of the noise rejection function of parallel decoding.
@@ -1721,13 +1415,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         bool: The status of the noise rejection function (True for ON, False for OFF).
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:PARallel:NREJect?")
-            return bool(int(response.strip()))
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:PARallel:NREJect?")
+        return bool(int(response.strip()))
 
+    @validation.validate(n=DECODER, time=validation.Range(0.0, 0.1, name="noise rejection time"))
     def set_decoder_parallel_noise_reject_time(self, n, time):
         """
         Set the noise rejection time of parallel decoding.
@@ -1737,12 +1428,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         time (float): The noise rejection time in seconds (0.00s to 100ms).
         """
-        valid_decoders = [1, 2]
-        if n in valid_decoders and isinstance(time, (float, int)) and 0.0 <= time <= 0.1: # 100ms = 0.1s
-            self.instrument.write(f":DECoder{n}:PARallel:NRTime {time}")
-        else:
-            print(f"Invalid decoder ({n}) or time ({time}). Time must be a float between 0.0 and 0.1 (100ms).")
+        self.instrument.write(f":DECoder{n}:PARallel:NRTime {time}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_parallel_noise_reject_time(self, n):
         """
         Query the noise rejection time of parallel decoding.
@@ -1753,13 +1441,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         float: The noise rejection time in scientific notation (seconds).
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:PARallel:NRTime?")
-            return float(response.strip())
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:PARallel:NRTime?")
+        return float(response.strip())
 
+    @validation.validate(n=DECODER, compensation=validation.Range(-0.1, 0.1, name="clock compensation"))
     def set_decoder_parallel_clock_compensation(self, n, compensation):
         """
         Set the clock compensation time of parallel decoding.
@@ -1768,12 +1453,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         compensation (float): The clock compensation time in seconds (-100ms to 100ms).
         """
-        valid_decoders = [1, 2]
-        if n in valid_decoders and isinstance(compensation, (float, int)) and -0.1 <= compensation <= 0.1: # 100ms = 0.1s
-            self.instrument.write(f":DECoder{n}:PARallel:CCOMpensation {compensation}")
-        else:
-            print(f"Invalid decoder ({n}) or compensation ({compensation}). Compensation must be a float between -0.1 and 0.1 (100ms).")
+        self.instrument.write(f":DECoder{n}:PARallel:CCOMpensation {compensation}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_parallel_clock_compensation(self, n):
         """
         Query the clock compensation time of parallel decoding.
@@ -1784,13 +1466,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         float: The compensation time in scientific notation (seconds).
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:PARallel:CCOMpensation?")
-            return float(response.strip())
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:PARallel:CCOMpensation?")
+        return float(response.strip())
 
+    @validation.validate(n=DECODER)
     def set_decoder_parallel_plot_function(self, n, state):
         """
         Turn on or off the curve (plot) function of parallel decoding.
@@ -1799,12 +1478,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         state (bool): Whether to turn on (True) or off (False) the curve function.
         """
-        valid_decoders = [1, 2]
-        if n in valid_decoders:
-            self.instrument.write(f":DECoder{n}:PARallel:PLOT {'ON' if state else 'OFF'}")
-        else:
-            print(f"Invalid decoder. Choose from {valid_decoders}.")
+        self.instrument.write(f":DECoder{n}:PARallel:PLOT {'ON' if state else 'OFF'}")
 
+    @validation.validate(n=DECODER)
     def get_decoder_parallel_plot_function(self, n):
         """
         Query the status of the curve (plot) function of parallel decoding.
@@ -1815,12 +1491,8 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         bool: The status of the curve function (True for ON, False for OFF).
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":DECoder{n}:PARallel:PLOT?")
-            return bool(int(response.strip()))
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":DECoder{n}:PARallel:PLOT?")
+        return bool(int(response.strip()))
 #Display Commands
     def clear_display(self):
         """
@@ -1830,6 +1502,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         """
         self.instrument.write(":DISPlay:CLEar")
 
+    @validation.validate(fmt=IMAGE_FORMAT)
     def get_display_data(self, color=None, invert=None, fmt=None):
         """
         Read the data stream of the image currently displayed on the screen.
@@ -1841,8 +1514,8 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         fmt (str, optional): Image format, one of {"BMP24", "BMP8", "PNG", "JPEG", "TIFF"}. Default is BMP24.
 
         Returns:
-        bytes: The raw image data stream, including the TMC Blockheader.
-               The user needs to handle parsing this data (remove TMC header).
+        memoryview: The image data with the TMC Blockheader removed, a view of the received
+                    block without a copy. b"" if the transfer failed.
         """
         command_parts = []
         if color is not None:
@@ -1850,37 +1523,65 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         if invert is not None:
             command_parts.append("ON" if invert else "OFF") # PDF says 1|ON or 0|OFF, but ON/OFF is cleaner
         if fmt is not None:
-            valid_formats = {"BMP24", "BMP8", "PNG", "JPEG", "TIFF"}
-            if fmt.upper() in valid_formats:
-                command_parts.append(fmt.upper())
-            else:
-                print(f"Invalid format: {fmt}. Using default.")
-                command_parts = [] # Reset to use default if format is invalid
-
-        command = ":DATA?"
+            command_parts.append(str(fmt))
+
+        command = ":DISPlay:DATA?"
         if command_parts:
             command += " " + ",".join(command_parts)
 
-
-        # Use query_binary_values to read the image data
-        # The 'B' datatype is for 8-bit unsigned integers (bytes)
-        # The PDF notes a TMC header which needs to be stripped by the user.
-        # It also mentions potential timeout issues for large data.
+        # A single raw read avoids unpacking the ~1 MB image into a list of integers.
+        # The timeout follows the size of the image format.
         try:
-            # It's crucial to set a proper timeout for large binary transfers
-            # self.instrument.timeout = 5000 # Example: 5 seconds timeout
-            data = self.instrument.query_binary_values(command, datatype='B', container=bytes)
-            # self.instrument.timeout = 2000 # Reset to default if needed
-            return data
+            return self._read_block(command, timeout_policy.display_size(fmt))
         except pyvisa.errors.VisaIOError as e:
             print(f"VISA IO Error while getting display data: {e}")
-            print("Consider increasing the instrument's timeout.")
             return b""
         except Exception as e:
             print(f"An unexpected error occurred: {e}")
             return b""
 
+    def get_screenshot(self, fmt=None):
+        """
+        Read the image currently displayed on the screen.
 
+        Without fmt the compressed PNG format is requested. If the oscilloscope answers with
+        another format (older firmware ignores the format parameter), that format is used
+        from then on without asking for PNG again.
+
+        Parameters:
+        fmt (str, optional): Image format, one of {"BMP24", "BMP8", "PNG", "JPEG", "TIFF"}.
+
+        Returns:
+        memoryview: The image data without TMC Blockheader (see get_display_data).
+        """
+        requested = fmt if fmt is not None else self._screenshot_format
+        data = self.get_display_data(color=True, invert=False, fmt=requested)
+        if fmt is None and requested == "PNG" and screenshot.image_format(data) != "PNG":
+            self._screenshot_format = None
+            if len(data) == 0:
+                # The format parameter was rejected, retry with the default format.
+                data = self.get_display_data()
+        if len(data) == 0:
+            raise RuntimeError("No image data received from the oscilloscope.")
+        return data
+
+    def save_screenshot(self, filename, writer=None):
+        """
+        Save the image currently displayed on the screen to a file on this computer.
+
+        Parameters:
+        filename (str): The file name. The extension of the image format is added if missing.
+        writer (screenshot.ScreenshotWriter, optional): Write the file on the writer's background thread.
+
+        Returns:
+        str: The name of the file.
+        """
+        data = self.get_screenshot()
+        if writer is not None:
+            return writer.submit(filename, data)
+        return screenshot.write_image(filename, data)
+
+    @validation.validate(display_type=validation.Choice("VECTors", "DOTS", name="display mode"))
     def set_display_type(self, display_type):
         """
         Set the display mode of the waveform on the screen.
@@ -1888,12 +1589,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         display_type (str): The display mode, one of {"VECTors", "DOTS"}.
         """
-        valid_types = {"VECTors", "DOTS"}
-        display_type = display_type.upper()
-        if display_type in valid_types:
-            self.instrument.write(f":DISPlay:TYPE {display_type}")
-        else:
-            print(f"Invalid display type. Choose from {valid_types}.")
+        self.instrument.write(f":DISPlay:TYPE {display_type}")
 
     def get_display_type(self):
         """
@@ -1905,6 +1601,8 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":DISPlay:TYPE?")
         return response.strip().upper()
 
+    @validation.validate(time=validation.Choice("MIN", "INFinite", 0.1, 0.2, 0.5, 1.0, 5.0, 10.0,
+                                                name="persistence time"))
     def set_display_persistence_time(self, time):
         """
         Set the persistence time.
@@ -1912,22 +1610,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         time (str or float): The persistence time, one of {"MIN", 0.1, 0.2, 0.5, 1, 5, 10, "INFinite"}.
         """
-        valid_times_str = {"MIN", "INFINITE"}
-        valid_times_float = {0.1, 0.2, 0.5, 1.0, 5.0, 10.0}
-
-        if isinstance(time, str):
-            time = time.upper()
-            if time in valid_times_str:
-                self.instrument.write(f":DISPlay:GRADing:TIME {time}")
-            else:
-                print(f"Invalid persistence time string. Choose from {valid_times_str}.")
-        elif isinstance(time, (int, float)):
-            if float(time) in valid_times_float:
-                self.instrument.write(f":DISPlay:GRADing:TIME {float(time)}")
-            else:
-                print(f"Invalid persistence time float/int. Choose from {valid_times_float}.")
-        else:
-            print(f"Invalid persistence time type. Must be a string or a float/int from allowed values.")
+        self.instrument.write(f":DISPlay:GRADing:TIME {time}")
 
 
     def get_display_persistence_time(self):
@@ -1944,6 +1627,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         except ValueError:
             return response_str # Returns MIN or INF
 
+    @validation.validate(brightness=validation.Range(0, 100, int, name="brightness"))
     def set_waveform_brightness(self, brightness):
         """
         Set the waveform brightness.
@@ -1951,10 +1635,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         brightness (int): The brightness level, from 0 to 100.
         """
-        if isinstance(brightness, int) and 0 <= brightness <= 100:
-            self.instrument.write(f":DISPlay:WBRightness {brightness}")
-        else:
-            print("Invalid brightness value. Must be an integer between 0 and 100.")
+        self.instrument.write(f":DISPlay:WBRightness {brightness}")
 
     def get_waveform_brightness(self):
         """
@@ -1966,6 +1647,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":DISPlay:WBRightness?")
         return int(response.strip())
 
+    @validation.validate(grid_type=validation.Choice("FULL", "HALF", "NONE", name="grid type"))
     def set_grid_type(self, grid_type):
         """
         Set the grid type of screen display.
@@ -1973,12 +1655,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         grid_type (str): The grid type, one of {"FULL", "HALF", "NONE"}.
         """
-        valid_types = {"FULL", "HALF", "NONE"}
-        grid_type = grid_type.upper()
-        if grid_type in valid_types:
-            self.instrument.write(f":DISPlay:GRID {grid_type}")
-        else:
-            print(f"Invalid grid type. Choose from {valid_types}.")
+        self.instrument.write(f":DISPlay:GRID {grid_type}")
 
     def get_grid_type(self):
         """
@@ -1990,6 +1667,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":DISPlay:GRID?")
         return response.strip().upper()
 
+    @validation.validate(brightness=validation.Range(0, 100, int, name="brightness"))
     def set_grid_brightness(self, brightness):
         """
         Set the brightness of the screen grid.
@@ -1997,10 +1675,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         brightness (int): The brightness level, from 0 to 100.
         """
-        if isinstance(brightness, int) and 0 <= brightness <= 100:
-            self.instrument.write(f":DISPlay:GBRightness {brightness}")
-        else:
-            print("Invalid brightness value. Must be an integer between 0 and 100.")
+        self.instrument.write(f":DISPlay:GBRightness {brightness}")
 
     def get_grid_brightness(self,):
         """
@@ -2013,6 +1688,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         return int(response.strip())
 
     # Event Table Commands
+    @validation.validate(n=DECODER)
     def set_event_table_display(self, n, state):
         """
         Turn on or off the decoding event table.
@@ -2022,12 +1698,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         state (bool): Whether to turn on (True) or off (False) the event table display.
         """
-        valid_decoders = [1, 2]
-        if n in valid_decoders:
-            self.instrument.write(f":ETABle{n}:DISP {'ON' if state else 'OFF'}")
-        else:
-            print(f"Invalid decoder channel. Choose from {valid_decoders}.")
+        self.instrument.write(f":ETABle{n}:DISP {'ON' if state else 'OFF'}")
 
+    @validation.validate(n=DECODER)
     def get_event_table_display(self, n):
         """
         Query the status of the decoding event table.
@@ -2038,13 +1711,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         bool: The status of the decoding event table (True for ON, False for OFF).
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":ETABle{n}:DISP?")
-            return bool(int(response.strip()))
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":ETABle{n}:DISP?")
+        return bool(int(response.strip()))
 
+    @validation.validate(n=DECODER, fmt=validation.Choice("HEX", "ASCII", "DEC", name="data display format"))
     def set_event_table_format(self, n, fmt):
         """
         Set the data display format of the event table.
@@ -2053,15 +1723,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         fmt (str): The data display format, one of {"HEX", "ASCII", "DEC"}.
         """
-        valid_decoders = [1, 2]
-        valid_formats = {"HEX", "ASCII", "DEC"}
-        fmt = fmt.upper()
-
-        if n in valid_decoders and fmt in valid_formats:
-            self.instrument.write(f":ETABle{n}:FORMat {fmt}")
-        else:
-            print(f"Invalid decoder ({n}) or format ({fmt}). Format: {valid_formats}")
+        self.instrument.write(f":ETABle{n}:FORMat {fmt}")
 
+    @validation.validate(n=DECODER)
     def get_event_table_format(self, n):
         """
         Query the data display format of the event table.
@@ -2072,13 +1736,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         str: The data display format, one of {"HEX", "ASC", "DEC"}.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":ETABle{n}:FORMat?")
-            return response.strip().upper()
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":ETABle{n}:FORMat?")
+        return response.strip().upper()
 
+    @validation.validate(n=DECODER, view_mode=validation.Choice("PACKage", "DETail", "PAYLoad", name="display mode"))
     def set_event_table_view_mode(self, n, view_mode):
         """
         Set the display mode of the event table.
@@ -2087,15 +1748,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         view_mode (str): The display mode, one of {"PACKage", "DETail", "PAYLoad"}.
         """
-        valid_decoders = [1, 2]
-        valid_modes = {"PACKage", "DETail", "PAYLoad"}
-        view_mode = view_mode.upper()
-
-        if n in valid_decoders and view_mode in valid_modes:
-            self.instrument.write(f":ETABle{n}:VIEW {view_mode}")
-        else:
-            print(f"Invalid decoder ({n}) or view mode ({view_mode}). View modes: {valid_modes}")
+        self.instrument.write(f":ETABle{n}:VIEW {view_mode}")
 
+    @validation.validate(n=DECODER)
     def get_event_table_view_mode(self, n):
         """
         Query the display mode of the event table.
@@ -2106,13 +1761,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         str: The display mode, one of {"PACK", "DET", "PAYL"}.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":ETABle{n}:VIEW?")
-            return response.strip().upper()
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":ETABle{n}:VIEW?")
+        return response.strip().upper()
 
+    @validation.validate(n=DECODER, column=validation.Choice("DATA", "TX", "RX", "MISO", "MOSI", name="column"))
     def set_event_table_column(self, n, column):
         """
         Set the current column of the event table.
@@ -2122,16 +1774,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         column (str): The column to set, e.g., "DATA", "TX", "RX", "MISO", "MOSI".
         """
-        valid_decoders = [1, 2]
-        valid_columns = {"DATA", "TX", "RX", "MISO", "MOSI"} # General list, actual validity depends on decoder mode
-        column = column.upper()
-
-        if n in valid_decoders and column in valid_columns:
-            self.instrument.write(f":ETABle{n}:COLumn {column}")
-        else:
-            print(f"Invalid decoder ({n}) or column ({column}). Column: {valid_columns}")
-            print("Note: Column validity depends on the active decoder mode.")
+        # The columns available depend on the decoder mode.
+        self.instrument.write(f":ETABle{n}:COLumn {column}")
 
+    @validation.validate(n=DECODER)
     def get_event_table_column(self, n):
         """
         Query the current column of the event table.
@@ -2142,13 +1788,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         str: The current column, e.g., "DATA", "TX", "RX", "MISO", "MOSI".
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":ETABle{n}:COLumn?")
-            return response.strip().upper()
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":ETABle{n}:COLumn?")
+        return response.strip().upper()
 
+    @validation.validate(n=DECODER, row=validation.Range(1, type=int, name="row"))
     def set_event_table_row(self, n, row):
         """
         Set the current row of the event table.
@@ -2157,12 +1800,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
         row (int): The row number, from 1 to the maximum number of rows of the current event table.
         """
-        valid_decoders = [1, 2]
-        if n in valid_decoders and isinstance(row, int) and row >= 1: # Max row is dynamic, so only check for >=1
-            self.instrument.write(f":ETABle{n}:ROW {row}")
-        else:
-            print(f"Invalid decoder ({n}) or row ({row}). Row must be an integer >= 1.")
+        self.instrument.write(f":ETABle{n}:ROW {row}")
 
+    @validation.validate(n=DECODER)
     def get_event_table_row(self, n):
         """
         Query the current row of the event table.
@@ -2173,13 +1813,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         int: The current row in integer. Returns 0 if the event table is empty.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":ETABle{n}:ROW?")
-            return int(response.strip())
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":ETABle{n}:ROW?")
+        return int(response.strip())
 
+    @validation.validate(n=DECODER, sort_type=validation.Choice("ASCend", "DESCend", name="sort type"))
     def set_event_table_sort_type(self, n, sort_type):
         """
         Set the display type of the decoding results in the event table.
@@ -2187,16 +1824,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         n (int): The decoder channel, either 1 or 2.
         sort_type (str): The sort type, one of {"ASCend", "DESCend"}.
-        """
-        valid_decoders = [1, 2]
-        valid_types = {"ASCend", "DESCend"}
-        sort_type = sort_type.upper()
-
-        if n in valid_decoders and sort_type in valid_types:
-            self.instrument.write(f":ETABle{n}:SORT {sort_type}")
-        else:
-            print(f"Invalid decoder ({n}) or sort type ({sort_type}). Sort types: {valid_types}")
+        """
+        self.instrument.write(f":ETABle{n}:SORT {sort_type}")
 
+    @validation.validate(n=DECODER)
     def get_event_table_sort_type(self, n):
         """
         Query the display type of the decoding results in the event table.
@@ -2207,13 +1838,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         str: The sort type, one of {"ASC", "DESC"}.
         """
-        if n in [1, 2]:
-            response = self.instrument.query(f":ETABle{n}:SORT?")
-            return response.strip().upper()
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
-            return None
+        response = self.instrument.query(f":ETABle{n}:SORT?")
+        return response.strip().upper()
 
+    @validation.validate(n=DECODER)
     def get_event_table_data(self, n):
         """
         Read the current event table data.
@@ -2222,26 +1850,61 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The decoder channel, either 1 or 2.
 
         Returns:
-        bytes: The raw event table data, including the TMC data description header.
-               The user needs to handle parsing this data (remove TMC header).
+        memoryview: The event table data with the TMC header removed (no copy is made).
+                    Use read_event_table to get the parsed table.
         """
-        if n in [1, 2]:
-            try:
-                # Use query_binary_values to read the event table data
-                data = self.instrument.query_binary_values(f":ETABle{n}:DATA?", datatype='B', container=bytes)
-                return data
-            except pyvisa.errors.VisaIOError as e:
-                print(f"VISA IO Error while getting event table data: {e}")
-                print("Consider increasing the instrument's timeout.")
-                return b""
-            except Exception as e:
-                print(f"An unexpected error occurred: {e}")
-                return b""
-        else:
-            print("Invalid decoder channel. Choose 1 or 2.")
+        try:
+            return self._read_block(f":ETABle{n}:DATA?", timeout_policy.EVENT_TABLE_SIZE)
+        except pyvisa.errors.VisaIOError as e:
+            print(f"VISA IO Error while getting event table data: {e}")
+            return b""
+        except Exception as e:
+            print(f"An unexpected error occurred: {e}")
             return b""
+
+    def read_event_table(self, n, as_dict=False):
+        """
+        Read and parse the current event table.
+
+        Parameters:
+        n (int): The decoder channel, either 1 or 2.
+        as_dict (bool): Return a dict of column arrays instead of a structured array.
+
+        Returns:
+        numpy.ndarray or dict: The table with the fields 'time' (s), one field per table
+                               column and 'error' (see oscilloscope_helper.parse_event_table).
+        """
+        if n not in [1, 2]:
+            raise ValueError("Invalid decoder channel. Choose 1 or 2.")
+        data = self._read_block(f":ETABle{n}:DATA?", timeout_policy.EVENT_TABLE_SIZE)
+        return oscilloscope_helper.parse_event_table(data, as_dict)
+
+    def iter_event_table(self, n, interval=0.5, timeout=None, as_dict=False):
+        """
+        Poll the event table while the decoder runs and yield the rows added since the last poll.
+
+        Parameters:
+        n (int): The decoder channel, either 1 or 2.
+        interval (float): Seconds between two reads of the event table.
+        timeout (float, optional): Stop after this many seconds. None polls until the caller stops iterating.
+        as_dict (bool): Yield dicts of column arrays instead of structured arrays.
+
+        Yields:
+        numpy.ndarray or dict: The new rows. Nothing is yielded for polls without new rows.
+        """
+        if n not in [1, 2]:
+            raise ValueError("Invalid decoder channel. Choose 1 or 2.")
+        tracker = oscilloscope_helper.EventTableTracker(as_dict)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while deadline is None or time.monotonic() < deadline:
+            rows = tracker.update(self._read_block(f":ETABle{n}:DATA?", timeout_policy.EVENT_TABLE_SIZE))
+            if len(rows["time"] if as_dict else rows):
+                yield rows
+            sleep(interval)
+
 #Function Commands
     # Function Commands (Waveform Recording)
+    @validation.validate(frame=FRAME)
     def set_waveform_record_end_frame(self, frame):
         """
         Set the end frame of waveform recording. 
@@ -2251,10 +1914,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         """
         # The PDF states "1 to the maximum number of frames can be recorded currently" 
         # We can't query max frames here to validate, so we'll just check for >= 1.
-        if isinstance(frame, int) and frame >= 1:
-            self.instrument.write(f":FUNCtion:WRECord:FEND {frame}") 
-        else:
-            print(f"Invalid frame value ({frame}). Frame must be an integer >= 1.")
+        self.instrument.write(f":FUNCtion:WRECord:FEND {frame}") 
 
     def get_waveform_record_end_frame(self):
         """
@@ -2276,6 +1936,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":FUNCtion:WRECord:FMAX?")
         return int(response.strip())
 
+    @validation.validate(interval=INTERVAL)
     def set_waveform_record_interval(self, interval):
         """
         Set the time interval between adjacent frames during waveform recording. 
@@ -2284,12 +1945,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         interval (float): The time interval in seconds. Range: 1e-6 to 1000 seconds. 
                           You can also use "MIN" for the minimum interval. 
         """
-        if isinstance(interval, str) and interval.upper() == "MIN":
-            self.instrument.write(":FUNCtion:WRECord:FINTerval MIN") 
-        elif isinstance(interval, (float, int)) and 1e-6 <= float(interval) <= 1000:
-            self.instrument.write(f":FUNCtion:WRECord:FINTerval {float(interval)}") 
-        else:
-            print(f"Invalid interval value ({interval}). Must be 'MIN' or a float between 1e-6 and 1000.")
+        self.instrument.write(f":FUNCtion:WRECord:FINTerval {interval}")
 
     def get_waveform_record_interval(self):
         """
@@ -2325,6 +1981,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":FUNCtion:WRECord:PROMpt?") 
         return bool(int(response.strip())) # Returns 1 for ON, 0 for OFF 
 
+    @validation.validate(operate_mode=validation.Choice("REC", "STOP", "SAVE", name="operation type"))
     def set_waveform_record_operation(self, operate_mode):
         """
         Set the operation type of waveform recording. 
@@ -2332,13 +1989,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         operate_mode (str): The operation type, one of {"REC", "STOP", "SAVE"}. 
         """
-        valid_modes = {"REC", "STOP", "SAVE"} 
-        operate_mode = operate_mode.upper() 
-
-        if operate_mode in valid_modes:
-            self.instrument.write(f":FUNCtion:WRECord:OPERate {operate_mode}") 
-        else:
-            print(f"Invalid operation mode ({operate_mode}). Choose from {valid_modes}.")
+        self.instrument.write(f":FUNCtion:WRECord:OPERate {operate_mode}") 
 
     def get_waveform_record_operation(self):
         """
@@ -2370,6 +2021,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         return bool(int(response.strip())) # Returns 1 for ON, 0 for OFF 
 
     # Function Commands (Waveform Playback)
+    @validation.validate(frame=FRAME)
     def set_waveform_replay_start_frame(self, frame):
         """
         Set the start frame of waveform playback. 
@@ -2378,10 +2030,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         frame (int): The start frame number, from 1 to the maximum number of frames recorded. 
         """
         # Similar to end frame, we'll just check for >= 1. 
-        if isinstance(frame, int) and frame >= 1:
-            self.instrument.write(f":FUNCtion:WREPlay:FSTart {frame}") 
-        else:
-            print(f"Invalid frame value ({frame}). Frame must be an integer >= 1.")
+        self.instrument.write(f":FUNCtion:WREPlay:FSTart {frame}") 
 
     def get_waveform_replay_start_frame(self):
         """
@@ -2393,6 +2042,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":FUNCtion:WREPlay:FSTart?") 
         return int(response.strip())
 
+    @validation.validate(frame=FRAME)
     def set_waveform_replay_end_frame(self, frame):
         """
         Set the end frame of waveform playback. 
@@ -2401,10 +2051,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         frame (int): The end frame number, from 1 to the maximum number of frames recorded. 
         """
         # Similar to start frame, we'll just check for >= 1. 
-        if isinstance(frame, int) and frame >= 1:
-            self.instrument.write(f":FUNCtion:WREPlay:FEND {frame}") 
-        else:
-            print(f"Invalid frame value ({frame}). Frame must be an integer >= 1.")
+        self.instrument.write(f":FUNCtion:WREPlay:FEND {frame}") 
 
     def get_waveform_replay_end_frame(self):
         """
@@ -2426,6 +2073,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":FUNCtion:WREPlay:FMAX?") 
         return int(response.strip())
 
+    @validation.validate(interval=INTERVAL)
     def set_waveform_replay_interval(self, interval):
         """
         Set the time interval between adjacent frames during waveform playback. 
@@ -2434,12 +2082,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         interval (float): The time interval in seconds. Range: 1e-6 to 1000 seconds. 
                           You can also use "MIN" for the minimum interval. 
         """
-        if isinstance(interval, str) and interval.upper() == "MIN":
-            self.instrument.write(":FUNCtion:WREPlay:FINTerval MIN") 
-        elif isinstance(interval, (float, int)) and 1e-6 <= float(interval) <= 1000:
-            self.instrument.write(f":FUNCtion:WREPlay:FINTerval {float(interval)}") 
-        else:
-            print(f"Invalid interval value ({interval}). Must be 'MIN' or a float between 1e-6 and 1000.")
+        self.instrument.write(f":FUNCtion:WREPlay:FINTerval {interval}")
 
     def get_waveform_replay_interval(self):
         """
@@ -2455,6 +2098,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         except ValueError:
             return response_str # Returns MIN
 
+    @validation.validate(mode=validation.Choice("NORMal", "LOOP", name="playback mode"))
     def set_waveform_replay_mode(self, mode):
         """
         Set the playback mode of the waveform. 
@@ -2462,13 +2106,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         mode (str): The playback mode, one of {"NORMal", "LOOP"}. 
         """
-        valid_modes = {"NORMal", "LOOP"} 
-        mode = mode.upper() 
-
-        if mode in valid_modes:
-            self.instrument.write(f":FUNCtion:WREPlay:MODE {mode}") 
-        else:
-            print(f"Invalid mode ({mode}). Choose from {valid_modes}.")
+        self.instrument.write(f":FUNCtion:WREPlay:MODE {mode}") 
 
     def get_waveform_replay_mode(self):
         """
@@ -2480,6 +2118,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":FUNCtion:WREPlay:MODE?") 
         return response.strip().upper() 
 
+    @validation.validate(direction=validation.Choice("FORWard", "BACKward", name="playback direction"))
     def set_waveform_replay_direction(self, direction):
         """
         Set the playback direction of the waveform. 
@@ -2487,13 +2126,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         direction (str): The playback direction, one of {"FORWard", "BACKward"}. 
         """
-        valid_directions = {"FORWard", "BACKward"} 
-        direction = direction.upper() 
-
-        if direction in valid_directions:
-            self.instrument.write(f":FUNCtion:WREPlay:DIRection {direction}") 
-        else:
-            print(f"Invalid direction ({direction}). Choose from {valid_directions}.")
+        self.instrument.write(f":FUNCtion:WREPlay:DIRection {direction}") 
 
     def get_waveform_replay_direction(self):
         """
@@ -2505,6 +2138,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":FUNCtion:WREPlay:DIRection?") 
         return response.strip().upper() 
 
+    @validation.validate(operate_type=validation.Choice("PLAY", "PAUSE", "STOP", name="operation type"))
     def set_waveform_replay_operate(self, operate_type):
         """
         Set the operation type of waveform playback. 
@@ -2512,13 +2146,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         operate_type (str): The operation type, one of {"PLAY", "PAUSE", "STOP"}. 
         """
-        valid_types = {"PLAY", "PAUSE", "STOP"} 
-        operate_type = operate_type.upper() 
-
-        if operate_type in valid_types:
-            self.instrument.write(f":FUNCtion:WREPlay:OPERate {operate_type}") 
-        else:
-            print(f"Invalid operation type ({operate_type}). Choose from {valid_types}.")
+        self.instrument.write(f":FUNCtion:WREPlay:OPERate {operate_type}") 
 
     def get_waveform_replay_operate(self):
         """
@@ -2530,6 +2158,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":FUNCtion:WREPlay:OPERate?") 
         return response.strip().upper() 
 
+    @validation.validate(current_frame=FRAME)
     def set_waveform_replay_current_frame(self, current_frame):
         """
         Set the current frame in waveform playback. 
@@ -2538,10 +2167,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         current_frame (int): The current frame number, from 1 to the maximum number of frames recorded. 
         """
         # We can't query max frames here to validate, so we'll just check for >= 1. 
-        if isinstance(current_frame, int) and current_frame >= 1:
-            self.instrument.write(f":FUNCtion:WREPlay:FCURrent {current_frame}") 
-        else:
-            print(f"Invalid current frame ({current_frame}). Frame must be an integer >= 1.")
+        self.instrument.write(f":FUNCtion:WREPlay:FCURrent {current_frame}") 
 
     def get_waveform_replay_current_frame(self):
         """
@@ -2767,6 +2393,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MATH:DISPlay?")
         return bool(int(response.strip()))
 
+    @validation.validate(operator=validation.Choice("ADD", "SUBTract", "MULTiply", "DIVision", "AND", "OR", "XOR",
+                                                    "NOT", "FFT", "INTG", "DIFF", "SQRT", "LOG", "LN", "EXP", "ABS",
+                                                    "FILTer", name="operator"))
     def set_math_operator(self, operator):
         """
         Set the operator of the math operation.
@@ -2776,14 +2405,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
                         "AND", "OR", "XOR", "NOT", "FFT", "INTG", "DIFF", "SQRT",
                         "LOG", "LN", "EXP", "ABS", "FILTer"}.
         """
-        valid_operators = {"ADD", "SUBTract", "MULTiply", "DIVision", "AND", "OR",
-                           "XOR", "NOT", "FFT", "INTG", "DIFF", "SQRT", "LOG", "LN",
-                           "EXP", "ABS", "FILTer"}
-        operator = operator.upper()
-        if operator in valid_operators:
-            self.instrument.write(f":MATH:OPERator {operator}")
-        else:
-            print(f"Invalid operator ({operator}). Choose from {valid_operators}.")
+        self.instrument.write(f":MATH:OPERator {operator}")
 
     def get_math_operator(self):
         """
@@ -2797,6 +2419,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MATH:OPERator?")
         return response.strip().upper()
 
+    @validation.validate(source=validation.Choice("CHANnel1", "CHANnel2", "FX", name="source"))
     def set_math_source1(self, source):
         """
         Set the source or source A of algebraic operation/functional operation/
@@ -2805,12 +2428,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2", "FX"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2", "FX"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":MATH:SOURce1 {source}")
-        else:
-            print(f"Invalid source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":MATH:SOURce1 {source}")
 
     def get_math_source1(self):
         """
@@ -2823,6 +2441,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MATH:SOURce1?")
         return response.strip().upper()
 
+    @validation.validate(source=validation.Choice("CHANnel1", "CHANnel2", "FX", name="source"))
     def set_math_source2(self, source):
         """
         Set source B of algebraic operation/the outer layer operation of compound operation.
@@ -2830,12 +2449,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2", "FX"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2", "FX"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":MATH:SOURce2 {source}")
-        else:
-            print(f"Invalid source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":MATH:SOURce2 {source}")
 
     def get_math_source2(self):
         """
@@ -2847,6 +2461,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MATH:SOURce2?")
         return response.strip().upper()
 
+    @validation.validate(source=SOURCE)
     def set_math_logic_source1(self, source):
         """
         Set source A of logic operation.
@@ -2854,12 +2469,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":MATH:LSOUrce1 {source}")
-        else:
-            print(f"Invalid source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":MATH:LSOUrce1 {source}")
 
     def get_math_logic_source1(self):
         """
@@ -2871,6 +2481,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MATH:LSOUrce1?")
         return response.strip().upper()
 
+    @validation.validate(source=SOURCE)
     def set_math_logic_source2(self, source):
         """
         Set source B of logic operation.
@@ -2878,12 +2489,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":MATH:LSOUrce2 {source}")
-        else:
-            print(f"Invalid source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":MATH:LSOUrce2 {source}")
 
     def get_math_logic_source2(self):
         """
@@ -2895,6 +2501,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MATH:LSOUrce2?")
         return response.strip().upper()
 
+    @validation.validate(scale=validation.Range(0, name="scale"))
     def set_math_scale(self, scale):
         """
         Set the vertical scale of the operation result. The unit depends on the operator
@@ -2904,10 +2511,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         scale (float): The vertical scale. The max range is from 1p to 5T (in 1-2-5 step).
         """
         # The range is very broad and depends on operator/source, so basic type check.
-        if isinstance(scale, (float, int)) and scale > 0: # Scale should be positive
-            self.instrument.write(f":MATH:SCALE {float(scale)}")
-        else:
-            print(f"Invalid scale value ({scale}). Must be a positive number.")
+        self.instrument.write(f":MATH:SCALE {float(scale)}")
 
     def get_math_scale(self):
         """
@@ -2919,6 +2523,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MATH:SCALE?")
         return float(response.strip())
 
+    @validation.validate(offset=validation.Range(name="offset"))
     def set_math_offset(self, offset):
         """
         Set the vertical offset of the operation result. The unit depends on the operator
@@ -2930,10 +2535,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         """
         # Validation for offset range is complex as it depends on current MathVerticalScale.
         # We'll just ensure it's a number for now.
-        if isinstance(offset, (float, int)):
-            self.instrument.write(f":MATH:OFFSet {float(offset)}")
-        else:
-            print(f"Invalid offset value ({offset}). Must be a number.")
+        self.instrument.write(f":MATH:OFFSet {float(offset)}")
 
     def get_math_offset(self):
         """
@@ -2972,6 +2574,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         """
         self.instrument.write(":MATH:RESet")
 
+    @validation.validate(source=SOURCE)
     def set_math_fft_source(self, source):
         """
         Set the source of FFT operation/filter.
@@ -2979,12 +2582,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":MATH:FFT:SOURce {source}")
-        else:
-            print(f"Invalid source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":MATH:FFT:SOURce {source}")
 
     def get_math_fft_source(self):
         """
@@ -2996,6 +2594,8 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MATH:FFT:SOURce?")
         return response.strip().upper()
 
+    @validation.validate(window_type=validation.Choice("RECTangle", "BLACkman", "HANNing", "HAMMing", "FLATtop",
+                                                       "TRIangle", name="window function"))
     def set_math_fft_window(self, window_type):
         """
         Set the window function of the FFT operation.
@@ -3005,12 +2605,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
                                                       "HANNing", "HAMMing",
                                                       "FLATtop", "TRIangle"}.
         """
-        valid_windows = {"RECTangle", "BLACkman", "HANNing", "HAMMing", "FLATtop", "TRIangle"}
-        window_type = window_type.upper()
-        if window_type in valid_windows:
-            self.instrument.write(f":MATH:FFT:WINDow {window_type}")
-        else:
-            print(f"Invalid window type ({window_type}). Choose from {valid_windows}.")
+        self.instrument.write(f":MATH:FFT:WINDow {window_type}")
 
     def get_math_fft_window(self):
         """
@@ -3042,6 +2637,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MATH:FFT:SPLit?")
         return bool(int(response.strip()))
 
+    @validation.validate(unit=validation.Choice("VRMS", "DB", name="vertical unit"))
     def set_math_fft_vertical_unit(self, unit):
         """
         Set the vertical unit of the FFT operation result.
@@ -3049,12 +2645,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         unit (str): The vertical unit, one of {"VRMS", "DB"}.
         """
-        valid_units = {"VRMS", "DB"}
-        unit = unit.upper()
-        if unit in valid_units:
-            self.instrument.write(f":MATH:FFT:UNIT {unit}")
-        else:
-            print(f"Invalid unit ({unit}). Choose from {valid_units}.")
+        self.instrument.write(f":MATH:FFT:UNIT {unit}")
 
     def get_math_fft_vertical_unit(self):
         """
@@ -3066,6 +2657,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MATH:FFT:UNIT?")
         return response.strip().upper()
 
+    @validation.validate(h_scale=validation.Range(0, name="horizontal scale"))
     def set_math_fft_horizontal_scale(self, h_scale):
         """
         Set the horizontal scale of the FFT operation result. Default unit is Hz.
@@ -3073,10 +2665,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         h_scale (float): The horizontal scale. Range depends on FFT mode and sample rate.
         """
-        if isinstance(h_scale, (float, int)) and h_scale > 0:
-            self.instrument.write(f":MATH:FFT:HSCale {float(h_scale)}")
-        else:
-            print(f"Invalid horizontal scale ({h_scale}). Must be a positive number.")
+        self.instrument.write(f":MATH:FFT:HSCale {float(h_scale)}")
 
     def get_math_fft_horizontal_scale(self):
         """
@@ -3088,6 +2677,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MATH:FFT:HSCale?")
         return float(response.strip())
 
+    @validation.validate(center_freq=validation.Range(0, name="center frequency"))
     def set_math_fft_horizontal_center(self, center_freq):
         """
         Set the center frequency of the FFT operation result. Default unit is Hz.
@@ -3095,10 +2685,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         center_freq (float): The center frequency. Range depends on FFT mode and sample rate.
         """
-        if isinstance(center_freq, (float, int)) and center_freq >= 0:
-            self.instrument.write(f":MATH:FFT:HCENter {float(center_freq)}")
-        else:
-            print(f"Invalid center frequency ({center_freq}). Must be a non-negative number.")
+        self.instrument.write(f":MATH:FFT:HCENter {float(center_freq)}")
 
     def get_math_fft_horizontal_center(self):
         """
@@ -3110,6 +2697,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MATH:FFT:HCENter?")
         return float(response.strip())
 
+    @validation.validate(mode=validation.Choice("TRACE", "MEMory", name="FFT mode"))
     def set_math_fft_mode(self, mode):
         """
         Set the FFT mode.
@@ -3118,12 +2706,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         mode (str): The FFT mode, one of {"TRACE", "MEMory"}.
                     TRACE: data source is displayed waveform. MEMory: data source is waveform in memory.
         """
-        valid_modes = {"TRACE", "MEMory"}
-        mode = mode.upper()
-        if mode in valid_modes:
-            self.instrument.write(f":MATH:FFT:MODE {mode}")
-        else:
-            print(f"Invalid mode ({mode}). Choose from {valid_modes}.")
+        self.instrument.write(f":MATH:FFT:MODE {mode}")
 
     def get_math_fft_mode(self):
         """
@@ -3135,6 +2718,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MATH:FFT:MODE?")
         return response.strip().upper()
 
+    @validation.validate(filter_type=validation.Choice("LPASS", "HPASS", "BPASS", "BSTOP", name="filter type"))
     def set_math_filter_type(self, filter_type):
         """
         Set the filter type.
@@ -3142,12 +2726,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         filter_type (str): The filter type, one of {"LPASS", "HPASS", "BPASS", "BSTOP"}.
         """
-        valid_types = {"LPASS", "HPASS", "BPASS", "BSTOP"}
-        filter_type = filter_type.upper()
-        if filter_type in valid_types:
-            self.instrument.write(f":MATH:FILTer:TYPE {filter_type}")
-        else:
-            print(f"Invalid filter type ({filter_type}). Choose from {valid_types}.")
+        self.instrument.write(f":MATH:FILTer:TYPE {filter_type}")
 
     def get_math_filter_type(self):
         """
@@ -3159,6 +2738,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MATH:FILTer:TYPE?")
         return response.strip().upper()
 
+    @validation.validate(freq1=validation.Range(0, name="frequency"))
     def set_math_filter_w1(self, freq1):
         """
         Set the cutoff frequency (wc1) of the low pass/high pass filter or cutoff
@@ -3167,10 +2747,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         freq1 (float): The cutoff frequency. Range depends on filter type and screen sample rate.
         """
-        if isinstance(freq1, (float, int)) and freq1 >= 0: # Frequencies should be non-negative
-            self.instrument.write(f":MATH:FILTer:W1 {float(freq1)}")
-        else:
-            print(f"Invalid frequency ({freq1}). Must be a non-negative number.")
+        self.instrument.write(f":MATH:FILTer:W1 {float(freq1)}")
 
     def get_math_filter_w1(self):
         """
@@ -3183,6 +2760,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MATH:FILTer:W1?")
         return float(response.strip())
 
+    @validation.validate(freq2=validation.Range(0, name="frequency"))
     def set_math_filter_w2(self, freq2):
         """
         Set the cutoff frequency 2 (wc2) of the band pass/band stop filter. Default unit is Hz.
@@ -3191,10 +2769,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         freq2 (float): The cutoff frequency 2. Range depends on filter type and screen sample rate.
         """
-        if isinstance(freq2, (float, int)) and freq2 >= 0: # Frequencies should be non-negative
-            self.instrument.write(f":MATH:FILTer:W2 {float(freq2)}")
-        else:
-            print(f"Invalid frequency ({freq2}). Must be a non-negative number.")
+        self.instrument.write(f":MATH:FILTer:W2 {float(freq2)}")
 
     def get_math_filter_w2(self):
         """
@@ -3206,6 +2781,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MATH:FILTer:W2?")
         return float(response.strip())
 
+    @validation.validate(start_point=validation.Range(0, 1198, int, name="start point"))
     def set_math_option_start_point(self, start_point):
         """
         Set the start point of the waveform math operation.
@@ -3215,10 +2791,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         start_point (int): The start point, from 0 to (End point currently set - 1).
         """
-        if isinstance(start_point, int) and 0 <= start_point <= 1198: # Max end point is 1199, so start can be up to 1198
-            self.instrument.write(f":MATH:OPTion:STARt {start_point}")
-        else:
-            print(f"Invalid start point ({start_point}). Must be an integer between 0 and 1198.")
+        self.instrument.write(f":MATH:OPTion:STARt {start_point}")
 
     def get_math_option_start_point(self):
         """
@@ -3230,6 +2803,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MATH:OPTion:STARt?")
         return int(response.strip())
 
+    @validation.validate(end_point=validation.Range(1, 1199, int, name="end point"))
     def set_math_option_end_point(self, end_point):
         """
         Set the end point of the waveform math operation.
@@ -3239,10 +2813,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         end_point (int): The end point, from (Start point currently set + 1) to 1199.
         """
-        if isinstance(end_point, int) and 1 <= end_point <= 1199: # Min start point is 0, so end can be at least 1
-            self.instrument.write(f":MATH:OPTion:END {end_point}")
-        else:
-            print(f"Invalid end point ({end_point}). Must be an integer between 1 and 1199.")
+        self.instrument.write(f":MATH:OPTion:END {end_point}")
 
     def get_math_option_end_point(self):
         """
@@ -3274,6 +2845,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MATH:OPTion:INVert?")
         return bool(int(response.strip()))
 
+    @validation.validate(sensitivity=validation.Range(0, 0.96, name="sensitivity"))
     def set_math_option_sensitivity(self, sensitivity):
         """
         Set the sensitivity of the logic operation. Default unit is div (current vertical scale).
@@ -3282,11 +2854,8 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         sensitivity (float): The sensitivity, from 0 to 0.96, step is 0.08.
         """
-        if isinstance(sensitivity, (float, int)) and 0 <= sensitivity <= 0.96:
-            # Optional: Add check for step 0.08 if strict adherence is needed
-            self.instrument.write(f":MATH:OPTion:SENSitivity {float(sensitivity)}")
-        else:
-            print(f"Invalid sensitivity ({sensitivity}). Must be a float between 0 and 0.96.")
+        # Optional: Add check for step 0.08 if strict adherence is needed
+        self.instrument.write(f":MATH:OPTion:SENSitivity {float(sensitivity)}")
 
     def get_math_option_sensitivity(self):
         """
@@ -3298,6 +2867,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MATH:OPTion:SENSitivity?")
         return float(response.strip())
 
+    @validation.validate(distance=validation.Range(3, 201, int, name="distance"))
     def set_math_option_distance(self, distance):
         """
         Set the smoothing window width of differential operation (diff).
@@ -3306,10 +2876,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         distance (int): The smoothing window width, from 3 to 201.
         """
-        if isinstance(distance, int) and 3 <= distance <= 201:
-            self.instrument.write(f":MATH:OPTion:DIStance {distance}")
-        else:
-            print(f"Invalid distance ({distance}). Must be an integer between 3 and 201.")
+        self.instrument.write(f":MATH:OPTion:DIStance {distance}")
 
     def get_math_option_distance(self):
         """
@@ -3340,6 +2907,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MATH:OPTion:ASCale?")
         return bool(int(response.strip()))
 
+    @validation.validate(threshold=validation.Range(name="threshold"))
     def set_math_option_threshold1(self, threshold):
         """
         Set the threshold level of source A in logic operations. Default unit is V.
@@ -3351,10 +2919,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
                            (4 * VerticalScale - VerticalOffset). Step: VerticalScale/50.
         """
         # Range depends on source A's scale and offset, so only basic type check.
-        if isinstance(threshold, (float, int)):
-            self.instrument.write(f":MATH:OPTion:THReshold1 {float(threshold)}")
-        else:
-            print(f"Invalid threshold ({threshold}). Must be a number.")
+        self.instrument.write(f":MATH:OPTion:THReshold1 {float(threshold)}")
 
     def get_math_option_threshold1(self):
         """
@@ -3366,6 +2931,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MATH:OPTion:THReshold1?")
         return float(response.strip())
 
+    @validation.validate(threshold=validation.Range(name="threshold"))
     def set_math_option_threshold2(self, threshold):
         """
         Set the threshold level of source B in logic operations. Default unit is V.
@@ -3377,10 +2943,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
                            (4 * VerticalScale - VerticalOffset). Step: VerticalScale/50.
         """
         # Range depends on source B's scale and offset, so only basic type check.
-        if isinstance(threshold, (float, int)):
-            self.instrument.write(f":MATH:OPTion:THReshold2 {float(threshold)}")
-        else:
-            print(f"Invalid threshold ({threshold}). Must be a number.")
+        self.instrument.write(f":MATH:OPTion:THReshold2 {float(threshold)}")
 
     def get_math_option_threshold2(self):
         """
@@ -3392,6 +2955,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MATH:OPTion:THReshold2?")
         return float(response.strip())
 
+    @validation.validate(source=SOURCE)
     def set_math_option_fx_source1(self, source):
         """
         Set source A of the inner layer operation of compound operation.
@@ -3399,12 +2963,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":MATH:OPTion:FX:SOURce1 {source}")
-        else:
-            print(f"Invalid source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":MATH:OPTion:FX:SOURce1 {source}")
 
     def get_math_option_fx_source1(self):
         """
@@ -3416,6 +2975,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MATH:OPTion:FX:SOURce1?")
         return response.strip().upper()
 
+    @validation.validate(source=SOURCE)
     def set_math_option_fx_source2(self, source):
         """
         Set source B of the inner layer operation of compound operation.
@@ -3423,12 +2983,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":MATH:OPTion:FX:SOURce2 {source}")
-        else:
-            print(f"Invalid source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":MATH:OPTion:FX:SOURce2 {source}")
 
     def get_math_option_fx_source2(self):
         """
@@ -3440,6 +2995,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MATH:OPTion:FX:SOURce2?")
         return response.strip().upper()
 
+    @validation.validate(operator=validation.Choice("ADD", "SUBTract", "MULTiply", "DIVision", name="operator"))
     def set_math_option_fx_operator(self, operator):
         """
         Set the operator of the inner layer operation of compound operation.
@@ -3447,12 +3003,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         operator (str): The operator, one of {"ADD", "SUBTract", "MULTiply", "DIVision"}.
         """
-        valid_operators = {"ADD", "SUBTract", "MULTiply", "DIVision"}
-        operator = operator.upper()
-        if operator in valid_operators:
-            self.instrument.write(f":MATH:OPTion:FX:OPERator {operator}")
-        else:
-            print(f"Invalid operator ({operator}). Choose from {valid_operators}.")
+        self.instrument.write(f":MATH:OPTion:FX:OPERator {operator}")
 
     def get_math_option_fx_operator(self):
         """
@@ -3484,6 +3035,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MASK:ENABle?")
         return bool(int(response.strip()))
 
+    @validation.validate(source=validation.Choice("CHANnel1", "CHANnel2", name="source channel"))
     def set_mask_source(self, source):
         """
         Set the source of the pass/fail test.
@@ -3491,12 +3043,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source channel, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":MASK:SOURce {source}")
-        else:
-            print(f"Invalid source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":MASK:SOURce {source}")
 
     def get_mask_source(self):
         """
@@ -3508,6 +3055,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MASK:SOURce?")
         return response.strip().upper()
 
+    @validation.validate(operate_mode=validation.Choice("RUN", "STOP", name="operation mode"))
     def set_mask_operate(self, operate_mode):
         """
         Run or stop the pass/fail test.
@@ -3515,12 +3063,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         operate_mode (str): The operation mode, one of {"RUN", "STOP"}.
         """
-        valid_modes = {"RUN", "STOP"}
-        operate_mode = operate_mode.upper()
-        if operate_mode in valid_modes:
-            self.instrument.write(f":MASK:OPERate {operate_mode}")
-        else:
-            print(f"Invalid operate mode ({operate_mode}). Choose from {valid_modes}.")
+        self.instrument.write(f":MASK:OPERate {operate_mode}")
 
     def get_mask_operate(self):
         """
@@ -3590,6 +3133,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MASK:OUTPut?")
         return bool(int(response.strip()))
 
+    @validation.validate(x_value=validation.Range(0.02, 4.0, name="X adjustment"))
     def set_mask_x_adjustment(self, x_value):
         """
         Set the horizontal adjustment parameter in the pass/fail test mask. Default unit is div.
@@ -3597,10 +3141,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         x_value (float): The horizontal adjustment parameter, from 0.02 to 4, step is 0.02.
         """
-        if isinstance(x_value, (float, int)) and 0.02 <= x_value <= 4.0:
-            self.instrument.write(f":MASK:X {float(x_value)}")
-        else:
-            print(f"Invalid X adjustment value ({x_value}). Must be a float between 0.02 and 4.0.")
+        self.instrument.write(f":MASK:X {float(x_value)}")
 
     def get_mask_x_adjustment(self):
         """
@@ -3612,6 +3153,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MASK:X?")
         return float(response.strip())
 
+    @validation.validate(y_value=validation.Range(0.04, 5.12, name="Y adjustment"))
     def set_mask_y_adjustment(self, y_value):
         """
         Set the vertical adjustment parameter in the pass/fail test mask. Default unit is div.
@@ -3619,10 +3161,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         y_value (float): The vertical adjustment parameter, from 0.04 to 5.12, step is 0.04.
         """
-        if isinstance(y_value, (float, int)) and 0.04 <= y_value <= 5.12:
-            self.instrument.write(f":MASK:Y {float(y_value)}")
-        else:
-            print(f"Invalid Y adjustment value ({y_value}). Must be a float between 0.04 and 5.12.")
+        self.instrument.write(f":MASK:Y {float(y_value)}")
 
     def get_mask_y_adjustment(self):
         """
@@ -3680,6 +3219,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         self.instrument.write(":MASK:RESet")
 
     # MEASURE Commands
+    @validation.validate(source=validation.Choice("CHANnel1", "CHANnel2", "MATH", name="source"))
     def set_measure_source(self, source):
         """
         Set the source of the current measurement parameter.
@@ -3687,12 +3227,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2", "MATH"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2", "MATH"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":MEASure:SOURce {source}")
-        else:
-            print(f"Invalid source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":MEASure:SOURce {source}")
 
     def get_measure_source(self):
         """
@@ -3704,6 +3239,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MEASure:SOURce?")
         return response.strip().upper()
 
+    @validation.validate(source=validation.Choice("CHANnel1", "CHANnel2", "OFF", name="source"))
     def set_measure_counter_source(self, source):
         """
         Set the source of the frequency counter, or disable the frequency counter.
@@ -3711,12 +3247,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2", "OFF"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2", "OFF"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":MEASure:COUNter:SOURce {source}")
-        else:
-            print(f"Invalid source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":MEASure:COUNter:SOURce {source}")
 
     def get_measure_counter_source(self):
         """
@@ -3738,6 +3269,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MEASure:COUNter:VALue?")
         return float(response.strip())
 
+    @validation.validate(item=MEASURE_SLOT)
     def clear_measure_item(self, item):
         """
         Clear one or all of the last five measurement items enabled.
@@ -3745,13 +3277,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         item (str): The item to clear, one of {"ITEM1", "ITEM2", "ITEM3", "ITEM4", "ITEM5", "ALL"}.
         """
-        valid_items = {"ITEM1", "ITEM2", "ITEM3", "ITEM4", "ITEM5", "ALL"}
-        item = item.upper()
-        if item in valid_items:
-            self.instrument.write(f":MEASure:CLEar {item}")
-        else:
-            print(f"Invalid item ({item}). Choose from {valid_items}.")
+        self.instrument.write(f":MEASure:CLEar {item}")
 
+    @validation.validate(item=MEASURE_SLOT)
     def recover_measure_item(self, item):
         """
         Recover the measurement item which has been cleared.
@@ -3759,12 +3287,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         item (str): The item to recover, one of {"ITEM1", "ITEM2", "ITEM3", "ITEM4", "ITEM5", "ALL"}.
         """
-        valid_items = {"ITEM1", "ITEM2", "ITEM3", "ITEM4", "ITEM5", "ALL"}
-        item = item.upper()
-        if item in valid_items:
-            self.instrument.write(f":MEASure:RECover {item}")
-        else:
-            print(f"Invalid item ({item}). Choose from {valid_items}.")
+        self.instrument.write(f":MEASure:RECover {item}")
 
     def set_all_measure_display(self, state):
         """
@@ -3785,6 +3308,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MEASure:ADISplay?")
         return bool(int(response.strip()))
 
+    @validation.validate(sources=MEASURE_SOURCES)
     def set_all_measure_source(self, sources):
         """
         Set the source(s) of the all measurement function.
@@ -3794,22 +3318,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
                                e.g., "CHANnel1", ["CHANnel1", "CHANnel2"].
                                Valid sources: {"CHANnel1", "CHANnel2", "MATH"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2", "MATH"}
         if isinstance(sources, str):
             sources = [sources]
-
-        formatted_sources = []
-        for src in sources:
-            src_upper = src.upper()
-            if src_upper in valid_sources:
-                formatted_sources.append(src_upper)
-            else:
-                print(f"Invalid source ({src}). Skipping. Valid sources: {valid_sources}")
-        
-        if formatted_sources:
-            self.instrument.write(f":MEASure:AMSource {','.join(formatted_sources)}")
-        else:
-            print("No valid sources provided for all measurement function.")
+        self.instrument.write(f":MEASure:AMSource {','.join(sources)}")
 
     def get_all_measure_source(self):
         """
@@ -3821,6 +3332,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MEASure:AMSource?")
         return [s.strip().upper() for s in response.strip().split(',')]
 
+    @validation.validate(value=validation.Range(7, 95, int, name="upper threshold"))
     def set_measure_setup_max_threshold(self, value):
         """
         Set the upper limit of the threshold (expressed in the percentage of amplitude)
@@ -3829,10 +3341,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         value (int): The percentage value, from 7 to 95.
         """
-        if isinstance(value, int) and 7 <= value <= 95:
-            self.instrument.write(f":MEASure:SETup:MAX {value}")
-        else:
-            print(f"Invalid value ({value}). Must be an integer between 7 and 95.")
+        self.instrument.write(f":MEASure:SETup:MAX {value}")
 
     def get_measure_setup_max_threshold(self):
         """
@@ -3844,6 +3353,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MEASure:SETup:MAX?")
         return int(response.strip())
 
+    @validation.validate(value=validation.Range(6, 94, int, name="middle threshold"))
     def set_measure_setup_mid_threshold(self, value):
         """
         Set the middle point of the threshold (expressed in the percentage of amplitude)
@@ -3852,10 +3362,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         value (int): The percentage value, from 6 to 94.
         """
-        if isinstance(value, int) and 6 <= value <= 94:
-            self.instrument.write(f":MEASure:SETup:MID {value}")
-        else:
-            print(f"Invalid value ({value}). Must be an integer between 6 and 94.")
+        self.instrument.write(f":MEASure:SETup:MID {value}")
 
     def get_measure_setup_mid_threshold(self):
         """
@@ -3867,6 +3374,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MEASure:SETup:MID?")
         return int(response.strip())
 
+    @validation.validate(value=validation.Range(5, 93, int, name="lower threshold"))
     def set_measure_setup_min_threshold(self, value):
         """
         Set the lower limit of the threshold (expressed in the percentage of amplitude)
@@ -3875,10 +3383,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         value (int): The percentage value, from 5 to 93.
         """
-        if isinstance(value, int) and 5 <= value <= 93:
-            self.instrument.write(f":MEASure:SETup:MIN {value}")
-        else:
-            print(f"Invalid value ({value}). Must be an integer between 5 and 93.")
+        self.instrument.write(f":MEASure:SETup:MIN {value}")
 
     def get_measure_setup_min_threshold(self):
         """
@@ -3890,6 +3395,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MEASure:SETup:MIN?")
         return int(response.strip())
 
+    @validation.validate(source=SOURCE)
     def set_measure_setup_phase_source_a(self, source):
         """
         Set source A of Phase 1→2 and Phase 1→2 measurements.
@@ -3897,12 +3403,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":MEASure:SETup:PSA {source}")
-        else:
-            print(f"Invalid source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":MEASure:SETup:PSA {source}")
 
     def get_measure_setup_phase_source_a(self):
         """
@@ -3914,6 +3415,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MEASure:SETup:PSA?")
         return response.strip().upper()
 
+    @validation.validate(source=SOURCE)
     def set_measure_setup_phase_source_b(self, source):
         """
         Set source B of Phase 1→2 and Phase 1→2 measurements.
@@ -3921,12 +3423,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":MEASure:SETup:PSB {source}")
-        else:
-            print(f"Invalid source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":MEASure:SETup:PSB {source}")
 
     def get_measure_setup_phase_source_b(self):
         """
@@ -3938,6 +3435,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MEASure:SETup:PSB?")
         return response.strip().upper()
 
+    @validation.validate(source=SOURCE)
     def set_measure_setup_delay_source_a(self, source):
         """
         Set source A of Delay 1→2 and Delay 1→2 measurements.
@@ -3945,12 +3443,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":MEASure:SETup:DSA {source}")
-        else:
-            print(f"Invalid source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":MEASure:SETup:DSA {source}")
 
     def get_measure_setup_delay_source_a(self):
         """
@@ -3962,6 +3455,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MEASure:SETup:DSA?")
         return response.strip().upper()
 
+    @validation.validate(source=SOURCE)
     def set_measure_setup_delay_source_b(self, source):
         """
         Set source B of Delay 1→2 and Delay 1→2 measurements.
@@ -3969,12 +3463,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":MEASure:SETup:DSB {source}")
-        else:
-            print(f"Invalid source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":MEASure:SETup:DSB {source}")
 
     def get_measure_setup_delay_source_b(self):
         """
@@ -4005,6 +3494,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":MEASure:STATistic:DISPlay?")
         return bool(int(response.strip()))
 
+    @validation.validate(mode=validation.Choice("DIFFerence", "EXTRemum", name="statistic mode"))
     def set_measure_statistic_mode(self, mode):
         """
         Set the statistic mode.
@@ -4012,12 +3502,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         mode (str): The statistic mode, one of {"DIFFerence", "EXTRemum"}.
         """
-        valid_modes = {"DIFFerence", "EXTRemum"}
-        mode = mode.upper()
-        if mode in valid_modes:
-            self.instrument.write(f":MEASure:STATistic:MODE {mode}")
-        else:
-            print(f"Invalid mode ({mode}). Choose from {valid_modes}.")
+        self.instrument.write(f":MEASure:STATistic:MODE {mode}")
 
     def get_measure_statistic_mode(self):
         """
@@ -4035,6 +3520,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         """
         self.instrument.write(":MEASure:STATistic:RESet")
 
+    @validation.validate(item=MEASURE_ITEM, sources=MEASURE_SOURCES)
     def set_measure_statistic_item(self, item, sources=None):
         """
         Enable the statistic function of any waveform parameter of the specified source.
@@ -4045,33 +3531,13 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
                                          Valid sources: {"CHANnel1", "CHANnel2", "MATH"}.
                                          Required for two-source parameters (RDELay, FDELay, RPHase, FPHase).
         """
-        valid_items = {"VMAX", "VMIN", "VPP", "VTOP", "VBASe", "VAMP", "VAVG", "VRMS",
-                       "OVERshoot", "PREShoot", "MARea", "MPARea", "PERiod", "FREQuency",
-                       "RTIMe", "FTIMe", "PWIDth", "NWIDth", "PDUTy", "NDUTy", "RDELay",
-                       "FDELay", "RPHase", "FPHase", "TVMAX", "TVMIN", "PSLEWrate",
-                       "NSLEWrate", "VUPper", "VMID", "VLOWer", "VARIance", "PVRMS",
-                       "PPULses", "NPULses", "PEDGes", "NEDGes"}
-        valid_sources = {"CHANnel1", "CHANnel2", "MATH"}
-
-        item = item.upper()
-        if item not in valid_items:
-            print(f"Invalid measurement item ({item}).")
-            return
-
         command_parts = [item]
         if sources:
-            if isinstance(sources, str):
-                sources = [sources]
-            for src in sources:
-                src_upper = src.upper()
-                if src_upper in valid_sources:
-                    command_parts.append(src_upper)
-                else:
-                    print(f"Invalid source ({src}) for item {item}. Skipping.")
-                    return # Stop if an invalid source is provided
+            command_parts.extend([sources] if isinstance(sources, str) else sources)
 
         self.instrument.write(f":MEASure:STATistic:ITEM {','.join(command_parts)}")
 
+    @validation.validate(stat_type=STATISTIC_TYPE, item=MEASURE_ITEM, sources=MEASURE_SOURCES)
     def get_measure_statistic_item(self, stat_type, item, sources=None):
         """
         Query the statistic result of any waveform parameter of the specified source.
@@ -4086,40 +3552,14 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         float: The statistic result in scientific notation.
         """
-        valid_stat_types = {"MAXimum", "MINimum", "CURRent", "AVERages", "DEViation"}
-        valid_items = {"VMAX", "VMIN", "VPP", "VTOP", "VBASe", "VAMP", "VAVG", "VRMS",
-                       "OVERshoot", "PREShoot", "MARea", "MPARea", "PERiod", "FREQuency",
-                       "RTIMe", "FTIMe", "PWIDth", "NWIDth", "PDUTy", "NDUTy", "RDELay",
-                       "FDELay", "RPHase", "FPHase", "TVMAX", "TVMIN", "PSLEWrate",
-                       "NSLEWrate", "VUPper", "VMID", "VLOWer", "VARIance", "PVRMS",
-                       "PPULses", "NPULses", "PEDGes", "NEDGes"}
-        valid_sources = {"CHANnel1", "CHANnel2", "MATH"}
-
-        stat_type = stat_type.upper()
-        item = item.upper()
-
-        if stat_type not in valid_stat_types:
-            print(f"Invalid statistic type ({stat_type}).")
-            return None
-        if item not in valid_items:
-            print(f"Invalid measurement item ({item}).")
-            return None
-
         command_parts = [stat_type, item]
         if sources:
-            if isinstance(sources, str):
-                sources = [sources]
-            for src in sources:
-                src_upper = src.upper()
-                if src_upper in valid_sources:
-                    command_parts.append(src_upper)
-                else:
-                    print(f"Invalid source ({src}) for item {item}. Skipping.")
-                    return None # Stop if an invalid source is provided
+            command_parts.extend([sources] if isinstance(sources, str) else sources)
 
         response = self.instrument.query(f":MEASure:STATistic:ITEM? {','.join(command_parts)}")
         return float(response.strip())
 
+    @validation.validate(item=MEASURE_ITEM, sources=MEASURE_SOURCES)
     def set_measure_item(self, item, sources=None):
         """
         Measure any waveform parameter of the specified source.
@@ -4130,33 +3570,13 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
                                          Valid sources: {"CHANnel1", "CHANnel2", "MATH"}.
                                          Required for two-source parameters (RDELay, FDELay, RPHase, FPHase).
         """
-        valid_items = {"VMAX", "VMIN", "VPP", "VTOP", "VBASe", "VAMP", "VAVG", "VRMS",
-                       "OVERshoot", "PREShoot", "MARea", "MPARea", "PERiod", "FREQuency",
-                       "RTIMe", "FTIMe", "PWIDth", "NWIDth", "PDUTy", "NDUTy", "RDELay",
-                       "FDELay", "RPHase", "FPHase", "TVMAX", "TVMIN", "PSLEWrate",
-                       "NSLEWrate", "VUPper", "VMID", "VLOWer", "VARIance", "PVRMS",
-                       "PPULses", "NPULses", "PEDGes", "NEDGes"}
-        valid_sources = {"CHANnel1", "CHANnel2", "MATH"}
-
-        item = item.upper()
-        if item not in valid_items:
-            print(f"Invalid measurement item ({item}).")
-            return
-
         command_parts = [item]
         if sources:
-            if isinstance(sources, str):
-                sources = [sources]
-            for src in sources:
-                src_upper = src.upper()
-                if src_upper in valid_sources:
-                    command_parts.append(src_upper)
-                else:
-                    print(f"Invalid source ({src}) for item {item}. Skipping.")
-                    return # Stop if an invalid source is provided
+            command_parts.extend([sources] if isinstance(sources, str) else sources)
 
         self.instrument.write(f":MEASure:ITEM {','.join(command_parts)}")
 
+    @validation.validate(item=MEASURE_ITEM, sources=MEASURE_SOURCES)
     def get_measure_item(self, item, sources=None):
         """
         Query the measurement result of any waveform parameter of the specified source.
@@ -4170,30 +3590,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         float: The measurement result in scientific notation.
         """
-        valid_items = {"VMAX", "VMIN", "VPP", "VTOP", "VBASe", "VAMP", "VAVG", "VRMS",
-                       "OVERshoot", "PREShoot", "MARea", "MPARea", "PERiod", "FREQuency",
-                       "RTIMe", "FTIMe", "PWIDth", "NWIDth", "PDUTy", "NDUTy", "RDELay",
-                       "FDELay", "RPHase", "FPHase", "TVMAX", "TVMIN", "PSLEWrate",
-                       "NSLEWrate", "VUPper", "VMID", "VLOWer", "VARIance", "PVRMS",
-                       "PPULses", "NPULses", "PEDGes", "NEDGes"}
-        valid_sources = {"CHANnel1", "CHANnel2", "MATH"}
-
-        item = item.upper()
-        if item not in valid_items:
-            print(f"Invalid measurement item ({item}).")
-            return None
-
         command_parts = [item]
         if sources:
-            if isinstance(sources, str):
-                sources = [sources]
-            for src in sources:
-                src_upper = src.upper()
-                if src_upper in valid_sources:
-                    command_parts.append(src_upper)
-                else:
-                    print(f"Invalid source ({src}) for item {item}. Skipping.")
-                    return None # Stop if an invalid source is provided
+            command_parts.extend([sources] if isinstance(sources, str) else sources)
 
         response = self.instrument.query(f":MEASure:ITEM? {','.join(command_parts)}")
         return float(response.strip())
@@ -4219,6 +3618,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":REFerence:DISPlay?")
         return bool(int(response.strip()))
 
+    @validation.validate(n=REFERENCE)
     def set_reference_channel_enable(self, n, state):
         """
         Enable or disable the specified reference channel.
@@ -4227,12 +3627,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The reference channel number, from 1 to 10.
         state (bool): True to enable (ON), False to disable (OFF).
         """
-        valid_channels = list(range(1, 11))
-        if n in valid_channels:
-            self.instrument.write(f":REFerence{n}:ENABle {'ON' if state else 'OFF'}")
-        else:
-            print(f"Invalid reference channel ({n}). Choose from {valid_channels}.")
+        self.instrument.write(f":REFerence{n}:ENABle {'ON' if state else 'OFF'}")
 
+    @validation.validate(n=REFERENCE)
     def get_reference_channel_enable(self, n):
         """
         Query the status of the specified reference channel.
@@ -4243,14 +3640,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         bool: True if reference channel is ON, False if OFF.
         """
-        valid_channels = list(range(1, 11))
-        if n in valid_channels:
-            response = self.instrument.query(f":REFerence{n}:ENABle?")
-            return bool(int(response.strip()))
-        else:
-            print(f"Invalid reference channel ({n}). Choose from {valid_channels}.")
-            return None
+        response = self.instrument.query(f":REFerence{n}:ENABle?")
+        return bool(int(response.strip()))
 
+    @validation.validate(n=REFERENCE, source=validation.Choice("CHANnel1", "CHANnel2", "MATH", name="source"))
     def set_reference_channel_source(self, n, source):
         """
         Set the source of the current reference channel.
@@ -4259,14 +3652,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The reference channel number, from 1 to 10.
         source (str): The source, one of {"CHANnel1", "CHANnel2", "MATH"}.
         """
-        valid_channels = list(range(1, 11))
-        valid_sources = {"CHANnel1", "CHANnel2", "MATH"}
-        source = source.upper()
-        if n in valid_channels and source in valid_sources:
-            self.instrument.write(f":REFerence{n}:SOURce {source}")
-        else:
-            print(f"Invalid reference channel ({n}) or source ({source}).")
+        self.instrument.write(f":REFerence{n}:SOURce {source}")
 
+    @validation.validate(n=REFERENCE)
     def get_reference_channel_source(self, n):
         """
         Query the source of the current reference channel.
@@ -4277,14 +3665,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         str: The source, one of {"CHAN1", "CHAN2", "MATH"}.
         """
-        valid_channels = list(range(1, 11))
-        if n in valid_channels:
-            response = self.instrument.query(f":REFerence{n}:SOURce?")
-            return response.strip().upper()
-        else:
-            print(f"Invalid reference channel ({n}). Choose from {valid_channels}.")
-            return None
+        response = self.instrument.query(f":REFerence{n}:SOURce?")
+        return response.strip().upper()
 
+    @validation.validate(n=REFERENCE, scale=validation.Range(0, name="scale"))
     def set_reference_channel_vertical_scale(self, n, scale):
         """
         Set the vertical scale of the specified reference channel.
@@ -4293,12 +3677,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The reference channel number, from 1 to 10.
         scale (float): The vertical scale. Range related to probe ratio (e.g., 1mV to 10V for 1X).
         """
-        valid_channels = list(range(1, 11))
-        if n in valid_channels and isinstance(scale, (float, int)) and scale > 0:
-            self.instrument.write(f":REFerence{n}:VSCale {float(scale)}")
-        else:
-            print(f"Invalid reference channel ({n}) or scale ({scale}). Scale must be a positive number.")
+        self.instrument.write(f":REFerence{n}:VSCale {float(scale)}")
 
+    @validation.validate(n=REFERENCE)
     def get_reference_channel_vertical_scale(self, n):
         """
         Query the vertical scale of the specified reference channel.
@@ -4309,14 +3690,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         float: The vertical scale in scientific notation.
         """
-        valid_channels = list(range(1, 11))
-        if n in valid_channels:
-            response = self.instrument.query(f":REFerence{n}:VSCale?")
-            return float(response.strip())
-        else:
-            print(f"Invalid reference channel ({n}). Choose from {valid_channels}.")
-            return None
+        response = self.instrument.query(f":REFerence{n}:VSCale?")
+        return float(response.strip())
 
+    @validation.validate(n=REFERENCE, offset=validation.Range(name="offset"))
     def set_reference_channel_vertical_offset(self, n, offset):
         """
         Set the vertical offset of the specified reference channel.
@@ -4325,12 +3702,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The reference channel number, from 1 to 10.
         offset (float): The vertical offset. Range: (-10 * RefVerticalScale) to (10 * RefVerticalScale).
         """
-        valid_channels = list(range(1, 11))
-        if n in valid_channels and isinstance(offset, (float, int)):
-            self.instrument.write(f":REFerence{n}:VOFFset {float(offset)}")
-        else:
-            print(f"Invalid reference channel ({n}) or offset ({offset}). Must be a number.")
+        self.instrument.write(f":REFerence{n}:VOFFset {float(offset)}")
 
+    @validation.validate(n=REFERENCE)
     def get_reference_channel_vertical_offset(self, n):
         """
         Query the vertical offset of the specified reference channel.
@@ -4341,14 +3715,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         float: The vertical offset in scientific notation.
         """
-        valid_channels = list(range(1, 11))
-        if n in valid_channels:
-            response = self.instrument.query(f":REFerence{n}:VOFFset?")
-            return float(response.strip())
-        else:
-            print(f"Invalid reference channel ({n}). Choose from {valid_channels}.")
-            return None
+        response = self.instrument.query(f":REFerence{n}:VOFFset?")
+        return float(response.strip())
 
+    @validation.validate(n=REFERENCE)
     def reset_reference_channel(self, n):
         """
         Reset the vertical scale and vertical offset of the specified reference channel to their default values.
@@ -4356,12 +3726,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         n (int): The reference channel number, from 1 to 10.
         """
-        valid_channels = list(range(1, 11))
-        if n in valid_channels:
-            self.instrument.write(f":REFerence{n}:RESet")
-        else:
-            print(f"Invalid reference channel ({n}). Choose from {valid_channels}.")
+        self.instrument.write(f":REFerence{n}:RESet")
 
+    @validation.validate(n=REFERENCE)
     def select_current_reference_channel(self, n):
         """
         Select the current reference channel.
@@ -4369,12 +3736,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         n (int): The reference channel number, from 1 to 10.
         """
-        valid_channels = list(range(1, 11))
-        if n in valid_channels:
-            self.instrument.write(f":REFerence{n}:CURRent")
-        else:
-            print(f"Invalid reference channel ({n}). Choose from {valid_channels}.")
+        self.instrument.write(f":REFerence{n}:CURRent")
 
+    @validation.validate(n=REFERENCE)
     def save_reference_waveform(self, n):
         """
         Store the waveform of the current reference channel to the internal memory as reference waveform.
@@ -4382,12 +3746,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         n (int): The reference channel number, from 1 to 10.
         """
-        valid_channels = list(range(1, 11))
-        if n in valid_channels:
-            self.instrument.write(f":REFerence{n}:SAVe")
-        else:
-            print(f"Invalid reference channel ({n}). Choose from {valid_channels}.")
+        self.instrument.write(f":REFerence{n}:SAVe")
 
+    @validation.validate(n=REFERENCE,
+                         color=validation.Choice("GRAY", "GREEn", "LBLue", "MAGenta", "ORANge", name="color"))
     def set_reference_channel_color(self, n, color):
         """
         Set the display color of the current reference channel.
@@ -4396,14 +3758,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         n (int): The reference channel number, from 1 to 10.
         color (str): The color, one of {"GRAY", "GREEn", "LBLue", "MAGenta", "ORANge"}.
         """
-        valid_channels = list(range(1, 11))
-        valid_colors = {"GRAY", "GREEn", "LBLue", "MAGenta", "ORANge"}
-        color = color.upper()
-        if n in valid_channels and color in valid_colors:
-            self.instrument.write(f":REFerence{n}:COLor {color}")
-        else:
-            print(f"Invalid reference channel ({n}) or color ({color}). Choose from {valid_colors}.")
+        self.instrument.write(f":REFerence{n}:COLor {color}")
 
+    @validation.validate(n=REFERENCE)
     def get_reference_channel_color(self, n):
         """
         Query the display color of the current reference channel.
@@ -4414,15 +3771,11 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         str: The color, one of {"GRAY", "GREE", "LBL", "MAG", "ORAN"}.
         """
-        valid_channels = list(range(1, 11))
-        if n in valid_channels:
-            response = self.instrument.query(f":REFerence{n}:COLor?")
-            return response.strip().upper()
-        else:
-            print(f"Invalid reference channel ({n}). Choose from {valid_channels}.")
-            return None
+        response = self.instrument.query(f":REFerence{n}:COLor?")
+        return response.strip().upper()
 
     # STORage Commands
+    @validation.validate(img_type=validation.Choice("PNG", "BMP8", "BMP24", "JPEG", "TIFF", name="image type"))
     def set_storage_image_type(self, img_type):
         """
         Set the image type when storing images.
@@ -4430,12 +3783,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         img_type (str): The image type, one of {"PNG", "BMP8", "BMP24", "JPEG", "TIFF"}.
         """
-        valid_types = {"PNG", "BMP8", "BMP24", "JPEG", "TIFF"}
-        img_type = img_type.upper()
-        if img_type in valid_types:
-            self.instrument.write(f":STORage:IMAGe:TYPE {img_type}")
-        else:
-            print(f"Invalid image type ({img_type}). Choose from {valid_types}.")
+        self.instrument.write(f":STORage:IMAGe:TYPE {img_type}")
 
     def get_storage_image_type(self):
         """
@@ -4537,6 +3885,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":SYSTem:LOCKed?")
         return bool(int(response.strip()))
 
+    @validation.validate(pon_mode=validation.Choice("LATest", "DEFault", name="power-on recall mode"))
     def set_system_power_on_recall(self, pon_mode):
         """
         Set the system configuration to be recalled when the oscilloscope is powered on again after power-off.
@@ -4544,12 +3893,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         pon_mode (str): The power-on recall mode, one of {"LATest", "DEFault"}.
         """
-        valid_modes = {"LATest", "DEFault"}
-        pon_mode = pon_mode.upper()
-        if pon_mode in valid_modes:
-            self.instrument.write(f":SYSTem:PON {pon_mode}")
-        else:
-            print(f"Invalid power-on recall mode ({pon_mode}). Choose from {valid_modes}.")
+        self.instrument.write(f":SYSTem:PON {pon_mode}")
 
     def get_system_power_on_recall(self):
         """
@@ -4570,10 +3914,10 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         license_key (str): The option license key.
         """
-        if isinstance(license_key, str) and len(license_key) == 28 and license_key.isalnum() and license_key.isupper():
-            self.instrument.write(f":SYSTem:OPTion:INSTall {license_key}")
-        else:
-            print(f"Invalid license key format ({license_key}). Must be a 28-character uppercase alphanumeric string.")
+        if not (isinstance(license_key, str) and len(license_key) == 28 and license_key.isalnum()
+                and license_key.isupper()):
+            raise ValueError(f"Invalid license key ({license_key}). Must be a 28-character uppercase alphanumeric string.")
+        self.instrument.write(f":SYSTem:OPTion:INSTall {license_key}")
 
     def uninstall_system_options(self):
         """
@@ -4620,18 +3964,13 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Query the setting of the oscilloscope.
 
         Returns:
-        bytes: The setting data stream, including the TMC data description header.
-               The user needs to handle parsing this data (remove TMC header).
+        bytes: The setting data stream without the TMC data description header.
         """
         try:
-            # It's crucial to set a proper timeout for large binary transfers
-            # self.instrument.timeout = 5000 # Example: 5 seconds timeout
-            data = self.instrument.query_binary_values(":SYSTem:SETup?", datatype='B', container=bytes)
-            # self.instrument.timeout = 2000 # Reset to default if needed
-            return data
+            # The setup is a few kB, the default transfer timeout applies.
+            return bytes(self._read_block(":SYSTem:SETup?", 1 << 14))
         except pyvisa.errors.VisaIOError as e:
             print(f"VISA IO Error while getting system setup data: {e}")
-            print("Consider increasing the instrument's timeout.")
             return b""
         except Exception as e:
             print(f"An unexpected error occurred: {e}")
@@ -4657,6 +3996,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TIMebase:DELay:ENABle?")
         return bool(int(response.strip()))
 
+    @validation.validate(offset=validation.Range(name="offset"))
     def set_timebase_delay_offset(self, offset):
         """
         Set the delayed timebase offset. Default unit is s.
@@ -4664,10 +4004,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         offset (float): The offset in seconds. Range depends on main timebase settings.
         """
-        if isinstance(offset, (float, int)):
-            self.instrument.write(f":TIMebase:DELay:OFFSet {float(offset)}")
-        else:
-            print(f"Invalid offset value ({offset}). Must be a number.")
+        self.instrument.write(f":TIMebase:DELay:OFFSet {float(offset)}")
 
     def get_timebase_delay_offset(self):
         """
@@ -4679,6 +4016,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TIMebase:DELay:OFFSet?")
         return float(response.strip())
 
+    @validation.validate(scale=validation.Range(0, name="scale"))
     def set_timebase_delay_scale(self, scale):
         """
         Set the delayed timebase scale. Default unit is s/div.
@@ -4686,10 +4024,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         scale (float): The scale in s/div. Range depends on main timebase and sample rate.
         """
-        if isinstance(scale, (float, int)) and scale > 0:
-            self.instrument.write(f":TIMebase:DELay:SCALe {float(scale)}")
-        else:
-            print(f"Invalid scale value ({scale}). Must be a positive number.")
+        self.instrument.write(f":TIMebase:DELay:SCALe {float(scale)}")
 
     def get_timebase_delay_scale(self):
         """
@@ -4701,6 +4036,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TIMebase:DELay:SCALe?")
         return float(response.strip())
 
+    @validation.validate(offset=validation.Range(name="offset"))
     def set_timebase_main_offset(self, offset):
         """
         Set the main timebase offset. Default unit is s.
@@ -4708,10 +4044,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         offset (float): The offset in seconds. Range depends on timebase mode and run state.
         """
-        if isinstance(offset, (float, int)):
-            self.instrument.write(f":TIMebase:MAIN:OFFSet {float(offset)}")
-        else:
-            print(f"Invalid offset value ({offset}). Must be a number.")
+        self.instrument.write(f":TIMebase:MAIN:OFFSet {float(offset)}")
 
     def get_timebase_main_offset(self):
         """
@@ -4723,6 +4056,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TIMebase:MAIN:OFFSet?")
         return float(response.strip())
 
+    @validation.validate(scale=validation.Range(0, name="scale"))
     def set_timebase_main_scale(self, scale):
         """
         Set the main timebase scale. Default unit is s/div.
@@ -4730,10 +4064,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         scale (float): The scale in s/div. YT mode: 2ns/div to 50s/div. Roll mode: 100ms/div to 50s/div.
         """
-        if isinstance(scale, (float, int)) and scale > 0:
-            self.instrument.write(f":TIMebase:MAIN:SCALe {float(scale)}")
-        else:
-            print(f"Invalid scale value ({scale}). Must be a positive number.")
+        self.instrument.write(f":TIMebase:MAIN:SCALe {float(scale)}")
 
     def get_timebase_main_scale(self):
         """
@@ -4745,6 +4076,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TIMebase:MAIN:SCALe?")
         return float(response.strip())
 
+    @validation.validate(mode=validation.Choice("MAIN", "XY", "ROLL", name="timebase mode"))
     def set_timebase_mode(self, mode):
         """
         Set the mode of the horizontal timebase.
@@ -4753,12 +4085,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         mode (str): The timebase mode, one of {"MAIN", "XY", "ROLL"}.
                     MAIN: YT mode. XY: XY mode. ROLL: Roll mode.
         """
-        valid_modes = {"MAIN", "XY", "ROLL"}
-        mode = mode.upper()
-        if mode in valid_modes:
-            self.instrument.write(f":TIMebase:MODE {mode}")
-        else:
-            print(f"Invalid mode ({mode}). Choose from {valid_modes}.")
+        self.instrument.write(f":TIMebase:MODE {mode}")
 
     def get_timebase_mode(self):
         """
@@ -4771,6 +4098,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         return response.strip().upper()
 
     # TRIGger Commands
+    @validation.validate(mode=validation.Choice("EDGE", "PULSE", "RUNT", "WINDows", "NEDGE", "SLOPE", "VIDeo",
+                                                "PATTern", "DELay", "TIMeout", "DURation", "SHOLD", "RS232", "IIC",
+                                                "SPI", name="trigger type"))
     def set_trigger_mode(self, mode):
         """
         Select the trigger type.
@@ -4780,14 +4110,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
                                             "SLOPE", "VIDeo", "PATTern", "DELay", "TIMeout",
                                             "DURation", "SHOLD", "RS232", "IIC", "SPI"}.
         """
-        valid_modes = {"EDGE", "PULSE", "RUNT", "WINDows", "NEDGE", "SLOPE",
-                       "VIDeo", "PATTern", "DELay", "TIMeout", "DURation",
-                       "SHOLD", "RS232", "IIC", "SPI"}
-        mode = mode.upper()
-        if mode in valid_modes:
-            self.instrument.write(f":TRIGger:MODE {mode}")
-        else:
-            print(f"Invalid trigger mode ({mode}). Choose from {valid_modes}.")
+        self.instrument.write(f":TRIGger:MODE {mode}")
 
     def get_trigger_mode(self):
         """
@@ -4812,6 +4135,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:STATus?")
         return response.strip().upper()
 
+    @validation.validate(sweep_mode=validation.Choice("AUTO", "NORMal", "SINGle", name="sweep mode"))
     def set_trigger_sweep_mode(self, sweep_mode):
         """
         Set the trigger mode (sweep mode).
@@ -4819,12 +4143,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         sweep_mode (str): The sweep mode, one of {"AUTO", "NORMal", "SINGle"}.
         """
-        valid_modes = {"AUTO", "NORMal", "SINGle"}
-        sweep_mode = sweep_mode.upper()
-        if sweep_mode in valid_modes:
-            self.instrument.write(f":TRIGger:SWEep {sweep_mode}")
-        else:
-            print(f"Invalid sweep mode ({sweep_mode}). Choose from {valid_modes}.")
+        self.instrument.write(f":TRIGger:SWEep {sweep_mode}")
 
     def get_trigger_sweep_mode(self):
         """
@@ -4867,6 +4186,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         return int(response.strip())
 
     # TRIGger:EDGE Commands
+    @validation.validate(source=validation.Choice("CHANnel1", "CHANnel2", "AC", "EXT", name="source"))
     def set_trigger_edge_source(self, source):
         """
         Set the trigger source in edge trigger.
@@ -4874,12 +4194,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2", "AC", "EXT"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2", "AC", "EXT"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":TRIGger:EDGE:SOURce {source}")
-        else:
-            print(f"Invalid edge trigger source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":TRIGger:EDGE:SOURce {source}")
 
     def get_trigger_edge_source(self):
         """
@@ -4891,6 +4206,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:EDGE:SOURce?")
         return response.strip().upper()
 
+    @validation.validate(slope_type=validation.Choice("POSitive", "NEGative", "RFALl", name="slope type"))
     def set_trigger_edge_slope(self, slope_type):
         """
         Set the edge type in edge trigger.
@@ -4899,12 +4215,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         slope_type (str): The slope type, one of {"POSitive", "NEGative", "RFALl"}.
                           POSitive: rising edge. NEGative: falling edge. RFALl: rising/falling edge.
         """
-        valid_types = {"POSitive", "NEGative", "RFALl"}
-        slope_type = slope_type.upper()
-        if slope_type in valid_types:
-            self.instrument.write(f":TRIGger:EDGE:SLOPE {slope_type}")
-        else:
-            print(f"Invalid edge slope type ({slope_type}). Choose from {valid_types}.")
+        self.instrument.write(f":TRIGger:EDGE:SLOPE {slope_type}")
 
     def get_trigger_edge_slope(self):
         """
@@ -4916,6 +4227,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:EDGE:SLOPE?")
         return response.strip().upper()
 
+    @validation.validate(level=LEVEL)
     def set_trigger_edge_level(self, level):
         """
         Set the trigger level in edge trigger. The unit is the same as the current amplitude unit of the signal source.
@@ -4923,10 +4235,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         level (float): The trigger level. Range: (-5 * VerticalScale - OFFSet) to (5 * VerticalScale - OFFSet).
         """
-        if isinstance(level, (float, int)):
-            self.instrument.write(f":TRIGger:EDGE:LEVel {float(level)}")
-        else:
-            print(f"Invalid edge trigger level ({level}). Must be a number.")
+        self.instrument.write(f":TRIGger:EDGE:LEVel {float(level)}")
 
     def get_trigger_edge_level(self):
         """
@@ -4939,6 +4248,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         return float(response.strip())
 
     # TRIGger:PULSE Commands
+    @validation.validate(source=SOURCE)
     def set_trigger_pulse_source(self, source):
         """
         Set the trigger source in pulse width trigger.
@@ -4946,12 +4256,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":TRIGger:PULSE:SOURce {source}")
-        else:
-            print(f"Invalid pulse trigger source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":TRIGger:PULSE:SOURce {source}")
 
     def get_trigger_pulse_source(self):
         """
@@ -4963,6 +4268,8 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:PULSE:SOURce?")
         return response.strip().upper()
 
+    @validation.validate(when_condition=validation.Choice("PGReater", "PLESS", "NGReater", "NLESS", "PGLess",
+                                                          "NGLess", name="condition"))
     def set_trigger_pulse_when(self, when_condition):
         """
         Set the trigger condition in pulse width trigger.
@@ -4971,12 +4278,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         when_condition (str): The condition, one of {"PGReater", "PLESS", "NGReater",
                                                     "NLESS", "PGLess", "NGLess"}.
         """
-        valid_conditions = {"PGReater", "PLESS", "NGReater", "NLESS", "PGLess", "NGLess"}
-        when_condition = when_condition.upper()
-        if when_condition in valid_conditions:
-            self.instrument.write(f":TRIGger:PULSE:WHEN {when_condition}")
-        else:
-            print(f"Invalid pulse trigger condition ({when_condition}). Choose from {valid_conditions}.")
+        self.instrument.write(f":TRIGger:PULSE:WHEN {when_condition}")
 
     def get_trigger_pulse_when(self):
         """
@@ -4988,6 +4290,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:PULSE:WHEN?")
         return response.strip().upper()
 
+    @validation.validate(width=WIDTH)
     def set_trigger_pulse_width(self, width):
         """
         Set the pulse width in pulse width trigger. Default unit is s.
@@ -4996,10 +4299,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         width (float): The pulse width in seconds, from 8ns to 10s.
         """
-        if isinstance(width, (float, int)) and 8e-9 <= width <= 10.0:
-            self.instrument.write(f":TRIGger:PULSE:WIDTH {float(width)}")
-        else:
-            print(f"Invalid pulse width ({width}). Must be a float between 8ns and 10s.")
+        self.instrument.write(f":TRIGger:PULSE:WIDTH {float(width)}")
 
     def get_trigger_pulse_width(self):
         """
@@ -5011,6 +4311,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:PULSE:WIDTH?")
         return float(response.strip())
 
+    @validation.validate(width=UPPER_WIDTH)
     def set_trigger_pulse_upper_width(self, width):
         """
         Set the upper pulse width in pulse width trigger. Default unit is s.
@@ -5019,10 +4320,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         width (float): The upper pulse width in seconds, from 16ns to 10s.
         """
-        if isinstance(width, (float, int)) and 16e-9 <= width <= 10.0:
-            self.instrument.write(f":TRIGger:PULSE:UWIDth {float(width)}")
-        else:
-            print(f"Invalid upper pulse width ({width}). Must be a float between 16ns and 10s.")
+        self.instrument.write(f":TRIGger:PULSE:UWIDth {float(width)}")
 
     def get_trigger_pulse_upper_width(self):
         """
@@ -5034,6 +4332,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:PULSE:UWIDth?")
         return float(response.strip())
 
+    @validation.validate(width=LOWER_WIDTH)
     def set_trigger_pulse_lower_width(self, width):
         """
         Set the lower pulse width in pulse width trigger. Default unit is s.
@@ -5042,10 +4341,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         width (float): The lower pulse width in seconds, from 8ns to 9.99s.
         """
-        if isinstance(width, (float, int)) and 8e-9 <= width <= 9.99:
-            self.instrument.write(f":TRIGger:PULSE:LWIDth {float(width)}")
-        else:
-            print(f"Invalid lower pulse width ({width}). Must be a float between 8ns and 9.99s.")
+        self.instrument.write(f":TRIGger:PULSE:LWIDth {float(width)}")
 
     def get_trigger_pulse_lower_width(self):
         """
@@ -5057,6 +4353,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:PULSE:LWIDth?")
         return float(response.strip())
 
+    @validation.validate(level=LEVEL)
     def set_trigger_pulse_level(self, level):
         """
         Set the trigger level in pulse width trigger. The unit is the same as the current amplitude unit.
@@ -5064,10 +4361,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         level (float): The trigger level. Range: (-5 * VerticalScale - OFFSet) to (5 * VerticalScale - OFFSet).
         """
-        if isinstance(level, (float, int)):
-            self.instrument.write(f":TRIGger:PULSE:LEVel {float(level)}")
-        else:
-            print(f"Invalid pulse trigger level ({level}). Must be a number.")
+        self.instrument.write(f":TRIGger:PULSE:LEVel {float(level)}")
 
     def get_trigger_pulse_level(self):
         """
@@ -5080,6 +4374,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         return float(response.strip())
 
     # TRIGger:SLOPE Commands
+    @validation.validate(source=SOURCE)
     def set_trigger_slope_source(self, source):
         """
         Set the trigger source in slope trigger.
@@ -5087,12 +4382,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":TRIGger:SLOPE:SOURce {source}")
-        else:
-            print(f"Invalid slope trigger source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":TRIGger:SLOPE:SOURce {source}")
 
     def get_trigger_slope_source(self):
         """
@@ -5104,6 +4394,8 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:SLOPE:SOURce?")
         return response.strip().upper()
 
+    @validation.validate(when_condition=validation.Choice("PGReater", "PLESS", "NGReater", "NLESS", "PGLess",
+                                                          "NGLess", name="condition"))
     def set_trigger_slope_when(self, when_condition):
         """
         Set the trigger condition in slope trigger.
@@ -5112,12 +4404,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         when_condition (str): The condition, one of {"PGReater", "PLESS", "NGReater",
                                                     "NLESS", "PGLess", "NGLess"}.
         """
-        valid_conditions = {"PGReater", "PLESS", "NGReater", "NLESS", "PGLess", "NGLess"}
-        when_condition = when_condition.upper()
-        if when_condition in valid_conditions:
-            self.instrument.write(f":TRIGger:SLOPE:WHEN {when_condition}")
-        else:
-            print(f"Invalid slope trigger condition ({when_condition}). Choose from {valid_conditions}.")
+        self.instrument.write(f":TRIGger:SLOPE:WHEN {when_condition}")
 
     def get_trigger_slope_when(self):
         """
@@ -5129,6 +4416,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:SLOPE:WHEN?")
         return response.strip().upper()
 
+    @validation.validate(time_value=WIDTH)
     def set_trigger_slope_time(self, time_value):
         """
         Set the time value in slope trigger. Default unit is s.
@@ -5137,10 +4425,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         time_value (float): The time value in seconds, from 8ns to 10s.
         """
-        if isinstance(time_value, (float, int)) and 8e-9 <= time_value <= 10.0:
-            self.instrument.write(f":TRIGger:SLOPE:TIME {float(time_value)}")
-        else:
-            print(f"Invalid slope time value ({time_value}). Must be a float between 8ns and 10s.")
+        self.instrument.write(f":TRIGger:SLOPE:TIME {float(time_value)}")
 
     def get_trigger_slope_time(self):
         """
@@ -5152,6 +4437,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:SLOPE:TIME?")
         return float(response.strip())
 
+    @validation.validate(time_value=UPPER_WIDTH)
     def set_trigger_slope_upper_time(self, time_value):
         """
         Set the upper limit of the time in slope trigger. Default unit is s.
@@ -5160,10 +4446,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         time_value (float): The upper limit of the time in seconds, from 16ns to 10s.
         """
-        if isinstance(time_value, (float, int)) and 16e-9 <= time_value <= 10.0:
-            self.instrument.write(f":TRIGger:SLOPE:TUPPer {float(time_value)}")
-        else:
-            print(f"Invalid slope upper time ({time_value}). Must be a float between 16ns and 10s.")
+        self.instrument.write(f":TRIGger:SLOPE:TUPPer {float(time_value)}")
 
     def get_trigger_slope_upper_time(self):
         """
@@ -5175,6 +4458,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:SLOPE:TUPPer?")
         return float(response.strip())
 
+    @validation.validate(time_value=LOWER_WIDTH)
     def set_trigger_slope_lower_time(self, time_value):
         """
         Set the lower limit of the time in slope trigger. Default unit is s.
@@ -5183,10 +4467,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         time_value (float): The lower limit of the time in seconds, from 8ns to 9.99s.
         """
-        if isinstance(time_value, (float, int)) and 8e-9 <= time_value <= 9.99:
-            self.instrument.write(f":TRIGger:SLOPE:TLOWer {float(time_value)}")
-        else:
-            print(f"Invalid slope lower time ({time_value}). Must be a float between 8ns and 9.99s.")
+        self.instrument.write(f":TRIGger:SLOPE:TLOWer {float(time_value)}")
 
     def get_trigger_slope_lower_time(self):
         """
@@ -5198,6 +4479,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:SLOPE:TLOWer?")
         return float(response.strip())
 
+    @validation.validate(window_type=validation.Choice("TA", "TB", "TAB", name="window type"))
     def set_trigger_slope_window(self, window_type):
         """
         Set the vertical window type in slope trigger.
@@ -5206,12 +4488,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         window_type (str): The window type, one of {"TA", "TB", "TAB"}.
                            TA: adjust upper limit. TB: adjust lower limit. TAB: adjust both.
         """
-        valid_types = {"TA", "TB", "TAB"}
-        window_type = window_type.upper()
-        if window_type in valid_types:
-            self.instrument.write(f":TRIGger:SLOPE:WINDow {window_type}")
-        else:
-            print(f"Invalid slope window type ({window_type}). Choose from {valid_types}.")
+        self.instrument.write(f":TRIGger:SLOPE:WINDow {window_type}")
 
     def get_trigger_slope_window(self):
         """
@@ -5223,6 +4500,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:SLOPE:WINDow?")
         return response.strip().upper()
 
+    @validation.validate(level=LEVEL)
     def set_trigger_slope_upper_level(self, level):
         """
         Set the upper limit of the trigger level in slope trigger. The unit is the same as the current amplitude unit.
@@ -5230,10 +4508,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         level (float): The upper limit level. Range: (-5 * VerticalScale - OFFSet) to (5 * VerticalScale - OFFSet).
         """
-        if isinstance(level, (float, int)):
-            self.instrument.write(f":TRIGger:SLOPE:ALEVel {float(level)}")
-        else:
-            print(f"Invalid slope upper level ({level}). Must be a number.")
+        self.instrument.write(f":TRIGger:SLOPE:ALEVel {float(level)}")
 
     def get_trigger_slope_upper_level(self):
         """
@@ -5245,6 +4520,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:SLOPE:ALEVel?")
         return float(response.strip())
 
+    @validation.validate(level=LEVEL)
     def set_trigger_slope_lower_level(self, level):
         """
         Set the lower limit of the trigger level in slope trigger. The unit is the same as the current amplitude unit.
@@ -5252,10 +4528,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         level (float): The lower limit level. Range: (-5 * VerticalScale - OFFSet) to (5 * VerticalScale - OFFSet).
         """
-        if isinstance(level, (float, int)):
-            self.instrument.write(f":TRIGger:SLOPE:BLEVel {float(level)}")
-        else:
-            print(f"Invalid slope lower level ({level}). Must be a number.")
+        self.instrument.write(f":TRIGger:SLOPE:BLEVel {float(level)}")
 
     def get_trigger_slope_lower_level(self):
         """
@@ -5268,6 +4541,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         return float(response.strip())
 
     # TRIGger:VIDeo Commands
+    @validation.validate(source=SOURCE)
     def set_trigger_video_source(self, source):
         """
         Select the trigger source in video trigger.
@@ -5275,12 +4549,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":TRIGger:VIDeo:SOURce {source}")
-        else:
-            print(f"Invalid video trigger source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":TRIGger:VIDeo:SOURce {source}")
 
     def get_trigger_video_source(self):
         """
@@ -5292,6 +4561,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:VIDeo:SOURce?")
         return response.strip().upper()
 
+    @validation.validate(polarity=validation.Choice("POSitive", "NEGative", name="polarity"))
     def set_trigger_video_polarity(self, polarity):
         """
         Select the video polarity in video trigger.
@@ -5299,12 +4569,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         polarity (str): The polarity, one of {"POSitive", "NEGative"}.
         """
-        valid_polarities = {"POSitive", "NEGative"}
-        polarity = polarity.upper()
-        if polarity in valid_polarities:
-            self.instrument.write(f":TRIGger:VIDeo:POLarity {polarity}")
-        else:
-            print(f"Invalid video polarity ({polarity}). Choose from {valid_polarities}.")
+        self.instrument.write(f":TRIGger:VIDeo:POLarity {polarity}")
 
     def get_trigger_video_polarity(self):
         """
@@ -5316,6 +4581,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:VIDeo:POLarity?")
         return response.strip().upper()
 
+    @validation.validate(mode=validation.Choice("ODDField", "EVENfield", "LINE", "ALINes", name="sync type"))
     def set_trigger_video_sync_mode(self, mode):
         """
         Set the sync type in video trigger.
@@ -5323,12 +4589,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         mode (str): The sync type, one of {"ODDField", "EVENfield", "LINE", "ALINes"}.
         """
-        valid_modes = {"ODDField", "EVENfield", "LINE", "ALINes"}
-        mode = mode.upper()
-        if mode in valid_modes:
-            self.instrument.write(f":TRIGger:VIDeo:MODE {mode}")
-        else:
-            print(f"Invalid video sync mode ({mode}). Choose from {valid_modes}.")
+        self.instrument.write(f":TRIGger:VIDeo:MODE {mode}")
 
     def get_trigger_video_sync_mode(self):
         """
@@ -5340,6 +4601,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:VIDeo:MODE?")
         return response.strip().upper()
 
+    @validation.validate(standard=validation.Choice("PALSecam", "NTSC", "480P", "576P", name="video standard"))
     def set_trigger_video_standard(self, standard):
         """
         Set the video standard in video trigger.
@@ -5347,12 +4609,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         standard (str): The video standard, one of {"PALSecam", "NTSC", "480P", "576P"}.
         """
-        valid_standards = {"PALSecam", "NTSC", "480P", "576P"}
-        standard = standard.upper()
-        if standard in valid_standards:
-            self.instrument.write(f":TRIGger:VIDeo:STANdard {standard}")
-        else:
-            print(f"Invalid video standard ({standard}). Choose from {valid_standards}.")
+        self.instrument.write(f":TRIGger:VIDeo:STANdard {standard}")
 
     def get_trigger_video_standard(self):
         """
@@ -5364,6 +4621,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:VIDeo:STANdard?")
         return response.strip().upper()
 
+    @validation.validate(level=LEVEL)
     def set_trigger_video_level(self, level):
         """
         Set the trigger level in video trigger. The unit is the same as the current amplitude unit.
@@ -5371,10 +4629,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         level (float): The trigger level. Range: (-5 * VerticalScale - OFFSet) to (5 * VerticalScale - OFFSet).
         """
-        if isinstance(level, (float, int)):
-            self.instrument.write(f":TRIGger:VIDeo:LEVel {float(level)}")
-        else:
-            print(f"Invalid video trigger level ({level}). Must be a number.")
+        self.instrument.write(f":TRIGger:VIDeo:LEVel {float(level)}")
 
     def get_trigger_video_level(self):
         """
@@ -5387,6 +4642,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         return float(response.strip())
 
     # TRIGger:PATTern Commands
+    @validation.validate(pa_ch1=PATTERN, pa_ch2=PATTERN)
     def set_trigger_pattern(self, pa_ch1, pa_ch2=None):
         """
         Set the pattern of each channel in pattern trigger.
@@ -5396,19 +4652,8 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         pa_ch2 (str, optional): Pattern for CH2, one of {"H", "L", "X", "R", "F"}.
                                 If omitted, CH2's pattern remains unchanged.
         """
-        valid_patterns = {"H", "L", "X", "R", "F"}
-        pa_ch1 = pa_ch1.upper()
-
-        if pa_ch1 not in valid_patterns:
-            print(f"Invalid pattern for CH1 ({pa_ch1}). Choose from {valid_patterns}.")
-            return
-
         command = f":TRIGger:PATTern:PATTern {pa_ch1}"
         if pa_ch2 is not None:
-            pa_ch2 = pa_ch2.upper()
-            if pa_ch2 not in valid_patterns:
-                print(f"Invalid pattern for CH2 ({pa_ch2}). Choose from {valid_patterns}.")
-                return
             command += f",{pa_ch2}"
         self.instrument.write(command)
 
@@ -5422,6 +4667,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:PATTern:PATTern?")
         return [p.strip().upper() for p in response.strip().split(',')]
 
+    @validation.validate(channel=validation.Choice("CHANnel1", "CHANnel2", name="channel"), level=LEVEL)
     def set_trigger_pattern_level(self, channel, level):
         """
         Set the trigger level of the specified channel in pattern trigger.
@@ -5431,16 +4677,9 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         channel (str): The channel, one of {"CHANnel1", "CHANnel2"}.
         level (float): The trigger level. Range: (-5 * VerticalScale - OFFSet) to (5 * VerticalScale - OFFSet).
         """
-        valid_channels = {"CHANnel1", "CHANnel2"}
-        channel = channel.upper()
-        if channel not in valid_channels:
-            print(f"Invalid channel ({channel}). Choose from {valid_channels}.")
-            return
-        if isinstance(level, (float, int)):
-            self.instrument.write(f":TRIGger:PATTern:LEVel {channel},{float(level)}")
-        else:
-            print(f"Invalid pattern trigger level ({level}). Must be a number.")
+        self.instrument.write(f":TRIGger:PATTern:LEVel {channel},{float(level)}")
 
+    @validation.validate(channel=validation.Choice("CHANnel1", "CHANnel2", name="channel"))
     def get_trigger_pattern_level(self, channel):
         """
         Query the trigger level of the specified channel in pattern trigger.
@@ -5451,15 +4690,11 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Returns:
         float: The trigger level in scientific notation.
         """
-        valid_channels = {"CHANnel1", "CHANnel2"}
-        channel = channel.upper()
-        if channel not in valid_channels:
-            print(f"Invalid channel ({channel}). Choose from {valid_channels}.")
-            return None
         response = self.instrument.query(f":TRIGger:PATTern:LEVel? {channel}")
         return float(response.strip())
 
     # TRIGger:DURATion Commands
+    @validation.validate(source=SOURCE)
     def set_trigger_duration_source(self, source):
         """
         Set the trigger source in duration trigger.
@@ -5467,12 +4702,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":TRIGger:DURATion:SOURce {source}")
-        else:
-            print(f"Invalid duration trigger source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":TRIGger:DURATion:SOURce {source}")
 
     def get_trigger_duration_source(self):
         """
@@ -5484,6 +4714,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:DURATion:SOURce?")
         return response.strip().upper()
 
+    @validation.validate(type_ch1=DURATION_TYPE, type_ch2=DURATION_TYPE)
     def set_trigger_duration_type(self, type_ch1, type_ch2=None):
         """
         Set the pattern of each channel in duration trigger.
@@ -5493,19 +4724,8 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         type_ch2 (str, optional): Pattern for CH2, one of {"H", "L", "X"}.
                                   If omitted, CH2's pattern remains unchanged.
         """
-        valid_types = {"H", "L", "X"}
-        type_ch1 = type_ch1.upper()
-
-        if type_ch1 not in valid_types:
-            print(f"Invalid type for CH1 ({type_ch1}). Choose from {valid_types}.")
-            return
-
         command = f":TRIGger:DURATion:TYPe {type_ch1}"
         if type_ch2 is not None:
-            type_ch2 = type_ch2.upper()
-            if type_ch2 not in valid_types:
-                print(f"Invalid type for CH2 ({type_ch2}). Choose from {valid_types}.")
-                return
             command += f",{type_ch2}"
         self.instrument.write(command)
 
@@ -5519,6 +4739,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:DURATion:TYPe?")
         return [t.strip().upper() for t in response.strip().split(',')]
 
+    @validation.validate(when_condition=validation.Choice("GREater", "LESS", "GLESs", name="condition"))
     def set_trigger_duration_when(self, when_condition):
         """
         Set the trigger condition in duration trigger.
@@ -5526,12 +4747,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         when_condition (str): The condition, one of {"GREater", "LESS", "GLESs"}.
         """
-        valid_conditions = {"GREater", "LESS", "GLESs"}
-        when_condition = when_condition.upper()
-        if when_condition in valid_conditions:
-            self.instrument.write(f":TRIGger:DURATion:WHEN {when_condition}")
-        else:
-            print(f"Invalid duration trigger condition ({when_condition}). Choose from {valid_conditions}.")
+        self.instrument.write(f":TRIGger:DURATion:WHEN {when_condition}")
 
     def get_trigger_duration_when(self):
         """
@@ -5543,6 +4759,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:DURATion:WHEN?")
         return response.strip().upper()
 
+    @validation.validate(time_value=validation.Range(8e-9, name="upper time"))
     def set_trigger_duration_upper_time(self, time_value):
         """
         Set the duration time upper limit in duration trigger. Default unit is s.
@@ -5551,10 +4768,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         time_value (float): The upper limit in seconds. Range depends on trigger condition.
         """
-        if isinstance(time_value, (float, int)) and time_value >= 8e-9: # Minimum value is 8ns or 16ns
-            self.instrument.write(f":TRIGger:DURATion:TUPPer {float(time_value)}")
-        else:
-            print(f"Invalid duration upper time ({time_value}). Must be a float >= 8ns.")
+        self.instrument.write(f":TRIGger:DURATion:TUPPer {float(time_value)}")
 
     def get_trigger_duration_upper_time(self):
         """
@@ -5566,6 +4780,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:DURATion:TUPPer?")
         return float(response.strip())
 
+    @validation.validate(time_value=LOWER_WIDTH)
     def set_trigger_duration_lower_time(self, time_value):
         """
         Set the duration time lower limit in duration trigger. Default unit is s.
@@ -5574,10 +4789,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         time_value (float): The lower limit in seconds, from 8ns to 9.99s.
         """
-        if isinstance(time_value, (float, int)) and 8e-9 <= time_value <= 9.99:
-            self.instrument.write(f":TRIGger:DURATion:TLOWer {float(time_value)}")
-        else:
-            print(f"Invalid duration lower time ({time_value}). Must be a float between 8ns and 9.99s.")
+        self.instrument.write(f":TRIGger:DURATion:TLOWer {float(time_value)}")
 
     def get_trigger_duration_lower_time(self):
         """
@@ -5590,6 +4802,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         return float(response.strip())
 
     # TRIGger:TIMeout Commands
+    @validation.validate(source=SOURCE)
     def set_trigger_timeout_source(self, source):
         """
         Set the trigger source in timeout trigger.
@@ -5597,12 +4810,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":TRIGger:TIMeout:SOURce {source}")
-        else:
-            print(f"Invalid timeout trigger source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":TRIGger:TIMeout:SOURce {source}")
 
     def get_trigger_timeout_source(self):
         """
@@ -5614,6 +4822,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:TIMeout:SOURce?")
         return response.strip().upper()
 
+    @validation.validate(slope_type=validation.Choice("POSitive", "NEGative", "RFALl", name="slope type"))
     def set_trigger_timeout_slope(self, slope_type):
         """
         Set the edge type in timeout trigger.
@@ -5621,12 +4830,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         slope_type (str): The slope type, one of {"POSitive", "NEGative", "RFALl"}.
         """
-        valid_types = {"POSitive", "NEGative", "RFALl"}
-        slope_type = slope_type.upper()
-        if slope_type in valid_types:
-            self.instrument.write(f":TRIGger:TIMeout:SLOPe {slope_type}")
-        else:
-            print(f"Invalid timeout slope type ({slope_type}). Choose from {valid_types}.")
+        self.instrument.write(f":TRIGger:TIMeout:SLOPe {slope_type}")
 
     def get_trigger_timeout_slope(self):
         """
@@ -5638,6 +4842,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:TIMeout:SLOPe?")
         return response.strip().upper()
 
+    @validation.validate(time_value=UPPER_WIDTH)
     def set_trigger_timeout_time(self, time_value):
         """
         Set the timeout time in timeout trigger. Default unit is s.
@@ -5645,10 +4850,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         time_value (float): The timeout time in seconds, from 16ns to 10s.
         """
-        if isinstance(time_value, (float, int)) and 16e-9 <= time_value <= 10.0:
-            self.instrument.write(f":TRIGger:TIMeout:TIMe {float(time_value)}")
-        else:
-            print(f"Invalid timeout time ({time_value}). Must be a float between 16ns and 10s.")
+        self.instrument.write(f":TRIGger:TIMeout:TIMe {float(time_value)}")
 
     def get_trigger_timeout_time(self):
         """
@@ -5661,6 +4863,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         return float(response.strip())
 
     # TRIGger:RUNT Commands
+    @validation.validate(source=SOURCE)
     def set_trigger_runt_source(self, source):
         """
         Set the trigger source in runt trigger.
@@ -5668,12 +4871,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":TRIGger:RUNT:SOURce {source}")
-        else:
-            print(f"Invalid runt trigger source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":TRIGger:RUNT:SOURce {source}")
 
     def get_trigger_runt_source(self):
         """
@@ -5685,6 +4883,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:RUNT:SOURce?")
         return response.strip().upper()
 
+    @validation.validate(polarity=validation.Choice("POSitive", "NEGative", name="polarity"))
     def set_trigger_runt_polarity(self, polarity):
         """
         Set the pulse polarity in runt trigger.
@@ -5692,12 +4891,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         polarity (str): The polarity, one of {"POSitive", "NEGative"}.
         """
-        valid_polarities = {"POSitive", "NEGative"}
-        polarity = polarity.upper()
-        if polarity in valid_polarities:
-            self.instrument.write(f":TRIGger:RUNT:POLarity {polarity}")
-        else:
-            print(f"Invalid runt polarity ({polarity}). Choose from {valid_polarities}.")
+        self.instrument.write(f":TRIGger:RUNT:POLarity {polarity}")
 
     def get_trigger_runt_polarity(self):
         """
@@ -5709,6 +4903,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:RUNT:POLarity?")
         return response.strip().upper()
 
+    @validation.validate(when_qualifier=validation.Choice("NONE", "GREater", "LESS", "GLESs", name="qualifier"))
     def set_trigger_runt_when(self, when_qualifier):
         """
         Set the qualifier in runt trigger.
@@ -5716,12 +4911,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         when_qualifier (str): The qualifier, one of {"NONE", "GREater", "LESS", "GLESs"}.
         """
-        valid_qualifiers = {"NONE", "GREater", "LESS", "GLESs"}
-        when_qualifier = when_qualifier.upper()
-        if when_qualifier in valid_qualifiers:
-            self.instrument.write(f":TRIGger:RUNT:WHEN {when_qualifier}")
-        else:
-            print(f"Invalid runt qualifier ({when_qualifier}). Choose from {valid_qualifiers}.")
+        self.instrument.write(f":TRIGger:RUNT:WHEN {when_qualifier}")
 
     def get_trigger_runt_when(self):
         """
@@ -5733,6 +4923,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:RUNT:WHEN?")
         return response.strip().upper()
 
+    @validation.validate(width=validation.Range(8e-9, name="upper width"))
     def set_trigger_runt_upper_width(self, width):
         """
         Set the pulse width upper limit in runt trigger. Default unit is s.
@@ -5741,10 +4932,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         width (float): The upper limit in seconds. Range depends on qualifier.
         """
-        if isinstance(width, (float, int)) and width >= 8e-9: # Min 8ns or 16ns
-            self.instrument.write(f":TRIGger:RUNT:WUPPer {float(width)}")
-        else:
-            print(f"Invalid runt upper width ({width}). Must be a float >= 8ns.")
+        self.instrument.write(f":TRIGger:RUNT:WUPPer {float(width)}")
 
     def get_trigger_runt_upper_width(self):
         """
@@ -5756,6 +4944,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:RUNT:WUPPer?")
         return float(response.strip())
 
+    @validation.validate(width=LOWER_WIDTH)
     def set_trigger_runt_lower_width(self, width):
         """
         Set the pulse width lower limit in runt trigger. Default unit is s.
@@ -5764,10 +4953,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         width (float): The lower limit in seconds. Range depends on qualifier.
         """
-        if isinstance(width, (float, int)) and width >= 8e-9 and width <= 9.99: # Max 9.99s
-            self.instrument.write(f":TRIGger:RUNT:WLOWer {float(width)}")
-        else:
-            print(f"Invalid runt lower width ({width}). Must be a float between 8ns and 9.99s.")
+        self.instrument.write(f":TRIGger:RUNT:WLOWer {float(width)}")
 
     def get_trigger_runt_lower_width(self):
         """
@@ -5779,6 +4965,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:RUNT:WLOWer?")
         return float(response.strip())
 
+    @validation.validate(level=LEVEL)
     def set_trigger_runt_upper_level(self, level):
         """
         Set the trigger level upper limit in runt trigger. The unit is the same as the current amplitude unit.
@@ -5786,10 +4973,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         level (float): The upper limit level. Range: (-5 * VerticalScale - OFFSet) to (5 * VerticalScale - OFFSet).
         """
-        if isinstance(level, (float, int)):
-            self.instrument.write(f":TRIGger:RUNT:ALEVel {float(level)}")
-        else:
-            print(f"Invalid runt upper level ({level}). Must be a number.")
+        self.instrument.write(f":TRIGger:RUNT:ALEVel {float(level)}")
 
     def get_trigger_runt_upper_level(self):
         """
@@ -5801,6 +4985,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:RUNT:ALEVel?")
         return float(response.strip())
 
+    @validation.validate(level=LEVEL)
     def set_trigger_runt_lower_level(self, level):
         """
         Set the trigger level lower limit in runt trigger. The unit is the same as the current amplitude unit.
@@ -5808,10 +4993,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         level (float): The lower limit level. Range: (-5 * VerticalScale - OFFSet) to (5 * VerticalScale - OFFSet).
         """
-        if isinstance(level, (float, int)):
-            self.instrument.write(f":TRIGger:RUNT:BLEVel {float(level)}")
-        else:
-            print(f"Invalid runt lower level ({level}). Must be a number.")
+        self.instrument.write(f":TRIGger:RUNT:BLEVel {float(level)}")
 
     def get_trigger_runt_lower_level(self):
         """
@@ -5824,6 +5006,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         return float(response.strip())
 
     # TRIGger:WINDows Commands
+    @validation.validate(source=SOURCE)
     def set_trigger_windows_source(self, source):
         """
         Set the trigger source in windows trigger.
@@ -5831,12 +5014,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":TRIGger:WINDows:SOURce {source}")
-        else:
-            print(f"Invalid windows trigger source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":TRIGger:WINDows:SOURce {source}")
 
     def get_trigger_windows_source(self):
         """
@@ -5848,6 +5026,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:WINDows:SOURce?")
         return response.strip().upper()
 
+    @validation.validate(window_type=validation.Choice("POSitive", "NEGative", "RFALl", name="window type"))
     def set_trigger_windows_slope(self, window_type):
         """
         Set the windows type in windows trigger.
@@ -5855,12 +5034,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         window_type (str): The window type, one of {"POSitive", "NEGative", "RFALl"}.
         """
-        valid_types = {"POSitive", "NEGative", "RFALl"}
-        window_type = window_type.upper()
-        if window_type in valid_types:
-            self.instrument.write(f":TRIGger:WINDows:SLOPe {window_type}")
-        else:
-            print(f"Invalid windows type ({window_type}). Choose from {valid_types}.")
+        self.instrument.write(f":TRIGger:WINDows:SLOPe {window_type}")
 
     def get_trigger_windows_slope(self):
         """
@@ -5872,6 +5046,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:WINDows:SLOPe?")
         return response.strip().upper()
 
+    @validation.validate(position_type=validation.Choice("EXIT", "ENTER", "TIMe", name="position type"))
     def set_trigger_windows_position(self, position_type):
         """
         Set the trigger position in windows trigger.
@@ -5879,12 +5054,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         position_type (str): The position type, one of {"EXIT", "ENTER", "TIMe"}.
         """
-        valid_types = {"EXIT", "ENTER", "TIMe"}
-        position_type = position_type.upper()
-        if position_type in valid_types:
-            self.instrument.write(f":TRIGger:WINDows:POSition {position_type}")
-        else:
-            print(f"Invalid windows position type ({position_type}). Choose from {valid_types}.")
+        self.instrument.write(f":TRIGger:WINDows:POSition {position_type}")
 
     def get_trigger_windows_position(self):
         """
@@ -5896,6 +5066,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:WINDows:POSition?")
         return response.strip().upper()
 
+    @validation.validate(time_value=WIDTH)
     def set_trigger_windows_time(self, time_value):
         """
         Set the hold time in windows trigger. Default unit is s.
@@ -5903,10 +5074,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         time_value (float): The hold time in seconds, from 8ns to 10s.
         """
-        if isinstance(time_value, (float, int)) and 8e-9 <= time_value <= 10.0:
-            self.instrument.write(f":TRIGger:WINDows:TIMe {float(time_value)}")
-        else:
-            print(f"Invalid windows time ({time_value}). Must be a float between 8ns and 10s.")
+        self.instrument.write(f":TRIGger:WINDows:TIMe {float(time_value)}")
 
     def get_trigger_windows_time(self):
         """
@@ -5918,6 +5086,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:WINDows:TIMe?")
         return float(response.strip())
 
+    @validation.validate(level=LEVEL)
     def set_trigger_windows_upper_level(self, level):
         """
         Set the trigger level upper limit in windows trigger. The unit is the same as the current amplitude unit.
@@ -5925,10 +5094,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         level (float): The upper limit level. Range: (-5 * VerticalScale - OFFSet) to (5 * VerticalScale - OFFSet).
         """
-        if isinstance(level, (float, int)):
-            self.instrument.write(f":TRIGger:WINDows:ALEVel {float(level)}")
-        else:
-            print(f"Invalid windows upper level ({level}). Must be a number.")
+        self.instrument.write(f":TRIGger:WINDows:ALEVel {float(level)}")
 
     def get_trigger_windows_upper_level(self):
         """
@@ -5940,6 +5106,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:WINDows:ALEVel?")
         return float(response.strip())
 
+    @validation.validate(level=LEVEL)
     def set_trigger_windows_lower_level(self, level):
         """
         Set the trigger level lower limit in windows trigger. The unit is the same as the current amplitude unit.
@@ -5947,10 +5114,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         level (float): The lower limit level. Range: (-5 * VerticalScale - OFFSet) to (5 * VerticalScale - OFFSet).
         """
-        if isinstance(level, (float, int)):
-            self.instrument.write(f":TRIGger:WINDows:BLEVel {float(level)}")
-        else:
-            print(f"Invalid windows lower level ({level}). Must be a number.")
+        self.instrument.write(f":TRIGger:WINDows:BLEVel {float(level)}")
 
     def get_trigger_windows_lower_level(self):
         """
@@ -5963,6 +5127,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         return float(response.strip())
 
     # TRIGger:DELay Commands
+    @validation.validate(source=SOURCE)
     def set_trigger_delay_source_a(self, source):
         """
         Set the trigger source A in delay trigger.
@@ -5970,12 +5135,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":TRIGger:DELay:SA {source}")
-        else:
-            print(f"Invalid delay trigger source A ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":TRIGger:DELay:SA {source}")
 
     def get_trigger_delay_source_a(self):
         """
@@ -5987,6 +5147,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:DELay:SA?")
         return response.strip().upper()
 
+    @validation.validate(slope_type=SLOPE)
     def set_trigger_delay_slope_a(self, slope_type):
         """
         Set the edge type of edge A in delay trigger.
@@ -5994,12 +5155,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         slope_type (str): The slope type, one of {"POSitive", "NEGative"}.
         """
-        valid_types = {"POSitive", "NEGative"}
-        slope_type = slope_type.upper()
-        if slope_type in valid_types:
-            self.instrument.write(f":TRIGger:DELay:SLOPA {slope_type}")
-        else:
-            print(f"Invalid delay slope A type ({slope_type}). Choose from {valid_types}.")
+        self.instrument.write(f":TRIGger:DELay:SLOPA {slope_type}")
 
     def get_trigger_delay_slope_a(self):
         """
@@ -6011,6 +5167,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:DELay:SLOPA?")
         return response.strip().upper()
 
+    @validation.validate(source=SOURCE)
     def set_trigger_delay_source_b(self, source):
         """
         Set the trigger source B in delay trigger.
@@ -6018,12 +5175,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":TRIGger:DELay:SB {source}")
-        else:
-            print(f"Invalid delay trigger source B ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":TRIGger:DELay:SB {source}")
 
     def get_trigger_delay_source_b(self):
         """
@@ -6035,6 +5187,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:DELay:SB?")
         return response.strip().upper()
 
+    @validation.validate(slope_type=SLOPE)
     def set_trigger_delay_slope_b(self, slope_type):
         """
         Set the edge type of edge B in delay trigger.
@@ -6042,12 +5195,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         slope_type (str): The slope type, one of {"POSitive", "NEGative"}.
         """
-        valid_types = {"POSitive", "NEGative"}
-        slope_type = slope_type.upper()
-        if slope_type in valid_types:
-            self.instrument.write(f":TRIGger:DELay:SLOPB {slope_type}")
-        else:
-            print(f"Invalid delay slope B type ({slope_type}). Choose from {valid_types}.")
+        self.instrument.write(f":TRIGger:DELay:SLOPB {slope_type}")
 
     def get_trigger_delay_slope_b(self):
         """
@@ -6059,6 +5207,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:DELay:SLOPB?")
         return response.strip().upper()
 
+    @validation.validate(delay_type=validation.Choice("GREater", "LESS", "GLESs", "GOUT", name="delay type"))
     def set_trigger_delay_type(self, delay_type):
         """
         Set the delay type in delay trigger.
@@ -6066,12 +5215,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         delay_type (str): The delay type, one of {"GREater", "LESS", "GLESs", "GOUT"}.
         """
-        valid_types = {"GREater", "LESS", "GLESs", "GOUT"}
-        delay_type = delay_type.upper()
-        if delay_type in valid_types:
-            self.instrument.write(f":TRIGger:DELay:TYPe {delay_type}")
-        else:
-            print(f"Invalid delay type ({delay_type}). Choose from {valid_types}.")
+        self.instrument.write(f":TRIGger:DELay:TYPe {delay_type}")
 
     def get_trigger_delay_type(self):
         """
@@ -6083,6 +5227,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:DELay:TYPe?")
         return response.strip().upper()
 
+    @validation.validate(time_value=UPPER_WIDTH)
     def set_trigger_delay_upper_time(self, time_value):
         """
         Set the upper limit of the delay time in delay trigger. Default unit is s.
@@ -6091,10 +5236,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         time_value (float): The upper limit in seconds, from 16ns to 10s.
         """
-        if isinstance(time_value, (float, int)) and 16e-9 <= time_value <= 10.0:
-            self.instrument.write(f":TRIGger:DELay:TUPPer {float(time_value)}")
-        else:
-            print(f"Invalid delay upper time ({time_value}). Must be a float between 16ns and 10s.")
+        self.instrument.write(f":TRIGger:DELay:TUPPer {float(time_value)}")
 
     def get_trigger_delay_upper_time(self):
         """
@@ -6106,6 +5248,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:DELay:TUPPer?")
         return float(response.strip())
 
+    @validation.validate(time_value=LOWER_WIDTH)
     def set_trigger_delay_lower_time(self, time_value):
         """
         Set the lower limit of the delay time in delay trigger. Default unit is s.
@@ -6114,10 +5257,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         time_value (float): The lower limit in seconds. Range depends on delay type.
         """
-        if isinstance(time_value, (float, int)) and 8e-9 <= time_value <= 9.99: # Max 9.99s
-            self.instrument.write(f":TRIGger:DELay:TLOWer {float(time_value)}")
-        else:
-            print(f"Invalid delay lower time ({time_value}). Must be a float between 8ns and 9.99s.")
+        self.instrument.write(f":TRIGger:DELay:TLOWer {float(time_value)}")
 
     def get_trigger_delay_lower_time(self):
         """
@@ -6130,6 +5270,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         return float(response.strip())
 
     # TRIGger:SHOLd Commands
+    @validation.validate(source=SOURCE)
     def set_trigger_setup_hold_data_source(self, source):
         """
         Set the data source in setup/hold trigger.
@@ -6137,12 +5278,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":TRIGger:SHOLd:DSrc {source}")
-        else:
-            print(f"Invalid setup/hold data source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":TRIGger:SHOLd:DSrc {source}")
 
     def get_trigger_setup_hold_data_source(self):
         """
@@ -6154,6 +5290,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:SHOLd:DSrc?")
         return response.strip().upper()
 
+    @validation.validate(source=SOURCE)
     def set_trigger_setup_hold_clock_source(self, source):
         """
         Set the clock source in setup/hold trigger.
@@ -6161,12 +5298,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":TRIGger:SHOLd:CSrc {source}")
-        else:
-            print(f"Invalid setup/hold clock source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":TRIGger:SHOLd:CSrc {source}")
 
     def get_trigger_setup_hold_clock_source(self):
         """
@@ -6178,6 +5310,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:SHOLd:CSrc?")
         return response.strip().upper()
 
+    @validation.validate(slope_type=SLOPE)
     def set_trigger_setup_hold_slope(self, slope_type):
         """
         Set the edge type in setup/hold trigger.
@@ -6185,12 +5318,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         slope_type (str): The slope type, one of {"POSitive", "NEGative"}.
         """
-        valid_types = {"POSitive", "NEGative"}
-        slope_type = slope_type.upper()
-        if slope_type in valid_types:
-            self.instrument.write(f":TRIGger:SHOLd:SLOPe {slope_type}")
-        else:
-            print(f"Invalid setup/hold slope type ({slope_type}). Choose from {valid_types}.")
+        self.instrument.write(f":TRIGger:SHOLd:SLOPe {slope_type}")
 
     def get_trigger_setup_hold_slope(self):
         """
@@ -6202,6 +5330,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:SHOLd:SLOPe?")
         return response.strip().upper()
 
+    @validation.validate(pattern_type=validation.Choice("H", "L", name="pattern type"))
     def set_trigger_setup_hold_pattern(self, pattern_type):
         """
         Set the data type in setup/hold trigger.
@@ -6209,12 +5338,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         pattern_type (str): The pattern type, one of {"H", "L"}.
         """
-        valid_types = {"H", "L"}
-        pattern_type = pattern_type.upper()
-        if pattern_type in valid_types:
-            self.instrument.write(f":TRIGger:SHOLd:PATTern {pattern_type}")
-        else:
-            print(f"Invalid setup/hold pattern type ({pattern_type}). Choose from {valid_types}.")
+        self.instrument.write(f":TRIGger:SHOLd:PATTern {pattern_type}")
 
     def get_trigger_setup_hold_pattern(self):
         """
@@ -6226,6 +5350,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:SHOLd:PATTern?")
         return response.strip().upper()
 
+    @validation.validate(setup_type=validation.Choice("SETup", "HOLd", "SETHOLd", name="setup type"))
     def set_trigger_setup_hold_type(self, setup_type):
         """
         Set the setup type in setup/hold trigger.
@@ -6233,12 +5358,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         setup_type (str): The setup type, one of {"SETup", "HOLd", "SETHOLd"}.
         """
-        valid_types = {"SETup", "HOLd", "SETHOLd"}
-        setup_type = setup_type.upper()
-        if setup_type in valid_types:
-            self.instrument.write(f":TRIGger:SHOLd:TYPe {setup_type}")
-        else:
-            print(f"Invalid setup/hold type ({setup_type}). Choose from {valid_types}.")
+        self.instrument.write(f":TRIGger:SHOLd:TYPe {setup_type}")
 
     def get_trigger_setup_hold_type(self):
         """
@@ -6250,6 +5370,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:SHOLd:TYPe?")
         return response.strip().upper()
 
+    @validation.validate(time_value=validation.Range(8e-9, 1.0, name="setup time"))
     def set_trigger_setup_hold_setup_time(self, time_value):
         """
         Set the setup time in setup/hold trigger. Default unit is s.
@@ -6258,10 +5379,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         time_value (float): The setup time in seconds, from 8ns to 1s.
         """
-        if isinstance(time_value, (float, int)) and 8e-9 <= time_value <= 1.0:
-            self.instrument.write(f":TRIGger:SHOLd:STIMe {float(time_value)}")
-        else:
-            print(f"Invalid setup time ({time_value}). Must be a float between 8ns and 1s.")
+        self.instrument.write(f":TRIGger:SHOLd:STIMe {float(time_value)}")
 
     def get_trigger_setup_hold_setup_time(self):
         """
@@ -6273,6 +5391,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:SHOLd:STIMe?")
         return float(response.strip())
 
+    @validation.validate(time_value=validation.Range(8e-9, 1.0, name="hold time"))
     def set_trigger_setup_hold_hold_time(self, time_value):
         """
         Set the hold time in setup/hold trigger. Default unit is s.
@@ -6281,10 +5400,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         time_value (float): The hold time in seconds, from 8ns to 1s.
         """
-        if isinstance(time_value, (float, int)) and 8e-9 <= time_value <= 1.0:
-            self.instrument.write(f":TRIGger:SHOLd:HTIMe {float(time_value)}")
-        else:
-            print(f"Invalid hold time ({time_value}). Must be a float between 8ns and 1s.")
+        self.instrument.write(f":TRIGger:SHOLd:HTIMe {float(time_value)}")
 
     def get_trigger_setup_hold_hold_time(self):
         """
@@ -6297,6 +5413,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         return float(response.strip())
 
     # TRIGger:NEDGe Commands
+    @validation.validate(source=SOURCE)
     def set_trigger_nth_edge_source(self, source):
         """
         Set the trigger source in Nth edge trigger.
@@ -6304,12 +5421,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":TRIGger:NEDGe:SOURce {source}")
-        else:
-            print(f"Invalid Nth edge trigger source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":TRIGger:NEDGe:SOURce {source}")
 
     def get_trigger_nth_edge_source(self):
         """
@@ -6321,6 +5433,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:NEDGe:SOURce?")
         return response.strip().upper()
 
+    @validation.validate(slope_type=SLOPE)
     def set_trigger_nth_edge_slope(self, slope_type):
         """
         Set the edge type in Nth edge trigger.
@@ -6328,12 +5441,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         slope_type (str): The slope type, one of {"POSitive", "NEGative"}.
         """
-        valid_types = {"POSitive", "NEGative"}
-        slope_type = slope_type.upper()
-        if slope_type in valid_types:
-            self.instrument.write(f":TRIGger:NEDGe:SLOPe {slope_type}")
-        else:
-            print(f"Invalid Nth edge slope type ({slope_type}). Choose from {valid_types}.")
+        self.instrument.write(f":TRIGger:NEDGe:SLOPe {slope_type}")
 
     def get_trigger_nth_edge_slope(self):
         """
@@ -6345,6 +5453,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:NEDGe:SLOPe?")
         return response.strip().upper()
 
+    @validation.validate(time_value=UPPER_WIDTH)
     def set_trigger_nth_edge_idle_time(self, time_value):
         """
         Set the idle time in Nth edge trigger. Default unit is s.
@@ -6352,10 +5461,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         time_value (float): The idle time in seconds, from 16ns to 10s.
         """
-        if isinstance(time_value, (float, int)) and 16e-9 <= time_value <= 10.0:
-            self.instrument.write(f":TRIGger:NEDGe:IDLE {float(time_value)}")
-        else:
-            print(f"Invalid Nth edge idle time ({time_value}). Must be a float between 16ns and 10s.")
+        self.instrument.write(f":TRIGger:NEDGe:IDLE {float(time_value)}")
 
     def get_trigger_nth_edge_idle_time(self):
         """
@@ -6367,6 +5473,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:NEDGe:IDLE?")
         return float(response.strip())
 
+    @validation.validate(count=validation.Range(1, 65535, int, name="edge count"))
     def set_trigger_nth_edge_count(self, count):
         """
         Set the number of edges in Nth edge trigger.
@@ -6374,10 +5481,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         count (int): The number of edges, from 1 to 65535.
         """
-        if isinstance(count, int) and 1 <= count <= 65535:
-            self.instrument.write(f":TRIGger:NEDGe:EDGE {count}")
-        else:
-            print(f"Invalid Nth edge count ({count}). Must be an integer between 1 and 65535.")
+        self.instrument.write(f":TRIGger:NEDGe:EDGE {count}")
 
     def get_trigger_nth_edge_count(self):
         """
@@ -6389,6 +5493,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:NEDGe:EDGE?")
         return int(response.strip())
 
+    @validation.validate(level=LEVEL)
     def set_trigger_nth_edge_level(self, level):
         """
         Set the trigger level in Nth edge trigger. The unit is the same as the current amplitude unit.
@@ -6396,10 +5501,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         level (float): The trigger level. Range: (-5 * VerticalScale - OFFSet) to (5 * VerticalScale - OFFSet).
         """
-        if isinstance(level, (float, int)):
-            self.instrument.write(f":TRIGger:NEDGe:LEVel {float(level)}")
-        else:
-            print(f"Invalid Nth edge trigger level ({level}). Must be a number.")
+        self.instrument.write(f":TRIGger:NEDGe:LEVel {float(level)}")
 
     def get_trigger_nth_edge_level(self):
         """
@@ -6412,6 +5514,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         return float(response.strip())
 
     # TRIGger:RS232 Commands
+    @validation.validate(source=SOURCE)
     def set_trigger_rs232_source(self, source):
         """
         Set the trigger source in RS232 trigger.
@@ -6419,12 +5522,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":TRIGger:RS232:SOURce {source}")
-        else:
-            print(f"Invalid RS232 trigger source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":TRIGger:RS232:SOURce {source}")
 
     def get_trigger_rs232_source(self):
         """
@@ -6436,6 +5534,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:RS232:SOURce?")
         return response.strip().upper()
 
+    @validation.validate(when_condition=validation.Choice("STARt", "ERRor", "PARity", "DATA", name="condition"))
     def set_trigger_rs232_when(self, when_condition):
         """
         Set the trigger condition in RS232 trigger.
@@ -6443,12 +5542,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         when_condition (str): The condition, one of {"STARt", "ERRor", "PARity", "DATA"}.
         """
-        valid_conditions = {"STARt", "ERRor", "PARity", "DATA"}
-        when_condition = when_condition.upper()
-        if when_condition in valid_conditions:
-            self.instrument.write(f":TRIGger:RS232:WHEN {when_condition}")
-        else:
-            print(f"Invalid RS232 trigger condition ({when_condition}). Choose from {valid_conditions}.")
+        self.instrument.write(f":TRIGger:RS232:WHEN {when_condition}")
 
     def get_trigger_rs232_when(self):
         """
@@ -6460,6 +5554,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:RS232:WHEN?")
         return response.strip().upper()
 
+    @validation.validate(parity_type=validation.Choice("EVEN", "ODD", "NONE", name="parity type"))
     def set_trigger_rs232_parity(self, parity_type):
         """
         Set the parity type when the trigger condition is ERRor or PARity in RS232 trigger.
@@ -6467,12 +5562,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         parity_type (str): The parity type, one of {"EVEN", "ODD", "NONE"}.
         """
-        valid_types = {"EVEN", "ODD", "NONE"}
-        parity_type = parity_type.upper()
-        if parity_type in valid_types:
-            self.instrument.write(f":TRIGger:RS232:PARity {parity_type}")
-        else:
-            print(f"Invalid RS232 parity type ({parity_type}). Choose from {valid_types}.")
+        self.instrument.write(f":TRIGger:RS232:PARity {parity_type}")
 
     def get_trigger_rs232_parity(self):
         """
@@ -6484,6 +5574,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:RS232:PARity?")
         return response.strip().upper()
 
+    @validation.validate(bit=validation.Choice(1, 2, name="stop bit"))
     def set_trigger_rs232_stop_bit(self, bit):
         """
         Set the stop bit when the trigger condition is ERRor in RS232 trigger.
@@ -6491,11 +5582,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         bit (int): The stop bit, one of {1, 2}.
         """
-        valid_bits = {1, 2}
-        if bit in valid_bits:
-            self.instrument.write(f":TRIGger:RS232:STOP {bit}")
-        else:
-            print(f"Invalid RS232 stop bit ({bit}). Choose from {valid_bits}.")
+        self.instrument.write(f":TRIGger:RS232:STOP {bit}")
 
     def get_trigger_rs232_stop_bit(self):
         """
@@ -6507,6 +5594,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:RS232:STOP?")
         return int(response.strip())
 
+    @validation.validate(data_value=DATA_VALUE)
     def set_trigger_rs232_data(self, data_value):
         """
         Set the data when the trigger condition is DATA in RS232 trigger.
@@ -6514,10 +5602,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         data_value (int): The data value. Range depends on current data bits (e.g., 0 to 2^n - 1).
         """
-        if isinstance(data_value, int) and data_value >= 0: # Max value depends on data bits, hard to validate here.
-            self.instrument.write(f":TRIGger:RS232:DATA {data_value}")
-        else:
-            print(f"Invalid RS232 data value ({data_value}). Must be a non-negative integer.")
+        self.instrument.write(f":TRIGger:RS232:DATA {data_value}")
 
     def get_trigger_rs232_data(self):
         """
@@ -6529,6 +5614,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:RS232:DATA?")
         return int(response.strip())
 
+    @validation.validate(width=validation.Choice(5, 6, 7, 8, name="data bits"))
     def set_trigger_rs232_data_width(self, width):
         """
         Set the data bits when the trigger condition is DATA in RS232 trigger.
@@ -6536,11 +5622,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         width (int): The data bits, one of {5, 6, 7, 8}.
         """
-        valid_widths = {5, 6, 7, 8}
-        if width in valid_widths:
-            self.instrument.write(f":TRIGger:RS232:WIDTh {width}")
-        else:
-            print(f"Invalid RS232 data width ({width}). Choose from {valid_widths}.")
+        self.instrument.write(f":TRIGger:RS232:WIDTh {width}")
 
     def get_trigger_rs232_data_width(self):
         """
@@ -6552,6 +5634,8 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:RS232:WIDTh?")
         return int(response.strip())
 
+    @validation.validate(baud_rate=validation.Choice(2400, 4800, 9600, 19200, 38400, 57600, 115200, 230400, 460800,
+                                                     921600, 1000000, "USER", name="RS232 baud rate"))
     def set_trigger_rs232_baud_rate(self, baud_rate):
         """
         Set the baud rate in RS232 trigger. Default unit is bps.
@@ -6560,13 +5644,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         baud_rate (int or str): The baud rate, one of {2400, 4800, 9600, 19200, 38400, 57600,
                                                    115200, 230400, 460800, 921600, 1000000} or "USER".
         """
-        valid_rates = {2400, 4800, 9600, 19200, 38400, 57600, 115200, 230400, 460800, 921600, 1000000}
-        if isinstance(baud_rate, int) and baud_rate in valid_rates:
-            self.instrument.write(f":TRIGger:RS232:BAUD {baud_rate}")
-        elif isinstance(baud_rate, str) and baud_rate.upper() == "USER":
-            self.instrument.write(":TRIGger:RS232:BAUD USER")
-        else:
-            print(f"Invalid RS232 baud rate ({baud_rate}). Choose from {valid_rates} or 'USER'.")
+        self.instrument.write(f":TRIGger:RS232:BAUD {baud_rate}")
 
     def get_trigger_rs232_baud_rate(self):
         """
@@ -6581,6 +5659,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         except ValueError:
             return response.strip().upper()
 
+    @validation.validate(user_baud=validation.Range(110, 20000000, int, name="baud rate"))
     def set_trigger_rs232_user_baud_rate(self, user_baud):
         """
         Set the user-defined baud rate in RS232 trigger. Default unit is bps.
@@ -6588,10 +5667,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         user_baud (int): The user-defined baud rate, from 110 to 20000000.
         """
-        if isinstance(user_baud, int) and 110 <= user_baud <= 20000000:
-            self.instrument.write(f":TRIGger:RS232:BUSer {user_baud}")
-        else:
-            print(f"Invalid RS232 user baud rate ({user_baud}). Must be an integer between 110 and 20000000.")
+        self.instrument.write(f":TRIGger:RS232:BUSer {user_baud}")
 
     def get_trigger_rs232_user_baud_rate(self):
         """
@@ -6603,6 +5679,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:RS232:BUSer?")
         return int(response.strip())
 
+    @validation.validate(level=LEVEL)
     def set_trigger_rs232_level(self, level):
         """
         Set the trigger level in RS232 trigger. The unit is the same as the current amplitude unit.
@@ -6610,10 +5687,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         level (float): The trigger level. Range: (-5 * VerticalScale - OFFSet) to (5 * VerticalScale - OFFSet).
         """
-        if isinstance(level, (float, int)):
-            self.instrument.write(f":TRIGger:RS232:LEVel {float(level)}")
-        else:
-            print(f"Invalid RS232 trigger level ({level}). Must be a number.")
+        self.instrument.write(f":TRIGger:RS232:LEVel {float(level)}")
 
     def get_trigger_rs232_level(self):
         """
@@ -6626,6 +5700,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         return float(response.strip())
 
     # TRIGger:IIC Commands
+    @validation.validate(source=SOURCE)
     def set_trigger_i2c_scl_source(self, source):
         """
         Set the channel source of SCL in I2C trigger.
@@ -6633,12 +5708,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":TRIGger:IIC:SCL {source}")
-        else:
-            print(f"Invalid I2C SCL source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":TRIGger:IIC:SCL {source}")
 
     def get_trigger_i2c_scl_source(self):
         """
@@ -6650,6 +5720,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:IIC:SCL?")
         return response.strip().upper()
 
+    @validation.validate(source=SOURCE)
     def set_trigger_i2c_sda_source(self, source):
         """
         Set the channel source of SDA in I2C trigger.
@@ -6657,12 +5728,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":TRIGger:IIC:SDA {source}")
-        else:
-            print(f"Invalid I2C SDA source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":TRIGger:IIC:SDA {source}")
 
     def get_trigger_i2c_sda_source(self):
         """
@@ -6674,6 +5740,8 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:IIC:SDA?")
         return response.strip().upper()
 
+    @validation.validate(trig_type=validation.Choice("STARt", "RESTart", "STOP", "NACKnowledge", "ADDRess", "DATA",
+                                                     "ADATa", name="trigger type"))
     def set_trigger_i2c_when(self, trig_type):
         """
         Set the trigger condition in I2C trigger.
@@ -6682,12 +5750,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         trig_type (str): The trigger type, one of {"STARt", "RESTart", "STOP",
                                                   "NACKnowledge", "ADDRess", "DATA", "ADATa"}.
         """
-        valid_types = {"STARt", "RESTart", "STOP", "NACKnowledge", "ADDRess", "DATA", "ADATa"}
-        trig_type = trig_type.upper()
-        if trig_type in valid_types:
-            self.instrument.write(f":TRIGger:IIC:WHEN {trig_type}")
-        else:
-            print(f"Invalid I2C trigger condition ({trig_type}). Choose from {valid_types}.")
+        self.instrument.write(f":TRIGger:IIC:WHEN {trig_type}")
 
     def get_trigger_i2c_when(self):
         """
@@ -6699,6 +5762,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:IIC:WHEN?")
         return response.strip().upper()
 
+    @validation.validate(bits=validation.Choice(7, 8, 10, name="address bits"))
     def set_trigger_i2c_address_width(self, bits):
         """
         Set the address bits when the trigger condition is ADDRess or ADATa in I2C trigger.
@@ -6706,11 +5770,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         bits (int): The address bits, one of {7, 8, 10}.
         """
-        valid_bits = {7, 8, 10}
-        if bits in valid_bits:
-            self.instrument.write(f":TRIGger:IIC:AWIDth {bits}")
-        else:
-            print(f"Invalid I2C address width ({bits}). Choose from {valid_bits}.")
+        self.instrument.write(f":TRIGger:IIC:AWIDth {bits}")
 
     def get_trigger_i2c_address_width(self):
         """
@@ -6722,6 +5782,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:IIC:AWIDth?")
         return int(response.strip())
 
+    @validation.validate(address_value=validation.Range(0, None, int, name="address"))
     def set_trigger_i2c_address(self, address_value):
         """
         Set the address when the trigger condition is ADDRess or ADATa in I2C trigger.
@@ -6729,10 +5790,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         address_value (int): The address value. Range depends on address bits (e.g., 0 to 127 for 7-bit).
         """
-        if isinstance(address_value, int) and address_value >= 0: # Max value depends on address bits, hard to validate here.
-            self.instrument.write(f":TRIGger:IIC:ADDRess {address_value}")
-        else:
-            print(f"Invalid I2C address value ({address_value}). Must be a non-negative integer.")
+        self.instrument.write(f":TRIGger:IIC:ADDRess {address_value}")
 
     def get_trigger_i2c_address(self):
         """
@@ -6744,6 +5802,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:IIC:ADDRess?")
         return int(response.strip())
 
+    @validation.validate(direction=validation.Choice("READ", "WRITe", "RWRite", name="direction"))
     def set_trigger_i2c_direction(self, direction):
         """
         Set the data direction when the trigger condition is ADDRess or ADATa in I2C trigger.
@@ -6751,12 +5810,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         direction (str): The direction, one of {"READ", "WRITe", "RWRite"}.
         """
-        valid_directions = {"READ", "WRITe", "RWRite"}
-        direction = direction.upper()
-        if direction in valid_directions:
-            self.instrument.write(f":TRIGger:IIC:DIRection {direction}")
-        else:
-            print(f"Invalid I2C direction ({direction}). Choose from {valid_directions}.")
+        self.instrument.write(f":TRIGger:IIC:DIRection {direction}")
 
     def get_trigger_i2c_direction(self):
         """
@@ -6768,6 +5822,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:IIC:DIRection?")
         return response.strip().upper()
 
+    @validation.validate(data_value=DATA_VALUE)
     def set_trigger_i2c_data(self, data_value):
         """
         Set the data when the trigger condition is DATA or ADATa in I2C trigger.
@@ -6775,10 +5830,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         data_value (int): The data value. Range depends on byte length (0 to 2^40 - 1).
         """
-        if isinstance(data_value, int) and data_value >= 0: # Max value 2^40 - 1, hard to validate.
-            self.instrument.write(f":TRIGger:IIC:DATA {data_value}")
-        else:
-            print(f"Invalid I2C data value ({data_value}). Must be a non-negative integer.")
+        self.instrument.write(f":TRIGger:IIC:DATA {data_value}")
 
     def get_trigger_i2c_data(self):
         """
@@ -6790,6 +5842,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:IIC:DATA?")
         return int(response.strip())
 
+    @validation.validate(level=LEVEL)
     def set_trigger_i2c_scl_level(self, level):
         """
         Set the trigger level of SCL in I2C trigger. The unit is the same as the current amplitude unit.
@@ -6797,10 +5850,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         level (float): The trigger level. Range: (-5 * VerticalScale - OFFSet) to (5 * VerticalScale - OFFSet).
         """
-        if isinstance(level, (float, int)):
-            self.instrument.write(f":TRIGger:IIC:CLEVel {float(level)}")
-        else:
-            print(f"Invalid I2C SCL level ({level}). Must be a number.")
+        self.instrument.write(f":TRIGger:IIC:CLEVel {float(level)}")
 
     def get_trigger_i2c_scl_level(self):
         """
@@ -6812,6 +5862,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:IIC:CLEVel?")
         return float(response.strip())
 
+    @validation.validate(level=LEVEL)
     def set_trigger_i2c_sda_level(self, level):
         """
         Set the trigger level of SDA in I2C trigger. The unit is the same as the current amplitude unit.
@@ -6819,10 +5870,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         level (float): The trigger level. Range: (-5 * VerticalScale - OFFSet) to (5 * VerticalScale - OFFSet).
         """
-        if isinstance(level, (float, int)):
-            self.instrument.write(f":TRIGger:IIC:DLEVel {float(level)}")
-        else:
-            print(f"Invalid I2C SDA level ({level}). Must be a number.")
+        self.instrument.write(f":TRIGger:IIC:DLEVel {float(level)}")
 
     def get_trigger_i2c_sda_level(self):
         """
@@ -6835,6 +5883,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         return float(response.strip())
 
     # TRIGger:SPI Commands
+    @validation.validate(source=SOURCE)
     def set_trigger_spi_scl_source(self, source):
         """
         Set the channel source of SCL in SPI trigger.
@@ -6842,12 +5891,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":TRIGger:SPI:SCL {source}")
-        else:
-            print(f"Invalid SPI SCL source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":TRIGger:SPI:SCL {source}")
 
     def get_trigger_spi_scl_source(self):
         """
@@ -6859,6 +5903,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:SPI:SCL?")
         return response.strip().upper()
 
+    @validation.validate(source=SOURCE)
     def set_trigger_spi_sda_source(self, source):
         """
         Set the channel source of SDA in SPI trigger.
@@ -6866,12 +5911,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":TRIGger:SPI:SDA {source}")
-        else:
-            print(f"Invalid SPI SDA source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":TRIGger:SPI:SDA {source}")
 
     def get_trigger_spi_sda_source(self):
         """
@@ -6883,6 +5923,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:SPI:SDA?")
         return response.strip().upper()
 
+    @validation.validate(trig_type=validation.Choice("CS", "TIMeout", name="trigger type"))
     def set_trigger_spi_when(self, trig_type):
         """
         Set the trigger condition in SPI trigger.
@@ -6890,12 +5931,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         trig_type (str): The trigger type, one of {"CS", "TIMeout"}.
         """
-        valid_types = {"CS", "TIMeout"}
-        trig_type = trig_type.upper()
-        if trig_type in valid_types:
-            self.instrument.write(f":TRIGger:SPI:WHEN {trig_type}")
-        else:
-            print(f"Invalid SPI trigger condition ({trig_type}). Choose from {valid_types}.")
+        self.instrument.write(f":TRIGger:SPI:WHEN {trig_type}")
 
     def get_trigger_spi_when(self):
         """
@@ -6907,6 +5943,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:SPI:WHEN?")
         return response.strip().upper()
 
+    @validation.validate(width=validation.Range(4, 32, int, name="data width"))
     def set_trigger_spi_data_width(self, width):
         """
         Set the data bits of the SDA channel in SPI trigger.
@@ -6914,10 +5951,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         width (int): The data bits, from 4 to 32.
         """
-        if isinstance(width, int) and 4 <= width <= 32:
-            self.instrument.write(f":TRIGger:SPI:WIDTh {width}")
-        else:
-            print(f"Invalid SPI data width ({width}). Must be an integer between 4 and 32.")
+        self.instrument.write(f":TRIGger:SPI:WIDTh {width}")
 
     def get_trigger_spi_data_width(self):
         """
@@ -6929,6 +5963,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:SPI:WIDTh?")
         return int(response.strip())
 
+    @validation.validate(data_value=DATA_VALUE)
     def set_trigger_spi_data(self, data_value):
         """
         Set the data in SPI trigger.
@@ -6936,10 +5971,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         data_value (int): The data value. Range depends on data bits (0 to 2^32 - 1).
         """
-        if isinstance(data_value, int) and data_value >= 0: # Max value 2^32 - 1, hard to validate.
-            self.instrument.write(f":TRIGger:SPI:DATA {data_value}")
-        else:
-            print(f"Invalid SPI data value ({data_value}). Must be a non-negative integer.")
+        self.instrument.write(f":TRIGger:SPI:DATA {data_value}")
 
     def get_trigger_spi_data(self):
         """
@@ -6951,6 +5983,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:SPI:DATA?")
         return int(response.strip())
 
+    @validation.validate(time_value=validation.Range(100e-9, 1.0, name="timeout"))
     def set_trigger_spi_timeout(self, time_value):
         """
         Set the timeout value when the trigger condition is TIMeout in SPI trigger. Default unit is s.
@@ -6958,10 +5991,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         time_value (float): The timeout value in seconds, from 100ns to 1s.
         """
-        if isinstance(time_value, (float, int)) and 100e-9 <= time_value <= 1.0:
-            self.instrument.write(f":TRIGger:SPI:TIMeout {float(time_value)}")
-        else:
-            print(f"Invalid SPI timeout value ({time_value}). Must be a float between 100ns and 1s.")
+        self.instrument.write(f":TRIGger:SPI:TIMeout {float(time_value)}")
 
     def get_trigger_spi_timeout(self):
         """
@@ -6973,6 +6003,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:SPI:TIMeout?")
         return float(response.strip())
 
+    @validation.validate(slope_type=validation.Choice("POSitive", "NEGative", name="clock edge"))
     def set_trigger_spi_clock_edge(self, slope_type):
         """
         Set the clock edge in SPI trigger.
@@ -6980,12 +6011,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         slope_type (str): The clock edge, one of {"POSitive", "NEGative"}.
         """
-        valid_types = {"POSitive", "NEGative"}
-        slope_type = slope_type.upper()
-        if slope_type in valid_types:
-            self.instrument.write(f":TRIGger:SPI:SLOPe {slope_type}")
-        else:
-            print(f"Invalid SPI clock edge ({slope_type}). Choose from {valid_types}.")
+        self.instrument.write(f":TRIGger:SPI:SLOPe {slope_type}")
 
     def get_trigger_spi_clock_edge(self):
         """
@@ -6997,6 +6023,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:SPI:SLOPe?")
         return response.strip().upper()
 
+    @validation.validate(level=LEVEL)
     def set_trigger_spi_scl_level(self, level):
         """
         Set the trigger level of the SCL channel in SPI trigger. The unit is the same as the current amplitude unit.
@@ -7004,10 +6031,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         level (float): The trigger level. Range: (-5 * VerticalScale - OFFSet) to (5 * VerticalScale - OFFSet).
         """
-        if isinstance(level, (float, int)):
-            self.instrument.write(f":TRIGger:SPI:CLEVel {float(level)}")
-        else:
-            print(f"Invalid SPI SCL level ({level}). Must be a number.")
+        self.instrument.write(f":TRIGger:SPI:CLEVel {float(level)}")
 
     def get_trigger_spi_scl_level(self):
         """
@@ -7019,6 +6043,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:SPI:CLEVel?")
         return float(response.strip())
 
+    @validation.validate(level=LEVEL)
     def set_trigger_spi_sda_level(self, level):
         """
         Set the trigger level of the SDA channel in SPI trigger. The unit is the same as the current amplitude unit.
@@ -7026,10 +6051,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         level (float): The trigger level. Range: (-5 * VerticalScale - OFFSet) to (5 * VerticalScale - OFFSet).
         """
-        if isinstance(level, (float, int)):
-            self.instrument.write(f":TRIGger:SPI:DLEVel {float(level)}")
-        else:
-            print(f"Invalid SPI SDA level ({level}). Must be a number.")
+        self.instrument.write(f":TRIGger:SPI:DLEVel {float(level)}")
 
     def get_trigger_spi_sda_level(self):
         """
@@ -7041,6 +6063,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:SPI:DLEVel?")
         return float(response.strip())
 
+    @validation.validate(level=LEVEL)
     def set_trigger_spi_cs_level(self, level):
         """
         Set or query the trigger level of the CS channel in SPI trigger. The unit is the same as the current amplitude unit.
@@ -7048,10 +6071,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         level (float): The trigger level. Range: (-5 * VerticalScale - OFFSet) to (5 * VerticalScale - OFFSet).
         """
-        if isinstance(level, (float, int)):
-            self.instrument.write(f":TRIGger:SPI:SLEVel {float(level)}")
-        else:
-            print(f"Invalid SPI CS level ({level}). Must be a number.")
+        self.instrument.write(f":TRIGger:SPI:SLEVel {float(level)}")
 
     def get_trigger_spi_cs_level(self):
         """
@@ -7063,6 +6083,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:SPI:SLEVel?")
         return float(response.strip())
 
+    @validation.validate(mode=validation.Choice("HIGH", "LOW", name="CS mode"))
     def set_trigger_spi_cs_mode(self, mode):
         """
         Set the CS mode when the trigger condition is CS in SPI trigger.
@@ -7070,12 +6091,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         mode (str): The CS mode, one of {"HIGH", "LOW"}.
         """
-        valid_modes = {"HIGH", "LOW"}
-        mode = mode.upper()
-        if mode in valid_modes:
-            self.instrument.write(f":TRIGger:SPI:MODE {mode}")
-        else:
-            print(f"Invalid SPI CS mode ({mode}). Choose from {valid_modes}.")
+        self.instrument.write(f":TRIGger:SPI:MODE {mode}")
 
     def get_trigger_spi_cs_mode(self):
         """
@@ -7087,6 +6103,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":TRIGger:SPI:MODE?")
         return response.strip().upper()
 
+    @validation.validate(source=SOURCE)
     def set_trigger_spi_cs_source(self, source):
         """
         Set the data source of the CS signal in SPI trigger.
@@ -7094,12 +6111,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":TRIGger:SPI:CS {source}")
-        else:
-            print(f"Invalid SPI CS source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":TRIGger:SPI:CS {source}")
 
     def get_trigger_spi_cs_source(self):
         """
@@ -7112,6 +6124,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         return response.strip().upper()
 
     # WAVeform Commands
+    @validation.validate(source=validation.Choice("CHANnel1", "CHANnel2", "MATH", name="waveform source"))
     def set_waveform_source(self, source):
         """
         Set the channel of which the waveform data will be read.
@@ -7119,12 +6132,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         Parameters:
         source (str): The source, one of {"CHANnel1", "CHANnel2", "MATH"}.
         """
-        valid_sources = {"CHANnel1", "CHANnel2", "MATH"}
-        source = source.upper()
-        if source in valid_sources:
-            self.instrument.write(f":WAVeform:SOURce {source}")
-        else:
-            print(f"Invalid waveform source ({source}). Choose from {valid_sources}.")
+        self.instrument.write(f":WAVeform:SOURce {source}")
 
     def get_waveform_source(self):
         """
@@ -7136,6 +6144,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":WAVeform:SOURce?")
         return response.strip().upper()
 
+    @validation.validate(mode=validation.Choice("NORMal", "MAXimum", "RAW", name="waveform mode"))
     def set_waveform_mode(self, mode):
         """
         Set the reading mode used by :WAVeform:DATA?.
@@ -7146,12 +6155,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
                     MAXimum: read displayed waveform data (run state) or internal memory data (stop state).
                     RAW: read internal memory waveform data.
         """
-        valid_modes = {"NORMal", "MAXimum", "RAW"}
-        mode = mode.upper()
-        if mode in valid_modes:
-            self.instrument.write(f":WAVeform:MODE {mode}")
-        else:
-            print(f"Invalid waveform mode ({mode}). Choose from {valid_modes}.")
+        self.instrument.write(f":WAVeform:MODE {mode}")
 
     def get_waveform_mode(self):
         """
@@ -7163,6 +6167,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":WAVeform:MODE?")
         return response.strip().upper()
 
+    @validation.validate(fmt=validation.Choice("WORD", "BYTE", "ASCII", name="format"))
     def set_waveform_format(self, fmt):
         """
         Set the return format of the waveform data.
@@ -7173,12 +6178,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
                    BYTE: 8 bits per point.
                    ASCII: actual voltage value in scientific notation, separated by commas.
         """
-        valid_formats = {"WORD", "BYTE", "ASCII"}
-        fmt = fmt.upper()
-        if fmt in valid_formats:
-            self.instrument.write(f":WAVeform:FORMat {fmt}")
-        else:
-            print(f"Invalid waveform format ({fmt}). Choose from {valid_formats}.")
+        self.instrument.write(f":WAVeform:FORMat {fmt}")
 
     def get_waveform_format(self):
         """
@@ -7196,18 +6196,23 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
 
         Returns:
         bytes or str: The waveform data.
-                      If format is BYTE or WORD, returns bytes (including TMC header).
+                      If format is BYTE or WORD, returns bytes (without the TMC header).
                       If format is ASCII, returns a comma-separated string of float values.
         """
-        current_format = self.get_waveform_format()
+        # Format and point range in one round trip, which is also timed once for the latency.
+        with self.timeout_policy.command():
+            response = self.instrument.query(":WAVeform:FORMat?;:WAVeform:STARt?;:WAVeform:STOP?")
+        current_format, start, stop = (part.strip() for part in response.split(";"))
+        current_format = current_format.upper()
         if current_format in ["BYTE", "WORD"]:
             try:
-                # Use query_binary_values for BYTE and WORD formats
-                data = self.instrument.query_binary_values(":WAVeform:DATA?", datatype='B', container=bytes)
-                return data
+                # One raw read for BYTE and WORD formats. The timeout is sized for the points
+                # between STARt and STOP in the current format.
+                points = int(stop) - int(start) + 1
+                size = timeout_policy.waveform_size(points, current_format)
+                return bytes(self._read_block(":WAVeform:DATA?", size))
             except pyvisa.errors.VisaIOError as e:
                 print(f"VISA IO Error while getting waveform data: {e}")
-                print("Consider increasing the instrument's timeout.")
                 return b""
             except Exception as e:
                 print(f"An unexpected error occurred: {e}")
@@ -7280,6 +6285,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":WAVeform:YREFerence?")
         return int(response.strip())
 
+    @validation.validate(start_point=validation.Range(1, None, int, name="start point"))
     def set_waveform_start_point(self, start_point):
         """
         Set the start point of waveform data reading.
@@ -7288,10 +6294,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         start_point (int): The start point. Range depends on current mode (NORMal: 1-1200,
                            MAX: 1 to effective points, RAW: 1 to max memory depth).
         """
-        if isinstance(start_point, int) and start_point >= 1:
-            self.instrument.write(f":WAVeform:STARt {start_point}")
-        else:
-            print(f"Invalid waveform start point ({start_point}). Must be an integer >= 1.")
+        self.instrument.write(f":WAVeform:STARt {start_point}")
 
     def get_waveform_start_point(self):
         """
@@ -7303,6 +6306,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         response = self.instrument.query(":WAVeform:STARt?")
         return int(response.strip())
 
+    @validation.validate(stop_point=validation.Range(1, None, int, name="stop point"))
     def set_waveform_stop_point(self, stop_point):
         """
         Set the stop point of waveform data reading.
@@ -7311,10 +6315,7 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
         stop_point (int): The stop point. Range depends on current mode (NORMal: 1-1200,
                           MAX: 1 to effective points, RAW: 1 to max memory depth).
         """
-        if isinstance(stop_point, int) and stop_point >= 1:
-            self.instrument.write(f":WAVeform:STOP {stop_point}")
-        else:
-            print(f"Invalid waveform stop point ({stop_point}). Must be an integer >= 1.")
+        self.instrument.write(f":WAVeform:STOP {stop_point}")
 
     def get_waveform_stop_point(self):
         """
@@ -7371,4 +6372,289 @@ amplitude of the waveform to view the signal details. State: {{1|ON}|{0|OFF}}"""
                 return None
         else:
             print(f"Unexpected number of parameters in waveform preamble. Expected 10, got {len(params)}. Raw response: {response}")
-            return None
\ No newline at end of file
+            return None
+
+    # Multi-channel Acquisition
+    def _read_block(self, command, expected_size=None):
+        """
+        Send a query that is answered with a TMC data block and read the answer with
+        a single raw read.
+
+        Parameters:
+        command (str): The query.
+        expected_size (int, optional): Expected response size in bytes. The I/O timeout is
+                                       then set by timeout_policy for this read.
+
+        Returns:
+        memoryview: The block payload without the TMC header (no copy is made).
+        """
+        if expected_size is None:
+            self.instrument.write(command)
+            return oscilloscope_helper.parse_tmc_block(self.instrument.read_raw())
+        with self.timeout_policy.transfer(self.instrument, expected_size) as transfer:
+            self.instrument.write(command)
+            data = self.instrument.read_raw()
+            transfer.nbytes = len(data)
+        return oscilloscope_helper.parse_tmc_block(data)
+
+    def _waveform_source_name(self, source):
+        """Convert 1, 2, "CHANnel1", "CHAN2", "MATH", ... to the short SCPI source name."""
+        name = str(source).upper()
+        if name in ("1", "2"):
+            return "CHAN" + name
+        if name in ("CHAN1", "CHAN2", "MATH"):
+            return name
+        if name in ("CHANNEL1", "CHANNEL2"):
+            return "CHAN" + name[-1]
+        raise ValueError(f"Invalid waveform source ({source}). Choose from 1, 2, 'CHANnel1', 'CHANnel2' or 'MATH'.")
+
+    def _read_sources_raw(self, sources, buffer=None, reuse_preambles=False):
+        """
+        Download the BYTE waveform codes of every source from the current (stopped) acquisition.
+        The waveform mode and format must already be set. Raises RuntimeError when the sources
+        do not have the same number of points or a data block is not the requested length, so
+        data of a previous acquisition left in the reused buffer is never returned.
+
+        Parameters:
+        sources (list): Short source names (see _waveform_source_name).
+        buffer (numpy.ndarray): Flat uint8 array to download into. Defaults to the reusable
+                                download buffer of the driver. A larger array is allocated
+                                when it is too small.
+        reuse_preambles (bool): Take the preambles from the cache instead of :WAVeform:PREamble?
+                                for the sources read before.
+
+        Returns:
+        tuple: (codes, preambles, buffer). codes is an (n_sources, n_points) uint8 view of
+               buffer, preambles the list of preamble dictionaries and buffer the flat array
+               that was actually used.
+        """
+        preambles = []
+        codes = None
+        for row, source in enumerate(sources):
+            self.instrument.write(f":WAVeform:SOURce {source}")
+            preamble = self._preamble_cache.get(source) if reuse_preambles else None
+            if preamble is None:
+                with self.timeout_policy.command():
+                    preamble = self.get_waveform_preamble()
+                if preamble is None:
+                    raise RuntimeError(f"Could not read the waveform preamble of {source}.")
+                self._preamble_cache[source] = preamble
+            preambles.append(preamble)
+            if codes is not None and preamble['points'] != codes.shape[1]:
+                raise RuntimeError(f"{source} has {preamble['points']} points but {sources[0]} has "
+                                   f"{codes.shape[1]}. The sources must come from the same acquisition.")
+            if codes is None:
+                size = len(sources) * preamble['points']
+                if buffer is None:
+                    if self._waveform_buffer.size < size:
+                        self._waveform_buffer = np.empty(size, dtype=np.uint8)
+                    buffer = self._waveform_buffer
+                elif buffer.size < size:
+                    buffer = np.empty(size, dtype=np.uint8)
+                codes = buffer[:size].reshape(len(sources), preamble['points'])
+            points = codes.shape[1]
+            for start in range(0, points, WAVEFORM_BYTE_CHUNK):
+                stop = min(start + WAVEFORM_BYTE_CHUNK, points)
+                self.instrument.write(f":WAVeform:STARt {start + 1}")
+                self.instrument.write(f":WAVeform:STOP {stop}")
+                block = self._read_block(":WAVeform:DATA?", timeout_policy.waveform_size(stop - start))
+                if len(block) != stop - start:
+                    raise RuntimeError(f"Expected {stop - start} points of {source} (points {start + 1} to {stop}), "
+                                       f"received {len(block)}.")
+                codes[row, start:stop] = np.frombuffer(block, dtype=np.uint8)
+        return codes, preambles, buffer
+
+    def _prepare_waveform_read(self, sources, mode):
+        """Validate the sources, then set the waveform mode and BYTE format. Returns the short source names."""
+        names = [self._waveform_source_name(s) for s in sources]
+        if not names:
+            raise ValueError("At least one waveform source is required.")
+        if "MATH" in names:
+            mode = "NORMal"
+        self.set_waveform_mode(mode)
+        self.instrument.write(":WAVeform:FORMat BYTE")
+        # The number of points depends on the mode, preambles of another mode are not reused.
+        if str(mode).upper() != self._preamble_mode:
+            self._preamble_cache.clear()
+            self._preamble_mode = str(mode).upper()
+        return names
+
+    def acquire_channels(self, sources, mode="RAW", stop=True, allocate=None, reuse_preambles=False):
+        """
+        Read several sources from the same acquisition and return them as one aligned array.
+
+        The oscilloscope is stopped once, so every source comes from the same trigger.
+        Each source's preamble is read once and kept in a cache shared with the decoding
+        step, and the download buffer is reused across calls. With reuse_preambles the
+        cached preambles of the previous call are used without querying them again.
+
+        Parameters:
+        sources (list): The sources to read, e.g. [1, 2, 'MATH'].
+        mode (str): Waveform reading mode, "RAW" (internal memory), "MAXimum" or "NORMal"
+                    (screen data). MATH can only be read in NORMal mode, so NORMal is used
+                    for every source when MATH is requested.
+        stop (bool): Stop the oscilloscope before reading. Set to False if it is already
+                     stopped (e.g. after a single trigger).
+        allocate (callable, optional): Called as allocate(shape, dtype) for the array the
+                     volts are decoded into, e.g. a slot of shared memory. Defaults to np.empty.
+        reuse_preambles (bool): Skip :WAVeform:PREamble? for sources read by the previous call
+                     in the same mode. Only valid if the timebase, vertical and acquisition
+                     settings have not changed since.
+
+        Returns:
+        tuple: (volts, time). volts is an (n_sources, n_points) float32 array and time the
+               common time axis in seconds.
+        """
+        names = self._prepare_waveform_read(sources, mode)
+        if stop:
+            self.stop()
+        codes, preambles, _ = self._read_sources_raw(names, reuse_preambles=reuse_preambles)
+        volts = (allocate or np.empty)(codes.shape, np.float32)
+        for row, preamble in enumerate(preambles):
+            oscilloscope_helper.decode_waveform(codes[row], preamble, out=volts[row])
+        return volts, oscilloscope_helper.waveform_time_axis(preambles[0], codes.shape[1])
+
+    def get_cached_preamble(self, source):
+        """
+        Return the preamble of source from the last acquire_channels call without querying
+        the oscilloscope, or None if the source has not been read yet.
+        """
+        return self._preamble_cache.get(self._waveform_source_name(source))
+
+    def wait_for_acquisition(self, timeout=None, poll_interval=0.001, arm_timeout=0.1, cancel=None):
+        """
+        Wait for the single acquisition armed by single() to finish.
+
+        Right after :SINGle the trigger status can still be STOP from the previous acquisition,
+        so an *OPC? handshake first waits until :SINGle has been executed, then the status is
+        polled until it leaves STOP (WAIT, RUN or TD) and returns to STOP. A STOP is only
+        accepted after such a transition. If the status has not left STOP arm_timeout after
+        :SINGle, :SINGle is sent again: the oscilloscope was not armed, or the acquisition
+        was too short to be seen by the polling and the next one is taken instead.
+
+        Parameters:
+        timeout (float, optional): Seconds to wait, raises TimeoutError when exceeded. None waits forever.
+        poll_interval (float): Seconds between trigger status queries.
+        arm_timeout (float): Seconds the status may stay STOP after :SINGle before it is sent again.
+        cancel (threading.Event, optional): Stop waiting when it is set.
+
+        Returns:
+        bool: True when the acquisition finished, False if cancel was set first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self.instrument.query("*OPC?")
+        executed = time.monotonic()
+        armed = False
+        while True:
+            if self.get_trigger_status() != "STOP":
+                armed = True
+            elif armed:
+                return True
+            elif time.monotonic() - executed > arm_timeout:
+                self.single()
+                self.instrument.query("*OPC?")
+                executed = time.monotonic()
+            if cancel is not None and cancel.is_set():
+                return False
+            if deadline is not None and time.monotonic() > deadline:
+                if not armed:
+                    raise TimeoutError(f"The oscilloscope did not leave STOP within {timeout} s after :SINGle.")
+                raise TimeoutError(f"The oscilloscope did not trigger within {timeout} s.")
+            sleep(poll_interval)
+
+    def continuous_capture(self, callback, n=None, sources=(1,), mode="RAW", queue_depth=4,
+                           trigger_timeout=None, poll_interval=0.001):
+        """
+        Repeatedly take single acquisitions and pass them to callback on a worker thread.
+
+        The next single acquisition is armed as soon as the data of the previous one has been
+        downloaded, so decoding and processing overlap with the next trigger and transfer.
+        At most queue_depth downloaded acquisitions wait for the worker; when they are all
+        in use the download of the next one waits until the worker frees a buffer.
+        The preambles are only read for the first acquisition, so the timebase, vertical and
+        acquisition settings must not change during the capture.
+
+        Parameters:
+        callback (callable): Called as callback(index, volts, time) on the worker thread, with
+                             volts an (n_sources, n_points) float32 array and time the time axis.
+                             volts is reused for the next acquisition, copy it to keep it.
+                             Returning False stops the capture.
+        n (int): Number of acquisitions to take. None runs until callback returns False
+                 or the capture is interrupted.
+        sources (list): The sources to read, e.g. [1, 2].
+        mode (str): Waveform reading mode (see acquire_channels).
+        queue_depth (int): Number of downloaded acquisitions that can wait for the worker.
+        trigger_timeout (float): Seconds to wait for each trigger. None waits forever.
+        poll_interval (float): Seconds between trigger status queries.
+
+        Returns:
+        int: The number of acquisitions passed to callback.
+        """
+        if n is not None and n < 1:
+            raise ValueError(f"Invalid number of acquisitions ({n}). Must be at least 1.")
+        if queue_depth < 1:
+            raise ValueError(f"Invalid queue depth ({queue_depth}). Must be at least 1.")
+        names = self._prepare_waveform_read(sources, mode)
+
+        free_buffers = queue.Queue()
+        for _ in range(queue_depth):
+            free_buffers.put(np.empty(0, dtype=np.uint8))
+        captured = queue.Queue()
+        stop_event = threading.Event()
+        state = {'processed': 0, 'error': None}
+
+        def worker():
+            volts = np.empty(0, dtype=np.float32)
+            while True:
+                item = captured.get()
+                if item is None:
+                    return
+                index, codes, preambles, buffer = item
+                try:
+                    if stop_event.is_set():
+                        continue
+                    if volts.size < codes.size:
+                        volts = np.empty(codes.size, dtype=np.float32)
+                    out = volts[:codes.size].reshape(codes.shape)
+                    for row, preamble in enumerate(preambles):
+                        oscilloscope_helper.decode_waveform(codes[row], preamble, out=out[row])
+                    axis = oscilloscope_helper.waveform_time_axis(preambles[0], codes.shape[1])
+                    if callback(index, out, axis) is False:
+                        stop_event.set()
+                    state['processed'] += 1
+                except BaseException as e:
+                    state['error'] = e
+                    stop_event.set()
+                finally:
+                    free_buffers.put(buffer)
+
+        thread = threading.Thread(target=worker, name="oscilloscope-capture", daemon=True)
+        thread.start()
+        armed = False
+        try:
+            index = 0
+            self.single()
+            armed = True
+            while not stop_event.is_set() and (n is None or index < n):
+                # The worker sets stop_event when the callback stops the capture, which ends
+                # the wait for the acquisition armed ahead of it.
+                if not self.wait_for_acquisition(trigger_timeout, poll_interval, cancel=stop_event):
+                    break
+                armed = False
+                buffer = free_buffers.get()
+                # The settings do not change during the capture, the preambles are read once.
+                codes, preambles, buffer = self._read_sources_raw(names, buffer, reuse_preambles=index > 0)
+                if n is None or index + 1 < n:
+                    # Re-arm before handing over the data so the next trigger is not missed.
+                    self.single()
+                    armed = True
+                captured.put((index, codes, preambles, buffer))
+                index += 1
+        finally:
+            captured.put(None)
+            thread.join()
+            if armed:
+                self.stop()
+        if state['error'] is not None:
+            raise state['error']
+        return state['processed']
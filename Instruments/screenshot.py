@@ -0,0 +1,172 @@
+"""
+Screenshot helpers shared by the instrument drivers.
+
+Drivers expose save_screenshot(filename, writer=None). The oscilloscope transfers
+the image to the computer, the Spike software saves it on its own computer.
+ScreenshotWriter moves format conversion and disk writes to a background thread
+so capture_time_lapse can keep its interval.
+"""
+import os
+import queue
+import threading
+import time
+
+# Magic bytes at the start of each image format and the matching file extension.
+IMAGE_SIGNATURES = (
+    (b'\x89PNG\r\n\x1a\n', "PNG"),
+    (b'\xff\xd8\xff', "JPEG"),
+    (b'BM', "BMP"),
+    (b'II*\x00', "TIFF"),
+    (b'MM\x00*', "TIFF"),
+)
+IMAGE_EXTENSIONS = {"PNG": ".png", "JPEG": ".jpg", "BMP": ".bmp", "TIFF": ".tiff"}
+
+
+def image_format(data):
+    """
+    Detect the format of image data from its first bytes.
+
+    Parameters:
+    data (bytes or memoryview): The image data without TMC header.
+
+    Returns:
+    str: One of "PNG", "JPEG", "BMP", "TIFF", or None if the format is not recognized.
+    """
+    start = bytes(data[:8])
+    for signature, name in IMAGE_SIGNATURES:
+        if start.startswith(signature):
+            return name
+    return None
+
+
+def with_extension(filename, data, convert_to=None):
+    """Add the extension matching the image data (or convert_to) to filename if it has none."""
+    if os.path.splitext(filename)[1]:
+        return filename
+    fmt = convert_to.upper() if convert_to is not None else image_format(data)
+    return filename + IMAGE_EXTENSIONS.get(fmt, ".img")
+
+
+def _convert(data, fmt):
+    """Re-encode image data into fmt ("PNG", "JPEG", ...) using Pillow."""
+    try:
+        from PIL import Image
+    except ImportError:
+        raise ImportError("Converting screenshots requires Pillow (pip install pillow).")
+    import io
+    output = io.BytesIO()
+    with Image.open(io.BytesIO(data)) as image:
+        image.save(output, format=fmt)
+    return output.getvalue()
+
+
+def write_image(filename, data, convert_to=None):
+    """
+    Write image data to filename, optionally converting it first.
+
+    Parameters:
+    filename (str): The file to write. The extension is added when missing.
+    data (bytes or memoryview): The image data.
+    convert_to (str, optional): Re-encode into this format ("PNG", "JPEG", ...) unless the
+                                data already has it. Requires Pillow.
+
+    Returns:
+    str: The name of the written file.
+    """
+    filename = with_extension(filename, data, convert_to)
+    if convert_to is not None and image_format(data) != convert_to.upper():
+        data = _convert(data, convert_to.upper())
+    with open(filename, 'wb') as f:
+        f.write(data)
+    return filename
+
+
+class ScreenshotWriter():
+    """
+    Write screenshots to disk on a background thread.
+
+    Use as a context manager, or call close() to wait for all pending writes.
+    Errors of the background thread are raised by the next submit() or close().
+    """
+
+    def __init__(self, convert_to=None, max_pending=16):
+        self.convert_to = convert_to
+        self._queue = queue.Queue(max_pending)
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name="screenshot-writer", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            filename, data = item
+            try:
+                if self._error is None:
+                    write_image(filename, data, self.convert_to)
+            except Exception as e:
+                self._error = e
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def submit(self, filename, data):
+        """
+        Queue data to be written to filename. Blocks when max_pending writes are waiting.
+
+        Returns:
+        str: The name the file will be written to.
+        """
+        self._raise_error()
+        if self._thread is None:
+            raise RuntimeError("The screenshot writer is closed.")
+        filename = with_extension(filename, data, self.convert_to)
+        self._queue.put((filename, data))
+        return filename
+
+    def close(self):
+        """Wait until all queued screenshots are written and stop the background thread."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        self._raise_error()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def capture_time_lapse(instrument, n, interval, directory=".", prefix="screenshot", convert_to=None):
+    """
+    Save n screenshots of an instrument, one every interval seconds.
+
+    Parameters:
+    instrument: A driver with a save_screenshot(filename, writer=None) method.
+    n (int): Number of screenshots.
+    interval (float): Seconds between the start of two screenshots.
+    directory (str): Directory of the screenshots. Must exist on the computer saving them.
+    prefix (str): Start of the file names, followed by the screenshot number.
+    convert_to (str, optional): Re-encode the screenshots in this format (requires Pillow).
+
+    Returns:
+    list: The names of the saved screenshots.
+    """
+    if n < 1:
+        raise ValueError(f"Invalid number of screenshots ({n}). Must be at least 1.")
+    if interval < 0:
+        raise ValueError(f"Invalid interval ({interval}). Must not be negative.")
+    names = []
+    with ScreenshotWriter(convert_to) as writer:
+        start = time.monotonic()
+        for i in range(n):
+            delay = start + i * interval - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            names.append(instrument.save_screenshot(os.path.join(directory, f"{prefix}_{i:04d}"), writer=writer))
+    return names
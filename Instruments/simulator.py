@@ -0,0 +1,156 @@
+"""
+In-memory instruments for running drivers and experiments without hardware.
+
+A SimulatedInstrument answers the commands of a command schema (the list of
+commands driver_generator extracts from a programming manual): set commands
+store their value, queries return the stored value or a default, unknown
+headers go to the error queue like on a real instrument (read it with
+:SYST:ERR?). Headers match in long or short form and with any numeric suffix,
+e.g. ':CALCulate:LLINe[1|2]:STATe' matches ':CALC:LLIN2:STAT'. Without a schema
+every header is accepted and remembered as it was sent.
+"""
+import re
+from collections import deque
+
+import pyvisa
+
+from Instruments import validation
+
+# One keyword of a header from a manual: optional ([...]), the keyword and its numeric suffix.
+NODE = re.compile(r'(?P<optional>\[)?:?(?P<keyword>\*?[A-Za-z]+)(?P<suffix>\[[\d|-]+\]|<\w+>)?\]?')
+ERROR_QUEUE = re.compile(r'^:SYST(?:EM)?:ERR(?:OR)?(?::NEXT)?$', re.IGNORECASE)
+
+
+def parse_header(header):
+    """
+    Split a header as written in a manual into its keywords.
+
+    Returns:
+    list: (keyword, optional, suffixes) per keyword. suffixes is None without a numeric
+          suffix, the tuple of allowed suffixes, or () if any number is allowed.
+    """
+    nodes = []
+    for match in NODE.finditer(header.strip().rstrip('?')):
+        suffix = match.group('suffix')
+        if suffix is None:
+            suffixes = None
+        elif '-' in suffix:
+            low, high = suffix.strip('[]').split('-')
+            suffixes = tuple(range(int(low), int(high) + 1))
+        elif suffix.startswith('['):
+            suffixes = tuple(int(s) for s in suffix.strip('[]').split('|'))
+        else:
+            suffixes = ()
+        nodes.append((match.group('keyword'), bool(match.group('optional')), suffixes))
+    return nodes
+
+
+def header_pattern(header):
+    """Regular expression matching the concrete forms of a header from a manual (without parameters and '?')."""
+    parts = []
+    for keyword, optional, suffixes in parse_header(header):
+        forms = sorted({keyword.upper(), validation.short_form(keyword).upper()}, key=len, reverse=True)
+        node = ("" if keyword.startswith("*") else ":") + "(?:" + "|".join(re.escape(f) for f in forms) + ")"
+        if suffixes is not None:
+            node += r"(\d*)"
+        parts.append(f"(?:{node})?" if optional else node)
+    return re.compile("^" + "".join(parts) + "$", re.IGNORECASE)
+
+
+def default_response(parameter):
+    """What a query answers before anything was set."""
+    kind = parameter['type'] if parameter else None
+    if kind == 'choice':
+        return validation.short_form(parameter['values'][0]).upper()
+    if kind == 'string':
+        return '""'
+    return "0"
+
+
+class SimulatedInstrument():
+    """Resource (write/query/read/read_raw) simulating the commands of a command schema."""
+
+    def __init__(self, commands, responses=None):
+        """
+        Parameters:
+        commands (list, optional): Command dictionaries with 'header' and 'parameter' (see
+                                   driver_generator). None accepts any header.
+        responses (dict, optional): Fixed answers by manual header (by the header as sent without
+                                    commands), e.g. {'*IDN?': 'Vendor,Model,1,1.0'}.
+        """
+        self.commands = None if commands is None else [(header_pattern(c['header']), c) for c in commands]
+        self.responses = {k.rstrip('?').upper(): v for k, v in (responses or {}).items()}
+        self.state = {}
+        self.errors = deque()
+        self.log = []
+        self.timeout = 2000
+        self._output = deque()
+
+    def _find(self, header):
+        if self.commands is None:
+            return {'header': header.upper(), 'parameter': None}, ()
+        for pattern, command in self.commands:
+            match = pattern.match(header)
+            if match:
+                return command, match.groups()
+        return None, None
+
+    def _store(self, command, value):
+        parameter = command.get('parameter') or {}
+        if parameter.get('type') == 'bool':
+            return "1" if validation.Boolean()(value) == "ON" else "0"
+        if parameter.get('type') == 'choice':
+            return validation.short_form(validation.Choice(*parameter['values'])(value)).upper()
+        return value
+
+    def _execute(self, message):
+        header, _, arguments = message.strip().partition(" ")
+        query = header.endswith("?")
+        header = header.rstrip("?")
+        if not header.startswith((":", "*")):
+            header = ":" + header
+        if query and ERROR_QUEUE.match(header):
+            self._output.append(self.errors.popleft() if self.errors else '0,"No error"')
+            return
+        command, suffixes = self._find(header)
+        if command is None:
+            self.errors.append(f'-113,"Undefined header;{message.strip()}"')
+            return
+        key = (command['header'], suffixes)
+        if query:
+            if key in self.state:
+                self._output.append(self.state[key])
+            else:
+                self._output.append(self.responses.get(command['header'].upper(),
+                                                       default_response(command.get('parameter'))))
+        elif arguments.strip():
+            try:
+                self.state[key] = self._store(command, arguments.strip())
+            except ValueError:
+                self.errors.append(f'-224,"Illegal parameter value;{message.strip()}"')
+
+    def write(self, message):
+        self.log.append(message)
+        for part in message.split(";"):
+            if part.strip():
+                self._execute(part)
+        return len(message)
+
+    def read(self):
+        if not self._output:
+            raise pyvisa.errors.VisaIOError(pyvisa.constants.StatusCode.error_timeout)
+        return self._output.popleft()
+
+    def read_raw(self, *args):
+        return (self.read() + "\n").encode()
+
+    def query(self, message):
+        self.write(message)
+        # Compound queries are answered in one message.
+        answers = [self.read()]
+        while self._output:
+            answers.append(self._output.popleft())
+        return ";".join(answers) + "\n"
+
+    def close(self):
+        pass
@@ -0,0 +1,760 @@
+"""Host-side helpers for the Signal Hound Spike spectrum analyzer.
+
+Like oscilloscope_helper, the functions and classes in this file work on data
+that has already been read from Spike. The only exceptions are the small
+functions that build compound SCPI queries for the SpectrumAnalyzer driver.
+"""
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from Instruments.oscilloscope_helper import parse_tmc_block
+
+#Compound Queries
+# Spike accepts several queries separated by ';' in one message and answers
+# with the responses separated by ';'.
+def build_compound_query(queries):
+    """Join SCPI queries into one compound message."""
+    return ";".join(queries)
+
+
+def split_compound_response(response, expected):
+    """
+    Split the response to a compound query.
+
+    Parameters:
+    response (str): The response, e.g. '1.0e9;-20.5'.
+    expected (int): The number of queries in the compound message.
+
+    Returns:
+    list: The responses as stripped strings.
+    """
+    parts = [part.strip() for part in response.strip().split(";")]
+    if len(parts) != expected:
+        raise ValueError(f"Expected {expected} responses to the compound query, got {len(parts)}: {response}")
+    return parts
+
+
+#Peak Table
+# One row of the Spike peak table. dfreq and damp are relative to the first peak.
+PEAK_TABLE_DTYPE = np.dtype([('freq', np.float64), ('amp', np.float64),
+                             ('dfreq', np.float64), ('damp', np.float64)])
+
+PEAK_TABLE_QUERIES = {
+    'freq': ":SENS:PEAK:TABL:FREQ? {}",
+    'amp': ":SENS:PEAK:TABL:AMPL? {}",
+    'dfreq': ":SENS:PEAK:TABL:FREQ:DELT? {}",
+    'damp': ":SENS:PEAK:TABL:AMPL:DELT? {}",
+}
+
+# Number of peak table rows read with one compound query.
+PEAK_TABLE_ROWS_PER_QUERY = 16
+
+
+def read_peak_rows(instrument, rows, fields, out):
+    """
+    Read fields of the given peak table rows with compound queries into out.
+
+    Parameters:
+    instrument: The VISA resource of the SpectrumAnalyzer.
+    rows (list): The peak numbers to read, from 1 as in the peak table of the Spike.
+    fields (tuple): Names from PEAK_TABLE_QUERIES.
+    out (numpy.ndarray): Array with PEAK_TABLE_DTYPE, peak n of the table is written to out[n - 1].
+    """
+    rows = list(rows)
+    for start in range(0, len(rows), PEAK_TABLE_ROWS_PER_QUERY):
+        chunk = rows[start:start + PEAK_TABLE_ROWS_PER_QUERY]
+        queries = [PEAK_TABLE_QUERIES[field].format(row) for row in chunk for field in fields]
+        response = instrument.query(build_compound_query(queries))
+        values = np.array(split_compound_response(response, len(queries)), dtype=np.float64)
+        values = values.reshape(len(chunk), len(fields))
+        indices = np.array(chunk) - 1
+        for column, field in enumerate(fields):
+            out[field][indices] = values[:, column]
+
+
+def update_peak_deltas(table):
+    """Compute dfreq and damp relative to the first peak, in place."""
+    if len(table):
+        np.subtract(table['freq'], table['freq'][0], out=table['dfreq'])
+        np.subtract(table['amp'], table['amp'][0], out=table['damp'])
+    return table
+
+
+#Trace Data
+def parse_trace_data(data, fmt):
+    """
+    Convert a :TRACe:DATA? response to an array of amplitudes.
+
+    Parameters:
+    data (bytes or str): The response. For REAL the IEEE 488.2 block with little endian
+                         32 bit floats, for ASCii the comma separated values.
+    fmt (str): The trace format, 'REAL' or 'ASCii' (see SpectrumAnalyzer.set_trace_format).
+
+    Returns:
+    numpy.ndarray: float32 amplitudes.
+    """
+    if fmt.upper().startswith("REAL"):
+        # Same definite length block as the oscilloscope's TMC block.
+        return np.frombuffer(parse_tmc_block(data), dtype='<f4')
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data).decode("ascii")
+    return np.array(data.strip().split(","), dtype=np.float32)
+
+
+def trace_frequencies(xstart, xincrement, points):
+    """Frequency in Hz of every point of a trace (see get_trace_xstart/get_trace_xincrement)."""
+    return xstart + xincrement * np.arange(points, dtype=np.float64)
+
+
+#Peak Search
+# Peaks found on the host. index is the trace point, lower/upper the N dB points
+# around the peak and bandwidth their distance. Deltas are relative to the first peak.
+PEAK_DTYPE = np.dtype([('index', np.int64), ('freq', np.float64), ('amp', np.float64),
+                       ('dfreq', np.float64), ('damp', np.float64), ('lower', np.float64),
+                       ('upper', np.float64), ('bandwidth', np.float64)])
+
+
+def _local_maxima(traces):
+    """Mask of the interior local maxima (first point of flat tops) of each row."""
+    mask = np.zeros(traces.shape, dtype=bool)
+    middle = traces[:, 1:-1]
+    mask[:, 1:-1] = (middle > traces[:, :-2]) & (middle >= traces[:, 2:])
+    return mask
+
+
+def _apply_excursion(trace, candidates, excursion):
+    """
+    Keep the candidates that rise at least excursion dB above the lowest point between
+    them and the next remaining peak (or the end of the trace) on both sides.
+    """
+    while len(candidates):
+        amps = trace[candidates]
+        # valleys[i] is the minimum between candidate i-1 and candidate i.
+        valleys = np.minimum.reduceat(trace, np.concatenate(([0], candidates)))
+        left_fail = amps - valleys[:-1] < excursion
+        right_fail = amps - valleys[1:] < excursion
+        # A failing peak is removed when the neighbour on the failing side is higher. The
+        # lower neighbour then fails too and is removed instead. Of two equal peaks the
+        # left one is kept, so one of them always survives.
+        higher_left = np.concatenate(([True], amps[:-1] >= amps[1:]))
+        higher_right = np.concatenate((amps[1:] > amps[:-1], [True]))
+        remove = (left_fail & higher_left) | (right_fail & higher_right)
+        if not remove.any():
+            break
+        candidates = candidates[~remove]
+    return candidates
+
+
+def _ndb_points(trace, freqs, index, level, start, stop):
+    """Interpolated frequencies where the trace falls below level left and right of index, within [start, stop)."""
+    left = np.flatnonzero(trace[start:index] < level)
+    right = np.flatnonzero(trace[index + 1:stop] < level)
+    lower = upper = np.nan
+    if len(left):
+        i = start + left[-1]
+        lower = np.interp(level, trace[i:i + 2], freqs[i:i + 2])
+    if len(right):
+        i = index + 1 + right[0]
+        upper = np.interp(level, trace[i - 1:i + 1][::-1], freqs[i - 1:i + 1][::-1])
+    return lower, upper
+
+
+def find_peaks(traces, freqs, excursion=6.0, threshold=None, ndb=3.0, max_peaks=None, sort="AMPLITUDE"):
+    """
+    Find every peak of one or several traces, like the Spike marker peak search and peak table.
+
+    Parameters:
+    traces (array-like): One trace (n_points,) or a batch (n_traces, n_points) in dBm.
+    freqs (array-like): Frequency of every trace point in Hz (see trace_frequencies).
+    excursion (float): Minimum rise in dB of a peak above the surrounding trace
+                       (set_peak_excursion/set_peak_table_excursion).
+    threshold (float, optional): Peaks below this amplitude are ignored
+                                 (set_peak_threshold/set_peak_table_threshold).
+    ndb (float): The bandwidth of a peak is measured ndb dB below its amplitude.
+    max_peaks (int, optional): Keep only this many peaks (the highest ones).
+    sort (str): Order of the peaks, 'AMPLITUDE' (highest first) or 'FREQUENCY'.
+
+    Returns:
+    numpy.ndarray or list: Array with PEAK_DTYPE for one trace, a list of them for a batch.
+    """
+    sort = sort.upper()
+    if sort not in ("AMPLITUDE", "FREQUENCY"):
+        raise ValueError(f"Invalid sort type: '{sort}'. Must be 'FREQUENCY' or 'AMPLITUDE'.")
+    if excursion < 0 or ndb <= 0:
+        raise ValueError("The excursion must not be negative and ndb must be positive.")
+    traces = np.asarray(traces, dtype=np.float64)
+    single = traces.ndim == 1
+    traces = np.atleast_2d(traces)
+    freqs = np.asarray(freqs, dtype=np.float64)
+    if freqs.shape != traces.shape[1:]:
+        raise ValueError(f"Expected {traces.shape[1]} frequencies, got {freqs.shape}.")
+
+    maxima = _local_maxima(traces)
+    results = []
+    for trace, mask in zip(traces, maxima):
+        peaks = _apply_excursion(trace, np.flatnonzero(mask), excursion)
+        if threshold is not None:
+            peaks = peaks[trace[peaks] >= threshold]
+        if max_peaks is not None and len(peaks) > max_peaks:
+            peaks = np.sort(peaks[np.argsort(trace[peaks], kind='stable')[::-1][:max_peaks]])
+        result = np.zeros(len(peaks), dtype=PEAK_DTYPE)
+        result['index'] = peaks
+        result['freq'] = freqs[peaks]
+        result['amp'] = trace[peaks]
+        # The N dB points are searched up to the neighbouring peaks.
+        bounds = np.concatenate(([0], peaks, [len(trace)]))
+        for i, index in enumerate(peaks):
+            result['lower'][i], result['upper'][i] = _ndb_points(
+                trace, freqs, index, trace[index] - ndb, bounds[i], bounds[i + 2])
+        result['bandwidth'] = result['upper'] - result['lower']
+        if sort == "AMPLITUDE":
+            result = result[np.argsort(-result['amp'], kind='stable')]
+        update_peak_deltas(result)
+        results.append(result)
+    return results[0] if single else results
+
+
+class PeakMarker():
+    """
+    Marker that moves between peaks found on the host, with the same moves as the
+    Spike marker (perform_peak_search, move_marker_to_next_peak, ..._left_peak, ..._right_peak).
+    """
+
+    def __init__(self, trace, freqs, excursion=6.0, threshold=None):
+        self.trace = np.asarray(trace, dtype=np.float64)
+        self.freqs = np.asarray(freqs, dtype=np.float64)
+        self.peaks = find_peaks(self.trace, self.freqs, excursion, threshold, sort="FREQUENCY")
+        self.index = None
+
+    @property
+    def frequency(self):
+        return None if self.index is None else self.freqs[self.index]
+
+    @property
+    def amplitude(self):
+        return None if self.index is None else self.trace[self.index]
+
+    def _move(self, candidates):
+        if len(candidates):
+            self.index = int(candidates['index'][np.argmax(candidates['amp'])])
+        return self.frequency
+
+    def peak_search(self):
+        """Move to the highest point of the trace."""
+        self.index = int(np.argmax(self.trace))
+        return self.frequency
+
+    def minimum_search(self):
+        """Move to the lowest point of the trace."""
+        self.index = int(np.argmin(self.trace))
+        return self.frequency
+
+    def next_peak(self):
+        """Move to the highest peak lower than the current position."""
+        if self.index is None:
+            return self.peak_search()
+        return self._move(self.peaks[self.peaks['amp'] < self.trace[self.index]])
+
+    def left_peak(self):
+        """Move to the nearest peak left of the current position."""
+        if self.index is None:
+            return self.peak_search()
+        left = self.peaks[self.peaks['index'] < self.index]
+        return self._move(left[-1:])
+
+    def right_peak(self):
+        """Move to the nearest peak right of the current position."""
+        if self.index is None:
+            return self.peak_search()
+        right = self.peaks[self.peaks['index'] > self.index]
+        return self._move(right[:1])
+
+
+#Limit Lines
+def parse_point_pairs(data):
+    """
+    Parse 'freq1,value1,freq2,value2,...' (limit line and path loss table data) into two
+    arrays sorted by frequency.
+
+    Returns:
+    tuple: (freqs, values) float64 arrays.
+    """
+    if isinstance(data, str):
+        data = data.strip()
+        values = np.array(data.split(","), dtype=np.float64) if data else np.zeros(0)
+    else:
+        values = np.asarray(data, dtype=np.float64).ravel()
+    if len(values) % 2:
+        raise ValueError(f"Expected frequency/value pairs, got {len(values)} values.")
+    freqs, values = values[0::2], values[1::2]
+    order = np.argsort(freqs, kind='stable')
+    return freqs[order], values[order]
+
+
+def interpolate_points(freqs, point_freqs, point_values, interpolation="LINEAR", fill=np.nan):
+    """
+    Interpolate point values at freqs, linearly in frequency (LINear) or in log frequency (LOGarithmic).
+    Frequencies outside the points get fill (None holds the first/last value).
+    """
+    freqs = np.asarray(freqs, dtype=np.float64)
+    if interpolation.upper().startswith("LOG"):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x, xp = np.log10(freqs), np.log10(point_freqs)
+    elif interpolation.upper().startswith("LIN"):
+        x, xp = freqs, point_freqs
+    else:
+        raise ValueError(f"Invalid interpolation type: '{interpolation}'. Allowed values are 'LINear' or 'LOGarithmic'.")
+    if len(point_freqs) == 0:
+        return np.full(freqs.shape, np.nan if fill is None else fill)
+    if fill is None:
+        return np.interp(x, xp, point_values)
+    return np.interp(x, xp, point_values, left=fill, right=fill)
+
+
+class LimitMask():
+    """
+    Limit line tested on this computer, with the same definition as a Spike limit line
+    (points, UPPer/LOWer type, LINear/LOGarithmic interpolation and Y offset).
+
+    The line is interpolated once onto the trace frequencies (align), after which any
+    number of traces is tested with one vectorized comparison. Trace points outside
+    the frequency range of the line are not tested.
+    """
+
+    def __init__(self, freqs, amps, line_type="UPPER", interpolation="LINEAR", offset=0.0):
+        """
+        Parameters:
+        freqs (array-like): Frequencies of the limit line points in Hz.
+        amps (array-like): Amplitudes of the points in dBm.
+        line_type (str): 'UPPer' (traces must stay below) or 'LOWer' (traces must stay above).
+        interpolation (str): 'LINear' or 'LOGarithmic'.
+        offset (float): dB offset added to the line (set_limit_line_offset_y).
+        """
+        line_type = line_type.strip().upper()
+        if line_type.startswith("UPP"):
+            self.upper = True
+        elif line_type.startswith("LOW"):
+            self.upper = False
+        else:
+            raise ValueError(f"Invalid limit line type: '{line_type}'. Allowed values are 'UPPer' or 'LOWer'.")
+        self.freqs, self.amps = parse_point_pairs(np.column_stack((freqs, amps)))
+        if len(self.freqs) < 2:
+            raise ValueError("A limit line needs at least 2 points.")
+        self.interpolation = interpolation.strip().upper()
+        self.offset = float(offset)
+        self._aligned = None
+        self._aligned_freqs = None
+
+    @classmethod
+    def from_spectrum_analyzer(cls, spectrum_analyzer, line_num):
+        """Read the definition of a limit line (1-6) from the Spike software."""
+        reference = spectrum_analyzer.get_limit_line_reference(line_num).strip().upper()
+        if reference.startswith("REL"):
+            raise ValueError("Only FIXed limit lines can be tested on the host.")
+        freqs, amps = parse_point_pairs(spectrum_analyzer.get_limit_line_data(line_num))
+        return cls(freqs, amps, spectrum_analyzer.get_limit_line_type(line_num),
+                   spectrum_analyzer.get_limit_line_interpolation(line_num),
+                   float(spectrum_analyzer.get_limit_line_offset_y(line_num)))
+
+    def align(self, freqs):
+        """
+        Interpolate the line onto the trace frequencies. The result is kept, so aligning
+        again to the same frequencies is free.
+
+        Returns:
+        numpy.ndarray: The limit at every trace point (NaN outside the line).
+        """
+        freqs = np.asarray(freqs, dtype=np.float64)
+        if self._aligned_freqs is None or not np.array_equal(freqs, self._aligned_freqs):
+            self._aligned = interpolate_points(freqs, self.freqs, self.amps, self.interpolation) + self.offset
+            self._aligned_freqs = freqs.copy()
+        return self._aligned
+
+    def failures(self, traces, freqs=None):
+        """
+        Parameters:
+        traces (array-like): One trace (n_points,) or a batch (n_traces, n_points) in dBm.
+        freqs (array-like, optional): Trace frequencies, defaults to the last aligned frequencies.
+
+        Returns:
+        numpy.ndarray: Boolean mask of the failing points, same shape as traces.
+        """
+        if freqs is not None:
+            self.align(freqs)
+        if self._aligned is None:
+            raise ValueError("The limit mask is not aligned to a frequency axis, pass freqs.")
+        traces = np.asarray(traces)
+        if traces.shape[-1] != len(self._aligned):
+            raise ValueError(f"Traces have {traces.shape[-1]} points, the limit mask {len(self._aligned)}.")
+        # NaN limits (outside the line) compare False and never fail.
+        if self.upper:
+            return traces > self._aligned
+        return traces < self._aligned
+
+    def test(self, traces, freqs=None):
+        """
+        Test traces against the line.
+
+        Returns:
+        tuple: (passed, failing). passed is a bool (one trace) or bool array (batch),
+               failing the mask of the failing points (see failures).
+        """
+        failing = self.failures(traces, freqs)
+        passed = ~failing.any(axis=-1)
+        return (bool(passed), failing) if failing.ndim == 1 else (passed, failing)
+
+    def failing_bins(self, trace, freqs=None):
+        """Indices of the failing points of one trace."""
+        return np.flatnonzero(self.failures(trace, freqs))
+
+
+#Path Loss
+class PathLossTable():
+    """
+    Path loss table (frequency/offset points) applied to traces on this computer.
+
+    The points are kept sorted by frequency. The correction is interpolated once per trace
+    frequency axis, so correcting further traces with the same axis is a single addition.
+    Frequencies outside the table use the offset of the first/last point.
+    """
+
+    def __init__(self, freqs, offsets, interpolation="LINEAR"):
+        """
+        Parameters:
+        freqs (array-like): Frequencies of the points in Hz.
+        offsets (array-like): Path loss of the points in dB.
+        interpolation (str): 'LINear' or 'LOGarithmic' (in frequency).
+        """
+        self.freqs, self.offsets = parse_point_pairs(np.column_stack((freqs, offsets)))
+        self.freqs.setflags(write=False)
+        self.offsets.setflags(write=False)
+        self.interpolation = interpolation
+        self._correction = None
+        self._correction_freqs = None
+        self._correction_interpolation = None
+
+    @classmethod
+    def from_response(cls, data, interpolation="LINEAR"):
+        """Create the table from a :SENS:CORR:PATH<n>:DATA? response."""
+        freqs, offsets = parse_point_pairs(data)
+        return cls(freqs, offsets, interpolation)
+
+    def __len__(self):
+        return len(self.freqs)
+
+    def to_scpi(self):
+        """The points as 'freq1,offset1,freq2,offset2,...' for :SENS:CORR:PATH<n>:DATA."""
+        return ",".join(f"{value:.12g}" for value in np.column_stack((self.freqs, self.offsets)).ravel())
+
+    def correction(self, freqs, interpolation=None):
+        """
+        The path loss at every trace frequency in dB, kept for the next call with the same
+        frequencies and interpolation. interpolation defaults to the one of the table.
+        """
+        interpolation = (interpolation or self.interpolation).upper()
+        freqs = np.asarray(freqs, dtype=np.float64)
+        if (self._correction_freqs is None or interpolation != self._correction_interpolation
+                or not np.array_equal(freqs, self._correction_freqs)):
+            if len(self.freqs) == 0:
+                correction = np.zeros(freqs.shape)
+            else:
+                correction = interpolate_points(freqs, self.freqs, self.offsets, interpolation, fill=None)
+            correction.setflags(write=False)
+            self._correction, self._correction_freqs = correction, freqs.copy()
+            self._correction_interpolation = interpolation
+        return self._correction
+
+
+def apply_path_loss(traces, freqs, tables, interpolation=None, out=None):
+    """
+    Add the path loss of one or several tables to traces.
+
+    Parameters:
+    traces (array-like): One trace (n_points,) or a batch (n_traces, n_points) in dB units.
+    freqs (array-like): The trace frequencies in Hz.
+    tables (list): PathLossTable instances (a single table is accepted too).
+    interpolation (str, optional): Overrides the interpolation of the tables.
+    out (numpy.ndarray, optional): Output array, may be traces itself for in place correction.
+
+    Returns:
+    numpy.ndarray: The corrected traces.
+    """
+    if isinstance(tables, PathLossTable):
+        tables = [tables]
+    total = np.zeros(len(freqs))
+    for table in tables:
+        total += table.correction(freqs, interpolation)
+    return np.add(traces, total, out=out)
+
+
+#Trace Statistics
+class TraceAccumulator():
+    """
+    Streaming statistics over fetched traces, like the Spike trace types (AVERAGE,
+    MAXHOLD, MINHOLD) but all at once and without waiting for the average count.
+
+    Every update works in place on arrays allocated once. Results can be read at
+    any time: power average (averaging in mW, as Spike does for power units), log
+    average (averaging in dB), max/min hold, variance of the dB values (Welford) and
+    approximate percentiles from a per-point histogram with bin_width dB resolution.
+    """
+
+    def __init__(self, points, percentiles=False, amplitude_range=(-200.0, 50.0), bin_width=0.5):
+        """
+        Parameters:
+        points (int): Number of points of the traces.
+        percentiles (bool): Keep the per-point histograms needed by percentile().
+        amplitude_range (tuple): Range of the histograms in dB, values outside are counted in the end bins.
+        bin_width (float): Histogram resolution in dB.
+        """
+        self.points = points
+        self.count = 0
+        self._power_sum = np.zeros(points)
+        self._mean = np.zeros(points)
+        self._m2 = np.zeros(points)
+        self._max = np.full(points, -np.inf, dtype=np.float32)
+        self._min = np.full(points, np.inf, dtype=np.float32)
+        self._scratch = np.empty(points)
+        self._delta = np.empty(points)
+        self._histogram = None
+        if percentiles:
+            low, high = amplitude_range
+            if not high > low or bin_width <= 0:
+                raise ValueError("Invalid histogram range or bin width.")
+            self._low = low
+            self._bin_width = bin_width
+            self._bins = int(np.ceil((high - low) / bin_width))
+            self._histogram = np.zeros((points, self._bins), dtype=np.uint32)
+            self._bin_offsets = np.arange(points) * self._bins
+
+    def reset(self):
+        """Forget every trace, keeping the allocated arrays."""
+        self.count = 0
+        self._power_sum.fill(0)
+        self._mean.fill(0)
+        self._m2.fill(0)
+        self._max.fill(-np.inf)
+        self._min.fill(np.inf)
+        if self._histogram is not None:
+            self._histogram.fill(0)
+
+    def update(self, traces):
+        """
+        Add one trace (points,) or a batch of traces (n_traces, points) in dB units.
+        """
+        traces = np.asarray(traces)
+        batch = np.atleast_2d(traces)
+        if batch.shape[1] != self.points:
+            raise ValueError(f"Expected traces with {self.points} points, got {batch.shape[1]}.")
+        scratch, delta = self._scratch, self._delta
+        for trace in batch:
+            np.maximum(self._max, trace, out=self._max)
+            np.minimum(self._min, trace, out=self._min)
+            # Power sum in mW.
+            np.multiply(trace, 0.1, out=scratch)
+            np.power(10.0, scratch, out=scratch)
+            self._power_sum += scratch
+            # Welford update of mean and sum of squared deviations.
+            self.count += 1
+            np.subtract(trace, self._mean, out=delta)
+            np.divide(delta, self.count, out=scratch)
+            self._mean += scratch
+            np.subtract(trace, self._mean, out=scratch)
+            delta *= scratch
+            self._m2 += delta
+            if self._histogram is not None:
+                np.subtract(trace, self._low, out=scratch)
+                scratch /= self._bin_width
+                np.clip(scratch, 0, self._bins - 1, out=scratch)
+                index = scratch.astype(np.intp)
+                index += self._bin_offsets
+                self._histogram.ravel()[index] += 1
+        return self
+
+    def _check(self):
+        if self.count == 0:
+            raise ValueError("No traces have been accumulated.")
+
+    def power_average(self, out=None):
+        """Average of the traces in linear power, in dB."""
+        self._check()
+        out = np.divide(self._power_sum, self.count, out=out)
+        return np.multiply(np.log10(out, out=out), 10.0, out=out)
+
+    def log_average(self, out=None):
+        """Average of the dB values."""
+        self._check()
+        if out is None:
+            return self._mean.copy()
+        np.copyto(out, self._mean)
+        return out
+
+    def max_hold(self):
+        """Maximum of every point (read-only view, updated by the next update)."""
+        self._check()
+        view = self._max.view()
+        view.setflags(write=False)
+        return view
+
+    def min_hold(self):
+        """Minimum of every point (read-only view, updated by the next update)."""
+        self._check()
+        view = self._min.view()
+        view.setflags(write=False)
+        return view
+
+    def variance(self, ddof=1, out=None):
+        """Variance of the dB values of every point."""
+        self._check()
+        if self.count <= ddof:
+            raise ValueError(f"At least {ddof + 1} traces are needed for the variance.")
+        return np.divide(self._m2, self.count - ddof, out=out)
+
+    def std(self, ddof=1):
+        """Standard deviation of the dB values of every point."""
+        return np.sqrt(self.variance(ddof))
+
+    def percentile(self, q):
+        """
+        Approximate q-th percentile (0-100) of every point from the histograms,
+        accurate to the bin width.
+        """
+        self._check()
+        if self._histogram is None:
+            raise ValueError("Create the accumulator with percentiles=True to compute percentiles.")
+        if not 0 <= q <= 100:
+            raise ValueError(f"Invalid percentile ({q}). Must be between 0 and 100.")
+        cumulative = np.cumsum(self._histogram, axis=1)
+        target = max(q / 100 * self.count, 1)
+        index = np.argmax(cumulative >= target, axis=1)
+        return self._low + (index + 0.5) * self._bin_width
+
+    def results(self):
+        """Every statistic as a dict of new arrays."""
+        results = {'count': self.count, 'power_average': self.power_average(),
+                   'log_average': self.log_average(), 'max_hold': self.max_hold().copy(),
+                   'min_hold': self.min_hold().copy()}
+        if self.count > 1:
+            results['variance'] = self.variance()
+        if self._histogram is not None:
+            results['median'] = self.percentile(50)
+        return results
+
+
+#Wideband Sweeps
+# Planning estimates: trace points per RBW and the largest trace of one segment.
+BINS_PER_RBW = 2.0
+MAX_SEGMENT_POINTS = 32768
+# Overlap between segments in RBWs, the edges of each segment are discarded.
+SEGMENT_OVERLAP_RBWS = 5.0
+
+SweepSegment = namedtuple('SweepSegment', ['start', 'stop', 'keep_start', 'keep_stop'])
+SweepPlan = namedtuple('SweepPlan', ['rbw', 'segments'])
+
+
+def rbw_step(rbw_hz):
+    """The largest RBW of the 1-3-10 sequence that is not above rbw_hz."""
+    if rbw_hz <= 0:
+        raise ValueError(f"Invalid RBW ({rbw_hz}). Must be positive.")
+    decade = 10.0 ** np.floor(np.log10(rbw_hz))
+    # Guard against rounding, e.g. log10(1000) = 2.9999999999999996.
+    if decade * 10 <= rbw_hz * (1 + 1e-12):
+        decade *= 10
+    return decade * 3 if rbw_hz >= decade * 3 * (1 - 1e-12) else decade
+
+
+def plan_sweep(start_hz, stop_hz, rbw_hz, max_points=MAX_SEGMENT_POINTS, overlap_rbws=SEGMENT_OVERLAP_RBWS):
+    """
+    Split a frequency range into the segments of a wideband sweep.
+
+    The sweep time of every segment falls with a wider RBW and every segment adds a fixed
+    configure/fetch overhead, so the fastest plan uses the widest 1-3-10 RBW that still
+    meets rbw_hz and the fewest segments that keep each trace under max_points. The
+    segments have equal width and overlap by overlap_rbws RBWs, which are cut at the
+    middle of the overlap when stitching.
+
+    Returns:
+    SweepPlan: (rbw, segments), each segment (start, stop, keep_start, keep_stop) in Hz.
+    """
+    if not stop_hz > start_hz:
+        raise ValueError("The stop frequency must be above the start frequency.")
+    rbw = rbw_step(rbw_hz)
+    overlap = overlap_rbws * rbw
+    max_span = max_points * rbw / BINS_PER_RBW - 2 * overlap
+    if max_span <= 0:
+        raise ValueError("max_points is too small for the overlap, lower overlap_rbws or raise max_points.")
+    count = int(np.ceil((stop_hz - start_hz) / max_span))
+    edges = np.linspace(start_hz, stop_hz, count + 1)
+    segments = [SweepSegment(max(start_hz, edges[i] - overlap), min(stop_hz, edges[i + 1] + overlap),
+                             edges[i], edges[i + 1]) for i in range(count)]
+    return SweepPlan(rbw, segments)
+
+
+def _trim_segment(segment, last, xstart, xincrement, data, fmt):
+    """Decode a segment trace and keep the points of its own part of the range."""
+    amps = parse_trace_data(data, fmt)
+    freqs = trace_frequencies(xstart, xincrement, len(amps))
+    first = np.searchsorted(freqs, segment.keep_start, side='left')
+    end = np.searchsorted(freqs, segment.keep_stop, side='right' if last else 'left')
+    return freqs[first:end], amps[first:end]
+
+
+def run_sweep_plan(plan, fetch, fmt):
+    """
+    Run the segments of a sweep plan and stitch them.
+
+    Parameters:
+    plan (SweepPlan): The plan (see plan_sweep).
+    fetch (callable): fetch(segment) sweeps one segment and returns (xstart, xincrement, data)
+                      with data the raw :TRAC:DATA? response.
+    fmt (str): The trace format of the responses, 'REAL' or 'ASCii'.
+
+    Returns:
+    tuple: (freqs, amps) of the stitched trace.
+    """
+    last = len(plan.segments) - 1
+    # Decoding and trimming a segment runs while the next segment is swept.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        futures = [pool.submit(_trim_segment, segment, i == last, *fetch(segment), fmt)
+                   for i, segment in enumerate(plan.segments)]
+        pieces = [future.result() for future in futures]
+    return (np.concatenate([freqs for freqs, _ in pieces]),
+            np.concatenate([amps for _, amps in pieces]))
+
+
+#Measurement Results
+# Result queries of each measurement, in the order of the MeasurementResults fields.
+MEASUREMENT_QUERIES = {
+    'channel_power': (
+        ('main_channel_power', ":SENS:CHP:CHP?"),
+        ('adjacent_channel_power_lower', ":SENS:CHP:CHP:LOW?"),
+        ('adjacent_channel_power_upper', ":SENS:CHP:CHP:UPP?"),
+        ('adjacent_channel_ac_power_lower', ":SENS:CHP:ACP:LOW?"),
+        ('adjacent_channel_ac_power_upper', ":SENS:CHP:ACP:UPP?"),
+    ),
+    'occupied_bandwidth': (
+        ('occupied_bandwidth', ":SENS:OBW:OBW?"),
+        ('occupied_bandwidth_center_frequency', ":SENS:OBW:CENT?"),
+        ('occupied_bandwidth_power', ":SENS:OBW:POW?"),
+    ),
+    'intermodulation': tuple(
+        [(f'imd_{p.lower()}_frequency', f":SENS:IMD:FREQ? {p}") for p in ("F1", "F2", "IM3L", "IM3U")] +
+        [(f'imd_{p.lower()}_power', f":SENS:IMD:TPOW? {p}") for p in ("F1", "F2", "IM3L", "IM3U")] +
+        [(f'imd_{p.lower()}_power_difference', f":SENS:IMD:TPOW:DIFF? {p}") for p in ("IM3L", "IM3U")] +
+        [(f'imd_{p.lower()}_toi', f":SENS:IMD:TOI? {p}") for p in ("IM3L", "IM3U")]
+    ),
+}
+
+MEASUREMENT_STATE_QUERIES = {
+    'channel_power': ":SENS:CHP:STAT?",
+    'occupied_bandwidth': ":SENS:OBW:STAT?",
+    'intermodulation': ":SENS:IMD:STAT?",
+}
+
+_MEASUREMENT_FIELDS = [field for queries in MEASUREMENT_QUERIES.values() for field, _ in queries]
+# Results of SpectrumAnalyzer.read_measurements. Units as the single getters: powers in
+# dBm, frequencies and bandwidths in Hz, power differences in dBc. None if not measured.
+MeasurementResults = namedtuple('MeasurementResults', _MEASUREMENT_FIELDS,
+                                defaults=(None,) * len(_MEASUREMENT_FIELDS))
@@ -1,11 +1,27 @@
 from Instruments.SCPICommandTree import mandatory
+from Instruments import spectrum_analyzer_helper
+from Instruments import validation
+import numpy as np
 import time
 
+# Argument checks shared by the setters, see validation.
+STATE = validation.Boolean()
+MODE = validation.Choice("SA", "RTSA", "ZS", "HARMonics", "NA", "PNoise", "DDEMod", "EMI", "ADEMod", "IH",
+                         "SEMask", "NFIGure", "WLAN", "BLE", "LTE", name="measurement mode")
+
 class SpectrumAnalyzer(mandatory.Mandatory):
     def __init__(self, device):
        #TODO Add in 
        self.instrument = device
-       self.valid_booleans = ['ON', 'OFF', 1, 0]
+       # Peak table of the last track_peak_table call, updated in place.
+       self._peak_table = np.zeros(0, dtype=spectrum_analyzer_helper.PEAK_TABLE_DTYPE)
+       # Trace format set with set_trace_format, queried on first use otherwise.
+       self._trace_format = None
+       # Path loss tables read from or written to Spike, and the table states, by table number.
+       self._path_loss_tables = {}
+       self._path_loss_states = {}
+       # Enable states of the channel power, OBW and IMD measurements, for read_measurements.
+       self._measurement_states = {}
 
     #Helper Functions
     def _validate_line_num(self, line_num):
@@ -32,19 +48,15 @@ class SpectrumAnalyzer(mandatory.Mandatory):
             print("Invalid response received: " + response)
             return None
 
+    @validation.validate(to_hide=STATE)
     def hide_spike(self, to_hide):
         """When set to true, hides the Spike application. The application will 
         be hidden in the taskbar but will continue to be visible in the task manager.
         The SCPI lockout dialog, device connecting progress dialog, no device 
         connected alert dialog and multiple devices connected alert dialog will be 
         hidden, overriding related settings in the preferences menu."""
-    
-        
-        if to_hide in self.valid_booleans:
-            comm = ":DISP:HIDE " + str(to_hide).upper()
-            self.instrument.write(comm)
-        else:
-            print("Invalid format. Allowed values are: " + str(self.valid_booleans))
+        comm = ":DISP:HIDE " + str(to_hide)
+        self.instrument.write(comm)
     
     def get_measurement_title(self):
         """ Get the measurement title."""
@@ -71,16 +83,13 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         comm = ":FORM:TRAC?"
         return self.instrument.query(comm)
 
+    @validation.validate(format=validation.Choice("ASCii", "REAL", name="trace format"))
     def set_trace_format(self, format):
         """Set the format the trace data is returned in.
         form: 'ASCii', 'REAL'"""
-    
-        allowed_type_values = ['ASCII', 'REAL','ASC']
-        if format.upper() in allowed_type_values:
-            comm = ":FORM:TRAC " + format
-            self.instrument.write(comm)
-        else:
-            print("Invalid format. Allowed values are: " + str(allowed_type_values))
+        comm = ":FORM:TRAC " + str(format)
+        self.instrument.write(comm)
+        self._trace_format = str(format).upper()
     
     def get_iq_format(self):
         #TODO: Test that :DATA unneeded
@@ -88,16 +97,12 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         comm = ":FORM:IQ?"
         return self.instrument.query(comm)
 
+    @validation.validate(format=validation.Choice("ASCii", "BINary", name="IQ format"))
     def set_iq_format(self, format):
         """Set the format the iq data is returned in.
         form: 'ASCii', 'BINary'"""
-    
-        allowed_type_values = ['ASCII', 'BINARY','BIN','ASC']
-        if format.upper() in allowed_type_values:
-            comm = ":FORM:IQ " + format
-            self.instrument.write(comm)
-        else:
-            print("Invalid format. Allowed values are: " + str(allowed_type_values))
+        comm = ":FORM:IQ " + str(format)
+        self.instrument.write(comm)
     
     #System Controls
     """The following commands are used to 
@@ -157,6 +162,20 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         comm = ":SYST:IMAG:SAVE:QUICK"
         self.instrument.write(comm)
 
+    def save_screenshot(self, filename=None, writer=None):
+        """
+        Saves a screenshot on the computer running Spike, with the same interface as the
+        oscilloscope driver so both can be used with screenshot.capture_time_lapse.
+        params: filename (str): The name of the image file. None uses the quick save.
+                writer: Unused, the image is written by Spike and not transferred.
+        returns: str: The name of the file, or None for a quick save.
+        """
+        if filename is None:
+            self.save_image_quick()
+        else:
+            self.save_image(filename)
+        return filename
+
     def load_user_preset(self, filename):
         """
         Loads the preset given by the file name. If the preset does not exist,
@@ -306,16 +325,25 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         Connects a device in the Spike software. For USB devices, you need to
         provide the serial number of the device to connect. For networked devices,
         send a string with form: SOCKET::IP::PORT example, SOCKET::192.168.1.1::12345
-        Returns 0 or 1 depending on if the device successfully opened.
+        Returns True or False depending on if the device successfully opened.
         params: connection_string (str): The connection string of the device to connect.
                                          For USB, this is the serial number. For networked,
                                          it's in the format SOCKET::IP::PORT.
         """
-        comm = f":SYST:DEV:CON {connection_string}"
-        self.instrument.write(comm)
-        # The documentation states it returns 0 or 1, but this is a 'write' command,
-        # so we'd typically query a status afterward if available.
-        # For now, we'll just print a message indicating the command was sent.
+        comm = f":SYST:DEV:CON? {connection_string}"
+        # CONnect? is a query, connecting can take 3-20 seconds.
+        response = self.instrument.query(comm)
+        try:
+            status = int(response)
+            if status == 1:
+                print(f"Device {connection_string} connected.")
+                return True
+            else:
+                print(f"Device {connection_string} could not be connected.")
+                return False
+        except ValueError:
+            print(f"Invalid response for device connection: {response}")
+            return None
 
     def disconnect_device(self):
         """
@@ -348,6 +376,7 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         print("All errors cleared from the error queue.")
     
     #Measurement Mode Controls
+    @validation.validate(mode=MODE)
     def set_mode(self, mode):
         """
         Determines the current measurement mode.
@@ -355,12 +384,8 @@ class SpectrumAnalyzer(mandatory.Mandatory):
                       'SA', 'RTSA', 'ZS', 'HARMonics', 'NA', 'PNoise', 'DDEMod',
                       'EMI', 'ADEMod', 'IH', 'SEMask', 'NFIGure', 'WLAN', 'BLE', 'LTE'.
         """
-        if mode.upper() in self.allowed_modes:
-            comm = f":INST:SEL {mode.upper()}"
-            self.instrument.write(comm)
-            
-        else:
-            print(f"Invalid mode: '{mode}'. Allowed modes are: {', '.join(self.allowed_modes)}")
+        comm = f":INST:SEL {mode}"
+        self.instrument.write(comm)
 
     def get_mode(self):
         """
@@ -412,6 +437,25 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         # If continuous is enabled, this command has no effect as per documentation.
         # You might want to check get_continuous_measurement_status() before call
 
+    def stream_traces(self, count=None, accumulator=None):
+        """
+        Takes sweeps one after the other and yields each fetched trace.
+        Continuous measurement should be disabled so every trace comes from a new sweep.
+        params: count (int): Number of sweeps, None sweeps until the caller stops iterating.
+                accumulator (spectrum_analyzer_helper.TraceAccumulator): Updated with every
+                    trace before it is yielded, so its statistics are always current.
+        Yields: numpy.ndarray: The trace (see get_trace_data).
+        """
+        taken = 0
+        while count is None or taken < count:
+            # *OPC? returns once the sweep started by INIT:IMM has finished.
+            self.instrument.query(":INIT:IMM;*OPC?")
+            trace = self.get_trace_data()
+            if accumulator is not None:
+                accumulator.update(trace)
+            taken += 1
+            yield trace
+
     #Limit Lines
     """These commands control the limit lines which are available in sweep, 
     real-time, and network analysis measurement modes. """
@@ -435,6 +479,7 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         return (status==1)
         
     
+    @validation.validate(state=STATE)
     def set_limit_line_state(self, line_num, state):
         """
         Enables or disables limit line testing. If there are not at least 2 points
@@ -443,12 +488,8 @@ class SpectrumAnalyzer(mandatory.Mandatory):
                 state (str or int): 'ON', 'OFF', 1 (for ON), or 0 (for OFF).
         """
         self._validate_line_num(line_num)
-
-        if state in self.valid_booleans:
-            comm = f":CALC:LLINE{line_num}:STAT {state}"
-            self.instrument.write(comm)
-        else:
-            print(f"Invalid state: '{state}'. Allowed values are: {self.valid_booleans}")
+        comm = f":CALC:LLINE{line_num}:STAT {state}"
+        self.instrument.write(comm)
 
 
     def set_limit_line_title(self, line_num, title):
@@ -493,6 +534,7 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         trace = self.instrument.query(comm)
         return trace
 
+    @validation.validate(line_type=validation.Choice("UPPer", "LOWer", name="limit line type"))
     def set_limit_line_type(self, line_num, line_type):
         """
         Specifies whether the limit line is an upper or lower bound.
@@ -500,12 +542,8 @@ class SpectrumAnalyzer(mandatory.Mandatory):
                 line_type (str): 'UPPer' for upper bound, 'LOWer' for lower bound.
         """
         self._validate_line_num(line_num)
-        line_type_upper = line_type.upper()
-        if line_type_upper in ['UPPER', 'LOWER']:
-            comm = f":CALC:LLINE{line_num}:TYPE {line_type_upper}"
-            self.instrument.write(comm)
-        else:
-            print(f"Invalid limit line type: '{line_type}'. Allowed values are 'UPPer' or 'LOWer'.")
+        comm = f":CALC:LLINE{line_num}:TYPE {line_type}"
+        self.instrument.write(comm)
 
     def get_limit_line_type(self, line_num):
         """
@@ -518,6 +556,7 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         line_type = self.instrument.query(comm)
         return line_type
 
+    @validation.validate(reference_type=validation.Choice("FIXed", "RELative", name="reference type"))
     def set_limit_line_reference(self, line_num, reference_type):
         """
         Specifies whether the limit line values are fixed/absolute or relative
@@ -526,12 +565,8 @@ class SpectrumAnalyzer(mandatory.Mandatory):
                 reference_type (str): 'FIXed' for fixed/absolute, 'RELative' for relative.
         """
         self._validate_line_num(line_num)
-        reference_type_upper = reference_type.upper()
-        if reference_type_upper in ['FIXED', 'RELATIVE']:
-            comm = f":CALC:LLINE{line_num}:REFerence {reference_type_upper}"
-            self.instrument.write(comm)
-        else:
-            print(f"Invalid reference type: '{reference_type}'. Allowed values are 'FIXed' or 'RELative'.")
+        comm = f":CALC:LLINE{line_num}:REFerence {reference_type}"
+        self.instrument.write(comm)
 
     def get_limit_line_reference(self, line_num):
         """
@@ -553,6 +588,7 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         comm = f":CALC:LLINE{line_num}:REFerence:TRANsform"
         self.instrument.write(comm)
 
+    @validation.validate(interpolation_type=validation.Choice("LINear", "LOGarithmic", name="interpolation type"))
     def set_limit_line_interpolation(self, line_num, interpolation_type):
         """
         Specifies whether the limit line uses linear or logarithmic interpolation.
@@ -560,12 +596,8 @@ class SpectrumAnalyzer(mandatory.Mandatory):
                 interpolation_type (str): 'LINear' for linear, 'LOGarithmic' for logarithmic.
         """
         self._validate_line_num(line_num)
-        interpolation_type_upper = interpolation_type.upper()
-        if interpolation_type_upper in ['LINEAR', 'LOGARITHMIC']:
-            comm = f":CALC:LLINE{line_num}:INTerpolate {interpolation_type_upper}"
-            self.instrument.write(comm)
-        else:
-            print(f"Invalid interpolation type: '{interpolation_type}'. Allowed values are 'LINear' or 'LOGarithmic'.")
+        comm = f":CALC:LLINE{line_num}:INTerpolate {interpolation_type}"
+        self.instrument.write(comm)
 
     def get_limit_line_interpolation(self, line_num):
         """
@@ -578,6 +610,7 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         interpolation = self.instrument.query(comm)
         return interpolation
 
+    @validation.validate(state=STATE)
     def set_limit_line_pause_state(self, line_num, state):
         """
         When enabled, a failure of this limit will pause the sweep update.
@@ -585,12 +618,8 @@ class SpectrumAnalyzer(mandatory.Mandatory):
                 state (str or int): 'ON', 'OFF', 1 (for ON), or 0 (for OFF).
         """
         self._validate_line_num(line_num)
-
-        if state in self.valid_booleans:
-            comm = f":CALC:LLINE{line_num}:PAUSE:STATe {state}"
-            self.instrument.write(comm)
-        else:
-            print(f"Invalid state: '{state}'. Allowed values are: {self.valid_booleans}")
+        comm = f":CALC:LLINE{line_num}:PAUSE:STATe {state}"
+        self.instrument.write(comm)
 
     def get_limit_line_pause_state(self, line_num):
         """
@@ -603,6 +632,7 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         status = self.instrument.query(comm)
         return (1==status)
 
+    @validation.validate(state=STATE)
     def set_limit_line_display_visibility(self, line_num, state):
         """
         When enabled, the limit line will be visible on the graticule.
@@ -610,12 +640,8 @@ class SpectrumAnalyzer(mandatory.Mandatory):
                 state (str or int): 'ON', 'OFF', 1 (for ON), or 0 (for OFF).
         """
         self._validate_line_num(line_num)
-
-        if state in self.valid_booleans:
-            comm = f":CALC:LLINE{line_num}:DISP:STATe {state}"
-            self.instrument.write(comm)
-        else:
-            print(f"Invalid state: '{state}'. Allowed values are: {self.valid_booleans}")
+        comm = f":CALC:LLINE{line_num}:DISP:STATe {state}"
+        self.instrument.write(comm)
 
     def is_limit_line_display_visible(self, line_num):
         """
@@ -628,6 +654,7 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         status = self.instrument.query(comm)
         return (1==status)
 
+    @validation.validate(state=STATE)
     def change_limit_line_result_visibility(self, line_num, state):
         """
         When enabled, the limit line pass/fail result will be visible on the graticule.
@@ -635,12 +662,8 @@ class SpectrumAnalyzer(mandatory.Mandatory):
                 state (str or int): 'ON', 'OFF', 1 (for ON), or 0 (for OFF).
         """
         self._validate_line_num(line_num)
-
-        if state in self.valid_booleans:
-            comm = f":CALC:LLINE{line_num}:DISP:RES:STAT {state}"
-            self.instrument.write(comm)
-        else:
-            print(f"Invalid state: '{state}'. Allowed values are: {self.valid_booleans}")
+        comm = f":CALC:LLINE{line_num}:DISP:RES:STAT {state}"
+        self.instrument.write(comm)
 
     def is_limit_line_result_visible(self, line_num):
         """
@@ -733,6 +756,16 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         status = self.instrument.query(comm)
         return (status == 0)
 
+    def get_limit_mask(self, line_num):
+        """
+        Reads a limit line definition once so traces can be tested on this computer.
+        params: line_num (int): The limit line number (1-6).
+        Returns: spectrum_analyzer_helper.LimitMask: The limit line, align it to the trace
+                 frequencies and test fetched traces with it.
+        """
+        self._validate_line_num(line_num)
+        return spectrum_analyzer_helper.LimitMask.from_spectrum_analyzer(self, line_num)
+
     def clear_all_limit_lines(self):
         """
         Resets all limit lines. Removes all points stored.
@@ -745,6 +778,7 @@ class SpectrumAnalyzer(mandatory.Mandatory):
     real-time, zero-span, harmonics, digital modulation analysis, 
     EMC precompliance, analog demod, and interference hunting measurement modes."""
 
+    @validation.validate(state=STATE)
     def set_path_loss_table_state(self, table_num, state):
         """
         Enables or disables application of this path loss table.
@@ -752,12 +786,9 @@ class SpectrumAnalyzer(mandatory.Mandatory):
                 state (str or int): 'ON', 'OFF', 1 (for ON), or 0 (for OFF).
         """
         self._validate_pathloss_table_num(table_num)
-        
-        if state in self.valid_booleans:
-            comm = f":SENS:CORR:PATH{table_num}:STAT {state}"
-            self.instrument.write(comm)
-        else:
-            print(f"Invalid state: '{state}'. Allowed values are: {self.valid_booleans}")
+        comm = f":SENS:CORR:PATH{table_num}:STAT {state}"
+        self.instrument.write(comm)
+        self._path_loss_states[table_num] = state == "ON"
 
     def get_path_loss_table_state(self, table_num):
         """
@@ -768,7 +799,8 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         self._validate_pathloss_table_num(table_num)
         comm = f":SENS:CORR:PATH{table_num}:STAT?"
         status = self.instrument.query(comm)
-        return (status == '1')
+        self._path_loss_states[table_num] = (status.strip() == '1')
+        return self._path_loss_states[table_num]
 
     def set_path_loss_table_description(self, table_num, description):
         """
@@ -798,13 +830,22 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         params: table_num (int): The path loss table number (1-8).
                 points_data (dict): (frequency, offset) pairs where frequency is in Hz and offset is in dB.
         """
-        data = ""
-        for key in points_data.keys():
-            data = data + str(key) + "," + str(points_data[key]) + ","
+        self.set_path_loss_table_points(table_num, list(points_data.keys()), list(points_data.values()))
 
+    def set_path_loss_table_points(self, table_num, freqs, offsets):
+        """
+        Uploads a whole path loss table with a single write, overwriting any existing points.
+        params: table_num (int): The path loss table number (1-8).
+                freqs (array-like): Frequencies in Hz.
+                offsets (array-like): Offsets in dB, one per frequency.
+        """
         self._validate_pathloss_table_num(table_num)
-        comm = f":SENS:CORR:PATH{table_num}:DATA {data[0:data.__len__()-1]}"
+        if len(freqs) != len(offsets):
+            raise ValueError("Path loss tables need one offset per frequency.")
+        table = spectrum_analyzer_helper.PathLossTable(freqs, offsets)
+        comm = f":SENS:CORR:PATH{table_num}:DATA {table.to_scpi()}"
         self.instrument.write(comm)
+        self._path_loss_tables[table_num] = table
 
     def get_path_loss_table_points_count(self, table_num):
         """
@@ -822,18 +863,44 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         Returns the points in the path loss table. Points are returned as freq/offset
         pairs where the frequencies are specified as Hz and the offsets as dB.
         params: table_num (int): The path loss table number (1-8).
-        Returns: dict : (frequency,offset) 
+        Returns: dict : (frequency,offset) as floats, sorted by frequency.
         """
-        self._validate_pathloss_table_num(table_num)
-        comm = f":SENS:CORR:PATH{table_num}:DATA?"
-        data = self.instrument.query(comm)
-        #TODO Test data is correct in unit test
-        data_list = data.split(',')
-        data_dict = {}
-        for i in range(0,data_list,2):
-            data_dict[data_list[i]] = data_list[i+1]
+        table = self.get_path_loss_table(table_num, refresh=True)
+        return dict(zip(table.freqs.tolist(), table.offsets.tolist()))
 
-        return data_dict
+    def get_path_loss_table(self, table_num, refresh=False):
+        """
+        Returns the path loss table, read from Spike only the first time (or when refresh is True).
+        params: table_num (int): The path loss table number (1-8).
+                refresh (bool): Read the table again, e.g. after it was changed in the Spike application.
+        Returns: spectrum_analyzer_helper.PathLossTable: The points as sorted read-only arrays.
+        """
+        self._validate_pathloss_table_num(table_num)
+        if refresh or table_num not in self._path_loss_tables:
+            comm = f":SENS:CORR:PATH{table_num}:DATA?"
+            data = self.instrument.query(comm)
+            self._path_loss_tables[table_num] = spectrum_analyzer_helper.PathLossTable.from_response(data)
+        return self._path_loss_tables[table_num]
+
+    def apply_path_loss(self, trace, freqs, table_nums, interpolation="LINEAR", out=None):
+        """
+        Applies path loss tables to fetched traces on this computer (trace + offset).
+        Tables enabled on the Spike are refused: the Spike already applies them to the traces it returns.
+        params: trace (array-like): One trace or a batch of traces (n_traces, n_points).
+                freqs (array-like): The trace frequencies in Hz (see get_trace_frequencies).
+                table_nums (int or list): The tables to apply, disabled on the Spike.
+                interpolation (str): 'LINear' or 'LOGarithmic' interpolation between the points.
+                out (numpy.ndarray): Output array, pass trace to correct in place.
+        Returns: numpy.ndarray: The corrected trace(s).
+        """
+        if isinstance(table_nums, int):
+            table_nums = [table_nums]
+        for n in table_nums:
+            enabled = self._path_loss_states[n] if n in self._path_loss_states else self.get_path_loss_table_state(n)
+            if enabled:
+                raise ValueError(f"Path loss table {n} is enabled on the Spike, which already applies it to the traces.")
+        tables = [self.get_path_loss_table(n) for n in table_nums]
+        return spectrum_analyzer_helper.apply_path_loss(trace, freqs, tables, interpolation, out)
 
     def clear_path_loss_table(self, table_num):
         """
@@ -843,6 +910,7 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         self._validate_pathloss_table_num(table_num)
         comm = f":SENS:CORR:PATH{table_num}:CLE"
         self.instrument.write(comm)
+        self._path_loss_tables.pop(table_num, None)
 
     def clear_all_path_loss_tables(self):
         """
@@ -850,21 +918,18 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         """
         comm = ":SENS:CORR:PATH:ALL:CLE"
         self.instrument.write(comm)
+        self._path_loss_tables.clear()
 #Reference Oscillscope Controls
     """These commands control the reference oscillator settings the of the spectrum analyzer."""
+    @validation.validate(source=validation.Choice("INTernal", "EXTernal", "OUTput", name="reference source"))
     def set_reference_oscillator_source(self, source):
         """
         Configures the reference oscillator source of the spectrum analyzer.
         params: source (str): The desired reference source. Allowed values are:
                               'INTERNAL', 'EXTERNAL', 'OUTPUT'.
         """
-        allowed_sources = ['INTERNAL', 'EXTERNAL', 'OUTPUT', 'INT', 'EXT', 'OUT']
-        source_upper = source.upper()
-        if source_upper in allowed_sources:
-            comm = f":SENSE:ROSCILLATOR:SOURCE {source_upper}"
-            self.instrument.write(comm)
-        else:
-            print(f"Invalid source: '{source}'. Allowed values are: {', '.join(allowed_sources)}")
+        comm = f":SENSE:ROSCILLATOR:SOURCE {source}"
+        self.instrument.write(comm)
 
     def get_reference_oscillator_source(self):
         """
@@ -896,6 +961,111 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         except ValueError:
             raise ValueError(f"Unexpected response for frequency center step size (not numeric): '{response}'")
 
+    def _query_float(self, command: str) -> float:
+        response = self.instrument.query(command).strip()
+        try:
+            return float(response)
+        except ValueError:
+            raise ValueError(f"Unexpected response for {command} (not numeric): '{response}'")
+
+    def set_sense_frequency_start(self, frequency_hz: float):
+        """
+        Sets the start frequency of the sweep.
+        Parameters:
+        frequency_hz: The start frequency in Hz.
+        """
+        self.instrument.write(f"SENSE:FREQ:STAR {frequency_hz}")
+
+    def get_sense_frequency_start(self) -> float:
+        """
+        Queries the start frequency of the sweep in Hz.
+        """
+        return self._query_float("SENSE:FREQ:STAR?")
+
+    def set_sense_frequency_stop(self, frequency_hz: float):
+        """
+        Sets the stop frequency of the sweep.
+        Parameters:
+        frequency_hz: The stop frequency in Hz.
+        """
+        self.instrument.write(f"SENSE:FREQ:STOP {frequency_hz}")
+
+    def get_sense_frequency_stop(self) -> float:
+        """
+        Queries the stop frequency of the sweep in Hz.
+        """
+        return self._query_float("SENSE:FREQ:STOP?")
+
+    def set_sense_frequency_center(self, frequency_hz: float):
+        """
+        Sets the center frequency of the sweep.
+        Parameters:
+        frequency_hz: The center frequency in Hz.
+        """
+        self.instrument.write(f"SENSE:FREQ:CENT {frequency_hz}")
+
+    def get_sense_frequency_center(self) -> float:
+        """
+        Queries the center frequency of the sweep in Hz.
+        """
+        return self._query_float("SENSE:FREQ:CENT?")
+
+    def set_sense_frequency_span(self, span_hz: float):
+        """
+        Sets the span of the sweep.
+        Parameters:
+        span_hz: The span in Hz.
+        """
+        self.instrument.write(f"SENSE:FREQ:SPAN {span_hz}")
+
+    def get_sense_frequency_span(self) -> float:
+        """
+        Queries the span of the sweep in Hz.
+        """
+        return self._query_float("SENSE:FREQ:SPAN?")
+
+    def sweep_wideband(self, start_hz: float, stop_hz: float, rbw_hz: float,
+                       max_points: int = None, overlap_rbws: float = None):
+        """
+        Sweeps a span wider than one acquisition in segments and returns one stitched trace.
+        The segments are planned with spectrum_analyzer_helper.plan_sweep. Each segment is
+        configured, swept and fetched with as few round trips as possible, while the previous
+        segment is decoded and trimmed on a worker thread. The frequency settings of the last
+        segment stay active afterwards.
+        Parameters:
+        start_hz, stop_hz: The frequency range in Hz.
+        rbw_hz: The largest acceptable resolution bandwidth in Hz.
+        max_points: Maximum number of trace points per segment.
+        overlap_rbws: Overlap between neighbouring segments in RBWs, removed when stitching.
+        Returns:
+        tuple: (freqs, amps) of the stitched trace, frequencies in Hz increasing.
+        """
+        kwargs = {}
+        if max_points is not None:
+            kwargs['max_points'] = max_points
+        if overlap_rbws is not None:
+            kwargs['overlap_rbws'] = overlap_rbws
+        plan = spectrum_analyzer_helper.plan_sweep(start_hz, stop_hz, rbw_hz, **kwargs)
+        self.set_sense_bandwidth_resolution(plan.rbw)
+        if self._trace_format is None:
+            self._trace_format = self.get_trace_format().strip().upper()
+        real = self._trace_format.startswith("REAL")
+
+        def fetch(segment):
+            # Configure and sweep in one message, *OPC? returns when the sweep is done.
+            self.instrument.query(f"SENSE:FREQ:STAR {segment.start};:SENSE:FREQ:STOP {segment.stop};"
+                                  f":INIT:IMM;*OPC?")
+            axis = spectrum_analyzer_helper.split_compound_response(
+                self.instrument.query(":TRAC:XSTA?;:TRAC:XINC?"), 2)
+            if real:
+                self.instrument.write(":TRAC:DATA?")
+                data = self.instrument.read_raw()
+            else:
+                data = self.instrument.query(":TRAC:DATA?")
+            return float(axis[0]), float(axis[1]), data
+
+        return spectrum_analyzer_helper.run_sweep_plan(plan, fetch, "REAL" if real else "ASCII")
+
 #Power Controls
     """These commands affect the RF front end of the device.    
     Not all settings are available for each Signal Hound spectrum analyzer. 
@@ -1102,18 +1272,13 @@ class SpectrumAnalyzer(mandatory.Mandatory):
     """These commands control the FFT processing for the receivers. 
     These settings are highly coupled with the frequency range and sweep time."""
     
+    @validation.validate(shape_type=validation.Choice("FLATtop", "NUTtall", "GAUSsian", name="shape type"))
     def set_sense_bandwidth_shape(self, shape_type: str):
         """
         Specifies the FFT window function for bandwidth shaping.
         Parameters:
         shape_type (str): The shape type. Allowed values are 'FLATTOP', 'NUTTALL', 'GAUSSIAN'.
         """
-        valid_shapes = {"FLATTOP", "NUTTALL", "GAUSSIAN", "FLAT", "NUT", "GAUS"}
-        shape_upper = shape_type.upper()
-        if shape_upper not in valid_shapes:
-            raise ValueError(f"Invalid shape type: '{shape_type}'. Must be 'FLATTOP', 'NUTTALL', or 'GAUSSIAN'.")
-        
-
         self.instrument.write(f"SENSE:BAND:SHAP {shape_type}")
 
     def get_sense_bandwidth_shape(self) -> str:
@@ -1124,21 +1289,32 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         """
         response = self.instrument.query("SENSE:BAND:SHAP?").strip()
         return response
+
+    def set_sense_bandwidth_resolution(self, rbw_hz: float):
+        """
+        Sets the resolution bandwidth. Spike uses RBWs in 1-3-10 steps, see
+        spectrum_analyzer_helper.rbw_step to choose one.
+        Parameters:
+        rbw_hz (float): The resolution bandwidth in Hz.
+        """
+        self.instrument.write(f"SENSE:BAND {rbw_hz}")
+
+    def get_sense_bandwidth_resolution(self) -> float:
+        """
+        Queries the resolution bandwidth in Hz.
+        """
+        return self._query_float("SENSE:BAND?")
 #Sweep Controls
     """The sweep commands control additional FFT settings of the receiver."""
+    @validation.validate(function_type=validation.Choice("AVERage", "MINMax", "MIN", "MAX",
+                                                         name="detector function type"))
     def set_sweep_detector_function(self, function_type: str):
         """
         Controls how the VBW processing is performed.
         Parameters:
         function_type (str): Allowed values are 'AVERAGE', 'MINMAX', 'MIN', 'MAX'.
         """
-        valid_functions = {"AVERAGE", "MINMAX", "MIN", "MAX", "AVER", "MINM", "MIN", "MAX"}
-        function_upper = function_type.upper()
-        if function_upper not in valid_functions:
-            raise ValueError(f"Invalid detector function type: '{function_type}'. Must be 'AVERAGE', 'MINMAX', 'MIN', or 'MAX'.")
-        
-
-        self.instrument.write(f"SENSE:SWE:DET:FUNC {function_upper}")
+        self.instrument.write(f"SENSE:SWE:DET:FUNC {function_type}")
 
     def get_sweep_detector_function(self) -> str:
         """
@@ -1157,19 +1333,14 @@ class SpectrumAnalyzer(mandatory.Mandatory):
             return "MAX"
         return response
 
+    @validation.validate(units_type=validation.Choice("POWer", "SAMPle", "VOLTage", "LOG", name="detector units type"))
     def set_sweep_detector_units(self, units_type: str):
         """
         Controls the units in which the detector function is performed.
         Parameters:
         units_type (str): Allowed values are 'POWER', 'SAMPLE', 'VOLTAGE', 'LOG'.
         """
-        valid_units = {"POWER", "SAMPLE", "VOLTAGE", "LOG", "POW", "SAMP", "VOLT", "LOG"}
-        units_upper = units_type.upper()
-        if units_upper not in valid_units:
-            raise ValueError(f"Invalid detector units type: '{units_type}'. Must be 'POWER', 'SAMPLE', 'VOLTAGE', or 'LOG'.")
-        
-
-        self.instrument.write(f"SENSE:SWE:DET:UNIT {units_upper}")
+        self.instrument.write(f"SENSE:SWE:DET:UNIT {units_type}")
 
     def get_sweep_detector_units(self) -> str:
         """
@@ -1202,17 +1373,15 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         except ValueError:
             raise ValueError(f"Unexpected response for TRACE:SELECT? (not numeric): '{response}'")
 
+    @validation.validate(trace_type=validation.Choice("OFF", "WRITE", "AVERAGE", "MAXHOLD", "MINHOLD", "MINMAX",
+                                                      name="trace type"))
     def set_trace_type(self, trace_type: str):
         """
         Specifies the behavior of the trace.
         Parameters:
         trace_type (str): Allowed values are 'OFF', 'WRITE', 'AVERAGE', 'MAXHOLD', 'MINHOLD', 'MINMAX'.
         """
-        valid_types = {"OFF", "WRITE", "AVERAGE", "MAXHOLD", "MINHOLD", "MINMAX"}
-        trace_type_upper = trace_type.upper()
-        if trace_type_upper not in valid_types:
-            raise ValueError(f"Invalid trace type: '{trace_type}'. Must be one of {valid_types}.")
-        self.instrument.write(f":TRAC:TYPE {trace_type_upper}")
+        self.instrument.write(f":TRAC:TYPE {trace_type}")
 
     def set_trace_average_count(self, count: int):
         """
@@ -1308,6 +1477,49 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         """
         response = self.instrument.query(":TRAC:XINC?")
         return float(response)
+
+    def get_trace_data(self) -> np.ndarray:
+        """
+        Retrieves the selected trace in the format set with set_trace_format.
+        REAL is read as one binary block of 32 bit floats, which is much faster than ASCii.
+        Returns:
+        numpy.ndarray: The trace amplitudes (float32), one per trace point.
+        """
+        if self._trace_format is None:
+            self._trace_format = self.get_trace_format().strip().upper()
+        if self._trace_format.startswith("REAL"):
+            self.instrument.write(":TRAC:DATA?")
+            return spectrum_analyzer_helper.parse_trace_data(self.instrument.read_raw(), "REAL")
+        return spectrum_analyzer_helper.parse_trace_data(self.instrument.query(":TRAC:DATA?"), "ASCII")
+
+    def get_trace_frequencies(self, points: int) -> np.ndarray:
+        """
+        Returns the frequency of every point of the selected trace in Hz.
+        Parameters:
+        points (int): The number of trace points (the length of get_trace_data()).
+        """
+        return spectrum_analyzer_helper.trace_frequencies(self.get_trace_xstart(), self.get_trace_xincrement(), points)
+
+    def find_trace_peaks(self, excursion_db: float = None, threshold_db: float = None, ndb: float = 3.0,
+                         sort: str = "AMPLITUDE") -> np.ndarray:
+        """
+        Fetches the selected trace and finds all of its peaks on this computer instead of
+        moving the Spike marker from peak to peak.
+        Parameters:
+        excursion_db (float): Peak excursion in dB. Defaults to the marker peak excursion (get_peak_excursion).
+        threshold_db (float): Peak threshold. Defaults to the marker peak threshold (get_peak_threshold).
+        ndb (float): Peak bandwidths are measured ndb dB below the peak.
+        sort (str): 'AMPLITUDE' or 'FREQUENCY'.
+        Returns:
+        numpy.ndarray: The peaks, see spectrum_analyzer_helper.find_peaks.
+        """
+        if excursion_db is None:
+            excursion_db = self.get_peak_excursion()
+        if threshold_db is None:
+            threshold_db = self.get_peak_threshold()
+        trace = self.get_trace_data()
+        freqs = self.get_trace_frequencies(len(trace))
+        return spectrum_analyzer_helper.find_peaks(trace, freqs, excursion_db, threshold_db, ndb, sort=sort)
     
 #Marker Controls
     """The marker commands control the Spike sweep markers."""
@@ -1362,17 +1574,14 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         response = self.instrument.query(":CALC:MARK:TRAC?")
         return int(response)
 
+    @validation.validate(mode=validation.Choice("POSition", "NOISE", "CHPower", "NDB", name="marker mode"))
     def set_marker_mode(self, mode: str):
         """
         Switches between positional and noise marker modes.
         Parameters:
         mode (str): 'POSITION', 'NOISE', 'CHPOWER', 'NDB'.
         """
-        valid_modes = {"POSITION", "NOISE", "POS", "CHPOWER","CHP","NDB"}
-        mode_upper = mode.upper()
-        if mode_upper not in valid_modes:
-            raise ValueError(f"Invalid marker mode: '{mode}'. Must be 'POSITION' or 'NOISE'.")
-        self.instrument.write(f":CALC:MARK:MODE {mode_upper}")
+        self.instrument.write(f":CALC:MARK:MODE {mode}")
 
     def get_marker_mode(self) -> str:
         """
@@ -1600,17 +1809,14 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         response = self.instrument.query(":CALC:MATH:RES?")
         return int(response)
 
+    @validation.validate(operation=validation.Choice("PDIFF", "PSUM", "LOFFSET", "LDIFF", name="operation"))
     def set_trace_math_operation(self, operation: str):
         """
         Specifies the trace math function.
         Parameters:
         operation (str): Allowed values are 'PDIFF', 'PSUM', 'LOFFSET', 'LDIFF'.
         """
-        valid_operations = {"PDIFF", "PSUM", "LOFFSET", "LDIFF"}
-        operation_upper = operation.upper()
-        if operation_upper not in valid_operations:
-            raise ValueError(f"Invalid operation: '{operation}'. Must be one of {valid_operations}.")
-        self.instrument.write(f":CALC:MATH:OP {operation_upper}")
+        self.instrument.write(f":CALC:MATH:OP {operation}")
 
     def get_trace_math_operation(self) -> str:
         """
@@ -1649,6 +1855,7 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         enable (bool): True to enable channel power measurement, False to disable.
         """
         self.instrument.write(f":SENS:CHP:STAT {'1' if enable else '0'}")
+        self._measurement_states['channel_power'] = bool(enable)
 
     def is_channel_power_enabled(self) -> bool:
         """
@@ -1657,7 +1864,8 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         bool: True if enabled, False otherwise.
         """
         response = self.instrument.query(":SENS:CHP:STAT?")
-        return response == '1'
+        self._measurement_states['channel_power'] = response.strip() == '1'
+        return self._measurement_states['channel_power']
 
     def set_channel_power_trace(self, trace_index: int):
         """
@@ -1822,6 +2030,7 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         enable (bool): True to enable, False to disable.
         """
         self.instrument.write(f":SENS:OBW:STAT {'1' if enable else '0'}")
+        self._measurement_states['occupied_bandwidth'] = bool(enable)
 
     def is_occupied_bandwidth_enabled(self) -> bool:
         """
@@ -1830,7 +2039,8 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         bool: True if enabled, False otherwise.
         """
         response = self.instrument.query(":SENS:OBW:STAT?")
-        return response == '1'
+        self._measurement_states['occupied_bandwidth'] = response.strip() == '1'
+        return self._measurement_states['occupied_bandwidth']
 
     def set_occupied_bandwidth_trace(self, trace_index: int):
         """
@@ -1904,6 +2114,7 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         enable (bool): True to enable, False to disable.
         """
         self.instrument.write(f":SENS:IMD:STAT {'1' if enable else '0'}")
+        self._measurement_states['intermodulation'] = bool(enable)
 
     def is_intermodulation_distortion_enabled(self) -> bool:
         """
@@ -1912,7 +2123,8 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         bool: True if enabled, False otherwise.
         """
         response = self.instrument.query(":SENS:IMD:STAT?")
-        return response == '1'
+        self._measurement_states['intermodulation'] = response.strip() == '1'
+        return self._measurement_states['intermodulation']
 
     def get_intermodulation_frequency(self, product: str) -> float:
         """
@@ -1958,6 +2170,39 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         response = self.instrument.query(f":SENS:IMD:TOI? {product.upper()}")
         return float(response)
     
+    def read_measurements(self, sweep: bool = False):
+        """
+        Reads the results of every enabled channel power, occupied bandwidth and
+        intermodulation measurement with one compound query.
+        The enable states are remembered from the enable_/is_..._enabled calls; states that
+        are not known yet are queried once, also with a single compound query.
+        Parameters:
+        sweep (bool): Trigger a sweep (INIT:IMM) and wait for it in the same message before
+                      reading, for one round trip per sweep with continuous measurement off.
+        Returns:
+        spectrum_analyzer_helper.MeasurementResults: The results, None for disabled measurements.
+        """
+        unknown = [m for m in spectrum_analyzer_helper.MEASUREMENT_STATE_QUERIES if m not in self._measurement_states]
+        if unknown:
+            queries = [spectrum_analyzer_helper.MEASUREMENT_STATE_QUERIES[m] for m in unknown]
+            response = self.instrument.query(spectrum_analyzer_helper.build_compound_query(queries))
+            for measurement, state in zip(unknown, spectrum_analyzer_helper.split_compound_response(response, len(queries))):
+                self._measurement_states[measurement] = state == '1'
+        enabled = [m for m in spectrum_analyzer_helper.MEASUREMENT_STATE_QUERIES if self._measurement_states[m]]
+        fields = [(field, query) for m in enabled for field, query in spectrum_analyzer_helper.MEASUREMENT_QUERIES[m]]
+        queries = [query for _, query in fields]
+        if sweep:
+            queries.insert(0, ":INIT:IMM;*OPC?")
+        if not queries:
+            return spectrum_analyzer_helper.MeasurementResults()
+        response = self.instrument.query(spectrum_analyzer_helper.build_compound_query(queries))
+        values = spectrum_analyzer_helper.split_compound_response(response, len(queries))
+        if sweep:
+            # The *OPC? answer of the sweep.
+            values = values[1:]
+        return spectrum_analyzer_helper.MeasurementResults(
+            **{field: float(value) for (field, _), value in zip(fields, values)})
+
 # Peak Table Controls
     """These commands control the Peak Table display panel in Swept Analysis mode."""
     def enable_peak_table(self, enable: bool):
@@ -2028,17 +2273,14 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         response = self.instrument.query(":SENS:PEAK:TABL:EXC?")
         return float(response)
 
+    @validation.validate(sort_type=validation.Choice("FREQUENCY", "AMPLITUDE", name="sort type"))
     def set_peak_table_sort(self, sort_type: str):
         """
         Specifies the sort order of the table. Allowed values: 'FREQUENCY', 'AMPLITUDE'.
         Parameters:
         sort_type (str): The sort order.
         """
-        valid_types = {"FREQUENCY", "AMPLITUDE"}
-        sort_type_upper = sort_type.upper()
-        if sort_type_upper not in valid_types:
-            raise ValueError(f"Invalid sort type: '{sort_type}'. Must be 'FREQUENCY' or 'AMPLITUDE'.")
-        self.instrument.write(f":SENS:PEAK:TABL:SORT {sort_type_upper}")
+        self.instrument.write(f":SENS:PEAK:TABL:SORT {sort_type}")
 
     def get_peak_table_sort(self) -> str:
         """
@@ -2117,4 +2359,41 @@ class SpectrumAnalyzer(mandatory.Mandatory):
         float: The amplitude delta in dB.
         """
         response = self.instrument.query(f":SENS:PEAK:TABL:AMPL:DELT? {peak_index}")
-        return response
\ No newline at end of file
+        return float(response)
+
+    def read_peak_table(self) -> np.ndarray:
+        """
+        Reads the whole peak table with one count query and compound queries for the rows,
+        instead of four queries per peak.
+        Returns:
+        numpy.ndarray: Structured array with the fields freq (Hz), amp (dBm), dfreq (Hz) and damp (dB),
+                       one row per peak in the order of the table.
+        """
+        count = self.get_peak_table_count()
+        table = np.zeros(count, dtype=spectrum_analyzer_helper.PEAK_TABLE_DTYPE)
+        spectrum_analyzer_helper.read_peak_rows(self.instrument, range(1, count + 1),
+                                                ('freq', 'amp', 'dfreq', 'damp'), table)
+        return table
+
+    def track_peak_table(self):
+        """
+        Reads the peak table after a new sweep and reports which rows changed.
+        Only frequency and amplitude are read, the deltas to the first peak are computed
+        locally and only for the table kept from the previous call, which is updated in place.
+        Returns:
+        tuple: (table, changed). table is the peak table (see read_peak_table), changed the
+               indices of the rows that are new or differ from the previous call.
+        """
+        count = self.get_peak_table_count()
+        previous = self._peak_table
+        if count != len(previous):
+            self._peak_table = np.zeros(count, dtype=spectrum_analyzer_helper.PEAK_TABLE_DTYPE)
+            kept = min(count, len(previous))
+            self._peak_table[:kept] = previous[:kept]
+        table = self._peak_table
+        old = table[['freq', 'amp']].copy()
+        spectrum_analyzer_helper.read_peak_rows(self.instrument, range(1, count + 1), ('freq', 'amp'), table)
+        spectrum_analyzer_helper.update_peak_deltas(table)
+        changed = (table['freq'] != old['freq']) | (table['amp'] != old['amp'])
+        changed[len(previous):] = True
+        return table, np.flatnonzero(changed)
\ No newline at end of file
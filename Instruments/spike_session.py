@@ -0,0 +1,134 @@
+"""
+Session with the Spike software for long unattended runs.
+
+A SpikeSession owns the connection to Spike (a transport.ReconnectingResource,
+so a dropped socket is reopened and pure queries are repeated transparently;
+writes raise after the reconnect), keeps the wanted device
+connected and resets the instrument state the fast way: loading a user preset
+takes well under a second, while a full preset power cycles the device for
+6-20 s. When a full preset is needed it runs on a background thread so the
+caller can keep working until it needs the instrument again.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from Instruments import transport
+from Instruments.spectrum_analyzer_signal_hound import SpectrumAnalyzer
+
+# Timeouts in ms for the slow Spike operations.
+PRESET_TIMEOUT = 30000
+CONNECT_TIMEOUT = 30000
+
+
+class SpikeSession():
+
+    def __init__(self, address=transport.SPIKE_ADDRESS, device=None, preset_file=None,
+                 timeout=5000, factory=None, retries=3, retry_delay=1.0):
+        """
+        Parameters:
+        address (str): VISA address of the Spike SCPI server.
+        device (str, optional): Connection string of the device to use (serial number or
+                                SOCKET::IP::PORT). None uses the active or the first available device.
+        preset_file (str, optional): User preset loaded by reset_state instead of a full preset.
+        timeout (int): I/O timeout in ms.
+        factory (callable, optional): Opens the resource, defaults to transport.open_resource(address).
+        retries (int): Reconnect attempts per call when the socket drops.
+        retry_delay (float): Seconds before the first reconnect attempt.
+        """
+        if factory is None:
+            factory = lambda: transport.open_resource(address, timeout)
+        self.device = device
+        self.preset_file = preset_file
+        self.resource = transport.ReconnectingResource(factory, retries, retry_delay,
+                                                       on_reconnect=self._on_reconnect)
+        self.analyzer = SpectrumAnalyzer(self.resource)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="spike-preset")
+        self._preset = None
+
+    def _with_timeout(self, timeout, function, *args):
+        """Run function with a longer I/O timeout, without other threads using the connection."""
+        with self.resource.lock:
+            previous = self.resource.timeout
+            self.resource.timeout = timeout
+            try:
+                return function(*args)
+            finally:
+                self.resource.timeout = previous
+
+    def _on_reconnect(self, resource):
+        # Spike keeps its settings when the socket drops, only the device may have gone.
+        print("Reconnected to Spike.")
+        self.ensure_device()
+
+    def is_device_connected(self):
+        """True if a device is active in Spike (and it is the wanted device, if one was given)."""
+        if not self.analyzer.get_device_active_status():
+            return False
+        if self.device is None:
+            return True
+        return self.analyzer.get_current_device_connection_string().strip() == self.device
+
+    def ensure_device(self, attempts=3):
+        """
+        Connect the device if it is not active. Returns True once it is connected,
+        raises RuntimeError if it cannot be connected.
+        """
+        if self.is_device_connected():
+            return True
+        device = self.device
+        if device is None:
+            devices = [d for d in self.analyzer.get_device_list() if d]
+            if not devices:
+                raise RuntimeError("No Signal Hound device available to connect.")
+            device = devices[0]
+        elif self.analyzer.get_device_active_status():
+            # Another device is active.
+            self.analyzer.disconnect_device()
+        for _ in range(attempts):
+            if self._with_timeout(CONNECT_TIMEOUT, self.analyzer.connect_device, device):
+                return True
+        raise RuntimeError(f"Could not connect device {device} after {attempts} attempts.")
+
+    def start_preset(self):
+        """
+        Start a full preset on a background thread and return its Future (result True if the
+        preset succeeded). Calls on the session block until the preset is done.
+        """
+        if self._preset is None or self._preset.done():
+            self._preset = self._executor.submit(self._run_preset)
+        return self._preset
+
+    def _run_preset(self):
+        # PRESet? presets and answers once the device has been reopened.
+        return self._with_timeout(PRESET_TIMEOUT, self.analyzer.is_preset_successful)
+
+    def wait_for_preset(self, timeout=None):
+        """Wait for a preset started with start_preset. Returns its result, True if none is running."""
+        if self._preset is None:
+            return True
+        return self._preset.result(timeout)
+
+    def reset_state(self, wait=True):
+        """
+        Bring Spike to a known state. With a preset_file the user preset is loaded, which
+        is much faster than a full preset. Otherwise a full preset is started in the
+        background; with wait=False its Future is returned instead of waiting for it.
+        """
+        if self.preset_file is not None:
+            with self.resource.lock:
+                self.analyzer.load_user_preset(self.preset_file)
+                self.analyzer.is_operation_complete()
+            return True
+        preset = self.start_preset()
+        return preset.result() if wait else preset
+
+    def close(self):
+        """Wait for a running preset and close the connection. Spike itself keeps running."""
+        self._executor.shutdown(wait=True)
+        self.resource.close()
+
+    def __enter__(self):
+        self.ensure_device()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
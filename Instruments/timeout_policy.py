@@ -0,0 +1,129 @@
+"""
+Per operation I/O timeouts.
+
+A single large instrument timeout makes every failed command hang, a small one cuts
+off screenshots and waveform downloads. A TimeoutPolicy gives every bulk transfer
+a timeout from its expected size and the measured speed of the link, and puts the
+resource timeout back afterwards so ordinary commands keep failing fast:
+
+    with policy.transfer(instrument, expected_bytes) as transfer:
+        instrument.write(":DISPlay:DATA? PNG")
+        data = instrument.read_raw()
+        transfer.nbytes = len(data)
+
+The link speed is learned from the completed transfers, the latency from short
+commands timed with policy.command().
+"""
+import threading
+import time
+from contextlib import contextmanager
+
+import pyvisa
+
+# Bytes per point of the :WAVeform:FORMat settings (ASCii is up to 13 characters and a comma).
+WAVEFORM_BYTES_PER_POINT = {"BYTE": 1, "WORD": 2, "ASC": 14}
+# Upper limits of the :DISPlay:DATA? image sizes of the 800x480 screen.
+DISPLAY_IMAGE_SIZES = {"BMP24": 800 * 480 * 3 + 54, "BMP8": 800 * 480 + 1078,
+                       "PNG": 800 * 480 * 3, "JPEG": 800 * 480 * 3, "TIFF": 800 * 480 * 3 + 1024}
+# The event table has no size query, this covers a full table.
+EVENT_TABLE_SIZE = 1 << 18
+# Length of a TMC block header.
+TMC_HEADER_SIZE = 11
+
+
+def waveform_size(points, fmt="BYTE"):
+    """Expected size in bytes of a :WAVeform:DATA? response of points points."""
+    per_point = next((size for name, size in WAVEFORM_BYTES_PER_POINT.items() if fmt.upper().startswith(name)),
+                     WAVEFORM_BYTES_PER_POINT["ASC"])
+    return TMC_HEADER_SIZE + points * per_point
+
+
+def display_size(fmt=None):
+    """Expected size in bytes of a :DISPlay:DATA? image, BMP24 if fmt is None."""
+    return TMC_HEADER_SIZE + DISPLAY_IMAGE_SIZES.get((fmt or "BMP24").upper(), DISPLAY_IMAGE_SIZES["BMP24"])
+
+
+class Transfer():
+    """Handle of a running transfer, set nbytes to the size actually read."""
+
+    def __init__(self, nbytes, timeout):
+        self.nbytes = nbytes
+        self.timeout = timeout
+
+
+class TimeoutPolicy():
+
+    def __init__(self, throughput=1e6, latency=0.05, safety=3.0, minimum=1000, maximum=120000, smoothing=0.3):
+        """
+        Parameters:
+        throughput (float): Initial estimate of the link speed in bytes/s (USB 2.0 instruments
+                            reach a few MB/s).
+        latency (float): Initial estimate of the time to answer a command in s.
+        safety (float): Factor between the expected duration and the timeout.
+        minimum (int): Shortest timeout in ms.
+        maximum (int): Longest timeout in ms.
+        smoothing (float): Weight of a new measurement in the running estimates (0 to 1).
+        """
+        self.throughput = throughput
+        self.latency = latency
+        self.safety = safety
+        self.minimum = minimum
+        self.maximum = maximum
+        self.smoothing = smoothing
+        self._lock = threading.Lock()
+
+    def expected_duration(self, nbytes):
+        """Expected duration in s of a transfer of nbytes bytes."""
+        return self.latency + nbytes / self.throughput
+
+    def timeout(self, nbytes):
+        """Timeout in ms for a transfer of nbytes bytes."""
+        timeout = 1000 * self.safety * self.expected_duration(nbytes)
+        return int(min(max(timeout, self.minimum), self.maximum))
+
+    def observe(self, nbytes, duration):
+        """Update the link estimates with a completed transfer of nbytes bytes that took duration s."""
+        with self._lock:
+            transfer_time = duration - self.latency
+            if nbytes >= 1 << 16 and transfer_time > 0:
+                self.throughput += self.smoothing * (nbytes / transfer_time - self.throughput)
+            elif nbytes < 1 << 12:
+                self.latency += self.smoothing * (duration - self.latency)
+
+    def timed_out(self):
+        """A transfer timed out: assume a slower link, so the next attempt gets more time."""
+        with self._lock:
+            self.throughput /= 2
+
+    @contextmanager
+    def command(self):
+        """Time a short command or query (no bulk data) to learn the latency, the timeout is not changed."""
+        start = time.perf_counter()
+        yield
+        self.observe(0, time.perf_counter() - start)
+
+    @contextmanager
+    def transfer(self, resource, nbytes):
+        """
+        Set the timeout of resource for a transfer of about nbytes bytes and restore it afterwards.
+
+        Yields:
+        Transfer: Set its nbytes to the size actually read, for learning the link speed.
+        """
+        handle = Transfer(nbytes, self.timeout(nbytes))
+        previous = getattr(resource, 'timeout', None)
+        # None means the resource waits forever, nothing to adjust.
+        if previous is not None:
+            resource.timeout = handle.timeout
+        start = time.perf_counter()
+        try:
+            yield handle
+        except pyvisa.errors.VisaIOError as e:
+            if e.error_code == pyvisa.constants.StatusCode.error_timeout:
+                self.timed_out()
+            raise
+        else:
+            self.observe(handle.nbytes, time.perf_counter() - start)
+        finally:
+            if previous is not None:
+                resource.timeout = previous
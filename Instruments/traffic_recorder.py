@@ -0,0 +1,304 @@
+"""
+Record the SCPI traffic of an experiment and replay it without the instrument.
+
+RecordingResource wraps a resource (see transport.py) and appends every write,
+query, read and read_raw with its start time, duration and response to a compact
+binary trace file. summarize and latency_histograms show where the time went:
+
+    python -m Instruments.traffic_recorder run.trace --top 10 --histogram
+
+ReplayResource answers from a trace file, so the host side processing of a run can
+be repeated at full speed: Oscilloscope(ReplayResource("run.trace")).
+
+A trace file is the MAGIC header followed by one record per call: RECORD (operation,
+start time in s since the recording started, duration in s, command and response
+lengths), then the command and the response bytes.
+"""
+import argparse
+import struct
+import threading
+import time
+from collections import namedtuple
+
+import numpy as np
+import pyvisa
+
+MAGIC = b"SCPITRC1"
+RECORD = struct.Struct("<Bdfii")
+
+WRITE, QUERY, READ, READ_RAW = 0, 1, 2, 3
+OPERATIONS = {WRITE: "write", QUERY: "query", READ: "read", READ_RAW: "read_raw"}
+# Set on the operation when the call raised. The response is then the VISA status code,
+# or the exception text for other errors.
+ERROR = 0x80
+
+TraceRecord = namedtuple('TraceRecord', ['operation', 'start', 'duration', 'command', 'response', 'error'])
+CommandSummary = namedtuple('CommandSummary', ['path', 'count', 'total_time', 'mean_time', 'max_time', 'response_bytes'])
+
+
+class RecordingResource():
+    """
+    Resource that passes every call to resource and records it in a trace file.
+
+    Attributes that are not defined here (timeout, read_termination, ...) are passed
+    to the wrapped resource. Use as a context manager or call close to flush the file.
+    The pyvisa helpers (query_binary_values, ...) are passed through too and are not
+    recorded, the drivers read binary blocks with write and read_raw.
+    """
+
+    def __init__(self, resource, path, record_responses=True):
+        """
+        Parameters:
+        resource: The resource to record, e.g. a pyvisa resource.
+        path (str): Trace file, overwritten.
+        record_responses (bool): Also store the response bytes (needed for replay). Without
+                                 them only the response sizes are recorded.
+        """
+        object.__setattr__(self, 'resource', resource)
+        object.__setattr__(self, 'record_responses', record_responses)
+        object.__setattr__(self, '_file', open(path, "wb", buffering=1 << 20))
+        object.__setattr__(self, '_lock', threading.Lock())
+        object.__setattr__(self, '_t0', time.perf_counter())
+        self._file.write(MAGIC)
+
+    def _record(self, operation, start, command, response):
+        duration = time.perf_counter() - start
+        command = command.encode()
+        if isinstance(response, str):
+            response = response.encode()
+        size = len(response)
+        if not self.record_responses and not operation & ERROR:
+            # A negative length means only the size was recorded.
+            response, size = b"", -size
+        with self._lock:
+            self._file.write(RECORD.pack(operation, start - self._t0, duration, len(command), size))
+            self._file.write(command)
+            self._file.write(response)
+
+    def _call(self, operation, command, *args):
+        method = getattr(self.resource, OPERATIONS[operation])
+        start = time.perf_counter()
+        try:
+            result = method(*args)
+        except Exception as e:
+            if isinstance(e, pyvisa.errors.VisaIOError):
+                text = str(int(e.error_code))
+            else:
+                text = f"{type(e).__name__}: {e}"
+            self._record(operation | ERROR, start, command, text)
+            raise
+        response = b"" if operation == WRITE else result
+        self._record(operation, start, command, response)
+        return result
+
+    def write(self, message):
+        return self._call(WRITE, message, message)
+
+    def query(self, message):
+        return self._call(QUERY, message, message)
+
+    def read(self):
+        return self._call(READ, "")
+
+    def read_raw(self, *args):
+        return self._call(READ_RAW, "", *args)
+
+    def flush(self):
+        with self._lock:
+            self._file.flush()
+
+    def close(self, close_resource=True):
+        """Close the trace file and (unless close_resource is False) the wrapped resource."""
+        with self._lock:
+            self._file.close()
+        if close_resource:
+            self.resource.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __getattr__(self, name):
+        return getattr(self.resource, name)
+
+    def __setattr__(self, name, value):
+        setattr(self.resource, name, value)
+
+
+def read_trace(path):
+    """Yield the TraceRecord of every call in a trace file."""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a SCPI trace file.")
+        while True:
+            header = f.read(RECORD.size)
+            if len(header) < RECORD.size:
+                # End of file, or a recording that was not closed.
+                return
+            operation, start, duration, command_length, size = RECORD.unpack(header)
+            command = f.read(command_length).decode()
+            if size < 0:
+                response = -size
+            else:
+                response = f.read(size)
+                if operation & ERROR or operation in (QUERY, READ):
+                    response = response.decode()
+            yield TraceRecord(OPERATIONS[operation & ~ERROR], start, duration, command, response,
+                              bool(operation & ERROR))
+
+
+def scpi_path(command):
+    """The command header without its parameters, e.g. ':WAV:DATA?'."""
+    return command.split(None, 1)[0].upper() if command.strip() else ""
+
+
+def _paths(records):
+    """Pair every record with its SCPI path. Reads belong to the command written before them."""
+    last = ""
+    for record in records:
+        if record.operation in ("read", "read_raw"):
+            path = last
+        else:
+            path = scpi_path(record.command)
+            last = path
+        yield path, record
+
+
+def summarize(records, top=None):
+    """
+    Time spent per SCPI path, slowest total first.
+
+    Parameters:
+    records (iterable): TraceRecords, e.g. read_trace(path).
+    top (int, optional): Only return the top entries.
+
+    Returns:
+    list: A CommandSummary per path. response_bytes counts the bytes of the responses.
+    """
+    totals = {}
+    for path, record in _paths(records):
+        size = record.response if isinstance(record.response, int) else len(record.response)
+        count, total, longest, nbytes = totals.get(path, (0, 0.0, 0.0, 0))
+        totals[path] = (count + 1, total + record.duration, max(longest, record.duration), nbytes + size)
+    summary = [CommandSummary(path, count, total, total / count, longest, nbytes)
+               for path, (count, total, longest, nbytes) in totals.items()]
+    summary.sort(key=lambda s: s.total_time, reverse=True)
+    return summary[:top] if top is not None else summary
+
+
+def latency_histograms(records, bins=None):
+    """
+    Histogram of the call durations per SCPI path.
+
+    Parameters:
+    records (iterable): TraceRecords, e.g. read_trace(path).
+    bins (array-like, optional): Bin edges in s, defaults to 0 and 2 bins per decade from 10 us to 100 s.
+
+    Returns:
+    tuple: (bin edges, {path: counts}).
+    """
+    if bins is None:
+        bins = np.concatenate(([0], np.logspace(-5, 2, 15)))
+    durations = {}
+    for path, record in _paths(records):
+        durations.setdefault(path, []).append(record.duration)
+    return bins, {path: np.histogram(values, bins)[0] for path, values in durations.items()}
+
+
+def format_summary(summary):
+    lines = [f"{'command':<32}{'calls':>8}{'total s':>12}{'mean ms':>10}{'max ms':>10}{'bytes':>12}"]
+    for s in summary:
+        lines.append(f"{s.path or '(read)':<32}{s.count:>8}{s.total_time:>12.4f}{s.mean_time * 1e3:>10.3f}"
+                     f"{s.max_time * 1e3:>10.3f}{s.response_bytes:>12}")
+    return "\n".join(lines)
+
+
+def format_histograms(bins, histograms, paths=None):
+    lines = []
+    for path in paths if paths is not None else histograms:
+        lines.append(path or "(read)")
+        counts = histograms[path]
+        width = max(counts.max(), 1)
+        for low, high, count in zip(bins[:-1], bins[1:], counts):
+            if count:
+                lines.append(f"  {low * 1e3:>10.3f} - {high * 1e3:<10.3f} ms {count:>7} {'#' * int(40 * count / width)}")
+    return "\n".join(lines)
+
+
+class ReplayResource():
+    """
+    Resource that answers with the responses of a trace file, in the recorded order.
+
+    Calls must match the recording: a different operation or command raises ValueError
+    (with strict=False only the operation is checked). Recorded errors are raised again,
+    VISA errors as pyvisa.errors.VisaIOError so driver error handling is exercised too.
+    Attributes (timeout, ...) are accepted and ignored.
+    """
+
+    def __init__(self, trace, strict=True):
+        """
+        Parameters:
+        trace (str or iterable): Trace file or TraceRecords. The responses must have been recorded.
+        strict (bool): Check that the commands match the recording.
+        """
+        self.records = list(read_trace(trace) if isinstance(trace, str) else trace)
+        self.strict = strict
+        self.position = 0
+
+    def _next(self, operation, command):
+        if self.position >= len(self.records):
+            raise ValueError(f"No more recorded traffic for {operation} {command!r}.")
+        record = self.records[self.position]
+        if record.operation != operation or (self.strict and record.command != command):
+            raise ValueError(f"Call {self.position} was {record.operation} {record.command!r} in the recording, "
+                             f"not {operation} {command!r}.")
+        self.position += 1
+        if record.error:
+            if record.response.lstrip("-").isdigit():
+                raise pyvisa.errors.VisaIOError(int(record.response))
+            raise RuntimeError(f"Recorded error: {record.response}")
+        if isinstance(record.response, int):
+            raise ValueError(f"Call {self.position - 1} was recorded without its response.")
+        return record.response
+
+    def write(self, message):
+        self._next("write", message)
+        return len(message)
+
+    def query(self, message):
+        return self._next("query", message)
+
+    def read(self):
+        return self._next("read", "")
+
+    def read_raw(self, *args):
+        return self._next("read_raw", "")
+
+    def remaining(self):
+        """Number of recorded calls not replayed yet."""
+        return len(self.records) - self.position
+
+    def close(self):
+        pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarize a SCPI trace file.")
+    parser.add_argument("trace", help="Trace file written by RecordingResource.")
+    parser.add_argument("--top", type=int, default=20, help="Number of commands to show.")
+    parser.add_argument("--histogram", action="store_true", help="Show the latency histogram of these commands.")
+    args = parser.parse_args(argv)
+    records = list(read_trace(args.trace))
+    summary = summarize(records, args.top)
+    print(f"{len(records)} calls, {sum(r.duration for r in records):.3f} s in I/O")
+    print(format_summary(summary))
+    if args.histogram:
+        bins, histograms = latency_histograms(records)
+        print()
+        print(format_histograms(bins, histograms, [s.path for s in summary]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,347 @@
+"""
+Connections to the instruments.
+
+The drivers only need an object with write, query and read_raw (a pyvisa
+resource). The classes in this file provide such objects with extra behaviour,
+e.g. ReconnectingResource reopens a dropped TCP connection to the Spike software
+without the driver noticing, and SocketResource talks to LAN instruments over a
+plain TCP socket instead of VISA.
+"""
+import re
+import socket
+import threading
+import time
+
+import pyvisa
+
+from Instruments import validation
+
+# Spike listens on this TCP port and terminates messages with a newline.
+SPIKE_PORT = 5025
+SPIKE_ADDRESS = f"TCPIP::127.0.0.1::{SPIKE_PORT}::SOCKET"
+# Raw socket port of the Rigol oscilloscopes (see Oscilloscope.get_lan_visa_address for the IP).
+RIGOL_SOCKET_PORT = 5555
+
+SOCKET_ADDRESS = re.compile(r"^TCPIP\d*::([^:]+)::(\d+)::SOCKET$", re.IGNORECASE)
+# Queries that change the instrument state, as short form header nodes. They are never
+# repeated after a lost connection: a preset or a device connect may already be running.
+SIDE_EFFECT_QUERIES = {("SYST", "PRES"), ("SYST", "DEV", "CON")}
+
+
+def socket_address(host, port):
+    """VISA address of a raw socket, e.g. socket_address('192.168.1.10', RIGOL_SOCKET_PORT)."""
+    return f"TCPIP::{host}::{port}::SOCKET"
+
+
+def open_resource(address, timeout=None, resource_manager=None, native_socket=False):
+    """
+    Open a pyvisa resource. Socket resources get newline termination, as used by Spike.
+
+    Parameters:
+    address (str): VISA address, e.g. 'TCPIP::127.0.0.1::5025::SOCKET'.
+    timeout (int, optional): I/O timeout in ms.
+    resource_manager (pyvisa.ResourceManager, optional): Defaults to a new resource manager.
+    native_socket (bool): Open socket addresses as a SocketResource, without VISA.
+    """
+    match = SOCKET_ADDRESS.match(address)
+    if native_socket and match:
+        return SocketResource(match.group(1), int(match.group(2)), 5000 if timeout is None else timeout)
+    if resource_manager is None:
+        resource_manager = pyvisa.ResourceManager()
+    resource = resource_manager.open_resource(address)
+    if address.upper().endswith("::SOCKET"):
+        resource.read_termination = "\n"
+        resource.write_termination = "\n"
+    if timeout is not None:
+        resource.timeout = timeout
+    return resource
+
+
+def is_connection_error(error):
+    """True if error means the connection is gone (as opposed to e.g. a timeout)."""
+    if isinstance(error, (TimeoutError, socket.timeout)):
+        # Subclasses of OSError, but the connection is still there.
+        return False
+    if isinstance(error, (ConnectionError, BrokenPipeError)):
+        return True
+    if isinstance(error, pyvisa.errors.VisaIOError):
+        return error.error_code in (pyvisa.constants.StatusCode.error_connection_lost,
+                                    pyvisa.constants.StatusCode.error_invalid_object)
+    return isinstance(error, OSError)
+
+
+def is_query_only(message):
+    """
+    True if every command of message is a query (header ending with '?') without side
+    effects, e.g. ':FREQ:CENT?;:FREQ:SPAN?'. Queries in SIDE_EFFECT_QUERIES do not count.
+    """
+    for part in message.split(";"):
+        header = part.strip().split(" ", 1)[0]
+        if not header.endswith("?") or tuple(validation.header_nodes(header)) in SIDE_EFFECT_QUERIES:
+            return False
+    return True
+
+
+class ReconnectingResource():
+    """
+    Resource that reopens its connection when it is lost and repeats the failed call.
+
+    Only queries that consist of queries alone (every header ends with '?', see
+    is_query_only) are repeated by default: a write or a query such as ':INIT:IMM;*OPC?' may have reached the
+    instrument before the connection dropped, and sending it again could e.g. start a
+    second sweep. For those the connection is reopened and the error raised, unless
+    retry_writes is set. A lost read is never repeated, its response is gone.
+
+    Calls are serialized with lock, so one resource can be shared between threads
+    (e.g. a background preset and the measurement loop). Hold lock to run several
+    calls without other threads in between. Attributes that are not
+    defined here (timeout, read_termination, ...) are passed to the current resource
+    and set again after a reconnect.
+    """
+
+    def __init__(self, factory, retries=3, retry_delay=1.0, on_reconnect=None, retry_writes=False):
+        """
+        Parameters:
+        factory (callable): Opens and returns a new resource, e.g. lambda: open_resource(address).
+        retries (int): How many times a call is retried after reconnecting.
+        retry_delay (float): Seconds to wait before reconnecting, doubled after every failed attempt.
+        on_reconnect (callable, optional): Called with this resource after every reconnect,
+                                           e.g. to restore instrument state.
+        retry_writes (bool): Also repeat writes and queries containing commands. Only for
+                             callers whose commands can safely be sent twice (settings).
+        """
+        object.__setattr__(self, '_factory', factory)
+        object.__setattr__(self, 'retries', retries)
+        object.__setattr__(self, 'retry_delay', retry_delay)
+        object.__setattr__(self, 'on_reconnect', on_reconnect)
+        object.__setattr__(self, 'retry_writes', retry_writes)
+        object.__setattr__(self, 'reconnects', 0)
+        object.__setattr__(self, '_settings', {})
+        object.__setattr__(self, 'lock', threading.RLock())
+        object.__setattr__(self, '_resource', factory())
+
+    def _reconnect(self):
+        try:
+            self._resource.close()
+        except Exception:
+            pass
+        object.__setattr__(self, '_resource', self._factory())
+        for name, value in self._settings.items():
+            setattr(self._resource, name, value)
+        object.__setattr__(self, 'reconnects', self.reconnects + 1)
+        if self.on_reconnect is not None:
+            self.on_reconnect(self)
+
+    def _try_reconnect(self, method, delay):
+        """Wait delay seconds and reopen the connection. Returns False if it is still unreachable."""
+        print(f"Connection lost ({method}), reconnecting in {delay} s.")
+        time.sleep(delay)
+        try:
+            self._reconnect()
+            return True
+        except Exception as e:
+            if not is_connection_error(e):
+                raise
+            return False
+
+    def _call(self, method, *args, repeat=True):
+        with self.lock:
+            delay = self.retry_delay
+            for attempt in range(self.retries + 1):
+                try:
+                    return getattr(self._resource, method)(*args)
+                except Exception as e:
+                    if attempt == self.retries or not is_connection_error(e):
+                        raise
+                    if not repeat:
+                        # Reconnect for the next call, but do not send the command again.
+                        for _ in range(self.retries):
+                            if self._try_reconnect(method, delay):
+                                break
+                            delay *= 2
+                        raise
+                # Still unreachable after this: the next attempt fails again and retries.
+                self._try_reconnect(method, delay)
+                delay *= 2
+
+    def write(self, message):
+        return self._call('write', message, repeat=self.retry_writes)
+
+    def query(self, message):
+        return self._call('query', message, repeat=self.retry_writes or is_query_only(message))
+
+    def read(self):
+        return self._call('read', repeat=False)
+
+    def read_raw(self, *args):
+        return self._call('read_raw', *args, repeat=False)
+
+    def close(self):
+        with self.lock:
+            self._resource.close()
+
+    def __getattr__(self, name):
+        return getattr(self._resource, name)
+
+    def __setattr__(self, name, value):
+        if name in ('retries', 'retry_delay', 'on_reconnect', 'retry_writes'):
+            object.__setattr__(self, name, value)
+            return
+        self._settings[name] = value
+        setattr(self._resource, name, value)
+
+
+class SocketResource():
+    """
+    Resource talking to an instrument over a plain TCP socket, without VISA.
+
+    It has the write/query/read/read_raw surface the drivers use. Nagle's algorithm is
+    off (small commands go out at once), the socket gets a large receive buffer and
+    responses are received with recv_into into preallocated memory: a definite length
+    block (#N...) is read straight into one buffer of its final size. read_raw returns
+    a complete block even if it contains the termination character.
+
+    Timeouts raise pyvisa.errors.VisaIOError like a VISA resource, a closed connection
+    raises ConnectionError (see ReconnectingResource).
+    """
+
+    def __init__(self, host, port, timeout=5000, read_termination="\n", write_termination="\n",
+                 chunk_size=1 << 16, receive_buffer=1 << 22, encoding="ascii"):
+        """
+        Parameters:
+        host (str): Instrument IP address or host name.
+        port (int): TCP port, e.g. SPIKE_PORT or RIGOL_SOCKET_PORT.
+        timeout (int or None): I/O timeout in ms, None waits forever.
+        read_termination (str): End of the responses.
+        write_termination (str): Appended to every command.
+        chunk_size (int): Initial size of the buffer for terminated responses, grown as needed.
+        receive_buffer (int): Requested size of the kernel receive buffer (SO_RCVBUF) in bytes.
+        encoding (str): Encoding of commands and text responses.
+        """
+        self.read_termination = read_termination
+        self.write_termination = write_termination
+        self.encoding = encoding
+        self._socket = socket.create_connection((host, port), None if timeout is None else timeout / 1000)
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        try:
+            self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, receive_buffer)
+        except OSError:
+            # The OS keeps its default size.
+            pass
+        self.timeout = timeout
+        # Received bytes not returned yet are _buffer[_start:_end].
+        self._buffer = bytearray(chunk_size)
+        self._start = 0
+        self._end = 0
+
+    @property
+    def timeout(self):
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, timeout):
+        self._timeout = timeout
+        self._socket.settimeout(None if timeout is None else timeout / 1000)
+
+    def _receive(self, view):
+        """recv_into view, returns the number of bytes received."""
+        try:
+            n = self._socket.recv_into(view)
+        except socket.timeout:
+            raise pyvisa.errors.VisaIOError(pyvisa.constants.StatusCode.error_timeout)
+        if n == 0:
+            raise ConnectionError("The instrument closed the connection.")
+        return n
+
+    def _fill(self):
+        """Receive more data into the buffer, making room first."""
+        if self._start == self._end:
+            self._start = self._end = 0
+        elif self._end == len(self._buffer):
+            if self._start > 0:
+                pending = self._end - self._start
+                self._buffer[:pending] = self._buffer[self._start:self._end]
+                self._start, self._end = 0, pending
+            else:
+                self._buffer.extend(bytes(len(self._buffer)))
+        self._end += self._receive(memoryview(self._buffer)[self._end:])
+
+    def _read_until(self, termination):
+        """Bytes up to and including termination."""
+        searched = self._start
+        while True:
+            index = self._buffer.find(termination, searched, self._end)
+            if index >= 0:
+                end = index + len(termination)
+                data = bytes(self._buffer[self._start:end])
+                self._start = end
+                return data
+            searched = max(self._start, self._end - len(termination) + 1)
+            offset = self._start
+            self._fill()
+            # _fill may have moved the pending data to the front of the buffer.
+            searched = max(self._start, searched - (offset - self._start))
+
+    def _read_exact(self, n):
+        """Ensure at least n bytes are in the buffer and return the view of the first n."""
+        while self._end - self._start < n:
+            self._fill()
+        return memoryview(self._buffer)[self._start:self._start + n]
+
+    def _read_into(self, view):
+        """Fill view, first from the buffer, then straight from the socket."""
+        pending = min(self._end - self._start, len(view))
+        view[:pending] = self._buffer[self._start:self._start + pending]
+        self._start += pending
+        received = pending
+        while received < len(view):
+            received += self._receive(view[received:])
+
+    def write(self, message):
+        data = (message + self.write_termination).encode(self.encoding)
+        self._socket.sendall(data)
+        return len(data)
+
+    def read_raw(self, size=None):
+        """
+        Read one response. A definite length block is read completely, with its header and
+        termination, like the pyvisa read_raw the drivers expect. size is accepted for
+        compatibility and ignored.
+        """
+        termination = self.read_termination.encode(self.encoding)
+        if bytes(self._read_exact(1)) != b"#":
+            return self._read_until(termination)
+        digits = bytes(self._read_exact(2)[1:])
+        if not digits.isdigit() or digits == b"0":
+            # Not a block, or an indefinite block ending with the termination.
+            return self._read_until(termination)
+        header = bytes(self._read_exact(2 + int(digits)))
+        if not header[2:].isdigit():
+            return self._read_until(termination)
+        self._start += len(header)
+        # Room for the termination too, so appending it never reallocates the block.
+        length = len(header) + int(header[2:])
+        response = bytearray(length + len(termination))
+        response[:len(header)] = header
+        self._read_into(memoryview(response)[len(header):length])
+        # The termination after the block, normally nothing else.
+        tail = self._read_until(termination)
+        if tail == termination:
+            response[length:] = tail
+        else:
+            del response[length:]
+            response += tail
+        return response
+
+    def read(self):
+        response = self.read_raw().decode(self.encoding)
+        if self.read_termination and response.endswith(self.read_termination):
+            response = response[:-len(self.read_termination)]
+        return response
+
+    def query(self, message):
+        self.write(message)
+        return self.read()
+
+    def close(self):
+        self._socket.close()
@@ -0,0 +1,198 @@
+"""
+Argument validation for the driver methods, built once at import.
+
+A Choice accepts the long or the short form of SCPI keywords in any case (plus
+numbers and their string form) and returns the canonical value, a Range checks and
+coerces numbers, Boolean turns True/1/"on" into "ON". The validate decorator
+applies them to the arguments of a method:
+
+    @validation.validate(channel=CHANNEL, coupling_mode=validation.Choice("AC", "DC", "GND"))
+    def set_channel_coupling_mode(self, channel, coupling_mode):
+
+Invalid arguments raise ValueError. In trusted, tight loops the checks can be
+switched off for all drivers with set_enabled(False) or the trusted() context.
+The arguments are then sent as given, so pass them in their canonical form
+("ON", "CHANnel1", ...).
+"""
+import functools
+import inspect
+from contextlib import contextmanager
+
+_enabled = True
+
+
+def set_enabled(enabled):
+    """Switch the validation of all decorated methods on or off (for all threads)."""
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def is_enabled():
+    return _enabled
+
+
+@contextmanager
+def trusted():
+    """Run a block without argument validation."""
+    previous = _enabled
+    set_enabled(False)
+    try:
+        yield
+    finally:
+        set_enabled(previous)
+
+
+def short_form(name):
+    """
+    Return the SCPI short form of a keyword: the leading upper case characters and the
+    numeric suffix, e.g. FREQ for FREQuency and CHAN1 for CHANnel1.
+    """
+    short = ""
+    for char in name:
+        if char.islower():
+            break
+        short += char
+    if len(short) < len(name):
+        suffix = name[len(name.rstrip("0123456789")):]
+        short += suffix
+    return short
+
+
+def short_node(node):
+    """
+    SCPI short form of a header node given in any case: CHAN1 for CHANnel1, CHANNEL1 and CHAN1.
+    Without the case of the manual, a long form keeps its first four characters, three if
+    the fourth is a vowel (IEEE 488.2 rule).
+    """
+    node = node.rstrip("?")
+    if any(c.islower() for c in node) and any(c.isupper() for c in node):
+        return short_form(node).upper()
+    name = node.rstrip("0123456789").upper()
+    suffix = node[len(name):]
+    if len(name) > 4:
+        name = name[:3] if name[3] in "AEIOU" else name[:4]
+    return name + suffix
+
+
+def header_nodes(command):
+    """The short form nodes of the header of command, e.g. ['CHAN1', 'OFFS'] for ':CHANnel1:OFFSet 2'."""
+    return [short_node(node) for node in command.strip().split(None, 1)[0].lstrip(":").split(":")]
+
+
+class Choice():
+    """One of a fixed set of values. Returns the value as it was given to the constructor."""
+
+    def __init__(self, *values, name="value"):
+        self.values = values
+        self.name = name
+        # Every accepted spelling maps to the canonical value.
+        lookup = {}
+        for value in values:
+            if isinstance(value, str):
+                lookup[value.upper()] = value
+                lookup[short_form(value)] = value
+            else:
+                lookup[value] = value
+                lookup[str(value)] = value
+        self._lookup = lookup
+
+    def __call__(self, value):
+        key = value.strip().upper() if isinstance(value, str) else value
+        try:
+            return self._lookup[key]
+        except (KeyError, TypeError):
+            raise ValueError(f"Invalid {self.name} ({value}). Choose from {self.values}.")
+
+    def __contains__(self, value):
+        try:
+            self(value)
+        except ValueError:
+            return False
+        return True
+
+
+class Range():
+    """A number between low and high (inclusive), converted to type. keywords (e.g. "MIN", "MAX") are accepted too."""
+
+    def __init__(self, low=None, high=None, type=float, keywords=(), name="value"):
+        self.low = low
+        self.high = high
+        self.type = type
+        self.name = name
+        self.keywords = Choice(*keywords, name=name) if keywords else None
+
+    def __call__(self, value):
+        if self.keywords is not None and isinstance(value, str) and value in self.keywords:
+            return self.keywords(value)
+        try:
+            number = float(value)
+            if self.type is int:
+                if number != int(number):
+                    raise ValueError
+                number = int(number)
+            else:
+                number = self.type(number)
+        except (TypeError, ValueError, OverflowError):
+            raise ValueError(f"Invalid {self.name} ({value}). Must be a {self.type.__name__}.")
+        if (self.low is not None and number < self.low) or (self.high is not None and number > self.high):
+            raise ValueError(f"Invalid {self.name} ({value}). Must be between {self.low} and {self.high}.")
+        return number
+
+
+class Boolean():
+    """True/False, 1/0 or "ON"/"OFF" in any case. Returns "ON" or "OFF"."""
+
+    _lookup = {True: "ON", False: "OFF", "ON": "ON", "OFF": "OFF", "1": "ON", "0": "OFF", "TRUE": "ON", "FALSE": "OFF"}
+
+    def __init__(self, name="state"):
+        self.name = name
+
+    def __call__(self, value):
+        key = value.strip().upper() if isinstance(value, str) else value
+        try:
+            return self._lookup[key]
+        except (KeyError, TypeError):
+            raise ValueError(f"Invalid {self.name} ({value}). Choose from ON, OFF, True, False, 1 or 0.")
+
+
+class ListOf():
+    """A single value or a list of values, each checked with check. Returns a list."""
+
+    def __init__(self, check):
+        self.check = check
+
+    def __call__(self, values):
+        if values is None:
+            return None
+        if isinstance(values, (str, int, float)):
+            values = [values]
+        return [self.check(value) for value in values]
+
+
+def validate(**validators):
+    """
+    Decorator validating and converting the named arguments of a function before the call.
+    The argument positions are looked up once, when the function is decorated.
+    """
+    def decorator(function):
+        parameters = list(inspect.signature(function).parameters)
+        unknown = set(validators) - set(parameters)
+        if unknown:
+            raise TypeError(f"{function.__name__} has no arguments {sorted(unknown)}.")
+        checks = tuple((parameters.index(name), name, check) for name, check in validators.items())
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+            if checks:
+                args = list(args)
+                for index, name, check in checks:
+                    if index < len(args):
+                        args[index] = check(args[index])
+                    elif name in kwargs:
+                        kwargs[name] = check(kwargs[name])
+            return function(*args, **kwargs)
+        wrapper.validators = validators
+        return wrapper
+    return decorator
@@ -0,0 +1,157 @@
+"""
+Shared instrument sessions for the driver tests.
+
+Tests derived from InstrumentTestCase get self.session, a resource for their
+instrument that is opened once per process and shared by all its tests instead
+of reopening the VISA resource in every test. The backend is chosen with the
+INSTRUMENT_BACKEND environment variable:
+
+    simulator  (default) an in-memory simulator.SimulatedInstrument, no hardware needed
+    replay     answers from the traces recorded on hardware, one trace per test
+    hardware   the instrument at its address in instrumentPorts.json
+
+With INSTRUMENT_RECORD=1 the hardware backend records a trace per test (into
+INSTRUMENT_TRACES, default Testing/traces) for the replay backend. Tests that
+need a real instrument set backends = ("replay", "hardware") and are skipped on
+the simulator. run_tests.py runs the suites in parallel processes.
+"""
+import atexit
+import json
+import os
+import unittest
+
+from Instruments import simulator
+from Instruments import traffic_recorder
+from Instruments import transport
+
+BACKENDS = ("simulator", "replay", "hardware")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PORTS_FILE = os.path.join(ROOT, "instrumentPorts.json")
+TRACE_DIRECTORY = os.path.join(ROOT, "Testing", "traces")
+# Addresses of instruments that are not in instrumentPorts.json.
+DEFAULT_ADDRESSES = {"Spike": transport.SPIKE_ADDRESS}
+# Fixed answers of the simulated instruments, everything else answers what was set (or 0).
+SIMULATED_RESPONSES = {
+    "Oscilloscope": {"*IDN?": "RIGOL TECHNOLOGIES,DS1202Z-E,DS1ZE264M00036,00.06.04", "*OPC?": "1", "*TST?": "0"},
+    "Spike": {"*IDN?": "Signal Hound,Spike,0,0", "*OPC?": "1"},
+}
+
+# Open sessions of this process by (backend, instrument name).
+_sessions = {}
+
+
+def backend():
+    """The backend selected with INSTRUMENT_BACKEND."""
+    name = os.environ.get("INSTRUMENT_BACKEND", "simulator").lower()
+    if name not in BACKENDS:
+        raise ValueError(f"Invalid INSTRUMENT_BACKEND ({name}). Choose from {BACKENDS}.")
+    return name
+
+
+def trace_directory():
+    return os.environ.get("INSTRUMENT_TRACES", TRACE_DIRECTORY)
+
+
+def trace_path(name, test_id):
+    """Trace file of one test on one instrument."""
+    return os.path.join(trace_directory(), name, f"{test_id}.trace")
+
+
+def address(name):
+    """Address of an instrument from instrumentPorts.json (INSTRUMENT_PORTS overrides the file)."""
+    path = os.environ.get("INSTRUMENT_PORTS", PORTS_FILE)
+    ports = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            ports = json.load(f)
+    if name in ports:
+        return ports[name]
+    if name in DEFAULT_ADDRESSES:
+        return DEFAULT_ADDRESSES[name]
+    raise KeyError(f"No address for {name} in {path}.")
+
+
+def session(name):
+    """
+    The shared session of an instrument on the current backend, opened on first use.
+    Replay has no shared session, see session_for_test.
+    """
+    key = (backend(), name)
+    if key not in _sessions:
+        if key[0] == "simulator":
+            _sessions[key] = simulator.SimulatedInstrument(None, SIMULATED_RESPONSES.get(name))
+        elif key[0] == "hardware":
+            _sessions[key] = transport.open_resource(address(name))
+        else:
+            raise ValueError("The replay backend has one session per test, use session_for_test.")
+    return _sessions[key]
+
+
+def session_for_test(name, test_id):
+    """
+    Resource for one test: the shared session, wrapped in a RecordingResource when
+    recording, or a ReplayResource of the test's trace.
+
+    Raises:
+    unittest.SkipTest: Replaying a test without a recorded trace.
+    """
+    current = backend()
+    if current == "replay":
+        path = trace_path(name, test_id)
+        if not os.path.exists(path):
+            raise unittest.SkipTest(f"No recorded trace {path}.")
+        return traffic_recorder.ReplayResource(path)
+    resource = session(name)
+    if current == "hardware" and os.environ.get("INSTRUMENT_RECORD") == "1":
+        path = trace_path(name, test_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return traffic_recorder.RecordingResource(resource, path)
+    return resource
+
+
+def close_sessions():
+    while _sessions:
+        _, resource = _sessions.popitem()
+        resource.close()
+
+
+atexit.register(close_sessions)
+
+
+def configuration(key):
+    """
+    Decorator naming the instrument configuration a test needs. run_tests.py runs the
+    tests of one instrument sorted by configuration, so the instrument is reconfigured
+    as rarely as possible. Undecorated tests are grouped by the word after test_.
+    """
+    def decorator(function):
+        function.configuration = key
+        return function
+    return decorator
+
+
+def configuration_key(test):
+    method = getattr(test, test._testMethodName, None)
+    key = getattr(method, "configuration", None)
+    if key is None:
+        key = test._testMethodName.split("_")[1] if test._testMethodName.count("_") else ""
+    return key
+
+
+class InstrumentTestCase(unittest.TestCase):
+    """
+    Test case using the shared session of instrument_name as self.session.
+
+    backends are the backends the tests can run on, the others skip them.
+    """
+    instrument_name = None
+    backends = BACKENDS
+
+    def setUp(self):
+        current = backend()
+        if current not in self.backends:
+            self.skipTest(f"Needs the {' or '.join(self.backends)} backend, INSTRUMENT_BACKEND is {current}.")
+        self.session = session_for_test(self.instrument_name, self.id())
+        if isinstance(self.session, traffic_recorder.RecordingResource):
+            # Only the trace is closed, the session stays open for the next test.
+            self.addCleanup(self.session.close, close_resource=False)
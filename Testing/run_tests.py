@@ -0,0 +1,136 @@
+"""
+Run the test suites in parallel processes.
+
+    python Testing/run_tests.py                                  all tests on the simulator
+    python Testing/run_tests.py --backend hardware test_oscilloscope.py
+    python Testing/run_tests.py --backend hardware --record      record traces for --backend replay
+
+The tests are split by class over --workers processes, each keeping its
+instrument sessions (see instrument_session.py) open from test to test. With
+the hardware backend the tests of an instrument run in one process, sorted by
+instrument_session.configuration_key so tests needing the same configuration
+follow each other, while the tests of other instruments and the unit tests run
+in parallel.
+"""
+import argparse
+import io
+import os
+import sys
+import time
+import unittest
+from collections import defaultdict
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from Testing import instrument_session
+
+# Outcome of one job: failures and errors are (test, traceback) pairs.
+JobResult = namedtuple('JobResult', ['label', 'tests_run', 'failures', 'errors', 'skipped', 'duration', 'output'])
+
+
+def iterate_tests(suite):
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from iterate_tests(test)
+        else:
+            yield test
+
+
+def plan(tests, backend, workers):
+    """
+    Split tests into jobs.
+
+    Returns:
+    list: (label, test ids) per job. Hardware-bound tests get one job per instrument,
+          the other tests are spread over workers jobs by class, largest classes first.
+    """
+    instruments = defaultdict(list)
+    classes = defaultdict(list)
+    for test in tests:
+        name = getattr(test, "instrument_name", None)
+        if backend == "hardware" and name is not None and backend in test.backends:
+            instruments[name].append(test)
+        else:
+            classes[f"{type(test).__module__}.{type(test).__qualname__}"].append(test)
+    jobs = []
+    for name, group in sorted(instruments.items()):
+        group.sort(key=lambda t: (instrument_session.configuration_key(t), t.id()))
+        jobs.append((name, [t.id() for t in group]))
+    bins = [[] for _ in range(max(1, workers))]
+    for group in sorted(classes.values(), key=len, reverse=True):
+        min(bins, key=len).extend(t.id() for t in group)
+    jobs.extend((f"worker {i}", ids) for i, ids in enumerate(bins) if ids)
+    return jobs
+
+
+def _run(label, suite, verbosity):
+    stream = io.StringIO()
+    start = time.perf_counter()
+    result = unittest.TextTestRunner(stream=stream, verbosity=verbosity).run(suite)
+    return JobResult(label, result.testsRun, [(str(t), tb) for t, tb in result.failures],
+                     [(str(t), tb) for t, tb in result.errors], len(result.skipped),
+                     time.perf_counter() - start, stream.getvalue())
+
+
+def run_job(job, verbosity=1):
+    """Run the tests of a job in this process."""
+    label, ids = job
+    return _run(label, unittest.defaultTestLoader.loadTestsFromNames(ids), verbosity)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the tests in parallel processes.")
+    parser.add_argument("pattern", nargs="?", default="test*.py", help="Test files to run (default test*.py).")
+    parser.add_argument("--backend", choices=instrument_session.BACKENDS,
+                        default=os.environ.get("INSTRUMENT_BACKEND", "simulator"))
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of processes.")
+    parser.add_argument("--record", action="store_true", help="Record a trace per test (hardware backend).")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    # The worker processes inherit the environment.
+    os.environ["INSTRUMENT_BACKEND"] = args.backend
+    if args.record:
+        os.environ["INSTRUMENT_RECORD"] = "1"
+    verbosity = 2 if args.verbose else 1
+    start = time.perf_counter()
+    suite = unittest.defaultTestLoader.discover(os.path.join(ROOT, "Testing"), args.pattern, top_level_dir=ROOT)
+    tests = list(iterate_tests(suite))
+    # Modules that failed to import cannot be loaded again by name, they are reported from here.
+    broken = [t for t in tests if type(t).__module__ == "unittest.loader"]
+    tests = [t for t in tests if type(t).__module__ != "unittest.loader"]
+    jobs = plan(tests, args.backend, args.workers)
+
+    results = [_run("import errors", unittest.TestSuite(broken), verbosity)] if broken else []
+    if len(jobs) > 1 and args.workers > 1:
+        # The workers are not daemonic, so tests can start processes of their own
+        # (e.g. test_acquisition_service).
+        with ProcessPoolExecutor(min(args.workers, len(jobs))) as executor:
+            futures = [executor.submit(run_job, job, verbosity) for job in jobs]
+            results.extend(future.result() for future in as_completed(futures))
+    else:
+        results.extend(run_job(job, verbosity) for job in jobs)
+
+    for result in results:
+        if args.verbose:
+            print(result.output)
+        for test, traceback in result.errors + result.failures:
+            print(f"{'=' * 70}\n{test} ({result.label})\n{'-' * 70}\n{traceback}")
+    tests_run = sum(r.tests_run for r in results)
+    failures = sum(len(r.failures) for r in results)
+    errors = sum(len(r.errors) for r in results)
+    skipped = sum(r.skipped for r in results)
+    print(f"Ran {tests_run} tests on the {args.backend} backend in {time.perf_counter() - start:.2f} s "
+          f"({len(results)} jobs, slowest {max((r.duration for r in results), default=0):.2f} s)")
+    status = "OK" if not failures and not errors else "FAILED"
+    print(f"{status} (failures={failures}, errors={errors}, skipped={skipped})")
+    return 0 if status == "OK" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
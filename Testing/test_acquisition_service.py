@@ -0,0 +1,133 @@
+import unittest
+import os
+import sys
+import functools
+import numpy as np
+sys.path.append('../Measurement_Software')
+from Instruments import acquisition_service
+
+
+class FakeScope():
+    """Single acquisitions of two channels: row r of acquisition i is offset + 10 * i + r."""
+
+    def __init__(self, points=1000, fail_at=None):
+        self.points = points
+        self.fail_at = fail_at
+        self.offset = 0.0
+        self.count = 0
+
+    def set_offset(self, offset):
+        self.offset = offset
+        return offset
+
+    def crash(self):
+        os._exit(1)
+
+    def single(self):
+        pass
+
+    def wait_for_acquisition(self, timeout=None):
+        pass
+
+    def acquire_channels(self, sources, mode="RAW", stop=True, allocate=None):
+        if self.count == self.fail_at:
+            raise TimeoutError("The oscilloscope did not trigger.")
+        volts = (allocate or np.empty)((len(sources), self.points), np.float32)
+        for row in range(len(sources)):
+            volts[row] = self.offset + 10 * self.count + row
+        self.count += 1
+        return volts, np.arange(self.points) * 1e-9
+
+
+def open_fake_scope(points=1000, fail_at=None):
+    return FakeScope(points, fail_at)
+
+
+def open_broken_scope():
+    raise OSError("VI_ERROR_RSRC_NFOUND")
+
+
+def row_means(array, capture):
+    return array.mean(axis=1).tolist(), capture.metadata['dx']
+
+
+ACQUIRE = functools.partial(acquisition_service.capture_channels, sources=(1, 2))
+
+
+class TestSharedRing(unittest.TestCase):
+
+    def test_slots(self):
+        ring = acquisition_service.SharedRing(slots=2, slot_bytes=100)
+        self.addCleanup(ring.close)
+        self.assertEqual(ring.slot_bytes, 128)
+        slot = ring.acquire()
+        ring.array(slot, (4, 8), np.float32)[...] = 3
+        capture = acquisition_service.Capture(slot, 0, (4, 8), "<f4", 0, {})
+        ring.publish(capture)
+        received = ring.next(1)
+        view = ring.view(received)
+        self.assertTrue(np.all(view == 3))
+        self.assertFalse(view.flags.writeable)
+        with self.assertRaises(ValueError):
+            ring.array(slot, (100,), np.float32)
+        del view
+        ring.release(received)
+        self.assertIsNotNone(ring.acquire(1))
+        self.assertIsNotNone(ring.acquire(1))
+        self.assertIsNone(ring.acquire(0.01))
+
+
+class TestAcquisitionService(unittest.TestCase):
+
+    def test_captures_in_this_process(self):
+        with acquisition_service.AcquisitionService(open_fake_scope, ACQUIRE, slots=3, slot_bytes=8000) as service:
+            self.assertEqual(service.call("set_offset", 0.5), 0.5)
+            service.start(n=6)
+            sequences = []
+            for volts, capture in service.captures(6, timeout=10):
+                self.assertEqual(volts.shape, (2, 1000))
+                self.assertEqual(volts[1, 0], 0.5 + 10 * capture.sequence + 1)
+                self.assertAlmostEqual(capture.metadata['dx'], 1e-9)
+                sequences.append(capture.sequence)
+            self.assertEqual(sequences, list(range(6)))
+            status = service.status()
+            self.assertEqual((status['sequence'], status['acquiring']), (6, False))
+            with self.assertRaises(RuntimeError):
+                service.call("set_gain", 2)
+
+    def test_analysis_pool(self):
+        with acquisition_service.AcquisitionService(open_fake_scope, ACQUIRE, slots=4, slot_bytes=8000) as service:
+            pool = service.analyze(row_means, workers=2)
+            service.start(n=20)
+            results = dict(pool.results(20, timeout=20))
+        self.assertEqual(sorted(results), list(range(20)))
+        self.assertEqual(results[7], ([70.0, 71.0], 1e-9))
+        for process in pool.processes:
+            self.assertFalse(process.is_alive())
+
+    def test_acquisition_error(self):
+        factory = functools.partial(open_fake_scope, fail_at=2)
+        with acquisition_service.AcquisitionService(factory, ACQUIRE, slots=2, slot_bytes=8000) as service:
+            service.start()
+            with self.assertRaises(RuntimeError) as raised:
+                for _ in service.captures(timeout=10):
+                    pass
+            self.assertIn("did not trigger", str(raised.exception))
+            self.assertFalse(service.status()['acquiring'])
+
+    def test_service_died(self):
+        with acquisition_service.AcquisitionService(open_fake_scope, ACQUIRE, slots=1, slot_bytes=8000) as service:
+            with self.assertRaises(RuntimeError) as raised:
+                service.call("crash")
+            self.assertIn("died", str(raised.exception))
+            with self.assertRaises(RuntimeError):
+                service.status()
+
+    def test_factory_error(self):
+        with self.assertRaises(RuntimeError) as raised:
+            acquisition_service.AcquisitionService(open_broken_scope, ACQUIRE, slots=1, slot_bytes=64)
+        self.assertIn("VI_ERROR_RSRC_NFOUND", str(raised.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
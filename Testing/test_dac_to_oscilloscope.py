@@ -0,0 +1,123 @@
+import unittest
+import sys
+import tempfile
+sys.path.append('../Measurement_Software')
+import numpy as np
+from Experiments import pulse_reference
+from Experiments.dac_to_oscilloscope import DacToOscilloscope, LocalRunner, compare_pulses, notebook_circuit
+
+
+SAMPLE_INTERVAL = 1e-9
+
+
+def synthesize_capture(pulse, start, n_points=2000, gain=0.5, noise=0.01, seed=0):
+    waveform, _ = pulse_reference.pulse_waveform(pulse, SAMPLE_INTERVAL)
+    capture = np.random.default_rng(seed).normal(0, noise, n_points)
+    capture[start:start + len(waveform)] += gain * waveform
+    return capture
+
+
+class FakeScope():
+    """Captures the pulse of the last batch run on the LocalRunner."""
+
+    def __init__(self):
+        self.calls = []
+        self.capture = None
+
+    def single(self):
+        self.calls.append("single")
+
+    def wait_for_acquisition(self, timeout=None):
+        self.calls.append("wait")
+        return True
+
+    def acquire_channels(self, sources, mode="RAW", stop=True):
+        self.calls.append("acquire")
+        return np.array([self.capture] * len(sources)), np.arange(len(self.capture)) * SAMPLE_INTERVAL
+
+
+class TestPulseReference(unittest.TestCase):
+
+    def test_cos_edge_square(self):
+        envelope = pulse_reference.cos_edge_square(SAMPLE_INTERVAL, 0.5e-6, ramp_fraction=0.5)
+        self.assertEqual(len(envelope), 500)
+        self.assertEqual(envelope[0], 0)
+        np.testing.assert_allclose(envelope[125:375], 1)
+        self.assertTrue(np.all(np.diff(envelope[:125]) > 0))
+
+
+class TestReferenceWaveformCache(unittest.TestCase):
+
+    def setUp(self):
+        self.pulse = notebook_circuit(n_qubits=1)[0]
+
+    def test_reuses_and_evicts(self):
+        cache = pulse_reference.ReferenceWaveformCache(maxsize=2)
+        waveform, envelope = cache.get(self.pulse, SAMPLE_INTERVAL)
+        again, _ = cache.get(dict(self.pulse), (3 * SAMPLE_INTERVAL) / 3)
+        self.assertIs(waveform, again)
+        self.assertFalse(waveform.flags.writeable)
+        np.testing.assert_array_equal(envelope, pulse_reference.pulse_waveform(self.pulse, SAMPLE_INTERVAL)[1])
+        cache.get(dict(self.pulse, freq=80e6), SAMPLE_INTERVAL)
+        cache.get(self.pulse, 2 * SAMPLE_INTERVAL)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNot(cache.get(self.pulse, SAMPLE_INTERVAL)[0], waveform)
+        self.assertEqual((cache.hits, cache.misses), (1, 4))
+
+    def test_persists_to_disk(self):
+        with tempfile.TemporaryDirectory() as directory:
+            waveform, _ = pulse_reference.ReferenceWaveformCache(directory=directory).get(self.pulse, SAMPLE_INTERVAL)
+            cache = pulse_reference.ReferenceWaveformCache(directory=directory)
+            np.testing.assert_array_equal(cache.get(self.pulse, SAMPLE_INTERVAL)[0], waveform)
+            self.assertEqual(cache.misses, 1)
+
+
+class TestComparePulses(unittest.TestCase):
+
+    def setUp(self):
+        self.pulse = notebook_circuit(n_qubits=1, freq=50e6)[0]
+        _, self.envelope = pulse_reference.pulse_waveform(self.pulse, SAMPLE_INTERVAL)
+
+    def test_finds_lag_and_gain(self):
+        captures = [synthesize_capture(self.pulse, 300), synthesize_capture(self.pulse, 1000, gain=0.25, seed=1)]
+        results = compare_pulses(captures, self.envelope, SAMPLE_INTERVAL, sources=[1, 2])
+        self.assertEqual([r.source for r in results], [1, 2])
+        self.assertAlmostEqual(results[0].lag, 300e-9, delta=5e-9)
+        self.assertAlmostEqual(results[1].lag, 1000e-9, delta=5e-9)
+        self.assertAlmostEqual(results[0].gain, 0.5, delta=0.05)
+        self.assertAlmostEqual(results[1].gain, 0.25, delta=0.05)
+        self.assertGreater(min(r.correlation for r in results), 0.95)
+
+    def test_capture_shorter_than_pulse(self):
+        with self.assertRaises(ValueError):
+            compare_pulses(np.zeros(100), self.envelope, SAMPLE_INTERVAL)
+
+
+class TestDacToOscilloscope(unittest.TestCase):
+
+    def test_run_pipelines_compilation(self):
+        scope = FakeScope()
+        circuits = [notebook_circuit(n_qubits=1, freq=f) for f in (50e6, 80e6)]
+        compiled = []
+
+        def compiler(circuit):
+            compiled.append(circuit[0]['freq'])
+            return circuit[0]['freq']
+
+        def on_batch(programs, n_total_shots):
+            pulse = dict(circuits[0][0], freq=programs[0])
+            scope.capture = synthesize_capture(pulse, 400)
+
+        runner = LocalRunner(on_batch)
+        experiment = DacToOscilloscope(scope, runner, compiler, sources=[1], n_total_shots=10)
+        results = experiment.run(circuits)
+        self.assertEqual(compiled, [50e6, 80e6])
+        self.assertEqual(runner.batches, [([50e6], 10), ([80e6], 10)])
+        self.assertEqual(scope.calls, ["single", "wait", "acquire"] * 2)
+        for (result,) in results:
+            self.assertAlmostEqual(result.lag, 400e-9, delta=5e-9)
+            self.assertGreater(result.correlation, 0.95)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+import unittest
+import sys
+import types
+sys.path.append('../Measurement_Software')
+from Instruments import driver_generator
+from Instruments import simulator
+
+MANUAL = """
+7.1 Display
+Command :DISPlay:HIDE <bool>
+:DISPlay:HIDE?
+:DISPlay:ANNotation:TITLe <string>
+:DISPlay:ANNotation:TITLe?
+:DISPlay:ANNotation:CLEar
+Description HIDE, When set to true, hides the application.
+HIDE?, Returns true when the application is not visible.
+TITLe, Set the measurement title.
+CLEar, Remove the title.
+Examples DISP:HIDE 1
+Command *IDN?
+*RCL <int>
+Description *IDN?, Query the serial number and name of the device.
+*RCL, Load preset [1-9].
+Examples *IDN?
+Command :INSTrument[:SELect]
+SA|RTSA|ZS|
+   IH|SEMask
+:INSTrument[:SELect]?
+Description SELect, Determines the current measurement mode.
+Examples INST SA
+Command :CALCulate:LLINe[1|2|3|4|5|6]:STATe ON|OFF|0|1
+:CALCulate:LLINe[1|2|3|4|5|6]:STATe?
+:CALCulate:LLINe[1|2|3|4|5|6]:DATA <freq1>, <ampl1>, …
+   19
+:CALCulate:LLINe[1|2|3|4|5|6]:DATA?
+Description STATe, Enable or disable testing of this limit line.
+DATA, Specify the points in the limit line.
+Examples CALC:LLIN1:STAT ON
+Command [:SENSe]:FREQuency:CENTer <freq>|UP|DOWN
+[:SENSe]:FREQuency:CENTer? [MIN|MAX]
+[:SENSe]:SWEep:TIME <double>
+[:SENSe]:SWEep:TIME?
+Description CENTer, Set the measurement center frequency.
+TIME, Specified as seconds.
+Examples :FREQ:CENT 1GHz
+"""
+
+
+def load(source, name):
+    module = types.ModuleType(name)
+    exec(compile(source, name, "exec"), module.__dict__)
+    return module
+
+
+class TestParseManual(unittest.TestCase):
+
+    def setUp(self):
+        self.commands = {c["header"]: c for c in driver_generator.parse_manual(MANUAL)}
+
+    def test_forms_and_parameters(self):
+        hide = self.commands[":DISPlay:HIDE"]
+        self.assertTrue(hide["set"] and hide["query"])
+        self.assertEqual(hide["parameter"], {"type": "bool"})
+        self.assertEqual(hide["description"], "When set to true, hides the application.")
+        self.assertEqual(hide["query_description"], "Returns true when the application is not visible.")
+        self.assertIsNone(self.commands[":DISPlay:ANNotation:CLEar"]["parameter"])
+        self.assertEqual(self.commands[":INSTrument[:SELect]"]["parameter"]["values"],
+                         ["SA", "RTSA", "ZS", "IH", "SEMask"])
+        self.assertEqual(self.commands[":CALCulate:LLINe[1|2|3|4|5|6]:DATA"]["parameter"]["type"], "raw")
+        center = self.commands["[:SENSe]:FREQuency:CENTer"]
+        self.assertEqual(center["parameter"], {"type": "float", "values": ["UP", "DOWN"]})
+        self.assertEqual(center["query_parameter"], {"type": "choice", "values": ["MIN", "MAX"], "optional": True})
+
+    def test_range_from_description(self):
+        recall = self.commands["*RCL"]["parameter"]
+        self.assertEqual((recall["type"], recall["low"], recall["high"]), ("int", 1, 9))
+
+    def test_header_pattern(self):
+        pattern = simulator.header_pattern(":CALCulate:LLINe[1|2|3|4|5|6]:STATe")
+        self.assertEqual(pattern.match(":calc:lline3:stat").groups(), ("3",))
+        self.assertIsNotNone(simulator.header_pattern("[:SENSe]:FREQuency:CENTer").match(":FREQ:CENT"))
+        self.assertIsNone(pattern.match(":CALC:LLIN3"))
+
+
+class TestGeneratedDriver(unittest.TestCase):
+
+    def setUp(self):
+        self.commands = driver_generator.parse_manual(MANUAL)
+        driver = load(driver_generator.generate_driver(self.commands, "Spike", "Spike"), "spike_driver")
+        stub = load(driver_generator.generate_simulator(self.commands, "Spike"), "spike_simulator")
+        self.simulator = stub.SpikeSimulator({"*IDN?": "Signal Hound,SM200B,1,4.0"})
+        self.driver = driver.Spike(self.simulator)
+
+    def test_set_and_query(self):
+        self.driver.enable_calculate_lline(2, True)
+        self.assertTrue(self.driver.is_calculate_lline_enabled(2))
+        self.assertFalse(self.driver.is_calculate_lline_enabled(1))
+        self.assertEqual(self.simulator.log[0], ":CALC:LLIN2:STAT ON")
+        self.driver.set_instrument("semask")
+        self.assertEqual(self.driver.get_instrument(), "SEM")
+        self.driver.set_display_annotation_title("Noise floor")
+        self.assertEqual(self.simulator.log[-1], ':DISP:ANN:TITL "Noise floor"')
+        self.driver.set_calculate_lline_data(1, [1e9, -10])
+        self.assertEqual(self.driver.get_calculate_lline_data(1), "1000000000.0,-10")
+        self.driver.display_annotation_clear()
+        self.assertEqual(self.driver.get_system_error(), '0,"No error"')
+
+    def test_validation(self):
+        with self.assertRaises(ValueError):
+            self.driver.enable_calculate_lline(7, True)
+        with self.assertRaises(ValueError):
+            self.driver.set_rcl(10)
+        with self.assertRaises(ValueError):
+            self.driver.set_instrument("SPECTRUM")
+
+    def test_mandatory_commands_are_inherited(self):
+        self.assertFalse(hasattr(self.driver, "get_idn"))
+        self.assertEqual(self.driver.get_id(), "Signal Hound,SM200B,1,4.0")
+
+    def test_existing_modules_are_reused(self):
+        entries = {(c["header"], form): match for c, form, _, match, _ in driver_generator.plan(self.commands)}
+        center = entries[("[:SENSe]:FREQuency:CENTer", "set")]
+        self.assertEqual((center.module, center.method), ("sense", "set_sense_frequency_center"))
+        self.assertIsNone(entries[(":DISPlay:HIDE", "set")])
+        self.driver.set_frequency_center(1e9)
+        self.assertEqual(self.simulator.log[-1], ":SENS:FREQ:CENT 1000000000.0")
+        self.assertEqual(self.driver.get_frequency_center(), 1e9)
+
+    def test_unknown_header_is_an_error(self):
+        self.simulator.write(":DISP:WIND:TRAC:Y:SCAL:RLEV 10")
+        self.assertTrue(self.driver.get_system_error().startswith("-113"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+import io
+import sys
+from contextlib import redirect_stdout
+sys.path.append('../Measurement_Software')
+from Instruments import error_checking
+from Instruments.oscilloscope_rigol import Oscilloscope
+
+
+class FakeErrorQueue():
+    """Queues -113 for every command with an unknown header and answers compound :SYST:ERR:NEXT? queries."""
+
+    KNOWN = (":CHANNEL1:RANGE", ":CHANNEL1:SCALE", ":CHAN1:SCAL")
+
+    def __init__(self):
+        self.queue = []
+        self.queries = []
+
+    def write(self, command):
+        header = command.split()[0].upper()
+        if header not in self.KNOWN:
+            self.queue.append(f'-113,"Undefined header;{header}"')
+
+    def query(self, command):
+        self.queries.append(command)
+        answers = []
+        for part in command.split(";"):
+            answers.append(self.queue.pop(0) if self.queue else '0,"No error"')
+        return ";".join(answers) + "\n"
+
+
+class TestErrorChecking(unittest.TestCase):
+
+    def test_parse_errors(self):
+        errors = error_checking.parse_errors('-113,"Undefined header;:CHAN1:OFFS 1";+0,"No error"\n')
+        self.assertEqual(errors, [(-113, "Undefined header;:CHAN1:OFFS 1"), (0, "No error")])
+
+    def test_drain_in_one_round_trip(self):
+        instrument = FakeErrorQueue()
+        for i in range(3):
+            instrument.write(f":BAD{i}")
+        self.assertEqual([code for code, _ in error_checking.drain_errors(instrument, depth=8)], [-113] * 3)
+        self.assertEqual(len(instrument.queries), 1)
+        for i in range(10):
+            instrument.write(f":BAD{i}")
+        self.assertEqual(len(Oscilloscope(instrument).get_system_errors(depth=4)), 10)
+        self.assertEqual(len(instrument.queries), 4)
+
+    def test_batch_attribution(self):
+        instrument = FakeErrorQueue()
+        checked = error_checking.ErrorCheckingResource(instrument, raise_errors=True)
+        scope = Oscilloscope(checked)
+        with self.assertRaises(error_checking.SCPIError) as error:
+            with checked.batch():
+                scope.set_channel_range(1, 8)
+                checked.write(":CHAN1:OFFS 1")
+                scope.set_channel_scale(1, 1)
+        self.assertEqual(len(instrument.queries), 1)
+        (record,) = error.exception.errors
+        self.assertEqual(record.code, -113)
+        self.assertEqual(record.command, ":CHAN1:OFFS 1")
+        self.assertEqual(len(record.candidates), 3)
+
+    def test_attribution_across_short_and_long_form(self):
+        commands = [":CHANnel1:SCALe 1", ":CHANnel1:OFFSet 2", ":TIMebase:MAIN:SCALe 1e-3"]
+        self.assertEqual(error_checking.attribute_error("Data out of range;:CHAN1:OFFS 2", commands), commands[1])
+        self.assertEqual(error_checking.attribute_error("Data out of range;CHANNEL1:OFFSET", commands), commands[1])
+        self.assertEqual(error_checking.attribute_error("Data out of range;:TIMEBASE:MAIN", commands), commands[2])
+        self.assertIsNone(error_checking.attribute_error("Data out of range;:CHAN2:OFFS", commands))
+        self.assertIsNone(error_checking.attribute_error("Data out of range", commands))
+
+    def test_interval(self):
+        instrument = FakeErrorQueue()
+        checked = error_checking.ErrorCheckingResource(instrument, interval=1)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            checked.write(":CHANnel1:RANGe 8")
+            checked.write(":OOPS 1")
+        self.assertEqual(len(instrument.queries), 2)
+        self.assertEqual([e.command for e in checked.errors], [":OOPS 1"])
+        self.assertIn("-113", output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
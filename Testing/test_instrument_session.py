@@ -0,0 +1,107 @@
+import unittest
+import sys
+import os
+import tempfile
+from unittest.mock import patch
+sys.path.append('../Measurement_Software')
+from Instruments import simulator
+from Instruments import traffic_recorder
+from Instruments.oscilloscope_rigol import Oscilloscope
+from Testing import instrument_session
+from Testing import run_tests
+
+
+class ScopeTests(instrument_session.InstrumentTestCase):
+    instrument_name = "Oscilloscope"
+    backends = ("replay", "hardware")
+
+    @instrument_session.configuration("averages")
+    def test_b(self):
+        pass
+
+    def test_trigger_mode(self):
+        pass
+
+    @instrument_session.configuration("averages")
+    def test_a(self):
+        pass
+
+
+class SpikeTests(instrument_session.InstrumentTestCase):
+    instrument_name = "Spike"
+
+    def test_title(self):
+        pass
+
+
+class TestSessions(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.addCleanup(instrument_session.close_sessions)
+
+    def environment(self, **variables):
+        variables.setdefault("INSTRUMENT_TRACES", self.directory.name)
+        return patch.dict(os.environ, variables)
+
+    def test_simulator_session_is_shared(self):
+        with self.environment(INSTRUMENT_BACKEND="simulator"):
+            session = instrument_session.session("Oscilloscope")
+            self.assertIs(instrument_session.session("Oscilloscope"), session)
+            self.assertEqual(Oscilloscope(session).get_id(), "RIGOL TECHNOLOGIES,DS1202Z-E,DS1ZE264M00036,00.06.04")
+
+    def test_invalid_backend(self):
+        with self.environment(INSTRUMENT_BACKEND="lab"):
+            with self.assertRaises(ValueError):
+                instrument_session.backend()
+
+    def test_record_and_replay(self):
+        device = simulator.SimulatedInstrument(None, {"*IDN?": "RIGOL TECHNOLOGIES,DS1202Z-E,1,1"})
+        with self.environment(INSTRUMENT_BACKEND="hardware", INSTRUMENT_RECORD="1"), \
+                patch.object(instrument_session.transport, "open_resource", return_value=device) as opened:
+            for _ in range(2):
+                resource = instrument_session.session_for_test("Oscilloscope", "Testing.test_x.T.test_id")
+                self.assertIsInstance(resource, traffic_recorder.RecordingResource)
+                resource.query("*IDN?")
+                resource.close(close_resource=False)
+            opened.assert_called_once_with("USB0::0x1AB1::0x0517::DS1ZE264M00036::INSTR")
+        with self.environment(INSTRUMENT_BACKEND="replay"):
+            replay = instrument_session.session_for_test("Oscilloscope", "Testing.test_x.T.test_id")
+            self.assertEqual(replay.query("*IDN?"), "RIGOL TECHNOLOGIES,DS1202Z-E,1,1\n")
+            with self.assertRaises(unittest.SkipTest):
+                instrument_session.session_for_test("Oscilloscope", "Testing.test_x.T.test_other")
+
+    def test_hardware_tests_are_skipped_on_the_simulator(self):
+        with self.environment(INSTRUMENT_BACKEND="simulator"):
+            result = unittest.TestResult()
+            unittest.defaultTestLoader.loadTestsFromTestCase(ScopeTests).run(result)
+            self.assertEqual((result.testsRun, len(result.skipped)), (3, 3))
+
+
+class TestPlan(unittest.TestCase):
+
+    def collect(self):
+        loader = unittest.defaultTestLoader
+        return list(run_tests.iterate_tests(unittest.TestSuite([loader.loadTestsFromTestCase(ScopeTests),
+                                                                 loader.loadTestsFromTestCase(SpikeTests),
+                                                                 loader.loadTestsFromTestCase(TestSessions)])))
+
+    def test_hardware_tests_run_per_instrument_by_configuration(self):
+        jobs = dict(run_tests.plan(self.collect(), "hardware", 4))
+        self.assertEqual([name.split(".")[-1] for name in jobs["Oscilloscope"]], ["test_a", "test_b", "test_trigger_mode"])
+        self.assertEqual(len(jobs["Spike"]), 1)
+        self.assertEqual(len(jobs), 3)
+
+    def test_simulator_tests_are_spread_by_class(self):
+        jobs = run_tests.plan(self.collect(), "simulator", 4)
+        self.assertEqual(sorted(len(ids) for _, ids in jobs), [1, 3, 4])
+        self.assertEqual(sum(len(ids) for _, ids in run_tests.plan(self.collect(), "simulator", 1)), 8)
+
+    def test_run_job(self):
+        result = run_tests.run_job(("worker 0", ["Testing.test_instrument_session.SpikeTests.test_title"]))
+        self.assertEqual((result.tests_run, result.failures, result.errors), (1, [], []))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+import os
+import sys
+import tempfile
+import time
+sys.path.append('../Measurement_Software')
+from Instruments import instrumentation
+from Instruments.oscilloscope_rigol import Oscilloscope
+from Instruments.spectrum_analyzer_signal_hound import SpectrumAnalyzer
+
+
+class SlowInstrument():
+    """Every query takes 10 ms."""
+
+    def __init__(self):
+        self.commands = []
+
+    def write(self, command):
+        self.commands.append(command)
+
+    def query(self, command):
+        time.sleep(0.01)
+        return "1.0E+9\n"
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = instrumentation.MetricsRegistry()
+        self.addCleanup(instrumentation.disable)
+
+    def test_host_and_io_time(self):
+        original = Oscilloscope.get_sample_rate
+        scope = Oscilloscope(SlowInstrument())
+        instrument = scope.instrument
+        with instrumentation.instrumented([Oscilloscope, SpectrumAnalyzer], self.registry):
+            self.assertIsNot(Oscilloscope.get_sample_rate, original)
+            for _ in range(3):
+                self.assertEqual(scope.get_sample_rate(), 1e9)
+            scope.clear_event_registers()
+        self.assertIs(Oscilloscope.get_sample_rate, original)
+        self.assertIs(scope.instrument, instrument)
+        metrics = self.registry.snapshot()
+        self.assertEqual(metrics["Oscilloscope.get_sample_rate"].calls, 3)
+        self.assertEqual(metrics["Oscilloscope.get_sample_rate"].io_calls, 3)
+        self.assertGreaterEqual(metrics["Oscilloscope.get_sample_rate"].io_time, 0.03)
+        self.assertLess(metrics["Oscilloscope.get_sample_rate"].host_time, 0.01)
+        # Inherited from the SCPICommandTree base class.
+        self.assertEqual(metrics["Mandatory.clear_event_registers"].calls, 1)
+        self.assertIn("Oscilloscope.get_sample_rate", self.registry.format_report())
+
+    def test_errors_and_prometheus(self):
+        scope = Oscilloscope(None)
+        with instrumentation.instrumented([Oscilloscope], self.registry):
+            with self.assertRaises(AttributeError):
+                scope.get_sample_rate()
+            with self.assertRaises(RuntimeError):
+                instrumentation.enable([Oscilloscope])
+        self.assertEqual(self.registry.snapshot()["Oscilloscope.get_sample_rate"].errors, 1)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "metrics.prom")
+            self.registry.write_prometheus(path)
+            with open(path) as f:
+                text = f.read()
+        self.assertIn('scpi_driver_calls_total{method="Oscilloscope.get_sample_rate"} 1', text)
+        self.assertIn('# TYPE scpi_driver_io_seconds_total counter', text)
+
+    def test_default_classes(self):
+        names = [c.__name__ for c in instrumentation.driver_classes()]
+        self.assertIn("Trace", names)
+        self.assertIn("SpectrumAnalyzer", names)
+
+
+if __name__ == '__main__':
+    unittest.main()
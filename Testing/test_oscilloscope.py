@@ -3,18 +3,16 @@ import sys
 import io
 sys.path.append('../Measurement_Software')
 from Instruments import oscilloscope_rigol
-import pyvisa
+from Testing import instrument_session
 
-class TestRigolOscilloscope(unittest.TestCase):
+class TestRigolOscilloscope(instrument_session.InstrumentTestCase):
+    # The expected values are those of the lab oscilloscope, the simulator answers
+    # them from instrument_session.SIMULATED_RESPONSES.
+    instrument_name = "Oscilloscope"
 
     def setup(self):
-        """Set up a mock instrument and RigolOscilloscope instance before each test."""
-        rm = pyvisa.ResourceManager()
-        insturment_list = [] #types the name of the instruments you want to query 
-
-        #Add auto connection
-        r = rm.open_resource('USB0::0x1AB1::0x0517::DS1ZE264M00036::INSTR')
-        self.scope = oscilloscope_rigol.Oscilloscope(r)
+        """Set up a RigolOscilloscope on the shared session before each test."""
+        self.scope = oscilloscope_rigol.Oscilloscope(self.session)
         self.instrument = self.scope.instrument
         # Redirect stdout to capture print statements
         self.held_stdout = sys.stdout
@@ -0,0 +1,294 @@
+import unittest
+import sys
+sys.path.append('../Measurement_Software')
+import numpy as np
+from Instruments import oscilloscope_helper
+from Instruments.oscilloscope_rigol import Oscilloscope
+
+
+def square_wave(points=200000, period=1000, duty=0.25, rise=20, high=3.3, low=0.0):
+    """Trapezoidal square wave with linear edges of the given number of samples."""
+    phase = np.arange(points) % period
+    wave = np.full(points, low, dtype=np.float64)
+    high_len = int(period * duty)
+    wave[(phase >= rise) & (phase < high_len)] = high
+    ramp_up = phase < rise
+    wave[ramp_up] = low + (high - low) * phase[ramp_up] / rise
+    ramp_down = (phase >= high_len) & (phase < high_len + rise)
+    wave[ramp_down] = high - (high - low) * (phase[ramp_down] - high_len) / rise
+    return wave
+
+
+class TestWaveformMeasurement(unittest.TestCase):
+
+    def setUp(self):
+        self.dt = 1e-9
+        self.wave = square_wave()
+        self.measurement = oscilloscope_helper.WaveformMeasurement(
+            self.wave, self.dt, chunk_size=4096, workers=4)
+
+    def test_canonical_measure_item(self):
+        self.assertEqual(oscilloscope_helper.canonical_measure_item("freq"), "FREQuency")
+        self.assertEqual(oscilloscope_helper.canonical_measure_item("OVERSHOOT"), "OVERshoot")
+        with self.assertRaises(ValueError):
+            oscilloscope_helper.canonical_measure_item("INVALID")
+
+    def test_voltage_items(self):
+        m = self.measurement
+        self.assertAlmostEqual(m.get_measure_item("VMAX"), 3.3)
+        self.assertAlmostEqual(m.get_measure_item("VMIN"), 0.0)
+        self.assertAlmostEqual(m.get_measure_item("VPP"), 3.3)
+        self.assertAlmostEqual(m.get_measure_item("VAVG"), self.wave.mean())
+        self.assertAlmostEqual(m.get_measure_item("VRMS"), np.sqrt(np.mean(self.wave ** 2)))
+        self.assertAlmostEqual(m.get_measure_item("VTOP"), 3.3, delta=0.02)
+        self.assertAlmostEqual(m.get_measure_item("VBASe"), 0.0, delta=0.02)
+
+    def test_time_items(self):
+        m = self.measurement
+        self.assertAlmostEqual(m.get_measure_item("PERiod"), 1000 * self.dt, delta=1e-12)
+        self.assertAlmostEqual(m.get_measure_item("FREQuency"), 1e6, delta=1)
+        # 10 % to 90 % of a 20 sample linear ramp.
+        self.assertAlmostEqual(m.get_measure_item("RTIMe"), 16 * self.dt, delta=0.5 * self.dt)
+        self.assertAlmostEqual(m.get_measure_item("FTIMe"), 16 * self.dt, delta=0.5 * self.dt)
+        self.assertAlmostEqual(m.get_measure_item("PDUTy"), 0.25, delta=0.01)
+        self.assertEqual(m.get_measure_item("PEDGes"), 200)
+        self.assertEqual(m.get_measure_item("NEDGes"), 200)
+
+    def test_chunking_matches_single_pass(self):
+        single = oscilloscope_helper.WaveformMeasurement(self.wave, self.dt, workers=1,
+                                                         chunk_size=self.wave.size)
+        for item in ("RTIMe", "PWIDth", "PEDGes", "VTOP"):
+            self.assertAlmostEqual(self.measurement.get_measure_item(item),
+                                   single.get_measure_item(item))
+
+    def test_delay_between_sources(self):
+        shifted = oscilloscope_helper.WaveformMeasurement(np.roll(self.wave, 100), self.dt)
+        self.assertAlmostEqual(self.measurement.get_measure_item("RDELay", shifted),
+                               100 * self.dt, delta=1e-12)
+        self.assertAlmostEqual(self.measurement.get_measure_item("RPHase", shifted), 36.0, delta=0.1)
+        with self.assertRaises(ValueError):
+            self.measurement.get_measure_item("RDELay")
+
+    def test_dc_signal_has_no_period(self):
+        flat = oscilloscope_helper.WaveformMeasurement(np.ones(1000), self.dt)
+        self.assertTrue(np.isnan(flat.get_measure_item("PERiod")))
+        self.assertEqual(flat.get_measure_item("VPP"), 0.0)
+
+    def test_invalid_thresholds(self):
+        with self.assertRaises(ValueError):
+            oscilloscope_helper.WaveformMeasurement(self.wave, self.dt, max_threshold=96)
+        with self.assertRaises(ValueError):
+            oscilloscope_helper.WaveformMeasurement(self.wave, self.dt, mid_threshold=10, min_threshold=20)
+
+    def test_decode_waveform(self):
+        preamble = {'yorigin': 0, 'yreference': 127, 'yincrement': 0.04}
+        volts = oscilloscope_helper.decode_waveform(np.array([127, 152, 102], dtype=np.uint8), preamble)
+        np.testing.assert_allclose(volts, [0.0, 1.0, -1.0], atol=1e-6)
+
+
+class TestTMCBlock(unittest.TestCase):
+
+    def test_parse_block(self):
+        payload = oscilloscope_helper.parse_tmc_block(b'#9000000004\x01\x02\x03\x04\n')
+        self.assertIsInstance(payload, memoryview)
+        self.assertEqual(bytes(payload), b'\x01\x02\x03\x04')
+
+    def test_invalid_block(self):
+        with self.assertRaises(ValueError):
+            oscilloscope_helper.parse_tmc_block(b'1,2,3')
+        with self.assertRaises(ValueError):
+            oscilloscope_helper.parse_tmc_block(b'#9000000010\x01')
+
+
+class TestEventTable(unittest.TestCase):
+
+    TABLE = (b"Decode1,UART\r\n"
+             b"Time,TX,Error\r\n"
+             b"-4.000000e-04,0x41,\r\n"
+             b"-3.000000e-04,0x42,Parity\r\n"
+             b"1.5us,0xFF,\r\n")
+
+    def test_parse_event_table(self):
+        table = oscilloscope_helper.parse_event_table(self.TABLE)
+        self.assertEqual(table.dtype.names, ("time", "tx", "error_text", "error"))
+        np.testing.assert_allclose(table["time"], [-4e-4, -3e-4, 1.5e-6])
+        np.testing.assert_array_equal(table["tx"], [0x41, 0x42, 0xFF])
+        np.testing.assert_array_equal(table["error"], [False, True, False])
+
+    def test_parse_as_dict(self):
+        columns = oscilloscope_helper.parse_event_table(b"Time,Data\n1e-6,12\n2e-6,\n", as_dict=True)
+        self.assertEqual(list(columns["data"]), [12, oscilloscope_helper.MISSING_INTEGER])
+        self.assertEqual(len(columns["time"]), 2)
+        with self.assertRaises(ValueError):
+            oscilloscope_helper.parse_event_table(b"1,2\n")
+
+    def test_malformed_rows(self):
+        # Six fields in total, as many as three well-formed rows, but the rows have 3, 1 and 2.
+        table = oscilloscope_helper.parse_event_table(b"Time,Data\n1e-6,1,7\n2e-6\n3e-6,3\n")
+        np.testing.assert_allclose(table["time"], [1e-6, 2e-6, 3e-6])
+        np.testing.assert_array_equal(table["data"], [1, oscilloscope_helper.MISSING_INTEGER, 3])
+
+    def test_tracker_returns_new_rows(self):
+        tracker = oscilloscope_helper.EventTableTracker()
+        first = tracker.update(self.TABLE[:-13])
+        self.assertEqual(len(first), 2)
+        new = tracker.update(self.TABLE)
+        np.testing.assert_array_equal(new["tx"], [0xFF])
+        self.assertEqual(len(tracker.update(self.TABLE)), 0)
+        # A cleared table starts over.
+        restarted = tracker.update(b"Time,TX\n1e-3,0x01\n")
+        self.assertEqual(len(restarted), 1)
+
+    def test_tracker_waits_for_header(self):
+        tracker = oscilloscope_helper.EventTableTracker()
+        self.assertEqual(len(tracker.update(b"")), 0)
+        self.assertEqual(len(tracker.update(b"Decode1,UART\r\n")), 0)
+        self.assertIsNone(tracker.header)
+        self.assertEqual(len(tracker.update(self.TABLE)), 3)
+        self.assertEqual(len(tracker.update(b"")), 0)
+        self.assertEqual(tracker.update(b"").dtype.names, ("time", "error"))
+
+
+class FakeScopeInstrument():
+    """Answers the waveform commands used by acquire_channels from per-source codes."""
+
+    def __init__(self, codes):
+        self.codes = codes
+        self.source = None
+        self.start = 1
+        self.stop = 1
+        self.writes = []
+        self.queries = []
+        self.pending = None
+        # Trigger status after :SINGle: still STOP from the previous acquisition, then waiting.
+        self.statuses = []
+        self.singles = 0
+        # Acquisitions armed after this many :SINGle never trigger.
+        self.trigger_limit = None
+
+    def write(self, command):
+        self.writes.append(command)
+        name, _, value = command.partition(' ')
+        if name == ":SINGle":
+            self.singles += 1
+            self.statuses = ["STOP", "WAIT", "WAIT"]
+        elif name == ":WAVeform:SOURce":
+            self.source = value
+        elif name == ":WAVeform:STARt":
+            self.start = int(value)
+        elif name == ":WAVeform:STOP":
+            self.stop = int(value)
+        elif name == ":WAVeform:DATA?":
+            data = self.codes[self.source][self.start - 1:self.stop].tobytes()
+            self.pending = b'#9%09d' % len(data) + data + b'\n'
+
+    def read_raw(self):
+        return self.pending
+
+    def query(self, command):
+        self.queries.append(command)
+        if command == "*OPC?":
+            return "1\n"
+        if command == ":TRIGger:STATus?":
+            if self.statuses:
+                return self.statuses.pop(0) + "\n"
+            waiting = self.trigger_limit is not None and self.singles > self.trigger_limit
+            return ("WAIT" if waiting else "STOP") + "\n"
+        points = len(self.codes[self.source])
+        return f"0,2,{points},1,1e-09,0,0,0.04,0,127\n"
+
+
+class TestAcquireChannels(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.codes = {name: rng.integers(0, 256, 600000, dtype=np.uint8) for name in ("CHAN1", "CHAN2")}
+        self.scope = Oscilloscope(FakeScopeInstrument(self.codes))
+
+    def test_acquire_channels(self):
+        volts, time = self.scope.acquire_channels([1, "CHANnel2"])
+        self.assertEqual(volts.shape, (2, 600000))
+        self.assertEqual(volts.dtype, np.float32)
+        np.testing.assert_allclose(volts[1], (self.codes["CHAN2"].astype(float) - 127) * 0.04, atol=1e-5)
+        self.assertAlmostEqual(time[1] - time[0], 1e-9)
+        self.assertEqual(self.scope.instrument.writes.count(":STOP"), 1)
+        self.assertEqual(self.scope.get_cached_preamble(2)['points'], 600000)
+
+    def test_buffer_reused(self):
+        self.scope.acquire_channels([1, 2])
+        buffer = self.scope._waveform_buffer
+        self.scope.acquire_channels([2])
+        self.assertIs(self.scope._waveform_buffer, buffer)
+
+    def test_continuous_capture(self):
+        results = []
+        count = self.scope.continuous_capture(
+            lambda index, volts, time: results.append((index, volts[0, :10].copy())),
+            n=5, sources=[1], queue_depth=2)
+        self.assertEqual(count, 5)
+        self.assertEqual([index for index, _ in results], list(range(5)))
+        np.testing.assert_allclose(results[-1][1], (self.codes["CHAN1"][:10].astype(float) - 127) * 0.04, atol=1e-5)
+        # Armed once per acquisition and never left armed.
+        self.assertEqual(self.scope.instrument.writes.count(":SINGle"), 5)
+        # The preamble is read for the first acquisition only.
+        self.assertEqual(self.scope.instrument.queries.count(":WAVeform:PREamble?"), 1)
+
+    def test_reuse_preambles(self):
+        self.scope.acquire_channels([1, 2])
+        volts, _ = self.scope.acquire_channels([1, 2], reuse_preambles=True)
+        self.assertEqual(self.scope.instrument.queries.count(":WAVeform:PREamble?"), 2)
+        np.testing.assert_allclose(volts[0], (self.codes["CHAN1"].astype(float) - 127) * 0.04, atol=1e-5)
+        # Another mode has other preambles.
+        self.scope.acquire_channels([1], mode="NORMal", reuse_preambles=True)
+        self.assertEqual(self.scope.instrument.queries.count(":WAVeform:PREamble?"), 3)
+
+    def test_wait_for_acquisition_ignores_stale_stop(self):
+        self.scope.single()
+        self.scope.wait_for_acquisition(timeout=1)
+        self.assertEqual(self.scope.instrument.statuses, [])
+        # No trigger status change: the stale STOP is not accepted, :SINGle is sent again.
+        self.assertTrue(self.scope.wait_for_acquisition(timeout=1, arm_timeout=0.01))
+        self.assertEqual(self.scope.instrument.writes.count(":SINGle"), 2)
+
+    def test_wait_for_acquisition_never_armed(self):
+        self.scope.single = lambda: None
+        with self.assertRaises(TimeoutError):
+            self.scope.wait_for_acquisition(timeout=0.05, arm_timeout=0.01)
+
+    def test_continuous_capture_stops(self):
+        count = self.scope.continuous_capture(lambda index, volts, time: index < 2, sources=[2])
+        self.assertEqual(count, 3)
+        self.assertEqual(self.scope.instrument.writes[-1], ":STOP")
+
+    def test_continuous_capture_stops_while_armed(self):
+        # The acquisition armed ahead of the stopping callback never triggers.
+        self.scope.instrument.trigger_limit = 3
+        count = self.scope.continuous_capture(lambda index, volts, time: index < 2, sources=[2])
+        self.assertEqual(count, 3)
+        self.assertEqual(self.scope.instrument.writes[-1], ":STOP")
+
+    def test_continuous_capture_error(self):
+        def callback(index, volts, time):
+            raise ZeroDivisionError
+        with self.assertRaises(ZeroDivisionError):
+            self.scope.continuous_capture(callback, n=3)
+
+    def test_invalid_source(self):
+        with self.assertRaises(ValueError):
+            self.scope.acquire_channels([3])
+
+    def test_short_block(self):
+        self.scope.acquire_channels([1, 2])
+        self.codes["CHAN2"] = self.codes["CHAN2"][:-10]
+        self.scope.instrument.query = lambda command: "0,2,600000,1,1e-09,0,0,0.04,0,127\n"
+        with self.assertRaises(RuntimeError):
+            self.scope.acquire_channels([1, 2])
+
+    def test_sources_with_different_lengths(self):
+        self.codes["CHAN2"] = self.codes["CHAN2"][:1000]
+        with self.assertRaises(RuntimeError):
+            self.scope.acquire_channels([1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,185 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+import threading
+import time
+sys.path.append('../Measurement_Software')
+from Experiments import scheduler
+
+# Filled by the experiments below: (label, start, end) per run and the attempts per label.
+RUNS = []
+ATTEMPTS = {}
+BARRIER = threading.Barrier(2, timeout=5)
+
+
+class FakeResource():
+
+    def __init__(self):
+        self.closed = False
+        self.source = None
+
+    def write(self, message):
+        self.source = message.split()[-1]
+
+    def query(self, message):
+        return self.source if message == "SOURce?" else "1"
+
+    def close(self):
+        self.closed = True
+
+
+class FakeDriver():
+    opened = 0
+
+    def __init__(self):
+        FakeDriver.opened += 1
+        self.instrument = FakeResource()
+
+    def read_source(self, source):
+        # Selects the source and reads it back, like a waveform read.
+        self.instrument.write(f"SOURce {source}")
+        time.sleep(0.005)
+        return self.instrument.query("SOURce?")
+
+
+def hold(instruments, label, seconds=0.1):
+    start = time.monotonic()
+    time.sleep(seconds)
+    RUNS.append((label, start, time.monotonic()))
+    return {name: driver.instrument.query("*OPC?") for name, driver in instruments.items()}
+
+
+def meet(instruments):
+    # Returns only if both jobs sharing the instrument run at the same time.
+    return BARRIER.wait()
+
+
+def read_sources(instruments, source):
+    return [instruments["Scope"].read_source(source) for _ in range(10)]
+
+
+def flaky(instruments, label):
+    ATTEMPTS[label] = ATTEMPTS.get(label, 0) + 1
+    if ATTEMPTS[label] == 1:
+        raise TimeoutError("The oscilloscope did not trigger.")
+    return ATTEMPTS[label]
+
+
+def overlap(first, second):
+    return first[1] < second[2] and second[1] < first[2]
+
+
+class TestScheduler(unittest.TestCase):
+
+    def setUp(self):
+        RUNS.clear()
+        ATTEMPTS.clear()
+        BARRIER.reset()
+        FakeDriver.opened = 0
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "queue.json")
+        self.scheduler = scheduler.Scheduler(self.path, {"Scope": FakeDriver, "Spike": FakeDriver},
+                                             workers=4, poll_interval=0.05)
+
+    def runs(self):
+        return {label: (label, start, end) for label, start, end in RUNS}
+
+    def test_exclusive_leases_and_interleaving(self):
+        for label in ("a", "b"):
+            self.scheduler.submit("Testing.test_scheduler:hold", ["Scope"], {"label": label})
+        self.scheduler.submit("Testing.test_scheduler:hold", ["Spike"], {"label": "c"})
+        utilization = self.scheduler.run()
+        runs = self.runs()
+        self.assertFalse(overlap(runs["a"], runs["b"]))
+        self.assertTrue(overlap(runs["a"], runs["c"]))
+        self.assertGreater(utilization["Scope"], utilization["Spike"])
+        self.assertEqual(FakeDriver.opened, 2)
+        self.assertEqual(self.scheduler.queue.get(1)["result"], {"Scope": "1"})
+        self.scheduler.close()
+
+    def test_shared_leases_run_together(self):
+        for _ in range(2):
+            self.scheduler.submit("Testing.test_scheduler:meet", {"Scope": scheduler.SHARED})
+        self.scheduler.run()
+        self.assertEqual([job["state"] for job in self.scheduler.queue.jobs], [scheduler.DONE] * 2)
+
+    def test_blocked_job_is_not_overtaken(self):
+        self.scheduler.submit("Testing.test_scheduler:hold", {"Scope": scheduler.SHARED}, {"label": "monitor"})
+        self.scheduler.submit("Testing.test_scheduler:hold", ["Scope"], {"label": "sweep"})
+        self.scheduler.submit("Testing.test_scheduler:hold", {"Scope": scheduler.SHARED}, {"label": "late"})
+        self.scheduler.run()
+        runs = self.runs()
+        self.assertLessEqual(runs["monitor"][2], runs["sweep"][1])
+        self.assertLessEqual(runs["sweep"][2], runs["late"][1])
+
+    def test_shared_jobs_do_not_interleave_driver_methods(self):
+        for source in ("CHAN1", "CHAN2"):
+            self.scheduler.submit("Testing.test_scheduler:read_sources", {"Scope": scheduler.SHARED},
+                                  {"source": source})
+        self.scheduler.run()
+        self.assertEqual([job["result"] for job in self.scheduler.queue.jobs],
+                         [["CHAN1"] * 10, ["CHAN2"] * 10])
+
+    def test_blocked_job_reserves_only_busy_instruments(self):
+        self.scheduler.submit("Testing.test_scheduler:hold", ["Scope"], {"label": "scope", "seconds": 0.3})
+        self.scheduler.submit("Testing.test_scheduler:hold", ["Scope", "Spike"], {"label": "both"})
+        self.scheduler.submit("Testing.test_scheduler:hold", ["Spike"], {"label": "spike"})
+        self.scheduler.run()
+        runs = self.runs()
+        self.assertTrue(overlap(runs["scope"], runs["spike"]))
+        self.assertLessEqual(runs["scope"][2], runs["both"][1])
+
+    def test_blocked_job_reserves_all_after_max_wait(self):
+        self.scheduler.max_wait = 0
+        self.scheduler.submit("Testing.test_scheduler:hold", ["Scope"], {"label": "scope", "seconds": 0.3})
+        self.scheduler.submit("Testing.test_scheduler:hold", ["Scope", "Spike"], {"label": "both"})
+        self.scheduler.submit("Testing.test_scheduler:hold", ["Spike"], {"label": "spike"})
+        self.scheduler.run()
+        runs = self.runs()
+        self.assertLessEqual(runs["both"][2], runs["spike"][1])
+
+    def test_retry_and_failure(self):
+        self.scheduler.submit("Testing.test_scheduler:flaky", ["Scope"], {"label": "retried"}, max_attempts=2)
+        self.scheduler.submit("Testing.test_scheduler:flaky", ["Spike"], {"label": "failed"})
+        self.scheduler.run()
+        retried, failed = self.scheduler.queue.jobs
+        self.assertEqual((retried["state"], retried["attempts"], retried["result"]), (scheduler.DONE, 2, 2))
+        self.assertEqual(failed["state"], scheduler.FAILED)
+        self.assertIn("did not trigger", failed["error"])
+
+    def test_resume_after_crash(self):
+        queue = scheduler.JobQueue(self.path)
+        for label in ("done", "interrupted", "waiting"):
+            queue.submit("Testing.test_scheduler:hold", ["Scope"], {"label": label, "seconds": 0})
+        queue.jobs[0].update(state=scheduler.DONE, attempts=1)
+        queue.jobs[1].update(state=scheduler.RUNNING, attempts=1)
+        queue.save()
+
+        resumed = scheduler.Scheduler(self.path, {"Scope": FakeDriver}, poll_interval=0.05)
+        self.assertEqual([job["state"] for job in resumed.queue.jobs],
+                         [scheduler.DONE, scheduler.QUEUED, scheduler.QUEUED])
+        resumed.run()
+        self.assertEqual(sorted(self.runs()), ["interrupted", "waiting"])
+        with open(self.path) as f:
+            jobs = json.load(f)["jobs"]
+        self.assertEqual([job["state"] for job in jobs], [scheduler.DONE] * 3)
+        self.assertEqual((jobs[1]["attempts"], jobs[1]["interruptions"]), (1, 1))
+
+    def test_invalid_jobs(self):
+        with self.assertRaises(ValueError):
+            self.scheduler.submit("Testing.test_scheduler:hold", {"Scope": "read"})
+        with self.assertRaises(ValueError):
+            self.scheduler.submit("Testing.test_scheduler:hold", ["Laser"])
+        with self.assertRaises(ValueError):
+            self.scheduler.submit("Testing.test_scheduler:hold", ["Scope"], {"label": object()})
+        job_id = self.scheduler.submit("Testing.test_scheduler:hold", ["Scope"], {"label": "x"})
+        self.scheduler.queue.cancel(job_id)
+        self.scheduler.run()
+        self.assertEqual(RUNS, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+import os
+import sys
+import tempfile
+sys.path.append('../Measurement_Software')
+from Instruments import screenshot
+from Instruments.oscilloscope_rigol import Oscilloscope
+
+PNG = b'\x89PNG\r\n\x1a\n' + bytes(100)
+BMP = b'BM' + bytes(100)
+
+
+class FakeDisplayInstrument():
+    """Answers :DISPlay:DATA? with a BMP image unless PNG is supported."""
+
+    def __init__(self, png_supported):
+        self.png_supported = png_supported
+        self.commands = []
+
+    def write(self, command):
+        self.commands.append(command)
+
+    def read_raw(self):
+        image = PNG if self.png_supported and "PNG" in self.commands[-1] else BMP
+        return b'#9%09d' % len(image) + image + b'\n'
+
+
+class TestScreenshot(unittest.TestCase):
+
+    def test_image_format(self):
+        self.assertEqual(screenshot.image_format(PNG), "PNG")
+        self.assertEqual(screenshot.image_format(memoryview(BMP)), "BMP")
+        self.assertIsNone(screenshot.image_format(b'1,2,3'))
+
+    def test_png_preferred(self):
+        scope = Oscilloscope(FakeDisplayInstrument(png_supported=True))
+        data = scope.get_screenshot()
+        self.assertEqual(data, PNG)
+        self.assertIsInstance(data, memoryview)
+        self.assertEqual(scope.instrument.commands[-1], ":DISPlay:DATA? ON,OFF,PNG")
+
+    def test_format_fallback_is_cached(self):
+        scope = Oscilloscope(FakeDisplayInstrument(png_supported=False))
+        self.assertEqual(bytes(scope.get_screenshot()), BMP)
+        scope.get_screenshot()
+        self.assertEqual(scope.instrument.commands[-1], ":DISPlay:DATA? ON,OFF")
+
+    def test_time_lapse(self):
+        scope = Oscilloscope(FakeDisplayInstrument(png_supported=True))
+        with tempfile.TemporaryDirectory() as directory:
+            names = screenshot.capture_time_lapse(scope, 3, 0.01, directory, prefix="scope")
+            self.assertEqual([os.path.basename(name) for name in names],
+                             ["scope_0000.png", "scope_0001.png", "scope_0002.png"])
+            for name in names:
+                with open(name, 'rb') as f:
+                    self.assertEqual(f.read(), PNG)
+
+
+if __name__ == '__main__':
+    unittest.main()
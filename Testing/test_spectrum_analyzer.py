@@ -1,11 +1,12 @@
 import unittest
 from Instruments import spectrum_analyzer_signal_hound
+from Testing import instrument_session
+
+class TestSpectrumAnalyzer(instrument_session.InstrumentTestCase):
+    instrument_name = "Spike"
 
-class TestSpectrumAnalyzer(unittest.TestCase):
-    
     def setup(self):
-        #TODO insert connection
-        self.sa = spectrum_analyzer_signal_hound.SpectrumAnalyzer(None)
+        self.sa = spectrum_analyzer_signal_hound.SpectrumAnalyzer(self.session)
     # --- Display Tests ---
     """def test_is_spike_hidden(self):
         self.mock_instrument.query.return_value = '1'
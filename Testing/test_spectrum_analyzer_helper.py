@@ -0,0 +1,359 @@
+import unittest
+from unittest.mock import MagicMock
+import sys
+sys.path.append('../Measurement_Software')
+import numpy as np
+from Instruments import spectrum_analyzer_helper
+from Instruments.spectrum_analyzer_signal_hound import SpectrumAnalyzer
+
+
+class FakePeakTable():
+    """Answers peak table queries, compound queries included, from lists of peaks numbered from 1."""
+
+    def __init__(self, freqs, amps):
+        self.freqs = list(freqs)
+        self.amps = list(amps)
+        self.queries = []
+
+    def _answer(self, query):
+        command, _, index = query.partition(" ")
+        if command == ":SENS:PEAK:TABL:COUN?":
+            return str(len(self.freqs))
+        number = int(index)
+        if not 1 <= number <= len(self.freqs):
+            raise ValueError(f"Invalid peak number ({number}).")
+        i = number - 1
+        return {
+            ":SENS:PEAK:TABL:FREQ?": self.freqs[i],
+            ":SENS:PEAK:TABL:AMPL?": self.amps[i],
+            ":SENS:PEAK:TABL:FREQ:DELT?": self.freqs[i] - self.freqs[0],
+            ":SENS:PEAK:TABL:AMPL:DELT?": self.amps[i] - self.amps[0],
+        }[command]
+
+    def query(self, message):
+        self.queries.append(message)
+        return ";".join(str(self._answer(q)) for q in message.split(";"))
+
+
+class TestPeakTable(unittest.TestCase):
+
+    def setUp(self):
+        self.freqs = np.linspace(1e9, 2e9, 15)
+        self.amps = -np.arange(15, dtype=float)
+        self.sa = SpectrumAnalyzer(FakePeakTable(self.freqs, self.amps))
+
+    def test_read_peak_table(self):
+        table = self.sa.read_peak_table()
+        self.assertEqual(table.dtype, spectrum_analyzer_helper.PEAK_TABLE_DTYPE)
+        np.testing.assert_allclose(table['freq'], self.freqs)
+        np.testing.assert_allclose(table['damp'], self.amps - self.amps[0])
+        # One count query and one compound query instead of 60 single queries.
+        self.assertEqual(len(self.sa.instrument.queries), 2)
+        self.assertIn(":SENS:PEAK:TABL:FREQ? 15", self.sa.instrument.queries[1])
+
+    def test_track_peak_table(self):
+        table, changed = self.sa.track_peak_table()
+        self.assertEqual(len(changed), 15)
+        np.testing.assert_allclose(table['dfreq'], self.freqs - self.freqs[0])
+        self.sa.instrument.amps[3] = 10.0
+        self.sa.instrument.freqs.append(3e9)
+        self.sa.instrument.amps.append(-80.0)
+        table, changed = self.sa.track_peak_table()
+        self.assertEqual(list(changed), [3, 15])
+        self.assertEqual(table['amp'][3], 10.0)
+        self.assertEqual(len(table), 16)
+
+    def test_compound_response_mismatch(self):
+        with self.assertRaises(ValueError):
+            spectrum_analyzer_helper.split_compound_response("1;2", 3)
+
+
+def tone_spectrum(freqs, tones, floor=-100.0, width=2e6):
+    """Spectrum in dBm of Gaussian shaped tones [(frequency, amplitude)] on a flat noise floor."""
+    power = np.full(freqs.shape, 10 ** (floor / 10))
+    for frequency, amplitude in tones:
+        power += 10 ** (amplitude / 10) * np.exp(-0.5 * ((freqs - frequency) / width) ** 2)
+    return 10 * np.log10(power)
+
+
+class TestPeakSearch(unittest.TestCase):
+
+    def setUp(self):
+        self.freqs = spectrum_analyzer_helper.trace_frequencies(1e9, 1e5, 10001)
+        self.trace = tone_spectrum(self.freqs, [(1.2e9, -20), (1.5e9, -40), (1.8e9, -70)])
+        self.trace += np.random.default_rng(1).normal(0, 0.3, self.trace.shape)
+
+    def test_find_peaks(self):
+        peaks = spectrum_analyzer_helper.find_peaks(self.trace, self.freqs, excursion=6.0)
+        np.testing.assert_allclose(peaks['freq'], [1.2e9, 1.5e9, 1.8e9], atol=2e5)
+        np.testing.assert_allclose(peaks['amp'], [-20, -40, -70], atol=1)
+        np.testing.assert_allclose(peaks['damp'], peaks['amp'] - peaks['amp'][0])
+        # 3 dB bandwidth of a Gaussian: 2 * sqrt(2 * 3 / (10 log10 e)) * width, the noise
+        # on the peak amplitude shifts the 3 dB points slightly.
+        expected = 2 * np.sqrt(2 * 3 / (10 * np.log10(np.e))) * 2e6
+        np.testing.assert_allclose(peaks['bandwidth'][:2], expected, rtol=0.1)
+
+    def test_threshold_and_sort(self):
+        peaks = spectrum_analyzer_helper.find_peaks(self.trace, self.freqs, excursion=6.0,
+                                                    threshold=-50, sort="FREQUENCY")
+        np.testing.assert_allclose(peaks['freq'], [1.2e9, 1.5e9], atol=2e5)
+
+    def test_equal_peaks_keep_one(self):
+        trace = [-100, -100, -10, -12, -11, -12, -10, -100, -100]
+        peaks = spectrum_analyzer_helper.find_peaks(trace, np.arange(9.0), excursion=6)
+        self.assertEqual(list(peaks['index']), [2])
+
+    def test_batch(self):
+        batch = np.stack([self.trace, self.trace - 10])
+        results = spectrum_analyzer_helper.find_peaks(batch, self.freqs, excursion=6.0, threshold=-75)
+        self.assertEqual([len(r) for r in results], [3, 2])
+
+    def test_marker(self):
+        marker = spectrum_analyzer_helper.PeakMarker(self.trace, self.freqs)
+        self.assertAlmostEqual(marker.peak_search(), 1.2e9, delta=2e5)
+        self.assertAlmostEqual(marker.next_peak(), 1.5e9, delta=2e5)
+        self.assertAlmostEqual(marker.right_peak(), 1.8e9, delta=2e5)
+        self.assertAlmostEqual(marker.left_peak(), 1.5e9, delta=2e5)
+
+    def test_parse_trace_data(self):
+        values = np.array([-10.5, -20.25], dtype='<f4')
+        block = b'#18' + values.tobytes() + b'\n'
+        np.testing.assert_array_equal(spectrum_analyzer_helper.parse_trace_data(block, "REAL"), values)
+        np.testing.assert_array_equal(spectrum_analyzer_helper.parse_trace_data("-10.5,-20.25\n", "ASCii"), values)
+
+
+class TestLimitMask(unittest.TestCase):
+
+    def setUp(self):
+        self.freqs = spectrum_analyzer_helper.trace_frequencies(1e9, 1e6, 1001)
+        self.mask = spectrum_analyzer_helper.LimitMask([1.1e9, 1.5e9, 1.9e9], [-30, -50, -30], offset=-5)
+
+    def test_align(self):
+        limit = self.mask.align(self.freqs)
+        self.assertTrue(np.isnan(limit[0]))
+        self.assertAlmostEqual(limit[500], -55)
+        self.assertAlmostEqual(limit[300], -45)
+        self.assertIs(self.mask.align(self.freqs), limit)
+
+    def test_log_interpolation(self):
+        mask = spectrum_analyzer_helper.LimitMask([1e6, 1e9], [0, -30], interpolation="LOGarithmic")
+        self.assertAlmostEqual(mask.align([1e7, 1e8])[0], -10)
+
+    def test_batch(self):
+        traces = np.full((1000, len(self.freqs)), -60.0)
+        traces[7, 500] = -54
+        traces[9, 0] = 0  # outside the limit line, not tested
+        passed, failing = self.mask.test(traces, self.freqs)
+        self.assertEqual(list(np.flatnonzero(~passed)), [7])
+        self.assertEqual(list(self.mask.failing_bins(traces[7])), [500])
+
+    def test_lower_line(self):
+        mask = spectrum_analyzer_helper.LimitMask([1e9, 2e9], [-70, -70], line_type="LOWer")
+        passed, _ = mask.test(np.full(len(self.freqs), -80.0), self.freqs)
+        self.assertFalse(passed)
+        with self.assertRaises(ValueError):
+            spectrum_analyzer_helper.LimitMask([1e9, 2e9], [0, 0], line_type="MIDDLE")
+
+
+class FakePathLoss():
+    """Stores path loss tables written with :SENS:CORR:PATH<n>:DATA."""
+
+    def __init__(self):
+        self.tables = {}
+        self.writes = []
+
+    def write(self, message):
+        self.writes.append(message)
+        command, _, data = message.partition(" ")
+        self.tables[command] = data
+
+    def query(self, message):
+        command = message.rstrip("?")
+        if command.endswith(":STAT"):
+            return "1" if self.tables.get(command) in ("ON", "1") else "0"
+        return self.tables.get(command, "")
+
+
+class TestPathLoss(unittest.TestCase):
+
+    def setUp(self):
+        self.sa = SpectrumAnalyzer(FakePathLoss())
+        self.freqs = spectrum_analyzer_helper.trace_frequencies(1e9, 1e6, 1001)
+
+    def test_upload_and_read_back(self):
+        self.sa.set_path_loss_table_points(2, [2e9, 1e9], [4.0, 2.0])
+        self.assertEqual(self.sa.instrument.writes, [":SENS:CORR:PATH2:DATA 1000000000,2,2000000000,4"])
+        self.assertEqual(self.sa.get_path_loss_table_data(2), {1e9: 2.0, 2e9: 4.0})
+
+    def test_apply_path_loss(self):
+        self.sa.set_path_loss_table_points(1, [1e9, 2e9], [2.0, 4.0])
+        self.sa.set_path_loss_table_points(3, [0, 3e9], [1.0, 1.0])
+        traces = np.zeros((100, len(self.freqs)))
+        corrected = self.sa.apply_path_loss(traces, self.freqs, [1, 3])
+        np.testing.assert_allclose(corrected[5, [0, 500, 1000]], [3.0, 4.0, 5.0])
+        self.sa.apply_path_loss(traces, self.freqs, table_nums=1, out=traces)
+        self.assertAlmostEqual(traces[0, 500], 3.0)
+
+    def test_enabled_table_is_not_applied_twice(self):
+        self.sa.set_path_loss_table_points(1, [1e9, 2e9], [2.0, 4.0])
+        self.sa.instrument.tables[":SENS:CORR:PATH1:STAT"] = "1"
+        with self.assertRaises(ValueError):
+            self.sa.apply_path_loss(np.zeros(len(self.freqs)), self.freqs, 1)
+        self.sa.set_path_loss_table_state(1, "OFF")
+        self.assertAlmostEqual(self.sa.apply_path_loss(np.zeros(len(self.freqs)), self.freqs, 1)[500], 3.0)
+
+    def test_cache_invalidated(self):
+        self.sa.set_path_loss_table_points(1, [1e9, 2e9], [2.0, 4.0])
+        table = self.sa.get_path_loss_table(1)
+        self.assertIs(self.sa.get_path_loss_table(1), table)
+        self.sa.clear_path_loss_table(1)
+        self.sa.instrument.tables.clear()
+        self.assertEqual(len(self.sa.get_path_loss_table(1)), 0)
+
+
+class TestTraceAccumulator(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(2)
+        self.traces = (-60 + rng.normal(0, 2, (200, 501))).astype(np.float32)
+        self.accumulator = spectrum_analyzer_helper.TraceAccumulator(501, percentiles=True, bin_width=0.1)
+
+    def test_statistics_match_numpy(self):
+        for trace in self.traces[:150]:
+            self.accumulator.update(trace)
+        self.accumulator.update(self.traces[150:])
+        traces = self.traces.astype(np.float64)
+        np.testing.assert_allclose(self.accumulator.log_average(), traces.mean(axis=0), atol=1e-9)
+        np.testing.assert_allclose(self.accumulator.variance(), traces.var(axis=0, ddof=1), rtol=1e-9)
+        np.testing.assert_array_equal(self.accumulator.max_hold(), self.traces.max(axis=0))
+        np.testing.assert_array_equal(self.accumulator.min_hold(), self.traces.min(axis=0))
+        power = 10 * np.log10(np.mean(10 ** (traces / 10), axis=0))
+        np.testing.assert_allclose(self.accumulator.power_average(), power, atol=1e-9)
+        np.testing.assert_allclose(self.accumulator.percentile(50), np.median(traces, axis=0), atol=0.35)
+
+    def test_updates_in_place(self):
+        self.accumulator.update(self.traces[0])
+        max_hold = self.accumulator.max_hold()
+        self.accumulator.update(self.traces[1])
+        np.testing.assert_array_equal(max_hold, np.maximum(self.traces[0], self.traces[1]))
+        self.accumulator.reset()
+        self.assertEqual(self.accumulator.count, 0)
+        with self.assertRaises(ValueError):
+            self.accumulator.log_average()
+
+    def test_stream_traces(self):
+        instrument = MagicMock()
+        traces = iter(self.traces[:5])
+        instrument.read_raw.side_effect = lambda: b'#42004' + next(traces).astype('<f4').tobytes()
+        sa = SpectrumAnalyzer(instrument)
+        sa.set_trace_format("REAL")
+        list(sa.stream_traces(5, self.accumulator))
+        self.assertEqual(self.accumulator.count, 5)
+        np.testing.assert_array_equal(self.accumulator.max_hold(), self.traces[:5].max(axis=0))
+
+
+class FakeSweeper():
+    """Sweeps the configured range with RBW/2 spacing, the amplitude is the frequency in GHz."""
+
+    def __init__(self):
+        self.start = self.stop = self.rbw = None
+        self.sweeps = 0
+
+    def write(self, message):
+        if message.startswith("SENSE:BAND "):
+            self.rbw = float(message.split()[1])
+
+    def query(self, message):
+        if message.startswith("SENSE:FREQ:STAR"):
+            parts = message.split(";")
+            self.start = float(parts[0].split()[1])
+            self.stop = float(parts[1].split()[1])
+            self.sweeps += 1
+            return "1"
+        if message == ":TRAC:XSTA?;:TRAC:XINC?":
+            return f"{self.start};{self.rbw / 2}"
+        if message == ":FORM:TRAC?":
+            return "REAL"
+
+    def read_raw(self):
+        freqs = spectrum_analyzer_helper.trace_frequencies(self.start, self.rbw / 2,
+                                                           int((self.stop - self.start) / (self.rbw / 2)) + 1)
+        data = (freqs / 1e9).astype('<f4').tobytes()
+        return b'#9%09d' % len(data) + data + b'\n'
+
+
+class TestSweepPlanner(unittest.TestCase):
+
+    def test_rbw_step(self):
+        self.assertEqual(spectrum_analyzer_helper.rbw_step(1000), 1000)
+        self.assertEqual(spectrum_analyzer_helper.rbw_step(2999), 1000)
+        self.assertEqual(spectrum_analyzer_helper.rbw_step(5e4), 3e4)
+
+    def test_plan_sweep(self):
+        plan = spectrum_analyzer_helper.plan_sweep(1e9, 3e9, 40e3, max_points=10000)
+        self.assertEqual(plan.rbw, 30e3)
+        max_span = 10000 * 30e3 / spectrum_analyzer_helper.BINS_PER_RBW
+        self.assertEqual(len(plan.segments), int(np.ceil(2e9 / (max_span - 2 * 5 * 30e3))))
+        for segment in plan.segments:
+            self.assertLessEqual(segment.stop - segment.start, max_span + 1)
+        self.assertEqual(plan.segments[0].start, 1e9)
+        self.assertEqual(plan.segments[-1].keep_stop, 3e9)
+
+    def test_sweep_wideband(self):
+        sa = SpectrumAnalyzer(FakeSweeper())
+        freqs, amps = sa.sweep_wideband(1e9, 1.5e9, 100e3, max_points=1000)
+        self.assertGreater(sa.instrument.sweeps, 1)
+        self.assertTrue(np.all(np.diff(freqs) > 0))
+        self.assertEqual(freqs[0], 1e9)
+        self.assertLessEqual(1.5e9 - freqs[-1], 50e3)
+        np.testing.assert_allclose(amps, freqs / 1e9, rtol=1e-6)
+
+
+class FakeMeasurements():
+    """Answers every query of a compound message, results are numbered 1, 2, 3, ..."""
+
+    def __init__(self, states):
+        self.states = states
+        self.messages = []
+
+    def write(self, message):
+        self.messages.append(message)
+
+    def query(self, message):
+        self.messages.append(message)
+        answers = []
+        for i, query in enumerate(message.split(";")):
+            if query.endswith(":STAT?"):
+                answers.append(self.states[query.split(":")[2]])
+            elif query == "*OPC?":
+                answers.append("1")
+            elif query != ":INIT:IMM":
+                answers.append(str(float(i + 1)))
+        return ";".join(answers)
+
+
+class TestReadMeasurements(unittest.TestCase):
+
+    def test_one_round_trip_per_sweep(self):
+        sa = SpectrumAnalyzer(FakeMeasurements({"CHP": "1", "OBW": "0", "IMD": "1"}))
+        results = sa.read_measurements()
+        self.assertEqual(results.main_channel_power, 1.0)
+        self.assertEqual(results.adjacent_channel_ac_power_upper, 5.0)
+        self.assertIsNone(results.occupied_bandwidth)
+        self.assertEqual(results.imd_im3u_toi, 17.0)
+        sa.instrument.messages.clear()
+        results = sa.read_measurements(sweep=True)
+        self.assertEqual(len(sa.instrument.messages), 1)
+        self.assertTrue(sa.instrument.messages[0].startswith(":INIT:IMM;*OPC?;"))
+        self.assertEqual(results.main_channel_power, 3.0)
+
+    def test_cached_enable_state(self):
+        sa = SpectrumAnalyzer(FakeMeasurements({"CHP": "0", "OBW": "0", "IMD": "0"}))
+        sa.enable_occupied_bandwidth(True)
+        results = sa.read_measurements()
+        self.assertEqual(results.occupied_bandwidth_power, 3.0)
+        self.assertIsNone(results.main_channel_power)
+
+
+if __name__ == '__main__':
+    unittest.main()
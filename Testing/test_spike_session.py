@@ -0,0 +1,158 @@
+import unittest
+import sys
+import io
+import threading
+sys.path.append('../Measurement_Software')
+from Instruments import transport
+from Instruments.spike_session import SpikeSession
+
+
+class FakeSpike():
+    """Spike SCPI server state shared by the connections opened by FakeSpikeConnection."""
+
+    def __init__(self):
+        self.active = None
+        self.devices = ["12345", "67890"]
+        self.drop_next = False
+        self.commands = []
+        self.preset_started = threading.Event()
+        self.release_preset = threading.Event()
+        self.release_preset.set()
+
+
+class FakeSpikeConnection():
+
+    def __init__(self, spike):
+        self.spike = spike
+        self.timeout = 2000
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+    def write(self, message):
+        self.spike.commands.append(message)
+
+    def query(self, message):
+        if self.closed:
+            raise ConnectionResetError("closed")
+        if self.spike.drop_next:
+            self.spike.drop_next = False
+            raise ConnectionResetError("dropped")
+        self.spike.commands.append(message)
+        spike = self.spike
+        if message == ":SYST:DEV:ACT?":
+            return "1" if spike.active else "0"
+        if message == ":SYST:DEV:CURR?":
+            return spike.active or ""
+        if message == ":SYST:DEV:LIST?":
+            return ",".join(spike.devices)
+        if message.startswith(":SYST:DEV:CON? "):
+            spike.active = message.split()[1]
+            return "1"
+        if message == ":SYST:DEV:DISC":
+            spike.active = None
+            return "1"
+        if message == ":SYST:PRES?":
+            assert self.timeout == 30000
+            spike.preset_started.set()
+            spike.release_preset.wait(5)
+            return "1"
+        if message == "*OPC?":
+            return "1"
+        return "0"
+
+
+class TestSpikeSession(unittest.TestCase):
+
+    def setUp(self):
+        self.held_stdout = sys.stdout
+        sys.stdout = io.StringIO()
+        self.spike = FakeSpike()
+        self.opened = []
+
+        def factory():
+            connection = FakeSpikeConnection(self.spike)
+            self.opened.append(connection)
+            return connection
+        self.session = SpikeSession(device="67890", preset_file="clean", factory=factory, retry_delay=0)
+
+    def tearDown(self):
+        self.session.close()
+        sys.stdout = self.held_stdout
+
+    def test_ensure_device(self):
+        self.spike.active = "12345"
+        self.assertTrue(self.session.ensure_device())
+        self.assertEqual(self.spike.active, "67890")
+        self.assertEqual(self.opened[0].timeout, 2000)
+
+    def test_reset_prefers_user_preset(self):
+        self.assertTrue(self.session.reset_state())
+        self.assertIn(":SYST:PRES:USER:LOAD clean.ini", self.spike.commands)
+        self.assertNotIn(":SYST:PRES?", self.spike.commands)
+
+    def test_background_preset(self):
+        self.spike.release_preset.clear()
+        self.session.preset_file = None
+        preset = self.session.reset_state(wait=False)
+        self.assertTrue(self.spike.preset_started.wait(5))
+        self.assertFalse(preset.done())
+        self.spike.release_preset.set()
+        self.assertTrue(self.session.wait_for_preset(5))
+        self.assertEqual(self.opened[0].timeout, 2000)
+
+    def test_reconnect(self):
+        self.session.resource.timeout = 4000
+        self.session.ensure_device()
+        self.spike.drop_next = True
+        self.spike.active = None
+        self.assertEqual(self.session.analyzer.get_device_count(), 0)
+        self.assertEqual(len(self.opened), 2)
+        self.assertEqual(self.opened[1].timeout, 4000)
+        # The device is connected again after the reconnect.
+        self.assertEqual(self.spike.active, "67890")
+
+    def test_other_errors_are_not_retried(self):
+        with self.assertRaises(ValueError):
+            transport.ReconnectingResource(lambda: _Failing(), retry_delay=0).query("*IDN?")
+        self.assertFalse(transport.is_connection_error(TimeoutError("timed out")))
+        self.assertTrue(transport.is_connection_error(ConnectionResetError("dropped")))
+
+    def test_commands_are_not_sent_twice(self):
+        self.session.ensure_device()
+        self.spike.drop_next = True
+        with self.assertRaises(ConnectionResetError):
+            self.session.resource.query(":INIT:IMM;*OPC?")
+        # Reconnected for the next call, but the sweep was not started again.
+        self.assertEqual(len(self.opened), 2)
+        self.assertNotIn(":INIT:IMM;*OPC?", self.spike.commands)
+        self.session.resource.retry_writes = True
+        self.spike.drop_next = True
+        self.assertEqual(self.session.resource.query(":INIT:IMM;*OPC?"), "0")
+        self.assertEqual(self.spike.commands.count(":INIT:IMM;*OPC?"), 1)
+
+    def test_preset_is_not_sent_twice(self):
+        self.session.ensure_device()
+        self.spike.drop_next = True
+        with self.assertRaises(ConnectionResetError):
+            self.session.resource.query(":SYST:PRES?")
+        self.assertNotIn(":SYST:PRES?", self.spike.commands)
+
+    def test_query_only(self):
+        self.assertTrue(transport.is_query_only(":SENS:PEAK:TABL:FREQ? 3;:SENS:PEAK:TABL:AMPL? 3"))
+        self.assertFalse(transport.is_query_only(":INIT:IMM;*OPC?"))
+        self.assertFalse(transport.is_query_only(":SYSTem:PRESet?"))
+        self.assertFalse(transport.is_query_only(':SYST:DEV:CON? "12345"'))
+
+
+class _Failing():
+    def query(self, message):
+        raise ValueError("bad")
+
+    def close(self):
+        pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+import sys
+sys.path.append('../Measurement_Software')
+import pyvisa
+from Instruments import timeout_policy
+from Instruments.oscilloscope_rigol import Oscilloscope
+
+
+class FakeBlockInstrument():
+    """Answers every query with a block of size bytes and remembers the timeout of each read."""
+
+    def __init__(self, size, fail=False):
+        self.timeout = 2000
+        self.size = size
+        self.fail = fail
+        self.read_timeouts = []
+
+    def write(self, command):
+        pass
+
+    def read_raw(self):
+        self.read_timeouts.append(self.timeout)
+        if self.fail:
+            raise pyvisa.errors.VisaIOError(pyvisa.constants.StatusCode.error_timeout)
+        return b'#9%09d' % self.size + bytes(self.size) + b'\n'
+
+
+class WaveformInstrument():
+    """Answers the waveform queries of get_waveform_data for points STARt to STOP in format."""
+
+    def __init__(self, fmt, start, stop):
+        self.timeout = 2000
+        self.answers = {":WAVeform:FORMat?": fmt, ":WAVeform:STARt?": f"{start}\n", ":WAVeform:STOP?": f"{stop}\n"}
+        self.size = (stop - start + 1) * (2 if fmt.startswith("WORD") else 1)
+        self.read_timeouts = []
+        self.queries = []
+
+    def query(self, command):
+        self.queries.append(command)
+        return ";".join(self.answers[c].strip() for c in command.split(";")) + "\n"
+
+    def write(self, command):
+        pass
+
+    def read_raw(self):
+        self.read_timeouts.append(self.timeout)
+        return b'#9%09d' % self.size + bytes(self.size) + b'\n'
+
+
+class TestTimeoutPolicy(unittest.TestCase):
+
+    def test_timeout_from_size(self):
+        policy = timeout_policy.TimeoutPolicy(throughput=1e6, latency=0.05, safety=2, minimum=500, maximum=60000)
+        self.assertEqual(policy.timeout(100), 500)
+        self.assertEqual(policy.timeout(10 ** 6), 2100)
+        self.assertEqual(policy.timeout(10 ** 9), 60000)
+        self.assertEqual(timeout_policy.waveform_size(1000, "WORD"), 2011)
+        self.assertEqual(timeout_policy.waveform_size(1000, "ASCii"), 14011)
+        self.assertGreater(timeout_policy.display_size("BMP24"), timeout_policy.display_size("BMP8"))
+
+    def test_learns_link_speed(self):
+        policy = timeout_policy.TimeoutPolicy(throughput=1e6, latency=0.0, smoothing=1.0)
+        policy.observe(10 ** 6, 0.1)
+        self.assertAlmostEqual(policy.throughput, 1e7)
+        policy.observe(100, 0.002)
+        self.assertAlmostEqual(policy.latency, 0.002)
+        policy.timed_out()
+        self.assertAlmostEqual(policy.throughput, 5e6)
+
+    def test_commands_update_latency(self):
+        policy = timeout_policy.TimeoutPolicy(latency=1.0, smoothing=1.0)
+        with policy.command():
+            pass
+        self.assertLess(policy.latency, 0.1)
+
+    def test_waveform_timeout_follows_format_and_points(self):
+        instrument = WaveformInstrument("WORD\n", 1, 100000)
+        scope = Oscilloscope(instrument)
+        scope.timeout_policy = timeout_policy.TimeoutPolicy(throughput=1e5, latency=0.0, smoothing=0.0)
+        self.assertEqual(len(scope.get_waveform_data()), 200000)
+        self.assertEqual(instrument.read_timeouts, [scope.timeout_policy.timeout(timeout_policy.waveform_size(100000, "WORD"))])
+        # Format and point range are read in one query.
+        self.assertEqual(len(instrument.queries), 1)
+
+    def test_driver_sets_and_restores_timeout(self):
+        instrument = FakeBlockInstrument(800 * 480 * 3)
+        scope = Oscilloscope(instrument)
+        scope.timeout_policy = timeout_policy.TimeoutPolicy(throughput=1e5, latency=0.0, smoothing=0.0)
+        self.assertEqual(len(scope.get_display_data(fmt="BMP24")), 800 * 480 * 3)
+        self.assertEqual(instrument.read_timeouts, [scope.timeout_policy.timeout(timeout_policy.display_size("BMP24"))])
+        self.assertGreater(instrument.read_timeouts[0], 30000)
+        self.assertEqual(instrument.timeout, 2000)
+
+    def test_timeout_restores_and_backs_off(self):
+        instrument = FakeBlockInstrument(100, fail=True)
+        scope = Oscilloscope(instrument)
+        self.assertEqual(scope.get_event_table_data(1), b"")
+        self.assertEqual(instrument.timeout, 2000)
+        self.assertAlmostEqual(scope.timeout_policy.throughput, 5e5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import unittest
+import io
+import os
+import sys
+import tempfile
+from contextlib import redirect_stdout
+sys.path.append('../Measurement_Software')
+import numpy as np
+import pyvisa
+from Instruments import traffic_recorder
+from Instruments.oscilloscope_rigol import Oscilloscope
+
+
+class FakeScope():
+    """Answers the waveform commands of the oscilloscope, times out on :BAD?."""
+
+    def __init__(self):
+        self.timeout = 2000
+
+    def write(self, command):
+        return len(command)
+
+    def query(self, command):
+        if command == ":BAD?":
+            raise pyvisa.errors.VisaIOError(pyvisa.constants.StatusCode.error_timeout)
+        return "1.0E+9\n"
+
+    def read_raw(self):
+        return b'#15hello\n'
+
+    def close(self):
+        pass
+
+
+class WaveformScope(FakeScope):
+    """Answers the commands of Oscilloscope.get_waveform_data with 1000 points in BYTE format."""
+
+    ANSWERS = {":WAVeform:FORMat?": "BYTE", ":WAVeform:STARt?": "1", ":WAVeform:STOP?": "1000"}
+
+    def query(self, command):
+        return ";".join(self.ANSWERS[c] for c in command.split(";")) + "\n"
+
+    def read_raw(self):
+        return b'#9000001000' + bytes(range(250)) * 4 + b'\n'
+
+
+class TestTrafficRecorder(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "run.trace")
+
+    def record(self, record_responses=True):
+        with traffic_recorder.RecordingResource(FakeScope(), self.path, record_responses) as resource:
+            resource.timeout = 5000
+            self.assertEqual(resource.resource.timeout, 5000)
+            scope = Oscilloscope(resource)
+            self.assertEqual(scope.get_sample_rate(), 1e9)
+            resource.write(":WAV:DATA?")
+            self.assertEqual(resource.read_raw(), b'#15hello\n')
+            with self.assertRaises(pyvisa.errors.VisaIOError):
+                resource.query(":BAD?")
+
+    def test_record_and_read(self):
+        self.record()
+        records = list(traffic_recorder.read_trace(self.path))
+        self.assertEqual([(r.operation, r.command) for r in records],
+                         [("query", ":ACQuire:SRATe?"), ("write", ":WAV:DATA?"), ("read_raw", ""), ("query", ":BAD?")])
+        self.assertEqual(records[0].response, "1.0E+9\n")
+        self.assertEqual(records[2].response, b'#15hello\n')
+        self.assertTrue(records[3].error)
+        self.assertTrue(all(r.duration >= 0 for r in records))
+
+    def test_summary(self):
+        self.record(record_responses=False)
+        records = list(traffic_recorder.read_trace(self.path))
+        summary = {s.path: s for s in traffic_recorder.summarize(records)}
+        self.assertEqual(summary[":WAV:DATA?"].count, 2)
+        self.assertEqual(summary[":WAV:DATA?"].response_bytes, 9)
+        self.assertEqual(summary[":ACQUIRE:SRATE?"].response_bytes, 7)
+        bins, histograms = traffic_recorder.latency_histograms(records)
+        self.assertEqual(histograms[":WAV:DATA?"].sum(), 2)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            traffic_recorder.main([self.path, "--histogram"])
+        self.assertIn(":WAV:DATA?", output.getvalue())
+
+    def test_replay(self):
+        self.record()
+        replay = traffic_recorder.ReplayResource(self.path)
+        replay.timeout = 5000
+        self.assertEqual(Oscilloscope(replay).get_sample_rate(), 1e9)
+        with self.assertRaises(ValueError):
+            replay.write(":WAV:MODE RAW")
+        replay.write(":WAV:DATA?")
+        self.assertEqual(replay.read_raw(), b'#15hello\n')
+        with self.assertRaises(pyvisa.errors.VisaIOError) as error:
+            replay.query(":BAD?")
+        self.assertEqual(error.exception.error_code, pyvisa.constants.StatusCode.error_timeout)
+        self.assertEqual(replay.remaining(), 0)
+
+    def test_waveform_data(self):
+        with traffic_recorder.RecordingResource(WaveformScope(), self.path) as resource:
+            data = Oscilloscope(resource).get_waveform_data()
+        self.assertEqual(len(data), 1000)
+        records = list(traffic_recorder.read_trace(self.path))
+        self.assertEqual(records[-2].command, ":WAVeform:DATA?")
+        self.assertEqual(records[-1].operation, "read_raw")
+        summary = {s.path: s for s in traffic_recorder.summarize(records)}
+        self.assertEqual(summary[":WAVEFORM:DATA?"].count, 2)
+        self.assertEqual(summary[":WAVEFORM:DATA?"].response_bytes, 1012)
+        replay = traffic_recorder.ReplayResource(self.path)
+        self.assertEqual(Oscilloscope(replay).get_waveform_data(), data)
+        self.assertEqual(replay.remaining(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+import socket
+import sys
+import threading
+sys.path.append('../Measurement_Software')
+import numpy as np
+import pyvisa
+from Instruments import transport
+from Instruments.oscilloscope_rigol import Oscilloscope
+
+
+class FakeSocketInstrument():
+    """TCP server answering newline terminated commands with a canned response."""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.commands = []
+        self.server = socket.create_server(("127.0.0.1", 0))
+        self.port = self.server.getsockname()[1]
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+        self.thread.start()
+
+    def _serve(self):
+        connection, _ = self.server.accept()
+        with connection:
+            data = b""
+            while True:
+                chunk = connection.recv(4096)
+                if not chunk:
+                    return
+                data += chunk
+                while b"\n" in data:
+                    command, data = data.split(b"\n", 1)
+                    self.commands.append(command.decode())
+                    response = self.responses.get(command.decode())
+                    if response is not None:
+                        # Send in pieces to exercise the reassembly.
+                        for start in range(0, len(response), 7000):
+                            connection.sendall(response[start:start + 7000])
+
+    def close(self):
+        self.server.close()
+
+
+class TestSocketResource(unittest.TestCase):
+
+    def setUp(self):
+        self.payload = np.arange(250000, dtype=np.uint32).astype(np.uint8).tobytes()
+        self.payload = self.payload[:1000] + b"\n\n" + self.payload[1000:]
+        block = b"#9%09d" % len(self.payload) + self.payload + b"\n"
+        self.server = FakeSocketInstrument({"*IDN?": b"RIGOL,DS1202Z-E\n", ":WAV:DATA?": block,
+                                            ":ACQuire:SRATe?": b"1.0E+9\n", ":WAVeform:DATA?": block,
+                                            ":WAVeform:FORMat?;:WAVeform:STARt?;:WAVeform:STOP?":
+                                                b"BYTE;1;%d\n" % len(self.payload)})
+        self.addCleanup(self.server.close)
+        address = transport.socket_address("127.0.0.1", self.server.port)
+        self.resource = transport.open_resource(address, timeout=2000, native_socket=True)
+        self.addCleanup(self.resource.close)
+
+    def test_query_and_block(self):
+        self.assertIsInstance(self.resource, transport.SocketResource)
+        self.assertEqual(self.resource.query("*IDN?"), "RIGOL,DS1202Z-E")
+        self.resource.write(":WAV:DATA?")
+        response = self.resource.read_raw()
+        self.assertEqual(bytes(response[11:-1]), self.payload)
+        self.assertEqual(self.resource.query("*IDN?"), "RIGOL,DS1202Z-E")
+
+    def test_driver_unchanged(self):
+        scope = Oscilloscope(self.resource)
+        self.assertEqual(scope.get_sample_rate(), 1e9)
+        self.assertEqual(bytes(scope._read_block(":WAV:DATA?")), self.payload)
+        self.assertEqual(scope.get_waveform_data(), self.payload)
+
+    def test_timeout(self):
+        self.resource.timeout = 100
+        with self.assertRaises(pyvisa.errors.VisaIOError) as error:
+            self.resource.query(":NO:ANSWer?")
+        self.assertEqual(error.exception.error_code, pyvisa.constants.StatusCode.error_timeout)
+        self.assertFalse(transport.is_connection_error(error.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
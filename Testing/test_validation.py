@@ -0,0 +1,131 @@
+import unittest
+import sys
+from unittest.mock import MagicMock
+sys.path.append('../Measurement_Software')
+from Instruments import validation
+from Instruments.oscilloscope_rigol import Oscilloscope
+from Instruments.spectrum_analyzer_signal_hound import SpectrumAnalyzer
+
+
+class TestValidators(unittest.TestCase):
+
+    def test_choice(self):
+        choice = validation.Choice("FREQuency", "AUTO", 6000, name="thing")
+        self.assertEqual(choice("freq"), "FREQuency")
+        self.assertEqual(choice("FREQUENCY"), "FREQuency")
+        self.assertEqual(choice("6000"), 6000)
+        self.assertIn("auto", choice)
+        with self.assertRaises(ValueError):
+            choice("FRE")
+        with self.assertRaises(ValueError):
+            choice([1])
+
+    def test_range_and_boolean(self):
+        averages = validation.Range(2, 1024, int, keywords=("MINimum",))
+        self.assertEqual(averages("16"), 16)
+        self.assertEqual(averages("min"), "MINimum")
+        for value in (1, 2048, 2.5, "many"):
+            with self.assertRaises(ValueError):
+                averages(value)
+        state = validation.Boolean()
+        self.assertEqual([state(v) for v in (True, 0, "on", "1")], ["ON", "OFF", "ON", "ON"])
+
+    def test_unknown_argument(self):
+        with self.assertRaises(TypeError):
+            validation.validate(nope=validation.Boolean())(lambda self, state: None)
+
+
+class TestDriverValidation(unittest.TestCase):
+
+    def setUp(self):
+        self.instrument = MagicMock()
+        self.scope = Oscilloscope(self.instrument)
+
+    def test_setters(self):
+        self.scope.set_memory_depth(12000)
+        self.instrument.write.assert_called_with(":ACQuire:MDEPth 12000")
+        self.scope.set_channel_coupling_mode(2, "dc")
+        self.instrument.write.assert_called_with(":CHANnel2:COUPling DC")
+        self.scope.channel_invert_waveform(1, True)
+        self.instrument.write.assert_called_with(":CHANnel1:INVert ON")
+        self.scope.set_channel_range(channel=1, param1="8")
+        self.instrument.write.assert_called_with(":CHANnel1:RANGe 8.0")
+        with self.assertRaises(ValueError):
+            self.scope.set_channel_bandwidth_limit(3, "20M")
+        with self.assertRaises(ValueError):
+            self.scope.set_memory_depth(1000)
+        with self.assertRaises(ValueError):
+            self.scope.set_number_of_averages(4096)
+
+    def test_mixed_case_choices(self):
+        self.scope.set_decoder_mode(1, "PARallel")
+        self.instrument.write.assert_called_with(":DECoder1:MODE PARallel")
+        self.scope.set_decoder_mode(2, "par")
+        self.instrument.write.assert_called_with(":DECoder2:MODE PARallel")
+        self.scope.set_trigger_edge_source("chan2")
+        self.instrument.write.assert_called_with(":TRIGger:EDGE:SOURce CHANnel2")
+        self.scope.set_all_measure_source(["CHANnel1", "math"])
+        self.instrument.write.assert_called_with(":MEASure:AMSource CHANnel1,MATH")
+        self.scope.set_trigger_pattern("h")
+        self.instrument.write.assert_called_with(":TRIGger:PATTern:PATTern H")
+        with self.assertRaises(ValueError):
+            self.scope.set_decoder_uart_data_width(1, 9)
+        with self.assertRaises(ValueError):
+            self.scope.set_decoder_mode(3, "UART")
+        with self.assertRaises(ValueError):
+            self.scope.set_decoder_mode(1, "CAN")
+
+    def test_getters_and_ranges(self):
+        self.instrument.query.return_value = "UART\n"
+        self.assertEqual(self.scope.get_decoder_mode("2"), "UART")
+        self.instrument.query.assert_called_with(":DECoder2:MODE?")
+        with self.assertRaises(ValueError):
+            self.scope.get_decoder_mode(3)
+        self.scope.set_cursor_manual("a", 100, 200)
+        self.instrument.write.assert_called_with(":CURSor:MANual:AY 200")
+        self.scope.set_waveform_record_interval("min")
+        self.instrument.write.assert_called_with(":FUNCtion:WRECord:FINTerval MIN")
+        self.scope.set_trigger_pulse_width(1e-6)
+        self.instrument.write.assert_called_with(":TRIGger:PULSE:WIDTH 1e-06")
+        for call in (lambda: self.scope.set_cursor_xy("A", 400, 100),
+                     lambda: self.scope.set_waveform_replay_interval(0),
+                     lambda: self.scope.set_trigger_pulse_upper_width(8e-9),
+                     lambda: self.scope.get_display_data(fmt="GIF")):
+            with self.assertRaises(ValueError):
+                call()
+
+    def test_spectrum_analyzer_setters(self):
+        sa = SpectrumAnalyzer(self.instrument)
+        sa.set_path_loss_table_state(2, True)
+        self.instrument.write.assert_called_with(":SENS:CORR:PATH2:STAT ON")
+        sa.set_limit_line_type(1, "lower")
+        self.instrument.write.assert_called_with(":CALC:LLINE1:TYPE LOWer")
+        sa.set_mode("pn")
+        self.instrument.write.assert_called_with(":INST:SEL PNoise")
+        with self.assertRaises(ValueError):
+            sa.set_limit_line_state(1, "INVALID")
+
+    def test_measure_item(self):
+        self.instrument.query.return_value = "1.5e6\n"
+        self.assertEqual(self.scope.get_measure_item("freq", "channel1"), 1.5e6)
+        self.instrument.query.assert_called_with(":MEASure:ITEM? FREQuency,CHANnel1")
+        self.scope.get_measure_statistic_item("max", "RDEL", ["CHAN1", "chan2"])
+        self.instrument.query.assert_called_with(":MEASure:STATistic:ITEM? MAXimum,RDELay,CHANnel1,CHANnel2")
+        with self.assertRaises(ValueError):
+            self.scope.get_measure_item("VPP", "CHANnel3")
+
+    def test_trusted(self):
+        with validation.trusted():
+            self.assertFalse(validation.is_enabled())
+            self.scope.set_memory_depth("AUTO")
+        self.assertTrue(validation.is_enabled())
+        self.instrument.write.assert_called_with(":ACQuire:MDEPth AUTO")
+        with validation.trusted():
+            self.scope.channel_invert_waveform(1, "ON")
+            self.instrument.write.assert_called_with(":CHANnel1:INVert ON")
+            SpectrumAnalyzer(self.instrument).hide_spike("OFF")
+            self.instrument.write.assert_called_with(":DISP:HIDE OFF")
+
+
+if __name__ == '__main__':
+    unittest.main()